@@ -358,11 +358,21 @@ class RecordingContext:
         the result is ready.
         """
 
-        self.records: List[mod_record_schema.Record] = []
+        self._records: List[mod_record_schema.Record] = []
         """Completed records."""
 
+        self.pending: List[Future] = []
+        """Serializations of calls captured in the background not yet waited
+        for. See
+        [CaptureMode.BACKGROUND][trulens.core.instruments.CaptureMode.BACKGROUND]."""
+
+        self.pending_feedback: List[mod_record_schema.Record] = []
+        """Records completed in the background whose feedback results are yet
+        to be waited for in
+        [FeedbackMode.WITH_APP][trulens.core.schema.feedback.FeedbackMode.WITH_APP]."""
+
         self.lock: Lock = Lock()
-        """Lock blocking access to `calls` and `records` when adding calls or finishing a record."""
+        """Lock blocking access to `calls`, `records`, `pending` and `pending_feedback` when adding calls or finishing a record."""
 
         self.token: Optional[contextvars.Token] = None
         """Token for context management."""
@@ -373,6 +383,44 @@ class RecordingContext:
         self.record_metadata = record_metadata
         """Metadata to attach to all records produced in this context."""
 
+    @property
+    def records(self) -> List[mod_record_schema.Record]:
+        """Completed records.
+
+        Waits for the calls captured in the background to be serialized.
+        """
+
+        self.wait_for_pending()
+
+        return self._records
+
+    def wait_for_pending(self) -> None:
+        """Wait for the calls captured in the background so far to be
+        serialized and their records completed.
+
+        In
+        [FeedbackMode.WITH_APP][trulens.core.schema.feedback.FeedbackMode.WITH_APP],
+        also waits for the feedback results of those records.
+
+        Raises:
+            Exception: The first error raised while serializing them.
+        """
+
+        with self.lock:
+            pending, self.pending = self.pending, []
+
+        errors = [future.exception() for future in pending]
+
+        with self.lock:
+            pending_feedback, self.pending_feedback = self.pending_feedback, []
+
+        for record in pending_feedback:
+            record.wait_for_feedback_results()
+
+        for error in errors:
+            if error is not None:
+                raise error
+
     def __iter__(self):
         return iter(self.records)
 
@@ -400,7 +448,7 @@ class RecordingContext:
 
     def __hash__(self) -> int:
         # The same app can have multiple recording contexts.
-        return hash(id(self.app)) + hash(id(self.records))
+        return hash(id(self.app)) + hash(id(self._records))
 
     def __eq__(self, other):
         return hash(self) == hash(other)
@@ -415,6 +463,21 @@ class RecordingContext:
             # processing calls with awaitable or generator results.
             self.calls[call.call_id] = call
 
+    def add_pending(self, future: Future) -> None:
+        """
+        Add the given serialization of calls captured in the background.
+        """
+        with self.lock:
+            self.pending.append(future)
+
+    def add_pending_feedback(self, record: mod_record_schema.Record) -> None:
+        """
+        Add the given record completed in the background to wait for the
+        feedback results of.
+        """
+        with self.lock:
+            self.pending_feedback.append(record)
+
     def finish_record(
         self,
         calls_to_record: Callable[
@@ -441,7 +504,7 @@ class RecordingContext:
             if existing_record is None:
                 # If existing record was given, we assume it was already
                 # inserted into this list.
-                self.records.append(record)
+                self._records.append(record)
 
         return record
 
@@ -636,6 +699,10 @@ class App(
         this is running, it will include them.
         """
 
+        # Records of calls captured in the background are only added once
+        # serialized.
+        mod_instruments.wait_for_serialization()
+
         records = []
 
         while not self.records_with_pending_feedback_results.empty():
@@ -1173,7 +1240,16 @@ class App(
             # If in blocking mode ("WITH_APP"), wait for feedbacks to finished
             # evaluating before returning the record.
 
-            record.wait_for_feedback_results()
+            if (
+                mod_instruments.Instrument.capture_mode
+                == mod_instruments.CaptureMode.BACKGROUND
+            ):
+                # Waiting here would hold up the serialization of all other
+                # calls. The recording context waits when its records are
+                # obtained instead.
+                ctx.add_pending_feedback(record)
+            else:
+                record.wait_for_feedback_results()
 
         return record
 
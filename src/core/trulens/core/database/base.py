@@ -1,9 +1,23 @@
 import abc
+import dataclasses
 from datetime import datetime
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
+from trulens.core.database import export as mod_export
+from trulens.core.database import retention as mod_retention
 from trulens.core.schema import feedback as mod_feedback_schema
 from trulens.core.schema import types as mod_types_schema
 from trulens.core.schema.app import AppDefinition
@@ -39,6 +53,34 @@ DEFAULT_DATABASE_REDACT_KEYS: bool = False
 """Default value for option to redact secrets before writing out data to database."""
 
 
+@dataclasses.dataclass(frozen=True)
+class HighWaterMark:
+    """Summary of the records and feedback results of a database that changes
+    when they do.
+
+    Read with
+    [get_high_water_mark][trulens.core.database.base.DB.get_high_water_mark]
+    to tell whether results read from the database are out of date without
+    reading them again.
+    """
+
+    first_record_ts: Optional[float] = None
+    """Timestamp of the oldest record. Changes when old records are
+    deleted."""
+
+    last_record_ts: Optional[float] = None
+    """Timestamp of the newest record."""
+
+    last_feedback_ts: Optional[float] = None
+    """Latest time a feedback result was written."""
+
+    n_feedback_results: int = 0
+    """Number of feedback results."""
+
+    n_records: int = 0
+    """Number of records. Drops when records are deleted."""
+
+
 class DB(SerialModel, abc.ABC):
     """Abstract definition of databases used by trulens.
 
@@ -291,6 +333,75 @@ class DB(SerialModel, abc.ABC):
 
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def claim_feedback(
+        self,
+        claimed_by: str,
+        lease_seconds: float,
+        limit: Optional[int] = None,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+        retry_running_seconds: float = 60.0,
+        retry_failed_seconds: float = 300.0,
+    ) -> pd.DataFrame:
+        """Atomically claim feedback results that are due for evaluation.
+
+        A feedback result is due if it has not been run yet, if it is running
+        but its lease has expired (or, for results without a lease, if it was
+        last updated more than `retry_running_seconds` ago), or if it failed
+        more than `retry_failed_seconds` ago. Claimed results are set to
+        RUNNING and leased to `claimed_by` for `lease_seconds` so that no
+        other evaluator claims them until the lease expires.
+
+        Args:
+            claimed_by: Identifier of the claiming evaluator.
+
+            lease_seconds: Duration of the lease in seconds.
+
+            limit: Maximum number of feedback results to claim.
+
+            run_location: Only claim feedback functions with this
+                run_location.
+
+            retry_running_seconds: How long to wait before claiming a running
+                feedback result that has no lease.
+
+            retry_failed_seconds: How long to wait before claiming a failed
+                feedback result.
+
+        Returns:
+            The claimed feedback results in the same format as
+                [get_feedback][trulens.core.database.base.DB.get_feedback].
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def renew_feedback_leases(
+        self,
+        feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID],
+        claimed_by: str,
+        lease_seconds: float,
+    ) -> int:
+        """Extend the leases of running feedback results claimed by
+        `claimed_by` to `lease_seconds` from now.
+
+        Returns:
+            The number of leases renewed.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def release_feedback(
+        self,
+        feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID],
+        claimed_by: str,
+    ) -> None:
+        """Release the leases of the given feedback results if held by
+        `claimed_by`."""
+
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def get_app(self, app_id: mod_types_schema.AppID) -> Optional[JSONized]:
         """Get the app with the given id from the database.
@@ -315,6 +426,7 @@ class DB(SerialModel, abc.ABC):
         app_ids: Optional[List[mod_types_schema.AppID]] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        since: Optional[HighWaterMark] = None,
     ) -> Tuple[pd.DataFrame, Sequence[str]]:
         """Get records from the database.
 
@@ -326,6 +438,10 @@ class DB(SerialModel, abc.ABC):
 
             limit: Limit on rows (records) returned.
 
+            since: If given, retrieve only the records added after its
+                `last_record_ts` or with feedback results written after its
+                `last_feedback_ts`.
+
         Returns:
             A DataFrame with the records.
 
@@ -333,6 +449,176 @@ class DB(SerialModel, abc.ABC):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def get_high_water_mark(self) -> HighWaterMark:
+        """Get a summary of the records and feedback results that changes when
+        they do, without reading them."""
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def iter_records_and_feedback(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        after: Optional[
+            Tuple[Union[datetime, str, float], mod_types_schema.RecordID]
+        ] = None,
+        feedback_calls: bool = False,
+        since: Optional[HighWaterMark] = None,
+        record_ids: Optional[List[mod_types_schema.RecordID]] = None,
+    ) -> Iterator[Tuple[pd.DataFrame, Sequence[str]]]:
+        """Get records from the database in chunks ordered by their timestamp
+        and id.
+
+        Chunks are read with keyset pagination so that reading later chunks
+        does not get slower, and each chunk is read only when requested from
+        the iterator.
+
+        Args:
+            app_ids: If given, retrieve only the records for the given apps.
+                Otherwise all apps are retrieved.
+
+            columns: Record and app columns to include. By default all of the
+                columns of
+                [get_records_and_feedback][trulens.core.database.base.DB.get_records_and_feedback]
+                except the serialized `record_json` and `app_json` which are
+                only read if requested here. Feedback result, latency, token
+                and cost columns are always included.
+
+            chunk_size: Maximum number of records per chunk.
+
+            after: The `ts` and `record_id` of a record. If given, only records
+                after this one are retrieved. Used to continue from the last
+                row of a prior chunk.
+
+            feedback_calls: Whether to include the `<feedback name>_calls`
+                columns with the feedback function calls.
+
+            since: If given, retrieve only the records added after its
+                `last_record_ts` or with feedback results written after its
+                `last_feedback_ts`.
+
+            record_ids: If given, retrieve only the records with these ids.
+
+        Returns:
+            An iterator of DataFrames with the records of each chunk and the
+                list of column names of each that contain feedback results.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_leaderboard(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        group_by_metadata_key: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Sequence[str]]:
+        """Aggregate records and their feedback results per app.
+
+        Args:
+            app_ids: If given, include only the records of the given apps.
+                Otherwise all apps are included.
+
+            group_by_metadata_key: If given, additionally group records by the
+                value of this key in their metadata. Records without the key
+                are not included.
+
+        Returns:
+            A DataFrame indexed by app id (and metadata value) with the average
+                of each feedback result, `latency` and `total_cost` per record,
+                as well as the number of records `n_records` and the sums of
+                their costs `sum_cost` and tokens `sum_tokens`. Sorted by the
+                feedback results in descending order.
+
+            A list of column names that contain feedback results.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def apply_retention(
+        self,
+        policy: mod_retention.RetentionPolicy,
+        archive: Optional[Union[str, Path]] = None,
+        archive_format: Union[
+            mod_retention.ArchiveFormat, str
+        ] = mod_retention.ArchiveFormat.JSONL,
+        batch_size: int = 500,
+        now: Optional[datetime] = None,
+    ) -> mod_retention.RetentionResult:
+        """Delete expired records and their feedback results.
+
+        Records are deleted in batches of at most `batch_size`, each in its own
+        transaction.
+
+        Args:
+            policy: Which records are expired.
+
+            archive: Directory to write each batch to before it is deleted. Not
+                archived if not given.
+
+            archive_format: Format of the archive files.
+
+            batch_size: Maximum number of records deleted per transaction.
+
+            now: Time against which the age of records is measured. Defaults to
+                the current time.
+
+        Returns:
+            Counts of what was deleted and the archive files written.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def export(
+        self,
+        path: Union[str, Path],
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> mod_export.TransferResult:
+        """Export records, their feedback results, apps and feedback
+        definitions to Parquet files in a directory.
+
+        Records are read in chunks of at most `chunk_size`, each written to the
+        files as Arrow record batches. See
+        [trulens.core.database.export][trulens.core.database.export].
+
+        Args:
+            path: The export directory.
+
+            app_ids: If given, export only the records of the given apps.
+
+            since: If given, export only the records made at or after this
+                time.
+
+            chunk_size: Maximum number of records read per query.
+
+        Returns:
+            Counts of what was exported and the files written.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def import_(
+        self, path: Union[str, Path], batch_size: int = 1000
+    ) -> mod_export.TransferResult:
+        """Import the files of a directory written by
+        [export][trulens.core.database.base.DB.export].
+
+        Rows are inserted in batches of at most `batch_size`, each in its own
+        transaction. Rows that already exist are updated.
+
+        Args:
+            path: The export directory.
+
+            batch_size: Maximum number of rows inserted per transaction.
+
+        Returns:
+            Counts of what was imported and the files read.
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def insert_ground_truth(
         self, ground_truth: GroundTruth
@@ -401,3 +687,17 @@ class DB(SerialModel, abc.ABC):
             A dataframe with the datasets.
         """
         raise NotImplementedError()
+
+    def explain_queries(self) -> pd.DataFrame:
+        """Explain the plans of the queries run most often against this
+        database, i.e. those of the deferred feedback evaluator and the
+        dashboard.
+
+        Returns:
+            A dataframe with one row per query containing the query name, its
+            SQL, its plan as reported by the database, and the list of tables
+            it scans sequentially (i.e. without the use of an index). The
+            last two are None if the database does not support explaining
+            queries.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,237 @@
+"""
+# Storage codec for serialized records
+
+Serialized records (`record_json`) and feedback calls (`calls_json`) repeat the
+same large strings, for example the contexts retrieved by a RAG app, across
+many rows. A [StorageCodec][trulens.core.database.codec.StorageCodec] given to
+[SQLAlchemyDB][trulens.core.database.sqlalchemy.SQLAlchemyDB] shrinks them
+before they are written:
+
+- String values of at least `min_blob_length` characters are moved to a blob
+  table keyed by the hash of their content so that each distinct value is
+  stored once. The serialized JSON keeps a reference to the blob in their
+  place.
+
+- The resulting JSON is compressed with zstd (if `zstandard` is installed) or
+  zlib.
+
+```python
+from trulens.core import TruSession
+from trulens.core.database.codec import StorageCodec
+
+session = TruSession(database_args=dict(codec=StorageCodec()))
+```
+
+Encoded values are text so no change to the column types is needed. They are
+decoded by the database on read, and rows written with or without a codec can
+be mixed in one database. SQL functions over the encoded columns, such as
+JSON path extraction, do not see their content.
+"""
+
+from __future__ import annotations
+
+import base64
+from enum import Enum
+import hashlib
+import re
+from typing import Dict, Mapping, Optional, Set, Union
+import zlib
+
+from trulens.core.utils.imports import REQUIREMENT_ZSTANDARD
+from trulens.core.utils.imports import OptionalImports
+from trulens.core.utils.imports import is_dummy
+
+with OptionalImports(messages=REQUIREMENT_ZSTANDARD) as opt:
+    import zstandard
+
+ENCODED_PREFIX = "trulens:"
+"""Prefix of encoded values. Plain JSON never starts with it."""
+
+_BLOBS_FLAG = "+blobs"
+"""Suffix of the compression of encoded values that refer to blobs."""
+
+_BLOB_REF = "\\u0000blob:"
+"""Start of the serialized string standing in for a blob."""
+
+_BLOB_REF_PATTERN = re.compile(r'"\\u0000blob:([0-9a-f]{64})"')
+
+_STRING_PATTERN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+"""Serialized JSON strings. Matched left to right over serialized JSON, these
+align with the strings of the JSON value as quotes only appear inside strings
+escaped."""
+
+
+class Compression(str, Enum):
+    """Compression of encoded values."""
+
+    NONE = "none"
+    """Not compressed."""
+
+    ZLIB = "zlib"
+    """Compressed with zlib from the standard library."""
+
+    ZSTD = "zstd"
+    """Compressed with zstd. Requires the `zstandard` package."""
+
+
+class StorageCodec:
+    """Encoding of serialized JSON for storage.
+
+    Args:
+        compression: How to compress encoded values. Defaults to zstd if
+            `zstandard` is installed and zlib otherwise.
+
+        level: Compression level. Defaults to the level of the compression
+            library.
+
+        min_blob_length: Serialized strings of at least this many characters
+            are stored as blobs. If None, blobs are not used.
+    """
+
+    def __init__(
+        self,
+        compression: Optional[Union[Compression, str]] = None,
+        level: Optional[int] = None,
+        min_blob_length: Optional[int] = 1024,
+    ):
+        if compression is None:
+            compression = (
+                Compression.ZLIB if is_dummy(zstandard) else Compression.ZSTD
+            )
+        self.compression = Compression(compression)
+
+        if self.compression == Compression.ZSTD:
+            opt.assert_installed(zstandard)
+
+        self.level = level
+        self.min_blob_length = min_blob_length
+
+    def __repr__(self) -> str:
+        return (
+            f"StorageCodec(compression={self.compression.value!r}, "
+            f"level={self.level!r}, min_blob_length={self.min_blob_length!r})"
+        )
+
+    def encode(
+        self, json_str: str, blobs: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Encode serialized JSON.
+
+        Args:
+            json_str: The serialized JSON.
+
+            blobs: Where to put the strings moved to blobs, by blob id. Blobs
+                are not used if not given.
+
+        Returns:
+            The encoded value.
+        """
+
+        flag = ""
+
+        if (
+            blobs is not None
+            and self.min_blob_length is not None
+            # A string that looks like a reference cannot be told apart from
+            # one.
+            and _BLOB_REF not in json_str
+        ):
+            flag = _BLOBS_FLAG
+
+            def _to_blob(match: re.Match) -> str:
+                literal = match.group(0)
+                if len(literal) < self.min_blob_length:
+                    return literal
+
+                blob_id = hashlib.sha256(literal.encode()).hexdigest()
+                blobs[blob_id] = literal
+
+                return f'"{_BLOB_REF}{blob_id}"'
+
+            json_str = _STRING_PATTERN.sub(_to_blob, json_str)
+
+        return self.compress(json_str, flag=flag)
+
+    def compress(self, text: str, flag: str = "") -> str:
+        """Compress `text` without moving strings to blobs."""
+
+        data = text.encode()
+
+        if self.compression == Compression.ZSTD:
+            data = base64.b85encode(
+                zstandard.ZstdCompressor(
+                    level=3 if self.level is None else self.level
+                ).compress(data)
+            ).decode()
+        elif self.compression == Compression.ZLIB:
+            data = base64.b85encode(
+                zlib.compress(data, -1 if self.level is None else self.level)
+            ).decode()
+        else:
+            data = text
+
+        return f"{ENCODED_PREFIX}{self.compression.value}{flag}:{data}"
+
+
+def is_encoded(value: Optional[str]) -> bool:
+    """Whether `value` was encoded by a
+    [StorageCodec][trulens.core.database.codec.StorageCodec]."""
+
+    return value is not None and value.startswith(ENCODED_PREFIX)
+
+
+def decompress(value: str) -> str:
+    """Decompress an encoded value, leaving references to blobs in place.
+
+    Values that are not encoded are returned as is.
+    """
+
+    if not is_encoded(value):
+        return value
+
+    compression, data = value[len(ENCODED_PREFIX) :].split(":", 1)
+    compression = Compression(compression.removesuffix(_BLOBS_FLAG))
+
+    if compression == Compression.ZSTD:
+        opt.assert_installed(zstandard)
+        return (
+            zstandard.ZstdDecompressor()
+            .decompress(base64.b85decode(data))
+            .decode()
+        )
+
+    if compression == Compression.ZLIB:
+        return zlib.decompress(base64.b85decode(data)).decode()
+
+    return data
+
+
+def uses_blobs(value: Optional[str]) -> bool:
+    """Whether encoded `value` may refer to blobs."""
+
+    return is_encoded(value) and value[len(ENCODED_PREFIX) :].split(":", 1)[
+        0
+    ].endswith(_BLOBS_FLAG)
+
+
+def blob_refs(json_str: str) -> Set[str]:
+    """Ids of the blobs referred to by decompressed `json_str`."""
+
+    if _BLOB_REF not in json_str:
+        return set()
+
+    return set(_BLOB_REF_PATTERN.findall(json_str))
+
+
+def resolve_blobs(json_str: str, blobs: Mapping[str, str]) -> str:
+    """Replace references to blobs in decompressed `json_str` by their
+    content.
+
+    Raises:
+        KeyError: If a referred blob is not in `blobs`.
+    """
+
+    if _BLOB_REF not in json_str:
+        return json_str
+
+    return _BLOB_REF_PATTERN.sub(lambda m: blobs[m.group(1)], json_str)
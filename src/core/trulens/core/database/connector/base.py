@@ -3,21 +3,30 @@ from __future__ import annotations
 from abc import ABC
 from abc import abstractmethod
 from concurrent import futures
-import json
+from datetime import datetime
+import functools
 import logging
-import queue
-from threading import Thread
-import time
+from pathlib import Path
+import threading
 from typing import (
+    Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
 )
+import weakref
 
 import pandas
+from trulens.core.database import export as mod_export
+from trulens.core.database import ingest as mod_ingest
+from trulens.core.database import retention as mod_retention
+from trulens.core.database import sqlite as mod_sqlite
 from trulens.core.database.base import DB
+from trulens.core.database.base import HighWaterMark
 from trulens.core.schema import app as mod_app_schema
 from trulens.core.schema import feedback as mod_feedback_schema
 from trulens.core.schema import record as mod_record_schema
@@ -34,9 +43,42 @@ class DBConnector(ABC):
     RECORDS_BATCH_TIMEOUT_IN_SEC: int = 10
     """Time to wait before inserting a batch of records into the database."""
 
-    batch_record_queue = queue.Queue()
+    RECORDS_BATCH_SIZE: int = 500
+    """Maximum number of records inserted into the database in one batch."""
 
-    batch_thread = None
+    RECORDS_QUEUE_SIZE: int = 10000
+    """Maximum number of records waiting to be inserted in batches."""
+
+    RECORDS_BACKPRESSURE: mod_ingest.BackpressurePolicy = (
+        mod_ingest.BackpressurePolicy.BLOCK
+    )
+    """What to do with new records when the batch queue is full.
+
+    See [BackpressurePolicy][trulens.core.database.ingest.BackpressurePolicy].
+    """
+
+    RECORDS_SPILL_PATH: Optional[str] = None
+    """File records are spilled to under
+    [SPILL][trulens.core.database.ingest.BackpressurePolicy.SPILL]
+    backpressure or when batches fail. If None, a file of the database in the
+    home directory is used, see
+    [default_spill_path][trulens.core.database.ingest.default_spill_path]."""
+
+    _ingest_pipeline: Optional[mod_ingest.RecordIngestPipeline] = None
+    """Pipeline for records added with `add_record_nowait`. Created on first
+    use."""
+
+    _ingest_lock: threading.Lock = threading.Lock()
+    """Lock for creating `_ingest_pipeline`."""
+
+    _ingest_finalizer: Optional[weakref.finalize] = None
+    """Stops `_ingest_pipeline` if the connector is collected without being
+    closed."""
+
+    _app_json_cache: Optional[Dict[mod_types_schema.AppID, serial.JSONized]] = (
+        None
+    )
+    """App definitions looked up while ingesting record batches."""
 
     @property
     @abstractmethod
@@ -49,8 +91,31 @@ class DBConnector(ABC):
 
         See [DB.reset_database][trulens.core.database.base.DB.reset_database].
         """
+        self.close()
         self.db.reset_database()
 
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Insert the records added with `add_record_nowait` and stop the
+        thread inserting them.
+
+        Records added afterwards are inserted by a new thread.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the records to be
+                inserted.
+        """
+
+        with DBConnector._ingest_lock:
+            pipeline = self._ingest_pipeline
+            self._ingest_pipeline = None
+
+            if self._ingest_finalizer is not None:
+                self._ingest_finalizer.detach()
+                self._ingest_finalizer = None
+
+        if pipeline is not None:
+            pipeline.stop(timeout=timeout)
+
     def migrate_database(self, **kwargs):
         """Migrates the database.
 
@@ -92,52 +157,134 @@ class DBConnector(ABC):
         self,
         record: mod_record_schema.Record,
     ) -> None:
-        """Add a record to the queue to be inserted in the next batch."""
-        if self.batch_thread is None:
-            self.batch_thread = Thread(target=self._batch_loop, daemon=True)
-            self.batch_thread.start()
-        self.batch_record_queue.put(record)
-
-    def _batch_loop(self):
-        while True:
-            time.sleep(self.RECORDS_BATCH_TIMEOUT_IN_SEC)
-            records = []
-            while True:
-                try:
-                    record = self.batch_record_queue.get_nowait()
-                    records.append(record)
-                except queue.Empty:
-                    break
-            if records:
-                try:
-                    self.db.batch_insert_record(records)
-                except Exception as e:
-                    # Re-queue the records that failed to be inserted
-                    for record in records:
-                        self.batch_record_queue.put(record)
-                    logger.error(
-                        "Re-queued records due to insertion error {}", e
+        """Add a record to the queue to be inserted in the next batch.
+
+        Depending on
+        [RECORDS_BACKPRESSURE][trulens.core.database.connector.DBConnector.RECORDS_BACKPRESSURE],
+        this may block if the queue is full. Records are inserted from a
+        thread which runs until the connector is closed (see
+        [close][trulens.core.database.connector.DBConnector.close]) or
+        collected.
+        """
+
+        pipeline = self._ingest_pipeline
+        if pipeline is None:
+            with DBConnector._ingest_lock:
+                pipeline = self._ingest_pipeline
+                if pipeline is None:
+                    # The pipeline only holds a weak reference to the
+                    # connector, whose thread would otherwise keep the
+                    # connector alive.
+                    pipeline = mod_ingest.RecordIngestPipeline(
+                        ingest_batch=functools.partial(
+                            _ingest_record_batch, weakref.ref(self)
+                        ),
+                        max_queue_size=self.RECORDS_QUEUE_SIZE,
+                        batch_size=self.RECORDS_BATCH_SIZE,
+                        flush_interval=self.RECORDS_BATCH_TIMEOUT_IN_SEC,
+                        backpressure=self.RECORDS_BACKPRESSURE,
+                        spill_path=self.RECORDS_SPILL_PATH
+                        or mod_ingest.default_spill_path(self._database_name()),
+                    )
+                    self._ingest_finalizer = weakref.finalize(
+                        self, pipeline.stop, timeout=0
+                    )
+                    self._ingest_pipeline = pipeline
+
+        pipeline.put(record)
+
+    def _database_name(self) -> str:
+        """Identifies the database for the default spill file."""
+
+        engine = getattr(self.db, "engine", None)
+        if engine is None:
+            return f"{type(self.db).__name__}:{self.db.table_prefix}"
+
+        path = mod_sqlite.database_path(engine.url)
+        if path is not None:
+            url = f"sqlite:///{path.resolve()}"
+        else:
+            url = engine.url.render_as_string(hide_password=True)
+
+        return f"{url}:{self.db.table_prefix}"
+
+    def flush_records(self, timeout: Optional[float] = None) -> bool:
+        """Insert all records added with `add_record_nowait` now.
+
+        Args:
+            timeout: Maximum time in seconds to wait.
+
+        Returns:
+            Whether all queued records were inserted before the timeout.
+        """
+
+        if self._ingest_pipeline is None:
+            return True
+
+        return self._ingest_pipeline.flush(timeout=timeout)
+
+    def get_ingest_metrics(self) -> Optional[mod_ingest.IngestMetrics]:
+        """Queue depth and flush latency of records added with
+        `add_record_nowait`.
+
+        Returns:
+            None if no records were added with `add_record_nowait`.
+        """
+
+        if self._ingest_pipeline is None:
+            return None
+
+        return self._ingest_pipeline.metrics
+
+    def _get_app_cached(
+        self, app_id: mod_types_schema.AppID
+    ) -> Optional[serial.JSONized[mod_app_schema.AppDefinition]]:
+        """Look up an app, caching the result for subsequent batches."""
+
+        if self._app_json_cache is None:
+            self._app_json_cache = {}
+
+        if app_id not in self._app_json_cache:
+            app_json = self.get_app(app_id=app_id)
+            if app_json is None:
+                return None
+            self._app_json_cache[app_id] = app_json
+
+        return self._app_json_cache[app_id]
+
+    def _ingest_record_batch(
+        self, records: List[mod_record_schema.Record]
+    ) -> None:
+        """Insert a batch of records and the pending feedback results of their
+        apps' feedback definitions."""
+
+        self.db.batch_insert_record(records)
+
+        feedback_results = []
+        for record in records:
+            app = self._get_app_cached(app_id=record.app_id)
+            if app is None:
+                continue
+
+            feedback_definitions = app.get("feedback_definitions", [])
+            # TODO(Dave): Modify this to add only client side feedback results
+            for feedback_definition_id in feedback_definitions:
+                feedback_results.append(
+                    mod_feedback_schema.FeedbackResult(
+                        feedback_definition_id=feedback_definition_id,
+                        record_id=record.record_id,
+                        name="feedback_name",  # this will be updated later by deferred evaluator
                     )
-                    continue
-                feedback_results = []
-                apps = {}
-                for record in records:
-                    app_id = record.app_id
-                    app = apps.setdefault(app_id, self.get_app(app_id=app_id))
-                    feedback_definitions = app.get("feedback_definitions", [])
-                    # TODO(Dave): Modify this to add only client side feedback results
-                    for feedback_definition_id in feedback_definitions:
-                        feedback_results.append(
-                            mod_feedback_schema.FeedbackResult(
-                                feedback_definition_id=feedback_definition_id,
-                                record_id=record.record_id,
-                                name="feedback_name",  # this will be updated later by deferred evaluator
-                            )
-                        )
-                try:
-                    self.db.batch_insert_feedback(feedback_results)
-                except Exception as e:
-                    logger.error("Failed to insert feedback results {}", e)
+                )
+
+        if len(feedback_results) == 0:
+            return
+
+        try:
+            self.db.batch_insert_feedback(feedback_results)
+        except Exception as e:
+            # Records are already in; retrying the batch would duplicate them.
+            logger.error("Failed to insert feedback results: %s", e)
 
     def add_app(
         self, app: mod_app_schema.AppDefinition
@@ -153,6 +300,9 @@ class DBConnector(ABC):
 
         """
 
+        if self._app_json_cache is not None:
+            self._app_json_cache.pop(app.app_id, None)
+
         return self.db.insert_app(app=app)
 
     def delete_app(self, app_id: mod_types_schema.AppID) -> None:
@@ -162,6 +312,9 @@ class DBConnector(ABC):
         Args:
             app_id (schema.AppID): The unique identifier of the app to be deleted.
         """
+        if self._app_json_cache is not None:
+            self._app_json_cache.pop(app_id, None)
+
         self.db.delete_app(app_id=app_id)
         logger.info(f"App with ID {app_id} has been successfully deleted.")
 
@@ -309,6 +462,7 @@ class DBConnector(ABC):
         app_ids: Optional[List[mod_types_schema.AppID]] = None,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
+        since: Optional[HighWaterMark] = None,
     ) -> Tuple[pandas.DataFrame, List[str]]:
         """Get records, their feedback results, and feedback names.
 
@@ -320,6 +474,10 @@ class DBConnector(ABC):
 
             limit: Limit on the number of records to return.
 
+            since: If given, return only the records added or with feedback
+                results written since this mark of
+                [get_high_water_mark][trulens.core.database.connector.DBConnector.get_high_water_mark].
+
         Returns:
             DataFrame of records with their feedback results.
 
@@ -327,11 +485,58 @@ class DBConnector(ABC):
         """
 
         df, feedback_columns = self.db.get_records_and_feedback(
-            app_ids, offset=offset, limit=limit
+            app_ids, offset=offset, limit=limit, since=since
         )
 
         return df, list(feedback_columns)
 
+    def get_high_water_mark(self) -> HighWaterMark:
+        """Get a summary of the records and feedback results that changes when
+        they do.
+
+        See [DB.get_high_water_mark][trulens.core.database.base.DB.get_high_water_mark].
+        """
+
+        return self.db.get_high_water_mark()
+
+    def iter_records_and_feedback(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        after: Optional[
+            Tuple[Union[datetime, str, float], mod_types_schema.RecordID]
+        ] = None,
+        feedback_calls: bool = False,
+        since: Optional[HighWaterMark] = None,
+        record_ids: Optional[List[mod_types_schema.RecordID]] = None,
+    ) -> Iterator[Tuple[pandas.DataFrame, List[str]]]:
+        """Get records, their feedback results, and feedback names in chunks.
+
+        See
+        [DB.iter_records_and_feedback][trulens.core.database.base.DB.iter_records_and_feedback].
+        """
+
+        for df, feedback_columns in self.db.iter_records_and_feedback(
+            app_ids,
+            columns=columns,
+            chunk_size=chunk_size,
+            after=after,
+            feedback_calls=feedback_calls,
+            since=since,
+            record_ids=record_ids,
+        ):
+            yield df, list(feedback_columns)
+
+    def explain_queries(self) -> pandas.DataFrame:
+        """Explain the plans of the queries run most often against the
+        database and report any sequential scans.
+
+        See [DB.explain_queries][trulens.core.database.base.DB.explain_queries].
+        """
+
+        return self.db.explain_queries()
+
     def get_leaderboard(
         self,
         app_ids: Optional[List[mod_types_schema.AppID]] = None,
@@ -349,32 +554,79 @@ class DBConnector(ABC):
             If group_by_metadata_key is provided, the DataFrame will be grouped by the specified key.
         """
 
-        if app_ids is None:
-            app_ids = []
+        df, feedback_cols = self.db.get_leaderboard(
+            app_ids=app_ids, group_by_metadata_key=group_by_metadata_key
+        )
+
+        return df[list(feedback_cols) + ["latency", "total_cost"]]
+
+    def apply_retention(
+        self,
+        policy: mod_retention.RetentionPolicy,
+        archive: Optional[Union[str, Path]] = None,
+        archive_format: Union[
+            mod_retention.ArchiveFormat, str
+        ] = mod_retention.ArchiveFormat.JSONL,
+        batch_size: int = 500,
+    ) -> mod_retention.RetentionResult:
+        """Delete expired records and their feedback results, archiving them
+        first if `archive` is given.
+
+        See [DB.apply_retention][trulens.core.database.base.DB.apply_retention].
+        """
+
+        if self._ingest_pipeline is not None:
+            # Records still queued would otherwise be written after the purge.
+            self._ingest_pipeline.flush()
 
-        df, feedback_cols = self.get_records_and_feedback(app_ids)
+        return self.db.apply_retention(
+            policy,
+            archive=archive,
+            archive_format=archive_format,
+            batch_size=batch_size,
+        )
 
-        col_agg_list = feedback_cols + ["latency", "total_cost"]
+    def export(
+        self,
+        path: Union[str, Path],
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> mod_export.TransferResult:
+        """Export records, their feedback results, apps and feedback
+        definitions to Parquet files in a directory.
 
-        if group_by_metadata_key is not None:
-            df["meta"] = [
-                json.loads(df["record_json"][i])["meta"] for i in range(len(df))
-            ]
+        See [DB.export][trulens.core.database.base.DB.export].
+        """
 
-            df[str(group_by_metadata_key)] = [
-                item.get(group_by_metadata_key, None)
-                if isinstance(item, dict)
-                else None
-                for item in df["meta"]
-            ]
-            return (
-                df.groupby(["app_id", str(group_by_metadata_key)])[col_agg_list]
-                .mean()
-                .sort_values(by=feedback_cols, ascending=False)
-            )
-        else:
-            return (
-                df.groupby("app_id")[col_agg_list]
-                .mean()
-                .sort_values(by=feedback_cols, ascending=False)
-            )
+        if self._ingest_pipeline is not None:
+            # Include records still queued.
+            self._ingest_pipeline.flush()
+
+        return self.db.export(
+            path, app_ids=app_ids, since=since, chunk_size=chunk_size
+        )
+
+    def import_(
+        self, path: Union[str, Path], batch_size: int = 1000
+    ) -> mod_export.TransferResult:
+        """Import the files of a directory written by
+        [export][trulens.core.database.connector.DBConnector.export].
+
+        See [DB.import_][trulens.core.database.base.DB.import_].
+        """
+
+        return self.db.import_(path, batch_size=batch_size)
+
+
+def _ingest_record_batch(
+    connector_ref: weakref.ref[DBConnector],
+    records: List[mod_record_schema.Record],
+) -> None:
+    """Insert a batch of records with the referenced connector."""
+
+    connector = connector_ref()
+    if connector is None:
+        raise RuntimeError("The connector of the records was collected.")
+
+    connector._ingest_record_batch(records)
@@ -6,6 +6,7 @@ from typing import (
     Any,
     Dict,
     Optional,
+    Sequence,
     Union,
 )
 
@@ -29,8 +30,13 @@ class DefaultDBConnector(DBConnector):
         database_prefix: Optional[str] = None,
         database_args: Optional[Dict[str, Any]] = None,
         database_check_revision: bool = True,
+        database_read_replica_urls: Optional[Sequence[str]] = None,
     ):
-        """Create a default DB connector backed by a database."""
+        """Create a default DB connector backed by a database.
+
+        Reads are routed to `database_read_replica_urls` if given. See
+        [trulens.core.database.replica][trulens.core.database.replica].
+        """
         self._db: Union[DB, OpaqueWrapper]
         database_args = database_args or {}
 
@@ -44,6 +50,7 @@ class DefaultDBConnector(DBConnector):
                     "database_engine": database_engine,
                     "database_redact_keys": database_redact_keys,
                     "database_prefix": database_prefix,
+                    "database_read_replica_urls": database_read_replica_urls,
                 }.items()
                 if v is not None
             })
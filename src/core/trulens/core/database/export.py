@@ -0,0 +1,215 @@
+"""
+# Columnar export and import of records and feedback results
+
+[TruSession.export][trulens.core.session.TruSession.export] writes records,
+their feedback results and the apps and feedback definitions they refer to
+into a directory with one Parquet file per table. Rows are read from the
+database in chunks and streamed to the files as Arrow record batches so the
+export never holds more than a chunk in memory.
+
+```python
+from datetime import datetime, timedelta
+
+session.export(
+    "trulens_export/",
+    app_ids=["my_app"],
+    since=datetime.now() - timedelta(days=7),
+)
+
+other_session.import_("trulens_export/")
+```
+
+The files have the columns of the database tables: the numeric columns of
+records and feedback results (such as `latency_s`, `n_tokens` and `cost` of
+records, and `result` of feedback results) as Arrow numbers, next to the
+serialized JSON columns as strings. They can be read directly with `pyarrow`,
+`pandas` or other engines that read Parquet:
+
+```python
+import pandas as pd
+
+records = pd.read_parquet("trulens_export/records.parquet")
+records.groupby("app_id")["latency_s"].describe()
+```
+
+Encoded values of databases with a
+[StorageCodec][trulens.core.database.codec.StorageCodec] are decoded on export
+so that exports do not depend on the database they were written from.
+
+Requires the `pyarrow` package.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Union
+
+import sqlalchemy as sa
+from trulens.core.database.retention import ARCHIVE_TABLES
+from trulens.core.utils.imports import REQUIREMENT_PYARROW
+from trulens.core.utils.imports import OptionalImports
+
+with OptionalImports(messages=REQUIREMENT_PYARROW) as opt:
+    import pyarrow
+    import pyarrow.parquet
+
+EXPORT_TABLES: Tuple[str, ...] = ARCHIVE_TABLES
+"""Base names of the tables written to exports, in the order they are
+imported."""
+
+
+@dataclasses.dataclass
+class TransferResult:
+    """Counts of the rows exported or imported."""
+
+    apps: int = 0
+    """Number of app definitions."""
+
+    feedback_definitions: int = 0
+    """Number of feedback definitions."""
+
+    records: int = 0
+    """Number of records."""
+
+    feedback_results: int = 0
+    """Number of feedback results."""
+
+    files: List[Path] = dataclasses.field(default_factory=list)
+    """Files written or read."""
+
+    def add(self, table: str, n: int) -> None:
+        """Count `n` rows of the table with the given base name."""
+
+        field = {
+            "apps": "apps",
+            "feedback_defs": "feedback_definitions",
+            "records": "records",
+            "feedbacks": "feedback_results",
+        }[table]
+
+        setattr(self, field, getattr(self, field) + n)
+
+
+def arrow_schema(table: sa.Table) -> pyarrow.Schema:
+    """Arrow schema of the rows of a database table.
+
+    Float and integer columns map to Arrow numbers and all others to strings.
+    """
+
+    opt.assert_installed(pyarrow)
+
+    fields = []
+    for column in table.columns:
+        if isinstance(column.type, sa.Float):
+            arrow_type = pyarrow.float64()
+        elif isinstance(column.type, sa.Integer):
+            arrow_type = pyarrow.int64()
+        else:
+            arrow_type = pyarrow.string()
+
+        # Nullable regardless of the column as rows written by older
+        # versions may lack values.
+        fields.append(pyarrow.field(column.name, arrow_type))
+
+    return pyarrow.schema(fields)
+
+
+class ExportWriter:
+    """Streams batches of table rows to one Parquet file per table.
+
+    Files are named `<table>.parquet` after the base name of the table and
+    are only complete once the writer is closed.
+
+    Args:
+        path: The export directory. Created if it does not exist. Existing
+            files of the same names are replaced.
+
+        tables: The database table of each base name in `EXPORT_TABLES`.
+
+        compression: Parquet compression codec.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        tables: Mapping[str, sa.Table],
+        compression: str = "zstd",
+    ):
+        opt.assert_installed(pyarrow)
+
+        self.path = Path(path)
+        self.compression = compression
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._schemas = {
+            table: arrow_schema(tables[table]) for table in EXPORT_TABLES
+        }
+        self._writers: Dict[str, pyarrow.parquet.ParquetWriter] = {}
+
+    def write(self, tables: Mapping[str, List[Dict[str, Any]]]) -> None:
+        """Write a batch of rows by table base name."""
+
+        for table in EXPORT_TABLES:
+            rows = tables.get(table)
+            if not rows:
+                continue
+
+            schema = self._schemas[table]
+
+            writer = self._writers.get(table)
+            if writer is None:
+                writer = self._writers[table] = pyarrow.parquet.ParquetWriter(
+                    self.path / f"{table}.parquet",
+                    schema,
+                    compression=self.compression,
+                )
+
+            writer.write_batch(
+                pyarrow.RecordBatch.from_pylist(rows, schema=schema)
+            )
+
+    def close(self) -> List[Path]:
+        """Finish writing the files.
+
+        Returns:
+            The files written.
+        """
+
+        files = []
+        for table in EXPORT_TABLES:
+            writer = self._writers.pop(table, None)
+            if writer is not None:
+                writer.close()
+                files.append(self.path / f"{table}.parquet")
+
+        return files
+
+
+def read_export(
+    path: Union[str, Path], batch_size: int = 10000
+) -> Iterator[Tuple[str, Path, pyarrow.RecordBatch]]:
+    """Read the files of an export directory in batches.
+
+    Args:
+        path: The export directory.
+
+        batch_size: Maximum number of rows per batch.
+
+    Returns:
+        Iterator of table base names, files and record batches, in the order
+            of `EXPORT_TABLES`.
+    """
+
+    opt.assert_installed(pyarrow)
+
+    for table in EXPORT_TABLES:
+        file = Path(path) / f"{table}.parquet"
+        if not file.exists():
+            continue
+
+        for batch in pyarrow.parquet.ParquetFile(file).iter_batches(
+            batch_size=batch_size
+        ):
+            yield table, file, batch
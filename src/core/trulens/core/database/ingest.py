@@ -0,0 +1,614 @@
+"""
+# Batched record ingestion
+
+Records produced by apps in
+[BUFFERED][trulens.core.schema.app.RecordIngestMode.BUFFERED] ingest mode are
+handed to a [RecordIngestPipeline][trulens.core.database.ingest.RecordIngestPipeline]
+owned by the app's [DBConnector][trulens.core.database.connector.DBConnector].
+The pipeline queues records in a bounded queue and writes them out in batches
+from a background thread. A batch is flushed once it reaches `batch_size`
+records or once the oldest queued record has waited `flush_interval` seconds,
+whichever comes first.
+
+When the queue is full, the behaviour is determined by the
+[BackpressurePolicy][trulens.core.database.ingest.BackpressurePolicy].
+
+Records spilled to a file are kept across restarts: a new pipeline ingests the
+spill files left behind by pipelines of processes that are no longer running
+if they spilled to the same directory, as they do by default for the same
+database (see
+[default_spill_path][trulens.core.database.ingest.default_spill_path]).
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import dataclasses
+from enum import Enum
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+import threading
+import time
+from typing import Callable, Deque, List, Optional, Union
+import weakref
+
+from trulens.core.schema import record as mod_record_schema
+
+logger = logging.getLogger(__name__)
+
+_SPILL_NAME = re.compile(r"spill_(\d+)\.jsonl(\.replay|\.recover)?")
+"""Names of default spill files and of the files they are moved to while
+replayed or recovered, with the id of the process that spilled to them."""
+
+_spill_paths_lock = threading.Lock()
+_spill_paths: "weakref.WeakValueDictionary[Path, RecordIngestPipeline]" = (
+    weakref.WeakValueDictionary()
+)
+"""Pipelines of this process by their spill file."""
+
+
+def default_spill_path(database: str) -> Path:
+    """Spill file of this process for the database identified by `database`,
+    such as its url.
+
+    The file is in a directory of the database under `~/.trulens/spill` (or the
+    temporary directory if there is no home directory) so that pipelines of
+    later processes find it.
+    """
+
+    try:
+        root = Path.home() / ".trulens" / "spill"
+    except RuntimeError:
+        root = Path(tempfile.gettempdir()) / "trulens" / "spill"
+
+    digest = hashlib.sha256(database.encode()).hexdigest()[:16]
+
+    return root / digest / f"spill_{os.getpid()}.jsonl"
+
+
+def _process_exists(pid: int) -> bool:
+    """Whether a process with the given id is running."""
+
+    if os.name == "nt":
+        # Signal 0 is CTRL_C_EVENT on Windows.
+        import ctypes
+
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but owned by another user.
+        return True
+
+    return True
+
+
+class BackpressurePolicy(str, Enum):
+    """What to do with new records when the ingest queue is full."""
+
+    BLOCK = "block"
+    """Block the producing (app) thread until there is room in the queue."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest queued record to make room for the new one."""
+
+    SPILL = "spill"
+    """Append the new record to a local spill file. Spilled records are
+    ingested once the queue drains."""
+
+
+@dataclasses.dataclass
+class IngestMetrics:
+    """Counters describing the state of a
+    [RecordIngestPipeline][trulens.core.database.ingest.RecordIngestPipeline]."""
+
+    queue_depth: int = 0
+    """Number of records waiting in the queue."""
+
+    max_queue_depth: int = 0
+    """Largest number of records observed in the queue."""
+
+    enqueued: int = 0
+    """Number of records accepted into the queue."""
+
+    ingested: int = 0
+    """Number of records written to the database."""
+
+    dropped: int = 0
+    """Number of records dropped, either due to backpressure or due to
+    exceeding the retries for a failed batch."""
+
+    spilled: int = 0
+    """Number of records written to the spill file."""
+
+    failed_flushes: int = 0
+    """Number of batch writes that raised an error."""
+
+    flushes: int = 0
+    """Number of successful batch writes."""
+
+    last_flush_latency: Optional[float] = None
+    """Duration in seconds of the last successful batch write."""
+
+    total_flush_latency: float = 0.0
+    """Total duration in seconds of all successful batch writes."""
+
+    @property
+    def mean_flush_latency(self) -> Optional[float]:
+        """Average duration in seconds of successful batch writes."""
+
+        if self.flushes == 0:
+            return None
+
+        return self.total_flush_latency / self.flushes
+
+
+class RecordIngestPipeline:
+    """Bounded queue of records written out in batches by a background thread.
+
+    Args:
+        ingest_batch: Function that writes out a batch of records. Raising an
+            error causes the batch to be retried up to `max_retries` times.
+
+        max_queue_size: Maximum number of records held in memory.
+
+        batch_size: Maximum number of records written out by one call to
+            `ingest_batch`.
+
+        flush_interval: Maximum time in seconds a record waits in the queue
+            before being written out.
+
+        backpressure: What to do when the queue is full.
+
+        spill_path: File to spill records to under
+            [SPILL][trulens.core.database.ingest.BackpressurePolicy.SPILL]
+            backpressure and when batches fail. Defaults to
+            [default_spill_path][trulens.core.database.ingest.default_spill_path]
+            of an unnamed database. Records left in it, or in default spill
+            files of stopped processes next to it, are ingested.
+
+        max_retries: How many times a failed batch is retried before its
+            records are spilled (under `SPILL` backpressure) or dropped.
+    """
+
+    def __init__(
+        self,
+        ingest_batch: Callable[[List[mod_record_schema.Record]], None],
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 10.0,
+        backpressure: Union[BackpressurePolicy, str] = BackpressurePolicy.BLOCK,
+        spill_path: Optional[Union[str, Path]] = None,
+        max_retries: int = 3,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("`max_queue_size` must be positive.")
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be positive.")
+
+        self.ingest_batch = ingest_batch
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = BackpressurePolicy(backpressure)
+        self.max_retries = max_retries
+
+        if spill_path is None:
+            spill_path = default_spill_path("")
+        self.spill_path = Path(spill_path)
+        self._replay_path = self.spill_path.with_name(
+            self.spill_path.name + ".replay"
+        )
+        self._recover_path = self.spill_path.with_name(
+            self.spill_path.name + ".recover"
+        )
+
+        self._queue: Deque[mod_record_schema.Record] = deque()
+        self._oldest_enqueued_at: Optional[float] = None
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._spill_lock = threading.Lock()
+
+        self._next_replay_at: float = 0.0
+        self._flush_requested: bool = False
+        self._stopped: bool = False
+
+        self._metrics = IngestMetrics()
+
+        self._recover_spills()
+
+        self._thread = threading.Thread(
+            target=self._run, name="RecordIngestPipeline", daemon=True
+        )
+        self._thread.start()
+
+        # The running thread keeps the pipeline alive until it is stopped. Hold
+        # only a weak reference so that a stopped pipeline can be collected.
+        atexit.register(_stop_at_exit, weakref.ref(self))
+
+    @property
+    def metrics(self) -> IngestMetrics:
+        """A snapshot of the pipeline's counters."""
+
+        with self._lock:
+            metrics = dataclasses.replace(self._metrics)
+            metrics.queue_depth = len(self._queue)
+
+        return metrics
+
+    def put(self, record: mod_record_schema.Record) -> None:
+        """Queue a record for ingestion, applying the backpressure policy if
+        the queue is full."""
+
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Record ingest pipeline has been stopped.")
+
+            if len(self._queue) >= self.max_queue_size:
+                if self.backpressure == BackpressurePolicy.BLOCK:
+                    while (
+                        len(self._queue) >= self.max_queue_size
+                        and not self._stopped
+                    ):
+                        self._not_full.wait()
+
+                elif self.backpressure == BackpressurePolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._metrics.dropped += 1
+
+                elif self.backpressure == BackpressurePolicy.SPILL:
+                    self._spill([record])
+                    return
+
+            if len(self._queue) == 0:
+                self._oldest_enqueued_at = time.monotonic()
+
+            self._queue.append(record)
+            self._metrics.enqueued += 1
+            self._metrics.max_queue_depth = max(
+                self._metrics.max_queue_depth, len(self._queue)
+            )
+
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                # Wake the worker to start the flush deadline of a new batch or
+                # to write out a full one.
+                self._not_empty.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write out all queued (and spilled) records now.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the flush to finish.
+
+        Returns:
+            Whether all records were written out before the timeout.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._lock:
+            self._flush_requested = True
+            self._next_replay_at = 0.0
+            self._not_empty.notify()
+
+            while self._flush_requested and self._thread.is_alive():
+                remaining = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+
+            return len(self._queue) == 0 and not self.spill_path.exists()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Flush all queued records and stop the background thread."""
+
+        self.flush(timeout=timeout)
+
+        with self._lock:
+            self._stopped = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def _next_batch(self) -> Optional[List[mod_record_schema.Record]]:
+        """Wait until a batch is due and take it off the queue.
+
+        Returns an empty list if spilled records are to be replayed and None
+        once the pipeline is stopped and drained.
+        """
+
+        with self._lock:
+            while True:
+                if len(self._queue) >= self.batch_size:
+                    break
+
+                if len(self._queue) > 0 and (
+                    self._flush_requested or self._stopped
+                ):
+                    break
+
+                if len(self._queue) == 0:
+                    if self.spill_path.exists():
+                        replay_in = self._next_replay_at - time.monotonic()
+                        if replay_in <= 0:
+                            # Replay spilled records now that the queue is
+                            # empty.
+                            return []
+                    else:
+                        replay_in = None
+
+                    self._flush_requested = False
+                    self._idle.notify_all()
+
+                    if self._stopped:
+                        return None
+
+                    self._not_empty.wait(replay_in)
+                    continue
+
+                due = self._oldest_enqueued_at + self.flush_interval
+                remaining = due - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                self._not_empty.wait(remaining)
+
+            batch = [
+                self._queue.popleft()
+                for _ in range(min(self.batch_size, len(self._queue)))
+            ]
+            self._oldest_enqueued_at = (
+                time.monotonic() if len(self._queue) > 0 else None
+            )
+            self._not_full.notify_all()
+
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+
+            if batch is None:
+                return
+
+            if len(batch) == 0:
+                if not self._replay_spill():
+                    # Do not retry spilled records before the next flush
+                    # interval unless a flush is requested.
+                    with self._lock:
+                        self._next_replay_at = (
+                            time.monotonic() + self.flush_interval
+                        )
+                continue
+
+            self._ingest_with_retries(batch)
+
+    def _ingest_with_retries(
+        self, batch: List[mod_record_schema.Record]
+    ) -> bool:
+        for attempt in range(self.max_retries + 1):
+            start = time.monotonic()
+            try:
+                self.ingest_batch(batch)
+
+            except Exception as e:
+                with self._lock:
+                    self._metrics.failed_flushes += 1
+
+                logger.warning(
+                    "Failed to ingest batch of %s record(s) (attempt %s of %s): %s",
+                    len(batch),
+                    attempt + 1,
+                    self.max_retries + 1,
+                    e,
+                )
+
+                if attempt < self.max_retries and not self._stopped:
+                    # Back off exponentially, capped at the flush interval.
+                    time.sleep(min(2**attempt * 0.1, self.flush_interval))
+
+                continue
+
+            latency = time.monotonic() - start
+
+            with self._lock:
+                self._metrics.flushes += 1
+                self._metrics.ingested += len(batch)
+                self._metrics.last_flush_latency = latency
+                self._metrics.total_flush_latency += latency
+
+            return True
+
+        if self.backpressure == BackpressurePolicy.SPILL:
+            with self._lock:
+                self._spill(batch)
+        else:
+            logger.error(
+                "Dropping batch of %s record(s) after %s failed attempt(s).",
+                len(batch),
+                self.max_retries + 1,
+            )
+            with self._lock:
+                self._metrics.dropped += len(batch)
+
+        return False
+
+    def _spill(self, records: List[mod_record_schema.Record]) -> None:
+        """Append records to the spill file. Requires `_lock`."""
+
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with self._spill_lock, self.spill_path.open("a") as f:
+                for record in records:
+                    f.write(record.model_dump_json() + "\n")
+
+            self._metrics.spilled += len(records)
+
+        except Exception as e:
+            logger.error(
+                "Could not spill %s record(s) to %s: %s",
+                len(records),
+                self.spill_path,
+                e,
+            )
+            self._metrics.dropped += len(records)
+
+    def _recover_spills(self) -> None:
+        """Move the records in spill files left behind by stopped pipelines to
+        the spill file of this one."""
+
+        with _spill_paths_lock:
+            # Another pipeline of this process may be using the spill file.
+            owner = _spill_paths.get(self.spill_path)
+            _spill_paths[self.spill_path] = self
+
+        # A leftover file being recovered goes first so that it is not
+        # replaced by the next one.
+        leftovers = (
+            [] if owner is not None else [self._recover_path, self._replay_path]
+        )
+
+        if self.spill_path.parent.is_dir():
+            for path in sorted(self.spill_path.parent.iterdir()):
+                match = _SPILL_NAME.fullmatch(path.name)
+                if match is None or path in leftovers:
+                    continue
+
+                pid = int(match.group(1))
+                if pid == os.getpid() or _process_exists(pid):
+                    continue
+
+                leftovers.append(path)
+
+        for path in leftovers:
+            if path != self._recover_path and self._recover_path.exists():
+                # Failed to recover the previous one.
+                break
+
+            try:
+                if path != self._recover_path:
+                    # Claim the file. Only one of the pipelines starting at
+                    # the same time gets it.
+                    os.replace(path, self._recover_path)
+
+                with self._spill_lock:
+                    with self._recover_path.open(
+                        "rb"
+                    ) as src, self.spill_path.open("ab") as dst:
+                        shutil.copyfileobj(src, dst)
+                        # The last record may have been cut short.
+                        dst.write(b"\n")
+
+                    self._recover_path.unlink()
+
+            except FileNotFoundError:
+                continue
+
+            except Exception as e:
+                logger.error(
+                    "Could not recover spilled records from %s: %s", path, e
+                )
+                continue
+
+            logger.info("Recovered spilled records from %s.", path)
+
+    def _replay_spill(self) -> bool:
+        """Ingest records from the spill file.
+
+        Returns:
+            Whether all spilled records were ingested.
+        """
+
+        replay_path = self._replay_path
+
+        with self._spill_lock:
+            # A replay file is left over if spilling its records again failed.
+            if not replay_path.exists():
+                if not self.spill_path.exists():
+                    return True
+                # Move the file so records spilled during replay go to a new
+                # one.
+                os.replace(self.spill_path, replay_path)
+
+        try:
+            ok = self._replay_file(replay_path)
+
+        except Exception as e:
+            logger.error("Failed to replay spilled records: %s", e)
+
+            # Spill the records again, including those already ingested.
+            with self._spill_lock:
+                with replay_path.open("rb") as src, self.spill_path.open(
+                    "ab"
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+
+            ok = False
+
+        replay_path.unlink()
+
+        return ok
+
+    def _replay_file(self, replay_path: Path) -> bool:
+        batch = []
+        ok = True
+        with replay_path.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                try:
+                    record = mod_record_schema.Record.model_validate(
+                        json.loads(line)
+                    )
+                except ValueError as e:
+                    # Cut short when the spilling process stopped.
+                    logger.error("Dropping unreadable spilled record: %s", e)
+                    with self._lock:
+                        self._metrics.dropped += 1
+                    continue
+
+                batch.append(record)
+
+                if len(batch) >= self.batch_size:
+                    ok = self._ingest_with_retries(batch) and ok
+                    batch = []
+
+        if batch:
+            ok = self._ingest_with_retries(batch) and ok
+
+        return ok
+
+
+def _stop_at_exit(pipeline_ref: weakref.ref[RecordIngestPipeline]) -> None:
+    pipeline = pipeline_ref()
+
+    if pipeline is None:
+        return
+
+    try:
+        pipeline.stop(timeout=pipeline.flush_interval)
+    except Exception as e:
+        logger.error("Failed to flush records at exit: %s", e)
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import traceback
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from trulens.core.database import orm as mod_orm
 from trulens.core.database.base import DB
+from trulens.core.database.codec import is_encoded
 from trulens.core.database.legacy.migration import MIGRATION_UNKNOWN_STR
 from trulens.core.database.legacy.migration import VersionException
 from trulens.core.database.migrations import DbRevisions
@@ -15,15 +18,140 @@ from trulens.core.schema import base as mod_base_schema
 from trulens.core.schema import feedback as mod_feedback_schema
 from trulens.core.schema import record as mod_record_schema
 from trulens.core.utils.pyschema import FunctionOrMethod
+from trulens.core.utils.serial import SerialModel
 
-sql_alchemy_migration_versions: List[int] = [1, 2, 3]
+
+def _validate_json(
+    model: Type[SerialModel], json_str: Optional[str]
+) -> Optional[SerialModel]:
+    if json_str is None or json_str == MIGRATION_UNKNOWN_STR:
+        return None
+
+    return model.model_validate_json(json_str)
+
+
+def migrate_alembic_3_to_10(db: DB, batch_size: int = 1000) -> None:
+    """Fill in the latency, token and cost columns added in revision 10 from
+    the JSON columns of existing records and feedback results.
+
+    Rows are updated in batches of `batch_size`, each in its own transaction.
+    """
+
+    for orm_class, primary_key, has_perf in [
+        (db.orm.Record, db.orm.Record.record_id, True),
+        (
+            db.orm.FeedbackResult,
+            db.orm.FeedbackResult.feedback_result_id,
+            False,
+        ),
+    ]:
+        columns = [primary_key, orm_class.cost_json]
+        if has_perf:
+            columns.append(orm_class.perf_json)
+
+        last = None
+        while True:
+            with Session(db.engine) as session, session.begin():
+                stmt = select(*columns).order_by(primary_key).limit(batch_size)
+                if last is not None:
+                    stmt = stmt.where(primary_key > last)
+
+                rows = session.execute(stmt).all()
+                if len(rows) == 0:
+                    break
+
+                updates = []
+                for row in rows:
+                    values = {
+                        primary_key.key: row[0],
+                        **mod_orm.cost_columns(
+                            _validate_json(mod_base_schema.Cost, row.cost_json)
+                        ),
+                    }
+                    if has_perf:
+                        values.update(
+                            mod_orm.perf_columns(
+                                _validate_json(
+                                    mod_base_schema.Perf, row.perf_json
+                                )
+                            )
+                        )
+                    updates.append(values)
+
+                # Bulk update by primary key.
+                session.execute(update(orm_class), updates)
+
+                last = rows[-1][0]
+
+
+def migrate_alembic_10_to_11(db: DB) -> None:
+    """Count the existing feedback results into the feedback counts table
+    added in revision 11."""
+
+    db.rebuild_feedback_counts()
+
+
+def migrate_alembic_11_to_13(db: DB, batch_size: int = 1000) -> None:
+    """Fill in the metadata column of records added in revision 13 from their
+    serialized records, which may be encoded.
+
+    Rows are updated in batches of `batch_size`, each in its own transaction.
+    """
+
+    rec = db.orm.Record
+
+    last = None
+    while True:
+        with Session(db.engine) as session, session.begin():
+            stmt = (
+                select(rec.record_id, rec.record_json)
+                .order_by(rec.record_id)
+                .limit(batch_size)
+            )
+            if last is not None:
+                stmt = stmt.where(rec.record_id > last)
+
+            rows = session.execute(stmt).all()
+            if len(rows) == 0:
+                break
+
+            record_jsons = db._decode_json(
+                session, [row.record_json for row in rows]
+            )
+
+            # Bulk update by primary key.
+            session.execute(
+                update(rec),
+                [
+                    {
+                        "record_id": row.record_id,
+                        "meta": _record_meta(record_json),
+                    }
+                    for row, record_json in zip(rows, record_jsons)
+                ],
+            )
+
+            last = rows[-1].record_id
+
+
+def _record_meta(record_json: Optional[str]) -> Optional[str]:
+    if record_json is None or record_json == MIGRATION_UNKNOWN_STR:
+        return None
+
+    return json.dumps(json.loads(record_json).get("meta"))
+
+
+sql_alchemy_migration_versions: List[int] = [1, 2, 3, 10, 11, 13]
 """DB versions."""
 
 sqlalchemy_upgrade_paths: Dict[int, Tuple[int, Callable[[DB]]]] = {
     # Dict Structure:
     # from_version: (to_version, migrate_method)
-    # Example:
-    # 1: (2, migrate_alembic_1_to_2)
+    1: (10, migrate_alembic_3_to_10),
+    2: (10, migrate_alembic_3_to_10),
+    3: (10, migrate_alembic_3_to_10),
+    10: (11, migrate_alembic_10_to_11),
+    11: (13, migrate_alembic_11_to_13),
 }
 """A DAG of upgrade functions to get to most recent DB."""
 
@@ -86,10 +214,13 @@ def _sql_alchemy_serialization_asserts(db: DB) -> None:
 
                             # Do not check Nullables
                             if db_json_str is not None:
+                                if is_encoded(db_json_str):
+                                    db_json_str = db._decode_json(
+                                        session, [db_json_str]
+                                    )[0]
+
                                 # Test deserialization
-                                test_json = json.loads(
-                                    getattr(db_record, attr_name)
-                                )
+                                test_json = json.loads(db_json_str)
 
                                 # special implementation checks for serialized classes
                                 if "implementation" in test_json:
@@ -0,0 +1,50 @@
+"""Add latency, token and cost columns to the records and feedbacks tables.
+
+The columns of existing rows are filled in by the data migration in
+`trulens.core.database.migrations.data`.
+
+Revision ID: 10
+Revises: 9
+Create Date: 2024-09-12 10:14:41.820193
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "10"
+down_revision = "9"
+branch_labels = None
+depends_on = "9"
+
+COLUMNS = [
+    ("records", "latency_s", sa.Float()),
+    ("records", "n_tokens", sa.Integer()),
+    ("records", "cost", sa.Float()),
+    ("records", "start_ts", sa.Float()),
+    ("feedbacks", "n_tokens", sa.Integer()),
+    ("feedbacks", "cost", sa.Float()),
+]
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    for table, column, type_ in COLUMNS:
+        op.add_column(prefix + table, sa.Column(column, type_, nullable=True))
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    for table in ["feedbacks", "records"]:
+        with op.batch_alter_table(prefix + table) as batch_op:
+            for _table, column, _ in reversed(COLUMNS):
+                if _table == table:
+                    batch_op.drop_column(column)
@@ -0,0 +1,45 @@
+"""Add feedback_counts table with the number of feedback results by feedback
+definition and status.
+
+The counts of existing feedback results are filled in by the data migration in
+`trulens.core.database.migrations.data`.
+
+Revision ID: 11
+Revises: 10
+Create Date: 2024-09-13 16:02:55.316478
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "11"
+down_revision = "10"
+branch_labels = None
+depends_on = "10"
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.create_table(
+        prefix + "feedback_counts",
+        sa.Column(
+            "feedback_definition_id", sa.VARCHAR(length=256), nullable=False
+        ),
+        sa.Column("status", sa.VARCHAR(length=64), nullable=False),
+        sa.Column("n_results", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("feedback_definition_id", "status"),
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.drop_table(prefix + "feedback_counts")
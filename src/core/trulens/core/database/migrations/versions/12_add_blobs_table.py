@@ -0,0 +1,39 @@
+"""Add blobs table with large string values shared by encoded records and
+feedback calls.
+
+Revision ID: 12
+Revises: 11
+Create Date: 2024-09-16 10:41:27.903215
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "12"
+down_revision = "11"
+branch_labels = None
+depends_on = "11"
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.create_table(
+        prefix + "blobs",
+        sa.Column("blob_id", sa.VARCHAR(length=64), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("blob_id"),
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.drop_table(prefix + "blobs")
@@ -0,0 +1,39 @@
+"""Add a column with the metadata of records to the records table.
+
+The column of existing rows is filled in by the data migration in
+`trulens.core.database.migrations.data`.
+
+Revision ID: 13
+Revises: 12
+Create Date: 2024-09-18 09:52:13.480215
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "13"
+down_revision = "12"
+branch_labels = None
+depends_on = "12"
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.add_column(
+        prefix + "records", sa.Column("meta", sa.Text(), nullable=True)
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    with op.batch_alter_table(prefix + "records") as batch_op:
+        batch_op.drop_column("meta")
@@ -0,0 +1,51 @@
+"""Add unique index on app_id of the apps table.
+
+Revision ID: 7
+Revises: 6
+Create Date: 2024-09-02 10:12:41.204118
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7"
+down_revision = "6"
+branch_labels = None
+depends_on = "6"
+
+
+def is_snowflake_engine(config) -> bool:
+    return config.attributes["engine"].name == "snowflake"
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    if is_snowflake_engine(config):
+        # Snowflake does not support indexes on standard tables. Upserts of
+        # apps there are merges which do not need a unique constraint.
+        return
+
+    # Revision 5 added app_id without making it the primary key of existing
+    # tables. Upserts of apps need a unique constraint to conflict on.
+    op.create_index(
+        prefix + "apps_app_id_idx",
+        prefix + "apps",
+        ["app_id"],
+        unique=True,
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    if is_snowflake_engine(config):
+        return
+
+    op.drop_index(prefix + "apps_app_id_idx", table_name=prefix + "apps")
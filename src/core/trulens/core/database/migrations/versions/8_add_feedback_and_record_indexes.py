@@ -0,0 +1,63 @@
+"""Add secondary indexes to the records and feedbacks tables.
+
+Revision ID: 8
+Revises: 7
+Create Date: 2024-09-05 14:03:27.510394
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8"
+down_revision = "7"
+branch_labels = None
+depends_on = "7"
+
+
+def is_snowflake_engine(config) -> bool:
+    return config.attributes["engine"].name == "snowflake"
+
+
+INDEXES = [
+    # Reading records of some apps ordered by timestamp.
+    ("records", "records_app_id_ts_idx", ["app_id", "ts", "record_id"]),
+    # Reading records of all apps ordered by timestamp.
+    ("records", "records_ts_idx", ["ts", "record_id"]),
+    # Feedback results of a record.
+    ("feedbacks", "feedbacks_record_id_idx", ["record_id"]),
+    # Join of feedback results with their definitions.
+    (
+        "feedbacks",
+        "feedbacks_feedback_definition_id_idx",
+        ["feedback_definition_id"],
+    ),
+    # Polling of feedback results to evaluate by the deferred evaluator.
+    ("feedbacks", "feedbacks_status_last_ts_idx", ["status", "last_ts"]),
+]
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    if is_snowflake_engine(config):
+        # Snowflake does not support indexes on standard tables.
+        return
+
+    for table, index, columns in INDEXES:
+        op.create_index(prefix + index, prefix + table, columns)
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    if is_snowflake_engine(config):
+        return
+
+    for table, index, _ in reversed(INDEXES):
+        op.drop_index(prefix + index, table_name=prefix + table)
@@ -0,0 +1,42 @@
+"""Add claimed_by and lease_until columns to feedbacks table.
+
+Revision ID: 9
+Revises: 8
+Create Date: 2024-09-09 11:26:05.187342
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9"
+down_revision = "8"
+branch_labels = None
+depends_on = "8"
+
+
+def upgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    op.add_column(
+        prefix + "feedbacks",
+        sa.Column("claimed_by", sa.VARCHAR(length=256), nullable=True),
+    )
+    op.add_column(
+        prefix + "feedbacks",
+        sa.Column("lease_until", sa.Float(), nullable=True),
+    )
+
+
+def downgrade(config) -> None:
+    prefix = config.get_main_option("trulens.table_prefix")
+
+    if prefix is None:
+        raise RuntimeError("trulens.table_prefix is not set")
+
+    with op.batch_alter_table(prefix + "feedbacks") as batch_op:
+        batch_op.drop_column("lease_until")
+        batch_op.drop_column("claimed_by")
@@ -3,12 +3,14 @@ from __future__ import annotations
 import abc
 import functools
 from sqlite3 import Connection as SQLite3Connection
-from typing import ClassVar, Dict, Generic, Type, TypeVar
+from typing import Any, ClassVar, Dict, Generic, Optional, Type, TypeVar
 
 from sqlalchemy import VARCHAR
 from sqlalchemy import Column
 from sqlalchemy import Engine
 from sqlalchemy import Float
+from sqlalchemy import Index
+from sqlalchemy import Integer
 from sqlalchemy import Text
 from sqlalchemy import event
 from sqlalchemy.ext.declarative import declared_attr
@@ -18,7 +20,9 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.schema import MetaData
 from trulens.core.database.base import DEFAULT_DATABASE_PREFIX
+from trulens.core.database.codec import StorageCodec
 from trulens.core.schema import app as mod_app_schema
+from trulens.core.schema import base as mod_base_schema
 from trulens.core.schema import dataset as mod_dataset_schema
 from trulens.core.schema import feedback as mod_feedback_schema
 from trulens.core.schema import groundtruth as mod_groundtruth_schema
@@ -38,6 +42,41 @@ TYPE_ID = VARCHAR(256)
 """Database type for unique IDs."""
 
 
+def _with_indexes(ddl, target, bind, dialect, **kwargs) -> bool:
+    """Whether to create secondary indexes in the given dialect.
+
+    Snowflake does not support indexes on standard tables.
+    """
+
+    return dialect.name != "snowflake"
+
+
+def perf_columns(perf: Optional[mod_base_schema.Perf]) -> Dict[str, Any]:
+    """Values of the `latency_s` and `start_ts` columns denormalized from a
+    [Perf][trulens.core.schema.base.Perf]."""
+
+    if perf is None:
+        return dict(latency_s=None, start_ts=None)
+
+    try:
+        start_ts = perf.start_time.timestamp()
+    except (OverflowError, ValueError, OSError):
+        # Placeholder perfs like `Perf.min()` have no valid timestamp.
+        start_ts = None
+
+    return dict(latency_s=perf.latency.total_seconds(), start_ts=start_ts)
+
+
+def cost_columns(cost: Optional[mod_base_schema.Cost]) -> Dict[str, Any]:
+    """Values of the `n_tokens` and `cost` columns denormalized from a
+    [Cost][trulens.core.schema.base.Cost]."""
+
+    if cost is None:
+        return dict(n_tokens=None, cost=None)
+
+    return dict(n_tokens=cost.n_tokens, cost=cost.cost)
+
+
 class BaseWithTablePrefix:  # to be mixed into DeclarativeBase or new_declarative_base()
     # Only for type hints or isinstance, issubclass checks.
     """ORM base class except with `__tablename__` defined in terms
@@ -112,6 +151,8 @@ class ORM(abc.ABC, Generic[T]):
     FeedbackDefinition: Type[T]
     Record: Type[T]
     FeedbackResult: Type[T]
+    FeedbackCount: Type[T]
+    Blob: Type[T]
     GroundTruth: Type[T]
     Dataset: Type[T]
 
@@ -213,6 +254,22 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
 
             _table_base_name = "records"
 
+            @declared_attr.directive
+            def __table_args__(cls):
+                # Match the filtering by app_id and ordering by (ts, record_id)
+                # done when reading records.
+                return (
+                    Index(
+                        cls._table_prefix + "records_app_id_ts_idx",
+                        "app_id",
+                        "ts",
+                        "record_id",
+                    ).ddl_if(callable_=_with_indexes),
+                    Index(
+                        cls._table_prefix + "records_ts_idx", "ts", "record_id"
+                    ).ddl_if(callable_=_with_indexes),
+                )
+
             record_id = Column(TYPE_ID, nullable=False, primary_key=True)
             app_id = Column(TYPE_ID, nullable=False)  # foreign key
 
@@ -224,6 +281,17 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
             cost_json = Column(TYPE_JSON, nullable=False)
             perf_json = Column(TYPE_JSON, nullable=False)
 
+            # Denormalized from perf_json and cost_json for reading and
+            # filtering without parsing JSON. Null if not known.
+            latency_s = Column(Float, nullable=True)
+            start_ts = Column(TYPE_TIMESTAMP, nullable=True)
+            n_tokens = Column(Integer, nullable=True)
+            cost = Column(Float, nullable=True)
+
+            # Denormalized from record_json, and never encoded, for grouping
+            # by metadata in SQL. Null if not known.
+            meta = Column(TYPE_JSON, nullable=True)
+
             app = relationship(
                 "AppDefinition",
                 backref=backref("records", cascade="all,delete"),
@@ -234,8 +302,16 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
 
             @classmethod
             def parse(
-                cls, obj: mod_record_schema.Record, redact_keys: bool = False
+                cls,
+                obj: mod_record_schema.Record,
+                redact_keys: bool = False,
+                codec: Optional[StorageCodec] = None,
+                blobs: Optional[Dict[str, str]] = None,
             ) -> ORM.Record:
+                record_json = json_str_of_obj(obj, redact_keys=redact_keys)
+                if codec is not None:
+                    record_json = codec.encode(record_json, blobs=blobs)
+
                 return cls(
                     record_id=obj.record_id,
                     app_id=obj.app_id,
@@ -245,7 +321,7 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
                     output=json_str_of_obj(
                         obj.main_output, redact_keys=redact_keys
                     ),
-                    record_json=json_str_of_obj(obj, redact_keys=redact_keys),
+                    record_json=record_json,
                     tags=obj.tags,
                     ts=obj.ts.timestamp(),
                     cost_json=json_str_of_obj(
@@ -254,6 +330,9 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
                     perf_json=json_str_of_obj(
                         obj.perf, redact_keys=redact_keys
                     ),
+                    meta=json_str_of_obj(obj.meta, redact_keys=redact_keys),
+                    **perf_columns(obj.perf),
+                    **cost_columns(obj.cost),
                 )
 
         class FeedbackResult(base):
@@ -267,6 +346,27 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
 
             _table_base_name = "feedbacks"
 
+            @declared_attr.directive
+            def __table_args__(cls):
+                # Match the lookups by record, by definition, and the polling
+                # of feedback results by status and age done by the evaluator.
+                return (
+                    Index(
+                        cls._table_prefix + "feedbacks_record_id_idx",
+                        "record_id",
+                    ).ddl_if(callable_=_with_indexes),
+                    Index(
+                        cls._table_prefix
+                        + "feedbacks_feedback_definition_id_idx",
+                        "feedback_definition_id",
+                    ).ddl_if(callable_=_with_indexes),
+                    Index(
+                        cls._table_prefix + "feedbacks_status_last_ts_idx",
+                        "status",
+                        "last_ts",
+                    ).ddl_if(callable_=_with_indexes),
+                )
+
             feedback_result_id = Column(
                 TYPE_ID, nullable=False, primary_key=True
             )
@@ -283,6 +383,15 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
             cost_json = Column(TYPE_JSON, nullable=False)
             multi_result = Column(TYPE_JSON)
 
+            # Denormalized from cost_json. Null if not known.
+            n_tokens = Column(Integer, nullable=True)
+            cost = Column(Float, nullable=True)
+
+            # Lease of a deferred evaluator on this feedback result. Only
+            # written by the claim, renew, and release operations of the DB.
+            claimed_by = Column(TYPE_ID, nullable=True)
+            lease_until = Column(TYPE_TIMESTAMP, nullable=True)
+
             record = relationship(
                 "Record",
                 backref=backref("feedback_results", cascade="all,delete"),
@@ -304,7 +413,15 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
                 cls,
                 obj: mod_feedback_schema.FeedbackResult,
                 redact_keys: bool = False,
+                codec: Optional[StorageCodec] = None,
+                blobs: Optional[Dict[str, str]] = None,
             ) -> ORM.FeedbackResult:
+                calls_json = json_str_of_obj(
+                    dict(calls=obj.calls), redact_keys=redact_keys
+                )
+                if codec is not None:
+                    calls_json = codec.encode(calls_json, blobs=blobs)
+
                 return cls(
                     feedback_result_id=obj.feedback_result_id,
                     record_id=obj.record_id,
@@ -312,17 +429,47 @@ def new_orm(base: Type[T]) -> Type[ORM[T]]:
                     last_ts=obj.last_ts.timestamp(),
                     status=obj.status.value,
                     error=obj.error,
-                    calls_json=json_str_of_obj(
-                        dict(calls=obj.calls), redact_keys=redact_keys
-                    ),
+                    calls_json=calls_json,
                     result=obj.result,
                     name=obj.name,
                     cost_json=json_str_of_obj(
                         obj.cost, redact_keys=redact_keys
                     ),
                     multi_result=obj.multi_result,
+                    **cost_columns(obj.cost),
                 )
 
+        class FeedbackCount(base):
+            """Number of feedback results of a feedback definition with a
+            status.
+
+            Maintained by the writes of
+            [SQLAlchemyDB][trulens.core.database.sqlalchemy.SQLAlchemyDB] to
+            feedback results so that counts can be read without scanning the
+            feedback results table.
+            """
+
+            _table_base_name = "feedback_counts"
+
+            feedback_definition_id = Column(
+                TYPE_ID, nullable=False, primary_key=True
+            )
+            status = Column(VARCHAR(64), nullable=False, primary_key=True)
+            n_results = Column(Integer, nullable=False)
+
+        class Blob(base):
+            """Large string value shared by serialized records and feedback
+            calls encoded with a
+            [StorageCodec][trulens.core.database.codec.StorageCodec].
+
+            Blobs are keyed by the hash of their content and never updated.
+            """
+
+            _table_base_name = "blobs"
+
+            blob_id = Column(VARCHAR(64), nullable=False, primary_key=True)
+            content = Column(Text, nullable=False)
+
         class GroundTruth(base):
             """
             ORM class for [GroundTruth][trulens.core.schema.groundtruth.GroundTruth].
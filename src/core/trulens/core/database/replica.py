@@ -0,0 +1,335 @@
+"""
+# Read replicas
+
+[SQLAlchemyDB][trulens.core.database.sqlalchemy.SQLAlchemyDB] can route its
+read-only methods, such as `get_records_and_feedback`, `get_feedback`,
+`get_apps`, the leaderboard and exports, to read replicas of the database so
+that dashboards and analytical scans do not compete with the apps and
+evaluators writing to the primary. Writes always go to the primary.
+
+```python
+from trulens.core.database.replica import ReplicaOptions
+
+session = TruSession(
+    database_url="postgresql://primary/trulens",
+    database_read_replica_urls=["postgresql://replica/trulens"],
+)
+
+# Or, with other settings:
+session = TruSession(
+    database_url="postgresql://primary/trulens",
+    database_args=dict(
+        read_replicas=ReplicaOptions(
+            urls=["postgresql://replica/trulens"], max_staleness=30.0
+        )
+    ),
+)
+```
+
+A replica is read from only if its replication lag is at most
+`max_staleness` seconds. The lag is measured with
+[replication_lag][trulens.core.database.replica.replication_lag] (or
+`lag_query`) at most every `check_interval` seconds. Reads fall back to the
+primary if no replica is fresh enough or reachable; replicas that fail to
+connect are skipped for `retry_interval` seconds.
+
+Unless `read_your_writes` is disabled, reads also go to the primary for
+`max_staleness` seconds after each write by the same database instance so
+that a process sees its own writes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+import math
+import threading
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class ReplicaOptions:
+    """Read replicas of a database and when to read from them."""
+
+    urls: List[str] = dataclasses.field(default_factory=list)
+    """Urls of the read replicas."""
+
+    max_staleness: float = 5.0
+    """Seconds of replication lag tolerated for reads."""
+
+    check_interval: float = 5.0
+    """Seconds a measurement of the replication lag of a replica is used for
+    before it is measured again."""
+
+    retry_interval: float = 30.0
+    """Seconds a replica that failed to connect is not read from."""
+
+    read_your_writes: bool = True
+    """Read from the primary for `max_staleness` seconds after writing."""
+
+    lag_query: Optional[str] = None
+    """Query returning the replication lag of a replica in seconds. Defaults
+    to the one of the dialect, see
+    [replication_lag][trulens.core.database.replica.replication_lag]."""
+
+    engine_params: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    """Sqlalchemy-related engine params of the replicas, in addition to their
+    url."""
+
+    def __post_init__(self):
+        if self.max_staleness < 0:
+            raise ValueError("`max_staleness` must not be negative.")
+
+
+@dataclasses.dataclass
+class ReplicaStats:
+    """Counters describing the routing of reads by a
+    [ReplicaRouter][trulens.core.database.replica.ReplicaRouter]."""
+
+    replica_reads: int = 0
+    """Number of reads from replicas."""
+
+    primary_reads: int = 0
+    """Number of reads that fell back to the primary."""
+
+    stale: int = 0
+    """Number of times a replica was skipped for lagging behind by more than
+    `max_staleness`."""
+
+    failures: int = 0
+    """Number of times a replica failed to connect or to report its lag."""
+
+
+def replication_lag(connection: sa.Connection) -> float:
+    """Seconds a replica lags behind its primary.
+
+    Measured on postgres from the replay position of the write-ahead log and
+    on mysql from the replica status. Databases that are not replicas report
+    no lag, as do other dialects whose lag cannot be measured. Replicas whose
+    replication is not running report an infinite lag.
+    """
+
+    dialect = connection.dialect.name
+
+    if dialect == "postgresql":
+        in_recovery, caught_up, lag = connection.execute(
+            sa.text(
+                "SELECT pg_is_in_recovery(), "
+                "pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn(), "
+                "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+            )
+        ).one()
+
+        if not in_recovery or caught_up:
+            return 0.0
+
+        return math.inf if lag is None else float(lag)
+
+    if dialect == "mysql":
+        try:
+            status = (
+                connection.exec_driver_sql("SHOW REPLICA STATUS")
+                .mappings()
+                .first()
+            )
+        except sa.exc.DBAPIError:
+            # Before mysql 8.0.22.
+            status = (
+                connection.exec_driver_sql("SHOW SLAVE STATUS")
+                .mappings()
+                .first()
+            )
+
+        if status is None:
+            return 0.0
+
+        lag = status.get(
+            "Seconds_Behind_Source", status.get("Seconds_Behind_Master")
+        )
+
+        return math.inf if lag is None else float(lag)
+
+    return 0.0
+
+
+class _Replica:
+    def __init__(self, url: str, options: ReplicaOptions, **session_params):
+        self.engine = sa.create_engine(
+            url,
+            **{
+                "pool_recycle": 300,
+                "pool_pre_ping": True,
+                **options.engine_params,
+            },
+        )
+        self.session = sessionmaker(self.engine, **session_params)
+
+        self.lag: Optional[float] = None
+        self.measured_at: float = -math.inf
+        self.failed_at: float = -math.inf
+
+        self.lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class ReplicaRouter:
+    """Picks the replica to run each read on.
+
+    Args:
+        options: The replicas and when to read from them.
+
+        **session_params: Sqlalchemy-related session params.
+    """
+
+    def __init__(self, options: ReplicaOptions, **session_params):
+        self.options = options
+
+        self._replicas = [
+            _Replica(url, options, **session_params) for url in options.urls
+        ]
+        self._next: int = 0
+
+        self._written_at: float = -math.inf
+
+        self._lock = threading.Lock()
+        self._stats = ReplicaStats()
+
+    @property
+    def stats(self) -> ReplicaStats:
+        """A snapshot of the router's counters."""
+
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def wrote(self) -> None:
+        """Note a write to the primary."""
+
+        self._written_at = time.monotonic()
+
+    def begin(self) -> Optional[ContextManager[sa.orm.Session]]:
+        """Begin a transaction on a replica fresh enough to read from.
+
+        Returns:
+            None if the read should go to the primary instead.
+        """
+
+        session = self._connect()
+
+        with self._lock:
+            if session is None:
+                self._stats.primary_reads += 1
+            else:
+                self._stats.replica_reads += 1
+
+        if session is None:
+            return None
+
+        return _transaction(session)
+
+    def dispose(self) -> None:
+        """Close the connections to the replicas."""
+
+        for replica in self._replicas:
+            replica.engine.dispose()
+
+    def _connect(self) -> Optional[sa.orm.Session]:
+        now = time.monotonic()
+
+        if (
+            self.options.read_your_writes
+            and now - self._written_at < self.options.max_staleness
+        ):
+            return None
+
+        with self._lock:
+            # Spread reads over the replicas.
+            start = self._next
+            self._next = (self._next + 1) % max(1, len(self._replicas))
+
+        for i in range(len(self._replicas)):
+            replica = self._replicas[(start + i) % len(self._replicas)]
+
+            if now - replica.failed_at < self.options.retry_interval:
+                continue
+
+            session = replica.session()
+            try:
+                lag = self._lag(replica, session, now)
+
+                if lag > self.options.max_staleness:
+                    with self._lock:
+                        self._stats.stale += 1
+                    session.close()
+                    continue
+
+                # Connect now so that unreachable replicas fall back to the
+                # primary before the read starts.
+                session.connection()
+
+            except sa.exc.DBAPIError as e:
+                session.close()
+
+                replica.failed_at = now
+                with self._lock:
+                    self._stats.failures += 1
+
+                logger.warning(
+                    "Reading from the primary database as replica %s failed: %s",
+                    replica.name,
+                    e,
+                )
+                continue
+
+            return session
+
+        return None
+
+    def _lag(
+        self, replica: _Replica, session: sa.orm.Session, now: float
+    ) -> float:
+        """Replication lag of `replica`, measured on `session` if the last
+        measurement is older than `check_interval`."""
+
+        # Other threads reading meanwhile use the prior measurement.
+        if (
+            replica.lag is not None
+            and now - replica.measured_at < self.options.check_interval
+        ) or not replica.lock.acquire(blocking=replica.lag is None):
+            return replica.lag
+
+        try:
+            connection = session.connection()
+            if self.options.lag_query is not None:
+                lag = connection.execute(
+                    sa.text(self.options.lag_query)
+                ).scalar()
+                lag = math.inf if lag is None else float(lag)
+            else:
+                lag = replication_lag(connection)
+
+            replica.lag = lag
+            replica.measured_at = now
+
+            return lag
+
+        finally:
+            replica.lock.release()
+
+
+@contextlib.contextmanager
+def _transaction(session: sa.orm.Session) -> Iterator[sa.orm.Session]:
+    """Commit the transaction begun on `session` once done and close it."""
+
+    with session:
+        yield session
+        session.commit()
@@ -0,0 +1,230 @@
+"""
+# Retention of records and feedback results
+
+A [RetentionPolicy][trulens.core.database.retention.RetentionPolicy] describes
+which records are expired: those older than `max_age` or beyond the newest
+`max_records_per_app` records of their app. Applying a policy with
+[TruSession.apply_retention][trulens.core.session.TruSession.apply_retention]
+deletes expired records and their feedback results in small batches, each in
+its own transaction, so that a live database is never locked for long.
+
+```python
+from datetime import timedelta
+
+from trulens.core.database.retention import RetentionPolicy
+
+session.apply_retention(
+    RetentionPolicy(max_age=timedelta(days=30), keep_failed=True),
+    archive="archive/",
+)
+```
+
+If an archive directory is given, each batch is written there before it is
+deleted, by an [ArchiveWriter][trulens.core.database.retention.ArchiveWriter],
+as gzipped JSON lines or Parquet files. Archives can be opened as a read-only
+database with
+[SQLAlchemyDB.from_archive][trulens.core.database.sqlalchemy.SQLAlchemyDB.from_archive].
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import timedelta
+from enum import Enum
+import gzip
+import hashlib
+import json
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+from trulens.core.utils.imports import REQUIREMENT_PYARROW
+from trulens.core.utils.imports import OptionalImports
+
+with OptionalImports(messages=REQUIREMENT_PYARROW) as opt:
+    import pyarrow
+
+ARCHIVE_TABLES: Tuple[str, ...] = (
+    "apps",
+    "feedback_defs",
+    "records",
+    "feedbacks",
+)
+"""Base names of the tables written to archives, in the order they are
+restored."""
+
+_ARCHIVE_FILE_PATTERN = re.compile(
+    r"^(\d+)\.(" + "|".join(ARCHIVE_TABLES) + r")\.(jsonl\.gz|parquet)$"
+)
+
+
+class ArchiveFormat(str, Enum):
+    """Format of archive files."""
+
+    JSONL = "jsonl"
+    """Gzipped JSON lines with one row per line."""
+
+    PARQUET = "parquet"
+    """Parquet compressed with zstd. Requires the `pyarrow` package."""
+
+
+@dataclasses.dataclass
+class RetentionPolicy:
+    """Which records to delete.
+
+    A record is expired if it is older than `max_age` or if it is not one of
+    the newest `max_records_per_app` records of its app. Expired records are
+    deleted along with their feedback results unless kept by `keep_failed` or
+    `keep_sample`.
+    """
+
+    max_age: Optional[timedelta] = None
+    """Age after which records expire."""
+
+    max_records_per_app: Optional[int] = None
+    """Number of newest records of each app that do not expire."""
+
+    keep_failed: bool = False
+    """Keep expired records that have failed feedback results."""
+
+    keep_sample: float = 0.0
+    """Fraction of expired records to keep. Records are sampled by their id
+    so the same records are kept each time the policy is applied."""
+
+    def __post_init__(self):
+        if (
+            self.max_records_per_app is not None
+            and self.max_records_per_app < 0
+        ):
+            raise ValueError("`max_records_per_app` must not be negative.")
+        if not 0.0 <= self.keep_sample <= 1.0:
+            raise ValueError("`keep_sample` must be between 0 and 1.")
+
+    def sampled(self, record_id: str) -> bool:
+        """Whether the expired record with the given id is kept by
+        `keep_sample`."""
+
+        if self.keep_sample <= 0.0:
+            return False
+
+        digest = hashlib.sha256(record_id.encode()).digest()
+
+        return int.from_bytes(digest[:8], "big") < self.keep_sample * 2**64
+
+
+@dataclasses.dataclass
+class RetentionResult:
+    """Outcome of applying a
+    [RetentionPolicy][trulens.core.database.retention.RetentionPolicy]."""
+
+    records_deleted: int = 0
+    """Number of records deleted."""
+
+    feedback_results_deleted: int = 0
+    """Number of feedback results deleted with their records."""
+
+    records_sampled: int = 0
+    """Number of expired records kept by `keep_sample`."""
+
+    batches: int = 0
+    """Number of transactions that deleted records."""
+
+    archive_files: List[Path] = dataclasses.field(default_factory=list)
+    """Files written to the archive."""
+
+
+class ArchiveWriter:
+    """Writes batches of table rows to numbered files in a directory.
+
+    Each batch is written as one file per table named
+    `<batch number>.<table>.<extension>`. Numbering continues after the files
+    already in the directory.
+
+    Args:
+        path: The archive directory. Created if it does not exist.
+
+        format: Format of the files.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        format: Union[ArchiveFormat, str] = ArchiveFormat.JSONL,
+    ):
+        self.path = Path(path)
+        self.format = ArchiveFormat(format)
+
+        if self.format == ArchiveFormat.PARQUET:
+            opt.assert_installed(pyarrow)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._next = 1 + max(
+            (number for number, _, _ in archive_files(self.path)), default=0
+        )
+
+    def write(self, tables: Dict[str, List[Dict[str, Any]]]) -> List[Path]:
+        """Write a batch of rows by table base name.
+
+        Returns:
+            The files written.
+        """
+
+        written = []
+
+        for table in ARCHIVE_TABLES:
+            rows = tables.get(table)
+            if not rows:
+                continue
+
+            if self.format == ArchiveFormat.PARQUET:
+                file = self.path / f"{self._next:06d}.{table}.parquet"
+                pd.DataFrame(rows).to_parquet(file, compression="zstd")
+            else:
+                file = self.path / f"{self._next:06d}.{table}.jsonl.gz"
+                with gzip.open(file, "wt", encoding="utf-8") as f:
+                    for row in rows:
+                        f.write(json.dumps(row) + "\n")
+
+            written.append(file)
+
+        self._next += 1
+
+        return written
+
+
+def archive_files(path: Union[str, Path]) -> List[Tuple[int, str, Path]]:
+    """The batch number, table base name and path of each file in an archive
+    directory, in the order they were written."""
+
+    files = []
+    for file in Path(path).iterdir():
+        if (match := _ARCHIVE_FILE_PATTERN.match(file.name)) is not None:
+            files.append((int(match.group(1)), match.group(2), file))
+
+    return sorted(
+        files, key=lambda f: (f[0], ARCHIVE_TABLES.index(f[1]), f[2].name)
+    )
+
+
+def read_archive(
+    path: Union[str, Path],
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Read the rows of each file of an archive directory.
+
+    Returns:
+        Iterator of table base names and the rows of one file.
+    """
+
+    for _, table, file in archive_files(path):
+        if file.name.endswith(".parquet"):
+            opt.assert_installed(pyarrow)
+            df = pd.read_parquet(file)
+            # Missing values are read as NaN.
+            rows = df.astype(object).where(df.notna(), None).to_dict("records")
+        else:
+            with gzip.open(file, "rt", encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f if line.strip()]
+
+        yield table, rows
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime
+import functools
 import json
 import logging
-from sqlite3 import OperationalError
+import os
+from pathlib import Path
+import sqlite3
+from types import SimpleNamespace
 from typing import (
     Any,
+    Callable,
     ClassVar,
+    ContextManager,
     Dict,
     Generator,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
 )
 import warnings
@@ -24,12 +33,17 @@ from alembic.ddl.impl import DefaultImpl
 import numpy as np
 import pandas as pd
 from pydantic import Field
+from pydantic import PrivateAttr
 import sqlalchemy as sa
-from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text as sql_text
 from trulens.core.database import base as mod_db
+from trulens.core.database import codec as mod_codec
+from trulens.core.database import export as mod_export
 from trulens.core.database import orm as mod_orm
+from trulens.core.database import replica as mod_replica
+from trulens.core.database import retention as mod_retention
+from trulens.core.database import sqlite as mod_sqlite
 from trulens.core.database.base import DB
 from trulens.core.database.exceptions import DatabaseVersionException
 from trulens.core.database.legacy.migration import MIGRATION_UNKNOWN_STR
@@ -60,6 +74,40 @@ from trulens.core.utils.text import UNICODE_STOP
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+RECORDS_AND_FEEDBACK_COLUMNS: Tuple[str, ...] = (
+    "app_id",
+    "app_json",
+    "type",
+    "record_id",
+    "input",
+    "output",
+    "tags",
+    "record_json",
+    "cost_json",
+    "perf_json",
+    "ts",
+)
+"""Record and app columns of the DataFrames produced by
+[get_records_and_feedback][trulens.core.database.sqlalchemy.SQLAlchemyDB.get_records_and_feedback]."""
+
+LAZY_RECORDS_AND_FEEDBACK_COLUMNS: Tuple[str, ...] = ("app_json", "record_json")
+"""Columns holding serialized apps and records which are only read by
+[iter_records_and_feedback][trulens.core.database.sqlalchemy.SQLAlchemyDB.iter_records_and_feedback]
+if requested."""
+
+JSON_DIALECTS: Tuple[str, ...] = ("sqlite", "postgresql", "mysql", "snowflake")
+"""Dialects whose JSON functions are used to aggregate records in the
+database."""
+
+BLOB_CACHE_SIZE: int = 1024
+"""Number of decoded blobs kept in memory by each database."""
+
+IN_CLAUSE_BATCH_SIZE: int = 500
+"""Maximum number of values in a single `IN` clause. Some databases limit the
+number of parameters of a statement."""
+
 
 class SnowflakeImpl(DefaultImpl):
     __dialect__ = "snowflake"
@@ -89,8 +137,52 @@ class SQLAlchemyDB(DB):
     session: Optional[sessionmaker] = None
     """Sqlalchemy session(maker)."""
 
+    codec: Optional[mod_codec.StorageCodec] = None
+    """Encoding of serialized records and feedback calls written to the
+    database. Written as plain JSON if not given.
+
+    Rows are decoded on read regardless of this setting.
+    """
+
+    sqlite: Optional[mod_sqlite.SQLiteOptions] = Field(
+        default_factory=mod_sqlite.SQLiteOptions
+    )
+    """Settings of file-based SQLite databases. See
+    [trulens.core.database.sqlite][trulens.core.database.sqlite].
+
+    Not used for other databases. If None, connections are used as configured
+    by the engine.
+    """
+
+    read_replicas: Optional[mod_replica.ReplicaOptions] = None
+    """Read replicas that read-only methods are run on. See
+    [trulens.core.database.replica][trulens.core.database.replica].
+
+    If None, reads run on the database written to.
+    """
+
     model_config: ClassVar[dict] = {"arbitrary_types_allowed": True}
 
+    _replicas: Optional[mod_replica.ReplicaRouter] = PrivateAttr(None)
+    """Router of reads to `read_replicas`."""
+
+    _writer: Optional[mod_sqlite.SQLiteWriter] = PrivateAttr(None)
+    """Thread running the writes to a SQLite database."""
+
+    _read_engine: Optional[sa.Engine] = PrivateAttr(None)
+    """Engine of read-only connections to a SQLite database."""
+
+    _read_session: Optional[sessionmaker] = PrivateAttr(None)
+    """Session(maker) of `_read_engine`."""
+
+    _blobs: Dict[str, str] = PrivateAttr(default_factory=dict)
+    """Cache of decoded blobs by blob id."""
+
+    _app_types: Dict[mod_types_schema.AppID, str] = PrivateAttr(
+        default_factory=dict
+    )
+    """Cache of the root class names of apps."""
+
     orm: Type[mod_orm.ORM]
     """
     Container of all the ORM classes for this database.
@@ -125,6 +217,77 @@ class SQLAlchemyDB(DB):
             self.engine = sa.create_engine(**self.engine_params)
         self.session = sessionmaker(self.engine, **self.session_params)
 
+        self._writer = None
+        self._read_engine = None
+        self._read_session = None
+
+        if self._replicas is not None:
+            self._replicas.dispose()
+        self._replicas = None
+        if self.read_replicas is not None and self.read_replicas.urls:
+            self._replicas = mod_replica.ReplicaRouter(
+                self.read_replicas, **self.session_params
+            )
+
+        path = mod_sqlite.database_path(self.engine.url)
+        if self.sqlite is None or path is None:
+            return
+
+        sa.event.listen(
+            self.engine,
+            "connect",
+            functools.partial(mod_sqlite.set_pragmas, self.sqlite.pragmas()),
+        )
+
+        if self.sqlite.writer:
+            self._writer = mod_sqlite.SQLiteWriter(
+                self.session, max_batch_size=self.sqlite.max_write_batch
+            )
+
+        if self.sqlite.read_pool_size > 0:
+            self._read_engine = mod_sqlite.create_read_engine(path, self.sqlite)
+            self._read_session = sessionmaker(
+                self._read_engine, **self.session_params
+            )
+
+    def _write(self, write: Callable[[sa.orm.Session], T]) -> T:
+        """Run `write` in a transaction and return its result.
+
+        Writes to SQLite databases run on the writer thread, possibly in the
+        same transaction as other writes.
+        """
+
+        if self._writer is not None:
+            result = self._writer.run(write)
+
+        else:
+            with self.session.begin() as session:
+                result = write(session)
+
+        if self._replicas is not None:
+            self._replicas.wrote()
+
+        return result
+
+    def _read(self) -> ContextManager[sa.orm.Session]:
+        """Begin a transaction that only reads.
+
+        Reads run on a read replica if one is fresh enough. Reads of SQLite
+        databases use read-only connections once the database file exists.
+        """
+
+        if self._replicas is not None:
+            transaction = self._replicas.begin()
+            if transaction is not None:
+                return transaction
+
+        if self._read_session is not None and os.path.exists(
+            self.engine.url.database
+        ):
+            return self._read_session.begin()
+
+        return self.session.begin()
+
     @classmethod
     def from_tru_args(
         cls,
@@ -135,6 +298,7 @@ class SQLAlchemyDB(DB):
             bool
         ] = mod_db.DEFAULT_DATABASE_REDACT_KEYS,
         database_prefix: Optional[str] = mod_db.DEFAULT_DATABASE_PREFIX,
+        database_read_replica_urls: Optional[Sequence[str]] = None,
         **kwargs: Dict[str, Any],
     ) -> SQLAlchemyDB:
         """Process database-related configuration provided to the [Tru][trulens.core.session.TruSession] class to
@@ -169,6 +333,16 @@ class SQLAlchemyDB(DB):
         if "redact_keys" not in kwargs:
             kwargs["redact_keys"] = database_redact_keys
 
+        if database_read_replica_urls:
+            if kwargs.get("read_replicas") is not None:
+                raise ValueError(
+                    "Please specify at most one of `database_read_replica_urls` and `read_replicas`"
+                )
+
+            kwargs["read_replicas"] = mod_replica.ReplicaOptions(
+                urls=list(database_read_replica_urls)
+            )
+
         if database_engine is not None:
             new_db: DB = SQLAlchemyDB.from_db_engine(database_engine, **kwargs)
         else:
@@ -220,6 +394,11 @@ class SQLAlchemyDB(DB):
             engine_params["max_overflow"] = 2
             engine_params["pool_use_lifo"] = True
 
+        if sa.engine.make_url(url).drivername.startswith("sqlite"):
+            # Local files do not drop connections. Pinging them only delays
+            # the writer thread.
+            engine_params["pool_pre_ping"] = False
+
         return cls(engine_params=engine_params, **kwargs)
 
     @classmethod
@@ -237,6 +416,78 @@ class SQLAlchemyDB(DB):
 
         return cls(engine=engine, **kwargs)
 
+    @classmethod
+    def from_archive(
+        cls,
+        path: Union[str, Path],
+        database_file: Optional[Union[str, Path]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> SQLAlchemyDB:
+        """
+        Open an archive written by
+        [apply_retention][trulens.core.database.sqlalchemy.SQLAlchemyDB.apply_retention]
+        as a read-only database.
+
+        The archive is restored into a sqlite database file on first use and
+        again whenever files were added to the archive since.
+
+        Args:
+            path: The archive directory.
+
+            database_file: The sqlite file to restore into. Defaults to
+                `archive.sqlite` in the archive directory.
+
+            kwargs: Additional arguments to pass to the database constructor.
+
+        Returns:
+            A database instance that cannot be written to.
+        """
+
+        path = Path(path)
+        database_file = Path(database_file or path / "archive.sqlite")
+
+        files = mod_retention.archive_files(path)
+        if not database_file.exists() or any(
+            file.stat().st_mtime > database_file.stat().st_mtime
+            for _, _, file in files
+        ):
+            restoring = database_file.with_name(database_file.name + ".tmp")
+            restoring.unlink(missing_ok=True)
+
+            # Restored without WAL so that the file can be opened read-only
+            # on its own.
+            db = cls.from_db_url(
+                f"sqlite:///{restoring}",
+                **{**kwargs, "sqlite": None, "read_replicas": None},
+            )
+            db.migrate_database()
+
+            orm_classes = db._orm_classes_by_name()
+
+            for table, rows in mod_retention.read_archive(path):
+                orm_class = orm_classes[table]
+                columns = {c.name for c in orm_class.__table__.columns}
+                with db.session.begin() as session:
+                    db._upsert(
+                        session,
+                        orm_class,
+                        [
+                            orm_class(**{
+                                k: v for k, v in row.items() if k in columns
+                            })
+                            for row in rows
+                        ],
+                    )
+
+            db.rebuild_feedback_counts()
+            db.engine.dispose()
+
+            restoring.replace(database_file)
+
+        return cls.from_db_url(
+            f"sqlite:///file:{database_file}?mode=ro&uri=true", **kwargs
+        )
+
     def check_db_revision(self):
         """See
         [DB.check_db_revision][trulens.core.database.base.DB.check_db_revision]."""
@@ -338,45 +589,226 @@ class SQLAlchemyDB(DB):
 
         self.migrate_database()
 
+    def _upsert(
+        self,
+        session: sa.orm.Session,
+        orm_class: Type[mod_orm.BaseWithTablePrefix],
+        objs: Sequence[mod_orm.BaseWithTablePrefix],
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Insert the given ORM objects, updating rows that already exist with
+        the same primary key.
+
+        Uses a single dialect-specific statement per chunk of rows instead of
+        a query followed by a merge per row. Chunks are sized to stay under the
+        bind parameter limit of the dialect. On sqlite, one statement compiled
+        once per table is executed for all rows. Dialects without a known
+        upsert statement fall back to `session.merge` for each object.
+
+        Args:
+            session: The session to execute in.
+
+            orm_class: The ORM class of the objects.
+
+            objs: The objects to upsert. If more than one has the same primary
+                key, the last one wins.
+
+            update_columns: Columns to update on existing rows. Defaults to
+                all columns except the primary key.
+        """
+
+        if len(objs) == 0:
+            return
+
+        table = orm_class.__table__
+        columns = [c.name for c in table.columns]
+
+        if session.get_bind().dialect.name not in _UPSERT_MAX_BIND_PARAMS:
+            for obj in objs:
+                session.merge(obj)
+            return
+
+        self._upsert_rows(
+            session,
+            orm_class,
+            [{c: getattr(obj, c) for c in columns} for obj in objs],
+            update_columns=update_columns,
+        )
+
+    def _upsert_rows(
+        self,
+        session: sa.orm.Session,
+        orm_class: Type[mod_orm.BaseWithTablePrefix],
+        rows: Sequence[Dict[str, Any]],
+        update_columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Like [_upsert][trulens.core.database.sqlalchemy.SQLAlchemyDB._upsert]
+        but for rows given as dictionaries of column values, without creating
+        ORM objects for dialects with an upsert statement.
+
+        Rows must have a value for every column of the table.
+        """
+
+        if len(rows) == 0:
+            return
+
+        table = orm_class.__table__
+        columns = [c.name for c in table.columns]
+        primary_key = [c.name for c in table.primary_key.columns]
+
+        if update_columns is None:
+            update_columns = [c for c in columns if c not in primary_key]
+
+        dialect = session.get_bind().dialect
+
+        if dialect.name not in _UPSERT_MAX_BIND_PARAMS:
+            for row in rows:
+                session.merge(orm_class(**row))
+            return
+
+        # A single statement cannot affect the same row twice.
+        rows = list(
+            {tuple(row[c] for c in primary_key): row for row in rows}.values()
+        )
+
+        if dialect.name == "sqlite":
+            # Run the statement compiled once per table for all rows at once.
+            sql, positions = _compiled_upsert(
+                dialect, table, tuple(primary_key), tuple(update_columns)
+            )
+            session.connection().exec_driver_sql(
+                sql, [tuple(row[c] for c in positions) for row in rows]
+            )
+            return
+
+        chunk_size = max(
+            1, _UPSERT_MAX_BIND_PARAMS[dialect.name] // len(columns)
+        )
+
+        for i in range(0, len(rows), chunk_size):
+            session.execute(
+                _upsert_statement(
+                    dialect=dialect,
+                    table=table,
+                    rows=rows[i : i + chunk_size],
+                    primary_key=primary_key,
+                    update_columns=update_columns,
+                )
+            )
+
+    def _insert_new_rows(
+        self,
+        session: sa.orm.Session,
+        orm_class: Type[mod_orm.BaseWithTablePrefix],
+        rows: Sequence[Dict[str, Any]],
+    ) -> Set[Any]:
+        """Insert those of `rows` whose primary key is not in the table yet
+        and return the primary keys of the rows inserted.
+
+        Rows already in the table, including those inserted by concurrent
+        writers, are left unchanged. The table must have a single primary key
+        column and rows must have a value for every column of the table.
+        """
+
+        if len(rows) == 0:
+            return set()
+
+        table = orm_class.__table__
+        (key,) = table.primary_key.columns
+        dialect = session.get_bind().dialect
+
+        # Sorted so that concurrent writers lock keys in the same order.
+        rows = sorted(rows, key=lambda row: row[key.name])
+
+        if dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+
+            chunk_size = max(
+                1, _UPSERT_MAX_BIND_PARAMS[dialect.name] // len(table.columns)
+            )
+
+            inserted = set()
+            for i in range(0, len(rows), chunk_size):
+                inserted.update(
+                    session.execute(
+                        insert(table)
+                        .values(rows[i : i + chunk_size])
+                        .on_conflict_do_nothing(index_elements=[key.name])
+                        .returning(key)
+                    ).scalars()
+                )
+            return inserted
+
+        # Other dialects do not report which rows of an upsert were inserted.
+        # Insert all rows at once and only one at a time if some exist.
+        try:
+            with session.begin_nested():
+                session.execute(sa.insert(table), list(rows))
+            return {row[key.name] for row in rows}
+        except sa.exc.IntegrityError:
+            pass
+
+        inserted = set()
+        for row in rows:
+            try:
+                with session.begin_nested():
+                    session.execute(sa.insert(table).values(row))
+                inserted.add(row[key.name])
+            except sa.exc.IntegrityError:
+                # Existing rows are left to the caller.
+                pass
+        return inserted
+
     def insert_record(
         self, record: mod_record_schema.Record
     ) -> mod_types_schema.RecordID:
         """See [DB.insert_record][trulens.core.database.base.DB.insert_record]."""
         # TODO: thread safety
 
-        _rec = self.orm.Record.parse(record, redact_keys=self.redact_keys)
-        with self.session.begin() as session:
-            if (
-                session.query(self.orm.Record)
-                .filter_by(record_id=record.record_id)
-                .first()
-            ):
-                session.merge(_rec)  # update existing
-            else:
-                session.merge(_rec)  # add new record # .add was not thread safe
+        blobs = {}
+        _rec = self.orm.Record.parse(
+            record, redact_keys=self.redact_keys, codec=self.codec, blobs=blobs
+        )
+
+        def write(session: sa.orm.Session) -> None:
+            self._insert_blobs(session, blobs)
+            self._upsert(session, self.orm.Record, [_rec])
 
-            logger.info("{UNICODE_CHECK} added record %s", _rec.record_id)
+        self._write(write)
 
-            return _rec.record_id
+        logger.info("%s added record %s", UNICODE_CHECK, _rec.record_id)
+
+        return _rec.record_id
 
     def batch_insert_record(
         self, records: List[mod_record_schema.Record]
     ) -> List[mod_types_schema.RecordID]:
         """See [DB.insert_record_batch][trulens_eval.database.base.DB.insert_record_batch]."""
-        with self.session.begin() as session:
-            records_list = [
-                self.orm.Record.parse(r, redact_keys=self.redact_keys)
-                for r in records
-            ]
-            session.bulk_save_objects(records_list)
-            logger.info(f"{UNICODE_CHECK} added record batch")
-            # return record ids from orm objects
-            return [r.record_id for r in records_list]
+        blobs = {}
+        records_list = [
+            self.orm.Record.parse(
+                r,
+                redact_keys=self.redact_keys,
+                codec=self.codec,
+                blobs=blobs,
+            )
+            for r in records
+        ]
+
+        def write(session: sa.orm.Session) -> None:
+            self._insert_blobs(session, blobs)
+            self._upsert(session, self.orm.Record, records_list)
+
+        self._write(write)
+
+        logger.info(f"{UNICODE_CHECK} added record batch")
+        # return record ids from orm objects
+        return [r.record_id for r in records_list]
 
     def get_app(self, app_id: mod_types_schema.AppID) -> Optional[JSONized]:
         """See [DB.get_app][trulens.core.database.base.DB.get_app]."""
 
-        with self.session.begin() as session:
+        with self._read() as session:
             if (
                 _app := session.query(self.orm.AppDefinition)
                 .filter_by(app_id=app_id)
@@ -387,7 +819,7 @@ class SQLAlchemyDB(DB):
     def get_apps(self) -> Iterable[JSON]:
         """See [DB.get_apps][trulens.core.database.base.DB.get_apps]."""
 
-        with self.session.begin() as session:
+        with self._read() as session:
             for _app in session.query(self.orm.AppDefinition):
                 yield json.loads(_app.app_json)
 
@@ -396,24 +828,21 @@ class SQLAlchemyDB(DB):
     ) -> mod_types_schema.AppID:
         """See [DB.insert_app][trulens.core.database.base.DB.insert_app]."""
 
-        # TODO: thread safety
+        _app = self.orm.AppDefinition.parse(app, redact_keys=self.redact_keys)
+        self._app_types.pop(_app.app_id, None)
 
-        with self.session.begin() as session:
-            if (
-                _app := session.query(self.orm.AppDefinition)
-                .filter_by(app_id=app.app_id)
-                .first()
-            ):
-                _app.app_json = app.model_dump_json()
-            else:
-                _app = self.orm.AppDefinition.parse(
-                    app, redact_keys=self.redact_keys
-                )
-                session.merge(_app)  # .add was not thread safe
+        self._write(
+            lambda session: self._upsert(
+                session,
+                self.orm.AppDefinition,
+                [_app],
+                update_columns=["app_json"],
+            )
+        )
 
-            logger.info("%s added app %s", UNICODE_CHECK, _app.app_id)
+        logger.info("%s added app %s", UNICODE_CHECK, _app.app_id)
 
-            return _app.app_id
+        return _app.app_id
 
     def delete_app(self, app_id: mod_types_schema.AppID) -> None:
         """
@@ -422,341 +851,2146 @@ class SQLAlchemyDB(DB):
         Args:
             app_id (schema.AppID): The unique identifier of the app to be deleted.
         """
-        with self.session.begin() as session:
+        self._app_types.pop(app_id, None)
+
+        def write(session: sa.orm.Session) -> None:
             _app = (
                 session.query(self.orm.AppDefinition)
                 .filter_by(app_id=app_id)
                 .first()
             )
             if _app:
+                # Feedback results of the app's records are deleted with it.
+                fr = self.orm.FeedbackResult
+                deltas = {
+                    (row.feedback_definition_id, row.status): -row.n_results
+                    for row in session.execute(
+                        sa.select(
+                            fr.feedback_definition_id,
+                            fr.status,
+                            sa.func.count().label("n_results"),
+                        )
+                        .join(
+                            self.orm.Record,
+                            self.orm.Record.record_id == fr.record_id,
+                        )
+                        .where(self.orm.Record.app_id == app_id)
+                        .group_by(fr.feedback_definition_id, fr.status)
+                    )
+                }
+
                 session.delete(_app)
+                self._update_feedback_counts(session, deltas)
                 logger.info(f"{UNICODE_CHECK} deleted app {app_id}")
             else:
                 logger.warning(f"App {app_id} not found for deletion.")
 
-    def insert_feedback_definition(
-        self, feedback_definition: mod_feedback_schema.FeedbackDefinition
-    ) -> mod_types_schema.FeedbackDefinitionID:
-        """See [DB.insert_feedback_definition][trulens.core.database.base.DB.insert_feedback_definition]."""
+        self._write(write)
 
-        # TODO: thread safety
+    def apply_retention(
+        self,
+        policy: mod_retention.RetentionPolicy,
+        archive: Optional[Union[str, Path]] = None,
+        archive_format: Union[
+            mod_retention.ArchiveFormat, str
+        ] = mod_retention.ArchiveFormat.JSONL,
+        batch_size: int = 500,
+        now: Optional[datetime] = None,
+    ) -> mod_retention.RetentionResult:
+        """See [DB.apply_retention][trulens.core.database.base.DB.apply_retention]."""
+
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be positive.")
+
+        writer = (
+            mod_retention.ArchiveWriter(archive, format=archive_format)
+            if archive is not None
+            else None
+        )
+        result = mod_retention.RetentionResult()
 
-        with self.session.begin() as session:
-            if (
-                _fb_def := session.query(self.orm.FeedbackDefinition)
-                .filter_by(
-                    feedback_definition_id=feedback_definition.feedback_definition_id
-                )
-                .first()
-            ):
-                _fb_def.app_json = feedback_definition.model_dump_json()
-            else:
-                _fb_def = self.orm.FeedbackDefinition.parse(
-                    feedback_definition, redact_keys=self.redact_keys
-                )
-                session.merge(_fb_def)  # .add was not thread safe
+        rec = self.orm.Record
+        fr = self.orm.FeedbackResult
 
-            logger.info(
-                "%s added feedback definition %s",
-                UNICODE_CHECK,
-                _fb_def.feedback_definition_id,
+        with self._read() as session:
+            app_ids = (
+                session.execute(
+                    sa.select(rec.app_id).distinct().order_by(rec.app_id)
+                )
+                .scalars()
+                .all()
             )
 
-            return _fb_def.feedback_definition_id
+        for app_id in app_ids:
+            expired = []
 
-    def get_feedback_defs(
-        self,
-        feedback_definition_id: Optional[
-            mod_types_schema.FeedbackDefinitionID
-        ] = None,
-    ) -> pd.DataFrame:
-        """See [DB.get_feedback_defs][trulens.core.database.base.DB.get_feedback_defs]."""
+            if policy.max_age is not None:
+                expired.append(
+                    rec.ts
+                    < ((now or datetime.now()) - policy.max_age).timestamp()
+                )
 
-        with self.session.begin() as session:
-            q = sa.select(self.orm.FeedbackDefinition)
-            if feedback_definition_id:
-                q = q.filter_by(feedback_definition_id=feedback_definition_id)
-            fb_defs = (row[0] for row in session.execute(q))
-            return pd.DataFrame(
-                data=(
-                    (fb.feedback_definition_id, json.loads(fb.feedback_json))
-                    for fb in fb_defs
-                ),
-                columns=["feedback_definition_id", "feedback_json"],
+            if policy.max_records_per_app is not None:
+                with self._read() as session:
+                    # The newest record beyond the ones to keep.
+                    newest_expired = session.execute(
+                        sa.select(rec.ts, rec.record_id)
+                        .where(rec.app_id == app_id)
+                        .order_by(rec.ts.desc(), rec.record_id.desc())
+                        .offset(policy.max_records_per_app)
+                        .limit(1)
+                    ).first()
+
+                if newest_expired is not None:
+                    expired.append(
+                        sa.or_(
+                            rec.ts < newest_expired.ts,
+                            sa.and_(
+                                rec.ts == newest_expired.ts,
+                                rec.record_id <= newest_expired.record_id,
+                            ),
+                        )
+                    )
+
+            if len(expired) == 0:
+                continue
+
+            stmt = sa.select(rec.ts, rec.record_id).where(
+                rec.app_id == app_id, sa.or_(*expired)
             )
+            if policy.keep_failed:
+                stmt = stmt.where(
+                    ~sa.exists().where(
+                        fr.record_id == rec.record_id,
+                        fr.status
+                        == mod_feedback_schema.FeedbackResultStatus.FAILED.value,
+                    )
+                )
+            stmt = stmt.order_by(rec.ts, rec.record_id).limit(batch_size)
+
+            def purge(
+                session: sa.orm.Session,
+                stmt: sa.Select = stmt,
+                last: Optional[Tuple[float, str]] = None,
+            ) -> Tuple[List[sa.Row], List[Path], int, int]:
+                """Delete the next batch of expired records after `last`.
+
+                Returns the batch, the archive files written and the numbers
+                of records and feedback results deleted.
+                """
+
+                if last is not None:
+                    # Continue after the prior batch, past sampled records
+                    # that were kept.
+                    stmt = stmt.where(
+                        sa.or_(
+                            rec.ts > last[0],
+                            sa.and_(rec.ts == last[0], rec.record_id > last[1]),
+                        )
+                    )
 
-    def insert_feedback(
-        self, feedback_result: mod_feedback_schema.FeedbackResult
-    ) -> mod_types_schema.FeedbackResultID:
-        """See [DB.insert_feedback][trulens.core.database.base.DB.insert_feedback]."""
+                rows = session.execute(stmt).all()
 
-        # TODO: thread safety
+                record_ids = [
+                    row.record_id
+                    for row in rows
+                    if not policy.sampled(row.record_id)
+                ]
+                if len(record_ids) == 0:
+                    return rows, [], 0, 0
 
-        _feedback_result = self.orm.FeedbackResult.parse(
-            feedback_result, redact_keys=self.redact_keys
-        )
-        with self.session.begin() as session:
-            if (
-                session.query(self.orm.FeedbackResult)
-                .filter_by(
-                    feedback_result_id=feedback_result.feedback_result_id
+                files = []
+                if writer is not None:
+                    files = writer.write(
+                        self._archive_rows(session, record_ids)
+                    )
+
+                return (rows, files, *self._delete_records(session, record_ids))
+
+            last = None
+            while True:
+                # One transaction per batch so that writers are not blocked
+                # for long.
+                rows, files, n_records, n_results = self._write(
+                    functools.partial(purge, last=last)
                 )
-                .first()
-            ):
-                session.merge(_feedback_result)  # update existing
-            else:
-                session.merge(
-                    _feedback_result
-                )  # insert new result # .add was not thread safe
-
-            status = mod_feedback_schema.FeedbackResultStatus(
-                _feedback_result.status
-            )
-
-            if status == mod_feedback_schema.FeedbackResultStatus.DONE:
-                icon = UNICODE_CHECK
-            elif status == mod_feedback_schema.FeedbackResultStatus.RUNNING:
-                icon = UNICODE_HOURGLASS
-            elif status == mod_feedback_schema.FeedbackResultStatus.NONE:
-                icon = UNICODE_CLOCK
-            elif status == mod_feedback_schema.FeedbackResultStatus.FAILED:
-                icon = UNICODE_STOP
-            else:
-                icon = "???"
+                if len(rows) == 0:
+                    break
 
-            logger.info(
-                "%s feedback result %s %s %s",
-                icon,
-                _feedback_result.name,
-                status.name,
-                _feedback_result.feedback_result_id,
-            )
+                last = (rows[-1].ts, rows[-1].record_id)
 
-            return _feedback_result.feedback_result_id
+                n_sampled = sum(policy.sampled(row.record_id) for row in rows)
+                result.records_sampled += n_sampled
+                result.archive_files.extend(files)
 
-    def batch_insert_feedback(
-        self, feedback_results: List[mod_feedback_schema.FeedbackResult]
-    ) -> List[mod_types_schema.FeedbackResultID]:
-        """See [DB.batch_insert_feedback][trulens_eval.database.base.DB.batch_insert_feedback]."""
-        with self.session.begin() as session:
-            feedback_results_list = [
-                self.orm.FeedbackResult.parse(f, redact_keys=self.redact_keys)
-                for f in feedback_results
-            ]
-            session.bulk_save_objects(feedback_results_list)
-            return [f.feedback_result_id for f in feedback_results_list]
+                if n_sampled < len(rows):
+                    result.records_deleted += n_records
+                    result.feedback_results_deleted += n_results
+                    result.batches += 1
 
-    def _feedback_query(
+        logger.info(
+            "%s deleted %s record(s) and %s feedback result(s)",
+            UNICODE_CHECK,
+            result.records_deleted,
+            result.feedback_results_deleted,
+        )
+
+        return result
+
+    def export(
         self,
-        count_by_status: bool = False,
-        shuffle: bool = False,
-        record_id: Optional[mod_types_schema.RecordID] = None,
-        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
-        feedback_definition_id: Optional[
-            mod_types_schema.FeedbackDefinitionID
-        ] = None,
-        status: Optional[
-            Union[
-                mod_feedback_schema.FeedbackResultStatus,
-                Sequence[mod_feedback_schema.FeedbackResultStatus],
-            ]
-        ] = None,
-        last_ts_before: Optional[datetime] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
-    ):
-        if count_by_status:
-            q = sa.select(
-                self.orm.FeedbackResult.status,
-                sa.func.count(self.orm.FeedbackResult.feedback_result_id),
-            ).group_by(self.orm.FeedbackResult.status)
-        else:
-            q = sa.select(self.orm.FeedbackResult)
+        path: Union[str, Path],
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> mod_export.TransferResult:
+        """See [DB.export][trulens.core.database.base.DB.export]."""
 
-        if record_id:
-            q = q.filter_by(record_id=record_id)
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be positive.")
 
-        if feedback_result_id:
-            q = q.filter_by(feedback_result_id=feedback_result_id)
+        rec = self.orm.Record
 
-        if feedback_definition_id:
-            q = q.filter_by(feedback_definition_id=feedback_definition_id)
+        stmt = sa.select(rec.ts, rec.record_id)
+        if app_ids is not None:
+            stmt = stmt.where(rec.app_id.in_(app_ids))
+        if since is not None:
+            stmt = stmt.where(rec.ts >= since.timestamp())
+        stmt = stmt.order_by(rec.ts, rec.record_id).limit(chunk_size)
 
-        if (
-            run_location is None
-            or run_location == mod_feedback_schema.FeedbackRunLocation.IN_APP
-        ):
-            # For legacy reasons, we handle the IN_APP and NULL/None case as the same.
-            q = q.filter(
-                sa.or_(
-                    self.orm.FeedbackDefinition.run_location.is_(None),
-                    self.orm.FeedbackDefinition.run_location
-                    == mod_feedback_schema.FeedbackRunLocation.IN_APP.value,
-                )
+        # Apps and feedback definitions are written once, with the first
+        # chunk that refers to them.
+        keys = {"apps": "app_id", "feedback_defs": "feedback_definition_id"}
+        written = {table: set() for table in keys}
+
+        writer = mod_export.ExportWriter(path, tables=self._tables_by_name())
+        result = mod_export.TransferResult()
+
+        try:
+            last = None
+            while True:
+                with self._read() as session:
+                    chunk_stmt = stmt
+                    if last is not None:
+                        chunk_stmt = chunk_stmt.where(
+                            sa.or_(
+                                rec.ts > last[0],
+                                sa.and_(
+                                    rec.ts == last[0], rec.record_id > last[1]
+                                ),
+                            )
+                        )
+
+                    rows = session.execute(chunk_stmt).all()
+                    if len(rows) == 0:
+                        break
+
+                    last = (rows[-1].ts, rows[-1].record_id)
+
+                    tables = self._archive_rows(
+                        session, [row.record_id for row in rows]
+                    )
+
+                for table, key in keys.items():
+                    tables[table] = [
+                        row
+                        for row in tables[table]
+                        if row[key] not in written[table]
+                    ]
+                    written[table].update(row[key] for row in tables[table])
+
+                writer.write(tables)
+
+                for table, table_rows in tables.items():
+                    result.add(table, len(table_rows))
+
+        finally:
+            result.files = writer.close()
+
+        logger.info(
+            "%s exported %s record(s) and %s feedback result(s) to %s",
+            UNICODE_CHECK,
+            result.records,
+            result.feedback_results,
+            path,
+        )
+
+        return result
+
+    def import_(
+        self, path: Union[str, Path], batch_size: int = 1000
+    ) -> mod_export.TransferResult:
+        """See [DB.import_][trulens.core.database.base.DB.import_]."""
+
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be positive.")
+
+        orm_classes = self._orm_classes_by_name()
+        json_columns = {"records": "record_json", "feedbacks": "calls_json"}
+
+        result = mod_export.TransferResult()
+
+        for table, file, batch in mod_export.read_export(
+            path, batch_size=batch_size
+        ):
+            orm_class = orm_classes[table]
+            columns = [c.name for c in orm_class.__table__.columns]
+
+            rows = [
+                {c: row.get(c) for c in columns} for row in batch.to_pylist()
+            ]
+
+            if table == "records":
+                for row in rows:
+                    if row["meta"] is None and row["record_json"] is not None:
+                        # Exported before records had a metadata column.
+                        row["meta"] = json.dumps(
+                            json.loads(row["record_json"]).get("meta")
+                        )
+
+            blobs = {}
+            if self.codec is not None and table in json_columns:
+                column = json_columns[table]
+                for row in rows:
+                    if row[column] is not None:
+                        row[column] = self.codec.encode(
+                            row[column], blobs=blobs
+                        )
+
+            def write(
+                session: sa.orm.Session,
+                table: str = table,
+                orm_class: Type[mod_orm.BaseWithTablePrefix] = orm_class,
+                rows: List[Dict[str, Any]] = rows,
+                blobs: Dict[str, str] = blobs,
+            ) -> None:
+                self._insert_blobs(session, blobs)
+
+                if table == "feedbacks":
+                    self._upsert_feedback_rows(session, rows)
+                else:
+                    self._upsert_rows(session, orm_class, rows)
+
+            # One transaction per batch.
+            self._write(write)
+
+            if table == "apps":
+                for row in rows:
+                    self._app_types.pop(row["app_id"], None)
+
+            result.add(table, len(rows))
+            if file not in result.files:
+                result.files.append(file)
+
+        logger.info(
+            "%s imported %s record(s) and %s feedback result(s) from %s",
+            UNICODE_CHECK,
+            result.records,
+            result.feedback_results,
+            path,
+        )
+
+        return result
+
+    def _orm_classes_by_name(
+        self,
+    ) -> Dict[str, Type[mod_orm.BaseWithTablePrefix]]:
+        """The ORM classes by the base name of their tables."""
+
+        return {
+            orm_class._table_base_name: orm_class
+            for orm_class in self.orm.registry.values()
+            if hasattr(orm_class, "_table_base_name")
+        }
+
+    def _tables_by_name(self) -> Dict[str, sa.Table]:
+        """The tables by their base name."""
+
+        return {
+            name: orm_class.__table__
+            for name, orm_class in self._orm_classes_by_name().items()
+        }
+
+    def _archive_rows(
+        self,
+        session: sa.orm.Session,
+        record_ids: Sequence[mod_types_schema.RecordID],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the rows of the given records, their feedback results, apps and
+        feedback definitions by table base name.
+
+        Encoded values are decoded so that archives do not depend on the blobs
+        of this database.
+        """
+
+        rec = self.orm.Record
+        fr = self.orm.FeedbackResult
+        app = self.orm.AppDefinition
+        fdef = self.orm.FeedbackDefinition
+
+        records = [
+            row._asdict()
+            for row in self._select_in(
+                session, list(rec.__table__.columns), rec.record_id, record_ids
+            )
+        ]
+        for row, record_json in zip(
+            records,
+            self._decode_json(session, [row["record_json"] for row in records]),
+        ):
+            row["record_json"] = record_json
+
+        results = [
+            row._asdict()
+            for row in self._select_in(
+                session, list(fr.__table__.columns), fr.record_id, record_ids
+            )
+        ]
+        for row, calls_json in zip(
+            results,
+            self._decode_json(session, [row["calls_json"] for row in results]),
+        ):
+            row["calls_json"] = calls_json
+
+        return {
+            "apps": [
+                row._asdict()
+                for row in self._select_in(
+                    session,
+                    list(app.__table__.columns),
+                    app.app_id,
+                    {row["app_id"] for row in records},
+                )
+            ],
+            "feedback_defs": [
+                row._asdict()
+                for row in self._select_in(
+                    session,
+                    list(fdef.__table__.columns),
+                    fdef.feedback_definition_id,
+                    {row["feedback_definition_id"] for row in results},
+                )
+            ],
+            "records": records,
+            "feedbacks": results,
+        }
+
+    def _delete_records(
+        self,
+        session: sa.orm.Session,
+        record_ids: Sequence[mod_types_schema.RecordID],
+    ) -> Tuple[int, int]:
+        """Delete the given records and their feedback results.
+
+        Returns:
+            The number of records and of feedback results deleted.
+        """
+
+        rec = self.orm.Record
+        fr = self.orm.FeedbackResult
+
+        deltas = defaultdict(int)
+        for row in self._select_in(
+            session,
+            [fr.feedback_definition_id, fr.status],
+            fr.record_id,
+            record_ids,
+        ):
+            deltas[(row.feedback_definition_id, row.status)] -= 1
+
+        record_ids = sorted(record_ids)
+        n_records = 0
+        for i in range(0, len(record_ids), IN_CLAUSE_BATCH_SIZE):
+            batch = record_ids[i : i + IN_CLAUSE_BATCH_SIZE]
+            session.execute(sa.delete(fr).where(fr.record_id.in_(batch)))
+            n_records += session.execute(
+                sa.delete(rec).where(rec.record_id.in_(batch))
+            ).rowcount
+
+        self._update_feedback_counts(session, deltas)
+
+        return n_records, -sum(deltas.values())
+
+    def insert_feedback_definition(
+        self, feedback_definition: mod_feedback_schema.FeedbackDefinition
+    ) -> mod_types_schema.FeedbackDefinitionID:
+        """See [DB.insert_feedback_definition][trulens.core.database.base.DB.insert_feedback_definition]."""
+
+        _fb_def = self.orm.FeedbackDefinition.parse(
+            feedback_definition, redact_keys=self.redact_keys
+        )
+        self._write(
+            lambda session: self._upsert(
+                session,
+                self.orm.FeedbackDefinition,
+                [_fb_def],
+                update_columns=["run_location", "feedback_json"],
+            )
+        )
+
+        logger.info(
+            "%s added feedback definition %s",
+            UNICODE_CHECK,
+            _fb_def.feedback_definition_id,
+        )
+
+        return _fb_def.feedback_definition_id
+
+    def get_feedback_defs(
+        self,
+        feedback_definition_id: Optional[
+            mod_types_schema.FeedbackDefinitionID
+        ] = None,
+    ) -> pd.DataFrame:
+        """See [DB.get_feedback_defs][trulens.core.database.base.DB.get_feedback_defs]."""
+
+        with self._read() as session:
+            q = sa.select(self.orm.FeedbackDefinition)
+            if feedback_definition_id:
+                q = q.filter_by(feedback_definition_id=feedback_definition_id)
+            fb_defs = (row[0] for row in session.execute(q))
+            return pd.DataFrame(
+                data=(
+                    (fb.feedback_definition_id, json.loads(fb.feedback_json))
+                    for fb in fb_defs
+                ),
+                columns=["feedback_definition_id", "feedback_json"],
+            )
+
+    def insert_feedback(
+        self, feedback_result: mod_feedback_schema.FeedbackResult
+    ) -> mod_types_schema.FeedbackResultID:
+        """See [DB.insert_feedback][trulens.core.database.base.DB.insert_feedback]."""
+
+        blobs = {}
+        _feedback_result = self.orm.FeedbackResult.parse(
+            feedback_result,
+            redact_keys=self.redact_keys,
+            codec=self.codec,
+            blobs=blobs,
+        )
+
+        def write(session: sa.orm.Session) -> None:
+            self._insert_blobs(session, blobs)
+            self._upsert_feedback(session, [_feedback_result])
+
+        self._write(write)
+
+        status = mod_feedback_schema.FeedbackResultStatus(
+            _feedback_result.status
+        )
+
+        if status == mod_feedback_schema.FeedbackResultStatus.DONE:
+            icon = UNICODE_CHECK
+        elif status == mod_feedback_schema.FeedbackResultStatus.RUNNING:
+            icon = UNICODE_HOURGLASS
+        elif status == mod_feedback_schema.FeedbackResultStatus.NONE:
+            icon = UNICODE_CLOCK
+        elif status == mod_feedback_schema.FeedbackResultStatus.FAILED:
+            icon = UNICODE_STOP
+        else:
+            icon = "???"
+
+        logger.info(
+            "%s feedback result %s %s %s",
+            icon,
+            _feedback_result.name,
+            status.name,
+            _feedback_result.feedback_result_id,
+        )
+
+        return _feedback_result.feedback_result_id
+
+    def batch_insert_feedback(
+        self, feedback_results: List[mod_feedback_schema.FeedbackResult]
+    ) -> List[mod_types_schema.FeedbackResultID]:
+        """See [DB.batch_insert_feedback][trulens_eval.database.base.DB.batch_insert_feedback]."""
+        blobs = {}
+        feedback_results_list = [
+            self.orm.FeedbackResult.parse(
+                f,
+                redact_keys=self.redact_keys,
+                codec=self.codec,
+                blobs=blobs,
+            )
+            for f in feedback_results
+        ]
+
+        def write(session: sa.orm.Session) -> None:
+            self._insert_blobs(session, blobs)
+            self._upsert_feedback(session, feedback_results_list)
+
+        self._write(write)
+
+        return [f.feedback_result_id for f in feedback_results_list]
+
+    def _upsert_feedback(
+        self,
+        session: sa.orm.Session,
+        feedback_results: Sequence["mod_orm.ORM.FeedbackResult"],
+    ) -> None:
+        """Upsert feedback results and update the feedback counts by the
+        changes in their statuses."""
+
+        columns = [c.name for c in self.orm.FeedbackResult.__table__.columns]
+
+        self._upsert_feedback_rows(
+            session,
+            [{c: getattr(res, c) for c in columns} for res in feedback_results],
+        )
+
+    def _upsert_feedback_rows(
+        self, session: sa.orm.Session, rows: Sequence[Dict[str, Any]]
+    ) -> None:
+        """Like
+        [_upsert_feedback][trulens.core.database.sqlalchemy.SQLAlchemyDB._upsert_feedback]
+        but for rows given as dictionaries of column values."""
+
+        fr = self.orm.FeedbackResult
+
+        # Like the upsert, the last one wins among the same ids.
+        rows = list({row["feedback_result_id"]: row for row in rows}.values())
+
+        # Lock the rows until the upsert so that concurrent writers do not
+        # both count the same prior status. SQLite transactions are
+        # serialized already.
+        for_update = session.get_bind().dialect.name in ("postgresql", "mysql")
+
+        deltas = defaultdict(int)
+
+        def count_prior_statuses(ids: Set[str]) -> Set[str]:
+            found = set()
+            for row in self._select_in(
+                session,
+                [fr.feedback_result_id, fr.feedback_definition_id, fr.status],
+                fr.feedback_result_id,
+                ids,
+                for_update=for_update,
+            ):
+                found.add(row.feedback_result_id)
+                deltas[(row.feedback_definition_id, row.status)] -= 1
+            return found
+
+        existing = count_prior_statuses({
+            row["feedback_result_id"] for row in rows
+        })
+
+        inserted = set()
+        if for_update:
+            # Locks do not cover missing rows so a concurrent writer may insert
+            # the same new results before this upsert. Insert the new rows
+            # first and count the prior status of those inserted by others.
+            new_ids = {
+                row["feedback_result_id"]
+                for row in rows
+                if row["feedback_result_id"] not in existing
+            }
+            inserted = self._insert_new_rows(
+                session,
+                fr,
+                [row for row in rows if row["feedback_result_id"] in new_ids],
+            )
+            count_prior_statuses(new_ids - inserted)
+
+        for row in rows:
+            deltas[(row["feedback_definition_id"], row["status"])] += 1
+
+        self._upsert_rows(
+            session,
+            fr,
+            [row for row in rows if row["feedback_result_id"] not in inserted],
+            update_columns=self._feedback_update_columns(),
+        )
+
+        self._update_feedback_counts(session, deltas)
+
+    def _update_feedback_counts(
+        self,
+        session: sa.orm.Session,
+        deltas: Dict[Tuple[mod_types_schema.FeedbackDefinitionID, str], int],
+    ) -> None:
+        """Add `deltas` to the feedback counts of the given (feedback
+        definition, status) pairs.
+
+        Uses a dialect-specific increment so that concurrent writers do not
+        lose each other's updates.
+        """
+
+        rows = [
+            dict(
+                feedback_definition_id=feedback_definition_id,
+                status=status,
+                n_results=delta,
+            )
+            # Sorted so that concurrent writers lock rows in the same order.
+            for (feedback_definition_id, status), delta in sorted(
+                deltas.items()
+            )
+            if delta != 0
+        ]
+
+        if len(rows) == 0:
+            return
+
+        table = self.orm.FeedbackCount.__table__
+        dialect = session.get_bind().dialect
+
+        if dialect.name in ("sqlite", "postgresql"):
+            if dialect.name == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+
+            stmt = insert(table).values(rows)
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["feedback_definition_id", "status"],
+                    set_={
+                        "n_results": table.c.n_results + stmt.excluded.n_results
+                    },
+                )
+            )
+
+        elif dialect.name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            stmt = insert(table).values(rows)
+            session.execute(
+                stmt.on_duplicate_key_update(
+                    n_results=table.c.n_results + stmt.inserted.n_results
+                )
+            )
+
+        else:
+            for row in rows:
+                result = session.execute(
+                    sa.update(table)
+                    .where(
+                        table.c.feedback_definition_id
+                        == row["feedback_definition_id"],
+                        table.c.status == row["status"],
+                    )
+                    .values(n_results=table.c.n_results + row["n_results"])
+                )
+                if result.rowcount == 0:
+                    session.execute(sa.insert(table).values(row))
+
+    def rebuild_feedback_counts(self) -> None:
+        """Recount the feedback results by feedback definition and status.
+
+        Feedback counts are maintained by the writes made through this class.
+        Rebuilding them is only needed if feedback results were written by
+        other means, for example by older versions of trulens.
+        """
+
+        fr = self.orm.FeedbackResult
+        table = self.orm.FeedbackCount.__table__
+
+        def write(session: sa.orm.Session) -> None:
+            session.execute(sa.delete(table))
+            session.execute(
+                sa.insert(table).from_select(
+                    ["feedback_definition_id", "status", "n_results"],
+                    sa.select(
+                        fr.feedback_definition_id,
+                        fr.status,
+                        sa.func.count(),
+                    ).group_by(fr.feedback_definition_id, fr.status),
+                )
+            )
+
+        self._write(write)
+
+    def _feedback_update_columns(self) -> List[str]:
+        """Columns of feedback results updated by upserts.
+
+        Excludes the lease columns which are only written by
+        [claim_feedback][trulens.core.database.sqlalchemy.SQLAlchemyDB.claim_feedback]
+        and related methods.
+        """
+
+        return [
+            c.name
+            for c in self.orm.FeedbackResult.__table__.columns
+            if not c.primary_key and c.name not in ("claimed_by", "lease_until")
+        ]
+
+    def _claimable_feedback(
+        self,
+        now: float,
+        retry_running_seconds: float,
+        retry_failed_seconds: float,
+    ):
+        """Condition selecting feedback results due for evaluation."""
+
+        fr = self.orm.FeedbackResult
+        lease_expired = sa.or_(fr.lease_until.is_(None), fr.lease_until < now)
+
+        return sa.or_(
+            fr.status == mod_feedback_schema.FeedbackResultStatus.NONE.value,
+            sa.and_(
+                fr.status
+                == mod_feedback_schema.FeedbackResultStatus.RUNNING.value,
+                sa.or_(
+                    fr.lease_until < now,
+                    # Results started without a lease, i.e. by older versions
+                    # or by feedback evaluated in the app.
+                    sa.and_(
+                        fr.lease_until.is_(None),
+                        fr.last_ts < now - retry_running_seconds,
+                    ),
+                ),
+            ),
+            sa.and_(
+                fr.status
+                == mod_feedback_schema.FeedbackResultStatus.FAILED.value,
+                fr.last_ts < now - retry_failed_seconds,
+                lease_expired,
+            ),
+        )
+
+    def claim_feedback(
+        self,
+        claimed_by: str,
+        lease_seconds: float,
+        limit: Optional[int] = None,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+        retry_running_seconds: float = 60.0,
+        retry_failed_seconds: float = 300.0,
+    ) -> pd.DataFrame:
+        """See [DB.claim_feedback][trulens.core.database.base.DB.claim_feedback]."""
+
+        fr = self.orm.FeedbackResult
+        table = fr.__table__
+
+        now = datetime.now().timestamp()
+        claimable = self._claimable_feedback(
+            now=now,
+            retry_running_seconds=retry_running_seconds,
+            retry_failed_seconds=retry_failed_seconds,
+        )
+
+        # Oldest first, using the status/last_ts index.
+        candidates = (
+            self._feedback_query(run_location=run_location, limit=limit)
+            .with_only_columns(fr.feedback_result_id)
+            .where(claimable)
+            .order_by(fr.last_ts)
+        )
+
+        lease = dict(
+            claimed_by=claimed_by,
+            lease_until=now + lease_seconds,
+            last_ts=now,
+        )
+        running = mod_feedback_schema.FeedbackResultStatus.RUNNING.value
+
+        def write(session: sa.orm.Session) -> pd.DataFrame:
+            dialect = session.get_bind().dialect
+
+            if dialect.update_returning and dialect.name in (
+                "sqlite",
+                "postgresql",
+            ):
+                claim_candidates = candidates
+                if dialect.name == "postgresql":
+                    # Concurrent claimers skip each other's rows instead of
+                    # waiting for them.
+                    claim_candidates = candidates.with_for_update(
+                        skip_locked=True, of=table
+                    )
+
+                # Claim with a single statement so that the write lock is
+                # taken at once. The status is set separately so that the
+                # prior statuses are returned for the feedback counts.
+                claimed = session.execute(
+                    sa.update(table)
+                    .where(
+                        claimable,
+                        # Do not correlate the subquery with the updated
+                        # table; it selects its own rows.
+                        table.c.feedback_result_id.in_(
+                            claim_candidates.correlate(None)
+                        ),
+                    )
+                    .values(**lease)
+                    .returning(
+                        table.c.feedback_result_id,
+                        table.c.feedback_definition_id,
+                        table.c.status,
+                    )
+                ).all()
+
+                claimed_ids = [row.feedback_result_id for row in claimed]
+                for i in range(0, len(claimed_ids), IN_CLAUSE_BATCH_SIZE):
+                    session.execute(
+                        sa.update(table)
+                        .where(
+                            table.c.feedback_result_id.in_(
+                                claimed_ids[i : i + IN_CLAUSE_BATCH_SIZE]
+                            )
+                        )
+                        .values(status=running)
+                    )
+
+            else:
+                # Dialects that cannot return the updated rows. Each row is
+                # claimed by a conditional update so that only one claimer
+                # succeeds.
+                claim = (
+                    sa.update(table)
+                    .where(claimable)
+                    .values(status=running, **lease)
+                )
+
+                claimed = []
+                for row in session.execute(
+                    candidates.with_only_columns(
+                        fr.feedback_result_id,
+                        fr.feedback_definition_id,
+                        fr.status,
+                    )
+                ).all():
+                    result = session.execute(
+                        claim.where(
+                            table.c.feedback_result_id == row.feedback_result_id
+                        )
+                    )
+                    if result.rowcount == 1:
+                        claimed.append(row)
+
+                claimed_ids = [row.feedback_result_id for row in claimed]
+
+            deltas = defaultdict(int)
+            for row in claimed:
+                deltas[(row.feedback_definition_id, row.status)] -= 1
+                deltas[(row.feedback_definition_id, running)] += 1
+            self._update_feedback_counts(session, deltas)
+
+            if len(claimed_ids) == 0:
+                return self._feedback_results_frame(session, [])
+
+            results = session.execute(
+                sa.select(fr)
+                .where(fr.feedback_result_id.in_(claimed_ids))
+                .order_by(fr.last_ts, fr.feedback_result_id)
+            ).scalars()
+
+            return self._feedback_results_frame(session, results)
+
+        return self._write(write)
+
+    def renew_feedback_leases(
+        self,
+        feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID],
+        claimed_by: str,
+        lease_seconds: float,
+    ) -> int:
+        """See [DB.renew_feedback_leases][trulens.core.database.base.DB.renew_feedback_leases]."""
+
+        if len(feedback_result_ids) == 0:
+            return 0
+
+        table = self.orm.FeedbackResult.__table__
+
+        def write(session: sa.orm.Session) -> int:
+            result = session.execute(
+                sa.update(table)
+                .where(
+                    table.c.feedback_result_id.in_(feedback_result_ids),
+                    table.c.claimed_by == claimed_by,
+                    table.c.status
+                    == mod_feedback_schema.FeedbackResultStatus.RUNNING.value,
+                )
+                .values(lease_until=datetime.now().timestamp() + lease_seconds)
+            )
+
+            return result.rowcount
+
+        return self._write(write)
+
+    def release_feedback(
+        self,
+        feedback_result_ids: Sequence[mod_types_schema.FeedbackResultID],
+        claimed_by: str,
+    ) -> None:
+        """See [DB.release_feedback][trulens.core.database.base.DB.release_feedback]."""
+
+        if len(feedback_result_ids) == 0:
+            return
+
+        table = self.orm.FeedbackResult.__table__
+
+        def write(session: sa.orm.Session) -> None:
+            session.execute(
+                sa.update(table)
+                .where(
+                    table.c.feedback_result_id.in_(feedback_result_ids),
+                    table.c.claimed_by == claimed_by,
+                )
+                .values(claimed_by=None, lease_until=None)
+            )
+
+        self._write(write)
+
+    def _feedback_query(
+        self,
+        count_by_status: bool = False,
+        shuffle: bool = False,
+        record_id: Optional[mod_types_schema.RecordID] = None,
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        feedback_definition_id: Optional[
+            mod_types_schema.FeedbackDefinitionID
+        ] = None,
+        status: Optional[
+            Union[
+                mod_feedback_schema.FeedbackResultStatus,
+                Sequence[mod_feedback_schema.FeedbackResultStatus],
+            ]
+        ] = None,
+        last_ts_before: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+    ):
+        if count_by_status:
+            q = sa.select(
+                self.orm.FeedbackResult.status,
+                sa.func.count(self.orm.FeedbackResult.feedback_result_id),
+            ).group_by(self.orm.FeedbackResult.status)
+        else:
+            q = sa.select(self.orm.FeedbackResult)
+
+        if record_id:
+            q = q.filter_by(record_id=record_id)
+
+        if feedback_result_id:
+            q = q.filter_by(feedback_result_id=feedback_result_id)
+
+        if feedback_definition_id:
+            q = q.filter_by(feedback_definition_id=feedback_definition_id)
+
+        q = q.filter(self._run_location_filter(run_location))
+        q = q.filter(
+            self.orm.FeedbackResult.feedback_definition_id
+            == self.orm.FeedbackDefinition.feedback_definition_id
+        )
+
+        if status:
+            if isinstance(status, mod_feedback_schema.FeedbackResultStatus):
+                status = [status.value]
+            q = q.filter(
+                self.orm.FeedbackResult.status.in_([s.value for s in status])
+            )
+        if last_ts_before:
+            q = q.filter(
+                self.orm.FeedbackResult.last_ts < last_ts_before.timestamp()
+            )
+
+        if offset is not None:
+            q = q.offset(offset)
+
+        if limit is not None:
+            q = q.limit(limit)
+
+        if shuffle:
+            # Ordering by random() would sort every matching row. Instead take
+            # the least recently updated rows using the status/last_ts index
+            # and shuffle them after reading (see get_feedback).
+            q = q.order_by(self.orm.FeedbackResult.last_ts)
+
+        return q
+
+    def _run_location_filter(
+        self, run_location: Optional[mod_feedback_schema.FeedbackRunLocation]
+    ):
+        """Condition selecting feedback definitions with the given run
+        location."""
+
+        if (
+            run_location is None
+            or run_location == mod_feedback_schema.FeedbackRunLocation.IN_APP
+        ):
+            # For legacy reasons, we handle the IN_APP and NULL/None case as the same.
+            return sa.or_(
+                self.orm.FeedbackDefinition.run_location.is_(None),
+                self.orm.FeedbackDefinition.run_location
+                == mod_feedback_schema.FeedbackRunLocation.IN_APP.value,
+            )
+
+        return self.orm.FeedbackDefinition.run_location == run_location.value
+
+    def get_feedback_count_by_status(
+        self,
+        record_id: Optional[mod_types_schema.RecordID] = None,
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        feedback_definition_id: Optional[
+            mod_types_schema.FeedbackDefinitionID
+        ] = None,
+        status: Optional[
+            Union[
+                mod_feedback_schema.FeedbackResultStatus,
+                Sequence[mod_feedback_schema.FeedbackResultStatus],
+            ]
+        ] = None,
+        last_ts_before: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        shuffle: bool = False,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+    ) -> Dict[mod_feedback_schema.FeedbackResultStatus, int]:
+        """See [DB.get_feedback_count_by_status][trulens.core.database.base.DB.get_feedback_count_by_status]."""
+
+        if all(
+            arg is None
+            for arg in (
+                record_id,
+                feedback_result_id,
+                last_ts_before,
+                offset,
+                limit,
+            )
+        ):
+            # Read the maintained counts instead of counting feedback results.
+            fc = self.orm.FeedbackCount
+            q = (
+                sa.select(fc.status, sa.func.sum(fc.n_results))
+                .where(
+                    fc.feedback_definition_id
+                    == self.orm.FeedbackDefinition.feedback_definition_id,
+                    self._run_location_filter(run_location),
+                )
+                .group_by(fc.status)
+            )
+            if feedback_definition_id:
+                q = q.where(fc.feedback_definition_id == feedback_definition_id)
+            if status:
+                if isinstance(status, mod_feedback_schema.FeedbackResultStatus):
+                    status = [status]
+                q = q.where(fc.status.in_([s.value for s in status]))
+
+            with self._read() as session:
+                return {
+                    mod_feedback_schema.FeedbackResultStatus(row[0]): int(
+                        row[1]
+                    )
+                    for row in session.execute(q)
+                    if row[1]
+                }
+
+        with self._read() as session:
+            q = self._feedback_query(
+                count_by_status=True,
+                **locals_except("self", "session"),
+            )
+            results = session.execute(q)
+
+            return {
+                mod_feedback_schema.FeedbackResultStatus(row[0]): row[1]
+                for row in results
+            }
+
+    def get_feedback(
+        self,
+        record_id: Optional[mod_types_schema.RecordID] = None,
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        feedback_definition_id: Optional[
+            mod_types_schema.FeedbackDefinitionID
+        ] = None,
+        status: Optional[
+            Union[
+                mod_feedback_schema.FeedbackResultStatus,
+                Sequence[mod_feedback_schema.FeedbackResultStatus],
+            ]
+        ] = None,
+        last_ts_before: Optional[datetime] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        shuffle: Optional[bool] = False,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+    ) -> pd.DataFrame:
+        """See [DB.get_feedback][trulens.core.database.base.DB.get_feedback]."""
+
+        with self._read() as session:
+            q = self._feedback_query(**locals_except("self", "session"))
+
+            results = (row[0] for row in session.execute(q))
+
+            df = self._feedback_results_frame(session, results)
+
+        if shuffle:
+            df = df.sample(frac=1).reset_index(drop=True)
+
+        return df
+
+    def get_records_and_feedback(
+        self,
+        app_ids: Optional[List[str]] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        since: Optional[mod_db.HighWaterMark] = None,
+    ) -> Tuple[pd.DataFrame, Sequence[str]]:
+        """See [DB.get_records_and_feedback][trulens.core.database.base.DB.get_records_and_feedback]."""
+
+        with self._read() as session:
+            stmt = self._records_and_feedback_query(
+                app_ids=app_ids, since=since, offset=offset, limit=limit
+            )
+
+            df, feedback_columns, _ = self._records_and_feedback_frame(
+                session, stmt, columns=RECORDS_AND_FEEDBACK_COLUMNS
+            )
+
+            return df, feedback_columns
+
+    def get_high_water_mark(self) -> mod_db.HighWaterMark:
+        """See [DB.get_high_water_mark][trulens.core.database.base.DB.get_high_water_mark]."""
+
+        rec = self.orm.Record
+        fr = self.orm.FeedbackResult
+        fc = self.orm.FeedbackCount
+
+        # Each value is read from an index or from the maintained counts
+        # instead of scanning the tables. The latest feedback result time is
+        # taken per status to use the status/last_ts index. Records are
+        # counted on an index rather than the table with their serialized
+        # records.
+        stmt = sa.select(
+            sa.select(sa.func.min(rec.ts)).scalar_subquery(),
+            sa.select(sa.func.max(rec.ts)).scalar_subquery(),
+            sa.select(sa.func.sum(fc.n_results)).scalar_subquery(),
+            sa.select(sa.func.count(rec.record_id)).scalar_subquery(),
+            *(
+                sa.select(sa.func.max(fr.last_ts))
+                .where(fr.status == status.value)
+                .scalar_subquery()
+                for status in mod_feedback_schema.FeedbackResultStatus
+            ),
+        )
+
+        with self._read() as session:
+            first_ts, last_ts, n_results, n_records, *feedback_ts = (
+                session.execute(stmt).one()
+            )
+
+        return mod_db.HighWaterMark(
+            first_record_ts=first_ts,
+            last_record_ts=last_ts,
+            last_feedback_ts=max(
+                (ts for ts in feedback_ts if ts is not None), default=None
+            ),
+            n_feedback_results=int(n_results or 0),
+            n_records=int(n_records or 0),
+        )
+
+    def iter_records_and_feedback(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        after: Optional[
+            Tuple[Union[datetime, str, float], mod_types_schema.RecordID]
+        ] = None,
+        feedback_calls: bool = False,
+        since: Optional[mod_db.HighWaterMark] = None,
+        record_ids: Optional[List[mod_types_schema.RecordID]] = None,
+    ) -> Iterator[Tuple[pd.DataFrame, Sequence[str]]]:
+        """See [DB.iter_records_and_feedback][trulens.core.database.base.DB.iter_records_and_feedback]."""
+
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be positive.")
+
+        if columns is None:
+            columns = [
+                col
+                for col in RECORDS_AND_FEEDBACK_COLUMNS
+                if col not in LAZY_RECORDS_AND_FEEDBACK_COLUMNS
+            ]
+        else:
+            unknown = set(columns) - set(RECORDS_AND_FEEDBACK_COLUMNS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown columns {sorted(unknown)}. "
+                    f"Expected some of {RECORDS_AND_FEEDBACK_COLUMNS}."
+                )
+
+        if after is not None:
+            ts, record_id = after
+            if isinstance(ts, str):
+                ts = datetime.fromisoformat(ts)
+            if isinstance(ts, datetime):
+                ts = ts.timestamp()
+            after = (ts, record_id)
+
+        while True:
+            # Each chunk is read in its own transaction so that iterating
+            # slowly does not hold the database.
+            with self._read() as session:
+                stmt = self._records_and_feedback_query(
+                    app_ids=app_ids,
+                    record_ids=record_ids,
+                    columns=columns,
+                    after=after,
+                    since=since,
+                    limit=chunk_size,
+                )
+
+                df, feedback_columns, after = self._records_and_feedback_frame(
+                    session,
+                    stmt,
+                    columns=columns,
+                    feedback_calls=feedback_calls,
+                )
+
+            if len(df) == 0:
+                return
+
+            yield df, feedback_columns
+
+            if len(df) < chunk_size:
+                return
+
+    def _records_and_feedback_query(
+        self,
+        app_ids: Optional[List[str]] = None,
+        record_ids: Optional[List[str]] = None,
+        columns: Sequence[str] = RECORDS_AND_FEEDBACK_COLUMNS,
+        after: Optional[Tuple[float, str]] = None,
+        since: Optional[mod_db.HighWaterMark] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ):
+        rec = self.orm.Record
+
+        stmt = sa.select(
+            rec.record_id,
+            rec.app_id,
+            rec.ts,
+            rec.latency_s,
+            rec.n_tokens,
+            rec.cost,
+            *(
+                getattr(rec, col)
+                for col in (
+                    "input",
+                    "output",
+                    "tags",
+                    "record_json",
+                    "cost_json",
+                    "perf_json",
+                )
+                if col in columns
+            ),
+        )
+        # NOTE: We are selecting records here because offset and limit need
+        # to be with respect to those rows instead of AppDefinition or
+        # FeedbackResult rows. Feedback results and apps are read separately
+        # for the selected records only in `_records_and_feedback_frame`.
+
+        if app_ids:
+            stmt = stmt.where(rec.app_id.in_(app_ids))
+
+        if record_ids is not None:
+            stmt = stmt.where(rec.record_id.in_(record_ids))
+
+        if after is not None:
+            # Keyset pagination: continue after the last (ts, record_id) seen.
+            # Unlike offsets, this does not require the database to skip over
+            # the rows of prior pages.
+            ts, record_id = after
+            stmt = stmt.where(
+                sa.or_(
+                    rec.ts > ts,
+                    sa.and_(rec.ts == ts, rec.record_id > record_id),
+                )
+            )
+
+        if since is not None and since.last_record_ts is not None:
+            fr = self.orm.FeedbackResult
+
+            # Listing every status lets the database scan the status/last_ts
+            # index for the recent feedback results of each.
+            changed = sa.select(fr.record_id).where(
+                fr.status.in_([
+                    status.value
+                    for status in mod_feedback_schema.FeedbackResultStatus
+                ])
+            )
+            if since.last_feedback_ts is not None:
+                changed = changed.where(fr.last_ts > since.last_feedback_ts)
+
+            # A union instead of `OR` so that both are index range scans.
+            stmt = stmt.where(
+                rec.record_id.in_(
+                    sa.union(
+                        sa.select(rec.record_id).where(
+                            rec.ts > since.last_record_ts
+                        ),
+                        changed,
+                    )
+                )
+            )
+
+        stmt = stmt.order_by(rec.ts, rec.record_id)
+
+        return stmt.limit(limit).offset(offset)
+
+    EXTRA_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "latency",
+        "total_tokens",
+        "total_cost",
+    )
+    """Columns computed from records by
+    [_records_and_feedback_frame][trulens.core.database.sqlalchemy.SQLAlchemyDB._records_and_feedback_frame]."""
+
+    def _records_and_feedback_frame(
+        self,
+        session: sa.orm.Session,
+        stmt: sa.Select,
+        columns: Sequence[str],
+        feedback_calls: bool = True,
+    ) -> Tuple[pd.DataFrame, List[str], Optional[Tuple[float, str]]]:
+        """Read the records selected by `stmt`, their feedback results and
+        their apps into a DataFrame.
+
+        Returns:
+            The DataFrame with the given columns, the feedback result columns
+                and the latency, token and cost columns.
+
+            The names of the feedback result columns.
+
+            The (ts, record_id) of the last record read, if any.
+        """
+
+        records = session.execute(stmt).all()
+
+        if len(records) == 0:
+            return (
+                pd.DataFrame(
+                    [],
+                    columns=[
+                        col
+                        for col in RECORDS_AND_FEEDBACK_COLUMNS
+                        if col in columns
+                    ]
+                    + list(self.EXTRA_COLUMNS),
+                ),
+                [],
+                None,
+            )
+
+        # Feedback results of all of the records in bulk instead of one query
+        # per record.
+        fb = self.orm.FeedbackResult
+        fb_columns = [fb.record_id, fb.name, fb.result, fb.multi_result]
+        if feedback_calls:
+            fb_columns.append(fb.calls_json)
+
+        record_ids = [rec.record_id for rec in records]
+        fb_rows = []
+        for i in range(0, len(record_ids), IN_CLAUSE_BATCH_SIZE):
+            fb_rows.extend(
+                session.execute(
+                    sa.select(*fb_columns)
+                    .where(
+                        fb.record_id.in_(
+                            record_ids[i : i + IN_CLAUSE_BATCH_SIZE]
+                        )
+                    )
+                    .order_by(fb.last_ts, fb.feedback_result_id)
+                )
+            )
+
+        if feedback_calls:
+            fb_rows = _with_decoded(
+                fb_rows,
+                "calls_json",
+                self._decode_json(session, [res.calls_json for res in fb_rows]),
+            )
+
+        results = defaultdict(list)
+        for res in fb_rows:
+            results[res.record_id].append(res)
+
+        if "record_json" in columns:
+            records = _with_decoded(
+                records,
+                "record_json",
+                self._decode_json(
+                    session, [rec.record_json for rec in records]
+                ),
+            )
+
+        apps = self._apps_of_records(
+            session,
+            {rec.app_id for rec in records},
+            app_json="app_json" in columns,
+        )
+
+        feedback_columns = set()
+        rows = []
+        for rec in records:
+            app_type, app_json = apps.get(rec.app_id, (None, None))
+
+            row = {
+                "app_id": rec.app_id,
+                "app_json": app_json,
+                "type": app_type,
+                "record_id": rec.record_id,
+                "ts": datetime.fromtimestamp(rec.ts).isoformat(),
+                **{
+                    col: getattr(rec, col)
+                    for col in (
+                        "input",
+                        "output",
+                        "tags",
+                        "record_json",
+                        "cost_json",
+                        "perf_json",
+                    )
+                    if col in columns
+                },
+            }
+            row = {
+                col: row[col]
+                for col in RECORDS_AND_FEEDBACK_COLUMNS
+                if col in columns
+            }
+            row.update(
+                _feedback_values(
+                    results[rec.record_id],
+                    feedback_columns,
+                    calls=feedback_calls,
+                )
+            )
+
+            rows.append(row)
+
+        df = pd.DataFrame(rows)
+        df["latency"] = pd.Series(
+            [rec.latency_s for rec in records], dtype=float
+        )
+        df["total_tokens"] = [rec.n_tokens for rec in records]
+        df["total_cost"] = pd.Series([rec.cost for rec in records], dtype=float)
+
+        last = records[-1]
+
+        return df, list(feedback_columns), (last.ts, last.record_id)
+
+    def _feedback_results_frame(
+        self,
+        session: sa.orm.Session,
+        results: Iterable["mod_orm.ORM.FeedbackResult"],
+    ) -> pd.DataFrame:
+        """Create a DataFrame of the given feedback results with their records,
+        apps and feedback definitions.
+
+        Related rows are read with one query per table instead of lazily per
+        feedback result and each distinct serialized record, app and feedback
+        definition is parsed once.
+        """
+
+        results = list(results)
+        calls_jsons = self._decode_json(
+            session, [res.calls_json for res in results]
+        )
+
+        rec = self.orm.Record
+        records = list(
+            self._select_in(
+                session,
+                [
+                    rec.record_id,
+                    rec.app_id,
+                    rec.record_json,
+                    rec.perf_json,
+                    rec.latency_s,
+                ],
+                rec.record_id,
+                {res.record_id for res in results},
+            )
+        )
+        records = {
+            row.record_id: row
+            for row in _with_decoded(
+                records,
+                "record_json",
+                self._decode_json(
+                    session, [row.record_json for row in records]
+                ),
+            )
+        }
+
+        app = self.orm.AppDefinition
+        apps = {}
+        for row in self._select_in(
+            session,
+            [app.app_id, app.app_json],
+            app.app_id,
+            {row.app_id for row in records.values()},
+        ):
+            app_json = json.loads(row.app_json)
+            apps[row.app_id] = (
+                app_json,
+                # Only the root class is needed here so the whole app is not
+                # validated.
+                Class.model_validate(app_json.get("root_class")),
             )
-        else:
-            q = q.filter(
-                self.orm.FeedbackDefinition.run_location == run_location.value
+
+        fdef = self.orm.FeedbackDefinition
+        feedback_jsons = {
+            row.feedback_definition_id: json.loads(row.feedback_json)
+            for row in self._select_in(
+                session,
+                [fdef.feedback_definition_id, fdef.feedback_json],
+                fdef.feedback_definition_id,
+                {res.feedback_definition_id for res in results},
             )
-        q = q.filter(
-            self.orm.FeedbackResult.feedback_definition_id
-            == self.orm.FeedbackDefinition.feedback_definition_id
+        }
+
+        record_jsons = {
+            record_id: (
+                json.loads(row.record_json),
+                json.loads(row.perf_json)
+                if row.perf_json != MIGRATION_UNKNOWN_STR
+                else no_perf,
+            )
+            for record_id, row in records.items()
+        }
+
+        def _extract(_result: "mod_orm.ORM.FeedbackResult", calls_json: str):
+            record = records[_result.record_id]
+            record_json, perf_json = record_jsons[_result.record_id]
+            app_json, _type = apps[record.app_id]
+
+            return (
+                _result.record_id,
+                _result.feedback_result_id,
+                _result.feedback_definition_id,
+                _result.last_ts,
+                mod_feedback_schema.FeedbackResultStatus(_result.status),
+                _result.error,
+                _result.name,
+                _result.result,
+                _result.multi_result,
+                _result.cost_json,  # why is cost_json not parsed?
+                perf_json,
+                json.loads(calls_json)["calls"],
+                feedback_jsons.get(_result.feedback_definition_id),
+                record_json,
+                app_json,
+                _type,
+                record.latency_s,
+                _result.n_tokens,
+                _result.cost,
+            )
+
+        return pd.DataFrame(
+            data=(
+                _extract(r, calls_json)
+                for r, calls_json in zip(results, calls_jsons)
+            ),
+            columns=[
+                "record_id",
+                "feedback_result_id",
+                "feedback_definition_id",
+                "last_ts",
+                "status",
+                "error",
+                "fname",
+                "result",
+                "multi_result",
+                "cost_json",
+                "perf_json",
+                "calls_json",
+                "feedback_json",
+                "record_json",
+                "app_json",
+                "type",
+                "latency",
+                "total_tokens",
+                "total_cost",
+            ],
         )
 
-        if status:
-            if isinstance(status, mod_feedback_schema.FeedbackResultStatus):
-                status = [status.value]
-            q = q.filter(
-                self.orm.FeedbackResult.status.in_([s.value for s in status])
+    @staticmethod
+    def _select_in(
+        session: sa.orm.Session,
+        columns: Sequence[sa.ColumnElement],
+        key: sa.ColumnElement,
+        values: Iterable[Any],
+        for_update: bool = False,
+    ) -> Iterator[sa.Row]:
+        """Select `columns` of the rows whose `key` is one of `values`, in
+        batches of at most `IN_CLAUSE_BATCH_SIZE` values.
+
+        If `for_update` is set, the selected rows are locked until the end of
+        the transaction.
+        """
+
+        values = sorted(values)
+
+        for i in range(0, len(values), IN_CLAUSE_BATCH_SIZE):
+            stmt = sa.select(*columns).where(
+                key.in_(values[i : i + IN_CLAUSE_BATCH_SIZE])
             )
-        if last_ts_before:
-            q = q.filter(
-                self.orm.FeedbackResult.last_ts < last_ts_before.timestamp()
+            if for_update:
+                # Lock in a consistent order so that concurrent writers do not
+                # deadlock.
+                stmt = stmt.order_by(key).with_for_update()
+
+            yield from session.execute(stmt)
+
+    def _insert_blobs(
+        self, session: sa.orm.Session, blobs: Dict[str, str]
+    ) -> None:
+        """Write the blobs produced by encoding rows that are not already in
+        the database."""
+
+        if len(blobs) == 0:
+            return
+
+        blob = self.orm.Blob
+
+        # Blobs are immutable so existing ones are not sent again.
+        existing = {
+            row.blob_id
+            for row in self._select_in(
+                session, [blob.blob_id], blob.blob_id, blobs
             )
+        }
 
-        if offset is not None:
-            q = q.offset(offset)
+        self._upsert(
+            session,
+            blob,
+            [
+                blob(blob_id=blob_id, content=self.codec.compress(content))
+                for blob_id, content in blobs.items()
+                if blob_id not in existing
+            ],
+            # Concurrent writers may insert the same blob.
+            update_columns=[],
+        )
 
-        if limit is not None:
-            q = q.limit(limit)
+    def _decode_json(
+        self, session: sa.orm.Session, values: Sequence[Optional[str]]
+    ) -> List[Optional[str]]:
+        """Decode serialized JSON values written with a
+        [StorageCodec][trulens.core.database.codec.StorageCodec].
 
-        if shuffle:
-            q = q.order_by(sa.func.random())
+        Values that are not encoded are returned as is. The blobs referred to
+        by all of the values are read with one query.
+        """
 
-        return q
+        decoded = list(values)
+        encoded = [
+            i for i, value in enumerate(values) if mod_codec.is_encoded(value)
+        ]
 
-    def get_feedback_count_by_status(
+        if len(encoded) == 0:
+            return decoded
+
+        refs = set()
+        for i in encoded:
+            decoded[i] = mod_codec.decompress(values[i])
+            if mod_codec.uses_blobs(values[i]):
+                refs |= mod_codec.blob_refs(decoded[i])
+
+        if len(refs) > 0:
+            blobs = self._read_blobs(session, refs)
+
+            for i in encoded:
+                if mod_codec.uses_blobs(values[i]):
+                    decoded[i] = mod_codec.resolve_blobs(decoded[i], blobs)
+
+        return decoded
+
+    def _read_blobs(
+        self, session: sa.orm.Session, blob_ids: Iterable[str]
+    ) -> Dict[str, str]:
+        """Get the decompressed content of the given blobs, from the cache
+        where possible."""
+
+        blobs = {}
+        missing = set()
+        for blob_id in blob_ids:
+            if (content := self._blobs.get(blob_id)) is not None:
+                blobs[blob_id] = content
+            else:
+                missing.add(blob_id)
+
+        blob = self.orm.Blob
+        for row in self._select_in(
+            session, [blob.blob_id, blob.content], blob.blob_id, missing
+        ):
+            content = mod_codec.decompress(row.content)
+            blobs[row.blob_id] = content
+
+            while len(self._blobs) >= BLOB_CACHE_SIZE:
+                # Evict the oldest entry.
+                self._blobs.pop(next(iter(self._blobs)), None)
+            self._blobs[row.blob_id] = content
+
+        return blobs
+
+    def _apps_of_records(
         self,
-        record_id: Optional[mod_types_schema.RecordID] = None,
-        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
-        feedback_definition_id: Optional[
-            mod_types_schema.FeedbackDefinitionID
-        ] = None,
-        status: Optional[
-            Union[
-                mod_feedback_schema.FeedbackResultStatus,
-                Sequence[mod_feedback_schema.FeedbackResultStatus],
-            ]
-        ] = None,
-        last_ts_before: Optional[datetime] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        shuffle: bool = False,
-        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
-    ) -> Dict[mod_feedback_schema.FeedbackResultStatus, int]:
-        """See [DB.get_feedback_count_by_status][trulens.core.database.base.DB.get_feedback_count_by_status]."""
+        session: sa.orm.Session,
+        app_ids: Iterable[mod_types_schema.AppID],
+        app_json: bool = False,
+    ) -> Dict[mod_types_schema.AppID, Tuple[str, Optional[str]]]:
+        """Get the root class names and optionally the serialized apps of the
+        given apps.
+
+        Root class names are cached so that the app json of each app is parsed
+        once and only read from the database if `app_json` is requested.
+        """
 
-        with self.session.begin() as session:
-            q = self._feedback_query(
-                count_by_status=True,
-                **locals_except("self", "session"),
+        app = self.orm.AppDefinition
+
+        app_ids = set(app_ids)
+        missing = app_ids - self._app_types.keys()
+
+        if app_json:
+            to_read = app_ids
+        else:
+            to_read = missing
+
+        apps = {}
+        for app_id, _app_json in session.execute(
+            sa.select(app.app_id, app.app_json).where(
+                app.app_id.in_(sorted(to_read))
             )
-            results = session.execute(q)
+        ):
+            if app_id in missing:
+                # Previous DBs did not contain entire app so we cannot
+                # deserialize AppDefinition here unless we fix prior DBs in
+                # migration. Because of this, loading just the `root_class`
+                # here.
+                self._app_types[app_id] = str(
+                    Class.model_validate(
+                        json.loads(_app_json).get("root_class")
+                    )
+                )
 
-            return {
-                mod_feedback_schema.FeedbackResultStatus(row[0]): row[1]
-                for row in results
-            }
+            apps[app_id] = (self._app_types[app_id], _app_json)
 
-    def get_feedback(
+        for app_id in app_ids - apps.keys():
+            if app_id in self._app_types:
+                apps[app_id] = (self._app_types[app_id], None)
+
+        return apps
+
+    def get_leaderboard(
         self,
-        record_id: Optional[mod_types_schema.RecordID] = None,
-        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
-        feedback_definition_id: Optional[
-            mod_types_schema.FeedbackDefinitionID
-        ] = None,
-        status: Optional[
-            Union[
-                mod_feedback_schema.FeedbackResultStatus,
-                Sequence[mod_feedback_schema.FeedbackResultStatus],
-            ]
-        ] = None,
-        last_ts_before: Optional[datetime] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
-        shuffle: Optional[bool] = False,
-        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
-    ) -> pd.DataFrame:
-        """See [DB.get_feedback][trulens.core.database.base.DB.get_feedback]."""
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        group_by_metadata_key: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Sequence[str]]:
+        """See [DB.get_leaderboard][trulens.core.database.base.DB.get_leaderboard]."""
 
-        with self.session.begin() as session:
-            q = self._feedback_query(**locals_except("self", "session"))
+        if self.engine.dialect.name not in JSON_DIALECTS:
+            return self._leaderboard_from_frames(
+                app_ids=app_ids, group_by_metadata_key=group_by_metadata_key
+            )
 
-            results = (row[0] for row in session.execute(q))
+        rec = self.orm.Record
+        fb = self.orm.FeedbackResult
+
+        group = [rec.app_id.label("app_id")]
+        if group_by_metadata_key is not None:
+            # The metadata column is not encoded, unlike record_json.
+            group.append(
+                self._json_text(rec.meta, group_by_metadata_key).label(
+                    str(group_by_metadata_key)
+                )
+            )
+        group_names = [col.name for col in group]
 
-            return _extract_feedback_results(results)
+        def _where(stmt):
+            if app_ids:
+                stmt = stmt.where(rec.app_id.in_(app_ids))
+            if group_by_metadata_key is not None:
+                # Like pandas groupby, leave out records without the key.
+                stmt = stmt.where(group[-1].is_not(None))
+            return stmt
+
+        record_stmt = _where(
+            sa.select(
+                *group,
+                sa.func.count().label("n_records"),
+                sa.func.avg(rec.latency_s).label("latency"),
+                sa.func.avg(rec.cost).label("total_cost"),
+                sa.func.sum(rec.cost).label("sum_cost"),
+                sa.func.sum(rec.n_tokens).label("sum_tokens"),
+            )
+        ).group_by(*group)
+
+        # Results are averaged per record first and then across records so
+        # that each record counts once regardless of how many times a
+        # feedback was evaluated on it.
+        single = sa.or_(fb.multi_result.is_(None), fb.multi_result == "null")
+        per_record = (
+            sa.select(
+                fb.record_id,
+                fb.name,
+                sa.func.avg(fb.result).label("result"),
+            )
+            .where(single, fb.result.is_not(None))
+            .group_by(fb.record_id, fb.name)
+            .subquery()
+        )
+        feedback_stmt = _where(
+            sa.select(
+                *group,
+                per_record.c.name,
+                sa.func.avg(per_record.c.result).label("result"),
+            ).join(rec, rec.record_id == per_record.c.record_id)
+        ).group_by(*group, per_record.c.name)
+
+        # Multi-result feedback values are spread over a JSON object with
+        # keys that are not known ahead of time so these are aggregated here
+        # instead of in the database. They are rare.
+        multi_stmt = _where(
+            sa.select(*group, fb.record_id, fb.name, fb.multi_result)
+            .join(rec, rec.record_id == fb.record_id)
+            .where(sa.not_(single))
+            .order_by(fb.last_ts, fb.feedback_result_id)
+        )
 
-    def get_records_and_feedback(
+        with self._read() as session:
+            df = pd.DataFrame(
+                session.execute(record_stmt).all(),
+                columns=group_names
+                + [
+                    "n_records",
+                    "latency",
+                    "total_cost",
+                    "sum_cost",
+                    "sum_tokens",
+                ],
+            ).set_index(group_names)
+
+            values = pd.DataFrame(
+                session.execute(feedback_stmt).all(),
+                columns=group_names + ["name", "result"],
+            )
+
+            multi_values = defaultdict(dict)
+            for row in session.execute(multi_stmt):
+                multi_result = json.loads(row.multi_result) or {}
+                for key, val in multi_result.items():
+                    if val is not None:
+                        multi_values[(*row[: len(group_names)], row.record_id)][
+                            f"{row.name}:::{key}"
+                        ] = val
+
+        if multi_values:
+            multi = pd.DataFrame(
+                [
+                    (*group_key[:-1], name, np.mean(val))
+                    for group_key, vals in multi_values.items()
+                    for name, val in vals.items()
+                ],
+                columns=group_names + ["name", "result"],
+            )
+            multi = (
+                multi.groupby(group_names + ["name"])["result"]
+                .mean()
+                .reset_index()
+            )
+            values = pd.concat([values, multi], ignore_index=True)
+
+        values["result"] = values["result"].astype(float)
+        feedback_cols = sorted(values["name"].unique())
+
+        if feedback_cols:
+            df = df.join(
+                values.pivot_table(
+                    index=group_names,
+                    columns="name",
+                    values="result",
+                    aggfunc="mean",
+                )
+            )
+            df = df.sort_values(by=feedback_cols, ascending=False)
+
+        df = df[
+            feedback_cols
+            + ["latency", "total_cost", "n_records", "sum_cost", "sum_tokens"]
+        ]
+        df.columns.name = None
+        df[["latency", "total_cost", "sum_cost", "sum_tokens"]] = df[
+            ["latency", "total_cost", "sum_cost", "sum_tokens"]
+        ].astype(float)
+
+        return df, feedback_cols
+
+    def _leaderboard_from_frames(
         self,
-        app_ids: Optional[List[str]] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = None,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        group_by_metadata_key: Optional[str] = None,
     ) -> Tuple[pd.DataFrame, Sequence[str]]:
-        """See [DB.get_records_and_feedback][trulens.core.database.base.DB.get_records_and_feedback]."""
+        """Compute the leaderboard in pandas for databases without support for
+        the JSON functions used by
+        [get_leaderboard][trulens.core.database.sqlalchemy.SQLAlchemyDB.get_leaderboard]."""
+
+        columns = ["app_id"]
+        if group_by_metadata_key is not None:
+            columns.append("record_json")
+
+        dfs = []
+        feedback_cols = set()
+        for df, chunk_feedback_cols in self.iter_records_and_feedback(
+            app_ids=app_ids, columns=columns, chunk_size=10000
+        ):
+            feedback_cols.update(chunk_feedback_cols)
+
+            if group_by_metadata_key is not None:
+                df[str(group_by_metadata_key)] = [
+                    meta.get(group_by_metadata_key, None)
+                    if isinstance(meta := json.loads(record_json)["meta"], dict)
+                    else None
+                    for record_json in df["record_json"]
+                ]
+                df = df.drop(columns=["record_json"])
+
+            dfs.append(df)
+
+        feedback_cols = sorted(feedback_cols)
+        group_names = ["app_id"]
+        if group_by_metadata_key is not None:
+            group_names.append(str(group_by_metadata_key))
+
+        df = pd.concat(
+            dfs
+            or [
+                pd.DataFrame(
+                    [],
+                    columns=group_names
+                    + ["latency", "total_cost", "total_tokens"],
+                )
+            ],
+            ignore_index=True,
+        )
+        for col in feedback_cols:
+            if col not in df.columns:
+                df[col] = np.nan
 
-        # TODO: Add pagination to this method. Currently the joinedload in
-        # select below disables lazy loading of records which will be a problem
-        # for large databases without the use of pagination.
+        groups = df.groupby(group_names)
+        df = groups[feedback_cols + ["latency", "total_cost"]].mean()
+        df["n_records"] = groups.size()
+        df["sum_cost"] = groups["total_cost"].sum().astype(float)
+        df["sum_tokens"] = groups["total_tokens"].sum().astype(float)
 
-        with self.session.begin() as session:
-            stmt = sa.select(self.orm.Record)
-            # NOTE: We are selecting records here because offset and limit need
-            # to be with respect to those rows instead of AppDefinition or
-            # FeedbackResult rows.
+        if feedback_cols:
+            df = df.sort_values(by=feedback_cols, ascending=False)
 
-            if app_ids:
-                stmt = stmt.where(self.orm.Record.app_id.in_(app_ids))
+        return df, feedback_cols
 
-            stmt = stmt.options(joinedload(self.orm.Record.feedback_results))
-            # NOTE(piotrm): The joinedload here makes it so that the
-            # feedback_results get loaded eagerly instead if lazily when
-            # accessed later.
+    def _json_text(self, column: sa.ColumnElement, *path: str):
+        """Expression for the text at `path` in the JSON-encoded `column`, or
+        NULL if there is nothing there."""
 
-            # TODO(piotrm): The subsequent logic in helper methods end up
-            # reading all of the records and feedback_results in order to create
-            # a DataFrame so there is no reason to not eagerly get all of this
-            # data. Ideally, though, we would be making some sort of lazy
-            # DataFrame and then could use the lazy join feature of sqlalchemy.
+        dialect = self.engine.dialect.name
 
-            stmt = stmt.order_by(self.orm.Record.ts, self.orm.Record.record_id)
-            # NOTE: feedback_results order is governed by the order_by on the
-            # orm.FeedbackResult.record backref definition. Here, we need to
-            # order Records as we did not use an auto join to retrieve them. If
-            # records were to be retrieved from AppDefinition.records via auto
-            # join, though, the orm backref ordering would be able to take hold.
+        if dialect == "postgresql":
+            return sa.func.json_extract_path_text(
+                sa.cast(column, sa.JSON), *path
+            )
+
+        if dialect == "snowflake":
+            return sa.func.json_extract_path_text(
+                column, ".".join(json.dumps(key) for key in path)
+            )
 
-            stmt = stmt.limit(limit).offset(offset)
+        json_path = "$" + "".join("." + json.dumps(key) for key in path)
+
+        if dialect == "mysql":
+            return sa.func.json_unquote(sa.func.json_extract(column, json_path))
+
+        # sqlite
+        return sa.func.json_extract(column, json_path)
+
+    def explain_queries(self) -> pd.DataFrame:
+        """See [DB.explain_queries][trulens.core.database.base.DB.explain_queries]."""
+
+        dialect = self.engine.dialect.name
+
+        queries = {
+            "evaluator poll": self._feedback_query(
+                status=[
+                    mod_feedback_schema.FeedbackResultStatus.NONE,
+                    mod_feedback_schema.FeedbackResultStatus.FAILED,
+                    mod_feedback_schema.FeedbackResultStatus.RUNNING,
+                ],
+                last_ts_before=datetime.now(),
+                limit=100,
+                shuffle=True,
+            ),
+            "feedback count by status": self._feedback_query(
+                count_by_status=True
+            ),
+            "feedback of record": self._feedback_query(
+                record_id="record_hash_0"
+            ),
+            "records and feedback": self._records_and_feedback_query(limit=100),
+            "records and feedback of app": self._records_and_feedback_query(
+                app_ids=["app_hash_0"], limit=100
+            ),
+        }
 
-            ex = session.execute(stmt).unique()
-            # unique needed for joinedload above.
+        tables = {
+            orm_class.__tablename__
+            for orm_class in self.orm.registry.values()
+            if hasattr(orm_class, "__tablename__")
+        }
 
-            records = [rec[0] for rec in ex]
-            # TODO: Make the iteration of records lazy in some way. See
-            # TODO(piotrm) above.
+        rows = []
+        with self.engine.connect() as conn:
+            for name, stmt in queries.items():
+                sql = str(
+                    stmt.compile(
+                        dialect=self.engine.dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
 
-            return AppsExtractor().get_df_and_cols(records=records)
+                plan, scanned = _explain(conn, dialect, sql)
+
+                rows.append({
+                    "query": name,
+                    "sql": sql,
+                    "plan": plan,
+                    "sequential_scans": None
+                    if scanned is None
+                    else sorted({
+                        table
+                        for table in tables
+                        for scan in scanned
+                        if _is_table_or_alias(scan, table)
+                    }),
+                })
+
+        return pd.DataFrame(
+            rows, columns=["query", "sql", "plan", "sequential_scans"]
+        )
 
     def insert_ground_truth(
         self, ground_truth: mod_groundtruth_schema.GroundTruth
     ) -> mod_types_schema.GroundTruthID:
         """See [DB.insert_ground_truth][trulens.core.database.base.DB.insert_ground_truth]."""
 
-        # TODO: thread safety
-        with self.session.begin() as session:
-            if (
-                _ground_truth := session.query(self.orm.GroundTruth)
-                .filter_by(ground_truth_id=ground_truth.ground_truth_id)
-                .first()
-            ):
-                # Update the existing record for idempotency
-                _ground_truth.ground_truth_json = ground_truth.model_dump_json()
-            else:
-                _ground_truth = self.orm.GroundTruth.parse(
-                    ground_truth, redact_keys=self.redact_keys
-                )
+        _ground_truth = self.orm.GroundTruth.parse(
+            ground_truth, redact_keys=self.redact_keys
+        )
 
-                session.merge(_ground_truth)
+        def write(session: sa.orm.Session) -> mod_types_schema.GroundTruthID:
+            self._upsert(
+                session,
+                self.orm.GroundTruth,
+                [_ground_truth],
+                update_columns=["ground_truth_json"],
+            )
 
             logger.info(
                 f"{UNICODE_CHECK} added ground truth {_ground_truth.ground_truth_id}"
@@ -764,51 +2998,38 @@ class SQLAlchemyDB(DB):
 
             return _ground_truth.ground_truth_id
 
+        return self._write(write)
+
     def batch_insert_ground_truth(
         self, ground_truths: List[mod_groundtruth_schema.GroundTruth]
     ) -> List[mod_types_schema.GroundTruthID]:
         """See [DB.batch_insert_ground_truth][trulens_eval.database.base.DB.batch_insert_ground_truth]."""
-        with self.session.begin() as session:
-            ground_truth_ids = [gt.ground_truth_id for gt in ground_truths]
-
-            # Fetch existing GroundTruth records that match these ids in one query
-            existing_ground_truths = (
-                session.query(self.orm.GroundTruth)
-                .filter(
-                    self.orm.GroundTruth.ground_truth_id.in_(ground_truth_ids)
-                )
-                .all()
+        ground_truths_list = [
+            self.orm.GroundTruth.parse(gt, redact_keys=self.redact_keys)
+            for gt in ground_truths
+        ]
+
+        def write(
+            session: sa.orm.Session,
+        ) -> List[mod_types_schema.GroundTruthID]:
+            # Existing ground truths only get their json updated for
+            # idempotency.
+            self._upsert(
+                session,
+                self.orm.GroundTruth,
+                ground_truths_list,
+                update_columns=["ground_truth_json"],
             )
-
-            existing_ground_truth_dict = {
-                gt.ground_truth_id: gt for gt in existing_ground_truths
-            }
-
-            ground_truths_to_insert = []
-            for ground_truth in ground_truths:
-                if ground_truth.ground_truth_id in existing_ground_truth_dict:
-                    existing_record = existing_ground_truth_dict[
-                        ground_truth.ground_truth_id
-                    ]
-                    # Update the existing record for idempotency
-                    existing_record.ground_truth_json = (
-                        ground_truth.model_dump_json()
-                    )
-                else:
-                    new_ground_truth = self.orm.GroundTruth.parse(
-                        ground_truth, redact_keys=self.redact_keys
-                    )
-                    ground_truths_to_insert.append(new_ground_truth)
-
-            session.bulk_save_objects(ground_truths_to_insert)
             return [gt.ground_truth_id for gt in ground_truths]
 
+        return self._write(write)
+
     def get_ground_truth(
         self, ground_truth_id: str | None = None
     ) -> Optional[JSONized]:
         """See [DB.get_ground_truth][trulens.core.database.base.DB.get_ground_truth]."""
 
-        with self.session.begin() as session:
+        with self._read() as session:
             if (
                 _ground_truth := session.query(self.orm.GroundTruth)
                 .filter_by(ground_truth_id=ground_truth_id)
@@ -820,7 +3041,7 @@ class SQLAlchemyDB(DB):
         self, dataset_name: str
     ) -> pd.DataFrame | None:
         """See [DB.get_ground_truths_by_dataset][trulens.core.database.base.DB.get_ground_truths_by_dataset]."""
-        with self.session.begin() as session:
+        with self._read() as session:
             q = sa.select(self.orm.Dataset)
             all_datasets = (row[0] for row in session.execute(q))
             df = None
@@ -847,28 +3068,26 @@ class SQLAlchemyDB(DB):
     ) -> mod_types_schema.DatasetID:
         """See [DB.insert_dataset][trulens.core.database.base.DB.insert_dataset]."""
 
-        with self.session.begin() as session:
-            if (
-                _dataset := session.query(self.orm.Dataset)
-                .filter_by(dataset_id=dataset.dataset_id)
-                .first()
-            ):
-                # Update the existing record for idempotency
-                _dataset.dataset_json = dataset.model_dump_json()
-            else:
-                _dataset = self.orm.Dataset.parse(
-                    dataset, redact_keys=self.redact_keys
-                )
-                session.merge(_dataset)
+        _dataset = self.orm.Dataset.parse(dataset, redact_keys=self.redact_keys)
+
+        def write(session: sa.orm.Session) -> mod_types_schema.DatasetID:
+            self._upsert(
+                session,
+                self.orm.Dataset,
+                [_dataset],
+                update_columns=["dataset_json"],
+            )
 
             logger.info(f"{UNICODE_CHECK} added dataset {_dataset.dataset_id}")
 
             return _dataset.dataset_id
 
+        return self._write(write)
+
     def get_datasets(self) -> pd.DataFrame:
         """See [DB.get_datasets][trulens.core.database.base.DB.get_datasets]."""
 
-        with self.session.begin() as session:
+        with self._read() as session:
             results = session.query(self.orm.Dataset)
 
             return pd.DataFrame(
@@ -877,105 +3096,184 @@ class SQLAlchemyDB(DB):
             )
 
 
-# Use this Perf for missing Perfs.
-# TODO: Migrate the database instead.
-no_perf = mod_base_schema.Perf.min().model_dump()
+_UPSERT_MAX_BIND_PARAMS: Dict[str, int] = {
+    "sqlite": 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999,
+    "postgresql": 65535,
+    "mysql": 65535,
+    "snowflake": 16384,
+}
+"""Maximum number of bind parameters in one upsert statement, by dialect.
 
+Dialects not listed here do not have an upsert statement implementation."""
 
-def _extract_feedback_results(
-    results: Iterable["mod_orm.FeedbackResult"],
-) -> pd.DataFrame:
-    def _extract(_result: "mod_orm.FeedbackResult"):
-        app_json = json.loads(_result.record.app.app_json)
-        _type = mod_app_schema.AppDefinition.model_validate(app_json).root_class
 
-        return (
-            _result.record_id,
-            _result.feedback_result_id,
-            _result.feedback_definition_id,
-            _result.last_ts,
-            mod_feedback_schema.FeedbackResultStatus(_result.status),
-            _result.error,
-            _result.name,
-            _result.result,
-            _result.multi_result,
-            _result.cost_json,  # why is cost_json not parsed?
-            json.loads(_result.record.perf_json)
-            if _result.record.perf_json != MIGRATION_UNKNOWN_STR
-            else no_perf,
-            json.loads(_result.calls_json)["calls"],
-            json.loads(_result.feedback_definition.feedback_json)
-            if _result.feedback_definition is not None
-            else None,
-            json.loads(_result.record.record_json),
-            app_json,
-            _type,
+def _upsert_statement(
+    dialect: sa.Dialect,
+    table: sa.Table,
+    rows: Optional[List[Dict[str, Any]]],
+    primary_key: Sequence[str],
+    update_columns: Sequence[str],
+) -> sa.Executable:
+    """Create a statement inserting `rows` into `table` or updating
+    `update_columns` of existing rows with the same `primary_key`.
+
+    Produces `INSERT ... ON CONFLICT DO UPDATE` for sqlite and postgres,
+    `INSERT ... ON DUPLICATE KEY UPDATE` for mysql and `MERGE` for snowflake.
+
+    If `rows` is None, the statement is to be executed with the rows as
+    parameters instead. Not supported for snowflake.
+    """
+
+    if dialect.name in ("sqlite", "postgresql"):
+        if dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+
+        stmt = insert(table) if rows is None else insert(table).values(rows)
+        if len(update_columns) == 0:
+            return stmt.on_conflict_do_nothing(index_elements=primary_key)
+
+        return stmt.on_conflict_do_update(
+            index_elements=primary_key,
+            set_={c: stmt.excluded[c] for c in update_columns},
         )
 
-    df = pd.DataFrame(
-        data=(_extract(r) for r in results),
-        columns=[
-            "record_id",
-            "feedback_result_id",
-            "feedback_definition_id",
-            "last_ts",
-            "status",
-            "error",
-            "fname",
-            "result",
-            "multi_result",
-            "cost_json",
-            "perf_json",
-            "calls_json",
-            "feedback_json",
-            "record_json",
-            "app_json",
-            "type",
-        ],
-    )
-    df["latency"] = _extract_latency(df["perf_json"])
-    df = pd.concat([df, _extract_tokens_and_cost(df["cost_json"])], axis=1)
-    return df
+    if dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        stmt = insert(table) if rows is None else insert(table).values(rows)
+        if len(update_columns) == 0:
+            # Assigning a key to itself makes duplicates a no-op.
+            update_columns = primary_key[:1]
+
+        return stmt.on_duplicate_key_update({
+            c: stmt.inserted[c] for c in update_columns
+        })
+
+    if dialect.name == "snowflake":
+        quote = dialect.identifier_preparer.quote
+        columns = list(rows[0].keys())
 
+        values = ", ".join(
+            "(" + ", ".join(f":r{i}_{j}" for j in range(len(columns))) + ")"
+            for i in range(len(rows))
+        )
+        source_columns = ", ".join(
+            f"column{j + 1} AS {quote(c)}" for j, c in enumerate(columns)
+        )
+        on = " AND ".join(
+            f"target.{quote(c)} = source.{quote(c)}" for c in primary_key
+        )
+        inserted_columns = ", ".join(quote(c) for c in columns)
+        inserted_values = ", ".join(f"source.{quote(c)}" for c in columns)
+
+        merge = (
+            f"MERGE INTO {dialect.identifier_preparer.format_table(table)} AS target "
+            f"USING (SELECT {source_columns} FROM VALUES {values}) AS source "
+            f"ON {on} "
+        )
+        if len(update_columns) > 0:
+            merge += "WHEN MATCHED THEN UPDATE SET " + ", ".join(
+                f"target.{quote(c)} = source.{quote(c)}" for c in update_columns
+            )
+        merge += (
+            f" WHEN NOT MATCHED THEN INSERT ({inserted_columns}) "
+            f"VALUES ({inserted_values})"
+        )
 
-def _extract_latency(
-    series: Iterable[Union[str, dict, mod_base_schema.Perf]],
-) -> pd.Series:
-    def _extract(perf_json: Union[str, dict, mod_base_schema.Perf]) -> int:
-        if perf_json == MIGRATION_UNKNOWN_STR:
-            return np.nan
+        return sql_text(merge).bindparams(**{
+            f"r{i}_{j}": row[c]
+            for i, row in enumerate(rows)
+            for j, c in enumerate(columns)
+        })
 
-        if isinstance(perf_json, str):
-            perf_json = json.loads(perf_json)
+    raise ValueError(f"No upsert statement for dialect {dialect.name}.")
 
-        if isinstance(perf_json, dict):
-            perf_json = mod_base_schema.Perf.model_validate(perf_json)
 
-        if isinstance(perf_json, mod_base_schema.Perf):
-            return perf_json.latency.seconds
+@functools.lru_cache(maxsize=256)
+def _compiled_upsert(
+    dialect: sa.Dialect,
+    table: sa.Table,
+    primary_key: Tuple[str, ...],
+    update_columns: Tuple[str, ...],
+) -> Tuple[str, Tuple[str, ...]]:
+    """The upsert statement of `table` compiled for `dialect`, and the columns
+    of its positional parameters.
 
-        if perf_json is None:
-            return 0
+    Sqlalchemy does not cache the compiled form of dialect-specific inserts so
+    compiling them for every write would dominate the cost of small writes.
+    """
 
-        raise ValueError(f"Failed to parse perf_json: {perf_json}")
+    compiled = _upsert_statement(
+        dialect=dialect,
+        table=table,
+        rows=None,
+        primary_key=primary_key,
+        update_columns=update_columns,
+    ).compile(dialect=dialect)
 
-    return pd.Series(data=(_extract(p) for p in series))
+    return compiled.string, tuple(compiled.positiontup)
 
 
-def _extract_tokens_and_cost(cost_json: pd.Series) -> pd.DataFrame:
-    def _extract(_cost_json: Union[str, dict]) -> Tuple[int, float]:
-        if isinstance(_cost_json, str):
-            _cost_json = json.loads(_cost_json)
-        if _cost_json is not None:
-            cost = mod_base_schema.Cost(**_cost_json)
-        else:
-            cost = mod_base_schema.Cost()
-        return cost.n_tokens, cost.cost
+# Use this Perf for missing Perfs.
+# TODO: Migrate the database instead.
+no_perf = mod_base_schema.Perf.min().model_dump()
 
-    return pd.DataFrame(
-        data=(_extract(c) for c in cost_json),
-        columns=["total_tokens", "total_cost"],
-    )
+
+def _explain(
+    conn: sa.Connection, dialect: str, sql: str
+) -> Tuple[Optional[str], Optional[List[str]]]:
+    """Get the plan of the given query and the names of the tables (or table
+    aliases) it scans sequentially.
+
+    Returns None for both if the dialect is not supported.
+    """
+
+    if dialect == "sqlite":
+        # Rows are (id, parent, notused, detail). A full table scan shows up as
+        # "SCAN <table>" without a "USING ... INDEX" clause.
+        details = [
+            row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql)
+        ]
+        scanned = [
+            detail.split()[1]
+            for detail in details
+            if detail.startswith("SCAN ") and "INDEX" not in detail
+        ]
+        return "\n".join(details), scanned
+
+    if dialect == "postgresql":
+        lines = [row[0] for row in conn.exec_driver_sql("EXPLAIN " + sql)]
+        # Lines look like "Seq Scan on <table> [<alias>]  (cost=...)".
+        scanned = [
+            line.split("Seq Scan on ", 1)[1].split()[0]
+            for line in lines
+            if "Seq Scan on " in line
+        ]
+        return "\n".join(lines), scanned
+
+    if dialect == "mysql":
+        result = conn.exec_driver_sql("EXPLAIN " + sql)
+        plan_rows = [dict(row._mapping) for row in result]
+        # Access type "ALL" is a full table scan.
+        scanned = [row["table"] for row in plan_rows if row["type"] == "ALL"]
+        return "\n".join(str(row) for row in plan_rows), scanned
+
+    logger.warning("Explaining queries is not supported for %s.", dialect)
+
+    return None, None
+
+
+def _is_table_or_alias(name: str, table: str) -> bool:
+    """Check whether `name` refers to `table` directly or via one of the
+    anonymous aliases (`<table>_<n>`) that sqlalchemy generates for joins."""
+
+    if name == table:
+        return True
+
+    suffix = name[len(table) + 1 :]
+    return name.startswith(table + "_") and suffix.isdigit()
 
 
 def _extract_ground_truths(
@@ -1008,171 +3306,62 @@ def _extract_ground_truths(
     )
 
 
-class AppsExtractor:
-    """Utilities for creating dataframes from orm instances."""
-
-    app_cols = ["app_id", "app_json", "type"]
-    rec_cols = [
-        "record_id",
-        "input",
-        "output",
-        "tags",
-        "record_json",
-        "cost_json",
-        "perf_json",
-        "ts",
-    ]
-    extra_cols = ["latency", "total_tokens", "total_cost"]
-    all_cols = app_cols + rec_cols + extra_cols
-
-    def __init__(self):
-        self.feedback_columns = set()
-
-    def get_df_and_cols(
-        self,
-        apps: Optional[List["mod_orm.ORM.AppDefinition"]] = None,
-        records: Optional[List["mod_orm.ORM.Record"]] = None,
-    ) -> Tuple[pd.DataFrame, Sequence[str]]:
-        """Produces a records dataframe which joins in information from apps and
-        feedback results.
-
-        Args:
-            apps: If given, includes all records of all of the apps in this
-                iterable.
-
-            records: If given, includes only these records. Mutually exclusive
-                with `apps`.
-        """
-
-        assert (
-            apps is None or records is None
-        ), "`apps` and `records` are mutually exclusive"
-
-        if apps is not None:
-            df = pd.concat(self.extract_apps(apps))
-
-        elif records is not None:
-            apps = {record.app for record in records}
-            df = pd.concat(self.extract_apps(apps=apps, records=records))
-
-        else:
-            raise ValueError("'apps` or `records` must be provided")
-
-        df["latency"] = _extract_latency(df["perf_json"])
-        df.reset_index(
-            drop=True, inplace=True
-        )  # prevent index mismatch on the horizontal concat that follows
-        df = pd.concat([df, _extract_tokens_and_cost(df["cost_json"])], axis=1)
-        return df, list(self.feedback_columns)
-
-    def extract_apps(
-        self,
-        apps: Iterable["mod_orm.ORM.AppDefinition"],
-        records: Optional[List["mod_orm.ORM.Record"]] = None,
-    ) -> Iterable[pd.DataFrame]:
-        """
-        Creates record rows with app information.
-
-        TODO: The means for enumerating records in this method is not ideal as
-        it does a lot of filtering.
-        """
-
-        yield pd.DataFrame(
-            [], columns=self.app_cols + self.rec_cols
-        )  # prevent empty iterator
-        for _app in apps:
-            try:
-                if records is None:
-                    # If records not provided, get all of them for `_app`.
-                    _recs = _app.records
-                else:
-                    # Otherwise get only the ones in `records`. WARNING: Avoid
-                    # using _app.records here as doing so might get all of the
-                    # records even the ones not in `records`
-                    _recs = (
-                        record
-                        for record in records
-                        if record.app_id == _app.app_id
-                    )
+def _with_decoded(
+    rows: Sequence[sa.Row], column: str, values: Sequence[Optional[str]]
+) -> List[Any]:
+    """Replace `column` of the given rows by the decoded `values`.
 
-                if _recs:
-                    df = pd.DataFrame(data=self.extract_records(_recs))
+    Rows whose value did not need decoding are kept as they are.
+    """
 
-                    for col in self.app_cols:
-                        if col == "type":
-                            # Previous DBs did not contain entire app so we cannot
-                            # deserialize AppDefinition here unless we fix prior DBs
-                            # in migration. Because of this, loading just the
-                            # `root_class` here.
+    return [
+        row
+        if value is getattr(row, column)
+        else SimpleNamespace(**{**row._asdict(), column: value})
+        for row, value in zip(rows, values)
+    ]
 
-                            df[col] = str(
-                                Class.model_validate(
-                                    json.loads(_app.app_json).get("root_class")
-                                )
-                            )
 
-                        else:
-                            df[col] = getattr(_app, col)
+def _feedback_values(
+    results: Iterable[Any], feedback_columns: set, calls: bool = True
+) -> Dict[str, Any]:
+    """Aggregate the feedback results of a record into a row of feedback
+    columns.
 
-                    yield df
-            except OperationalError as e:
-                print(
-                    "Error encountered while attempting to retrieve an app. "
-                    "This issue may stem from a corrupted database."
-                )
-                print(f"Error details: {e}")
+    Args:
+        results: Feedback result rows or orm instances of a single record.
 
-    def extract_records(
-        self, records: Iterable["mod_orm.ORM.Record"]
-    ) -> Iterable[pd.Series]:
-        for _rec in records:
-            calls = defaultdict(list)
-            values = defaultdict(list)
+        feedback_columns: Set to which the names of the produced feedback
+            columns are added.
 
-            try:
-                for _res in _rec.feedback_results:
-                    calls[_res.name].append(
-                        json.loads(_res.calls_json)["calls"]
-                    )
-                    if (
-                        _res.multi_result is not None
-                        and (multi_result := json.loads(_res.multi_result))
-                        is not None
-                    ):
-                        for key, val in multi_result.items():
-                            if (
-                                val is not None
-                            ):  # avoid getting Nones into np.mean
-                                name = f"{_res.name}:::{key}"
-                                values[name] = val
-                                self.feedback_columns.add(name)
-                    elif (
-                        _res.result is not None
-                    ):  # avoid getting Nones into np.mean
-                        values[_res.name].append(_res.result)
-                        self.feedback_columns.add(_res.name)
-
-                row = {
-                    **{k: np.mean(v) for k, v in values.items()},
-                    **{k + "_calls": flatten(v) for k, v in calls.items()},
-                }
+        calls: Whether to include the `<name>_calls` columns with the feedback
+            function calls. Requires `calls_json` in `results`.
+    """
 
-                for col in self.rec_cols:
-                    row[col] = (
-                        datetime.fromtimestamp(_rec.ts).isoformat()
-                        if col == "ts"
-                        else getattr(_rec, col)
-                    )
+    _calls = defaultdict(list)
+    values = defaultdict(list)
 
-                yield row
+    for _res in results:
+        if calls:
+            _calls[_res.name].append(json.loads(_res.calls_json)["calls"])
 
-            except Exception as e:
-                # Handling unexpected errors, possibly due to database issues.
-                print(
-                    "Error encountered while attempting to retrieve feedback results. "
-                    "This issue may stem from a corrupted database."
-                )
-                print(f"Error details: {e}")
+        if (
+            _res.multi_result is not None
+            and (multi_result := json.loads(_res.multi_result)) is not None
+        ):
+            for key, val in multi_result.items():
+                if val is not None:  # avoid getting Nones into np.mean
+                    name = f"{_res.name}:::{key}"
+                    values[name] = val
+                    feedback_columns.add(name)
+        elif _res.result is not None:  # avoid getting Nones into np.mean
+            values[_res.name].append(_res.result)
+            feedback_columns.add(_res.name)
+
+    return {
+        **{k: np.mean(v) for k, v in values.items()},
+        **{k + "_calls": flatten(v) for k, v in _calls.items()},
+    }
 
 
 def flatten(nested: Iterable[Iterable[Any]]) -> List[Any]:
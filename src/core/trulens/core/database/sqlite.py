@@ -0,0 +1,360 @@
+"""
+# High-concurrency SQLite
+
+File-based SQLite databases opened by
+[SQLAlchemyDB][trulens.core.database.sqlalchemy.SQLAlchemyDB] are set up
+according to its [SQLiteOptions][trulens.core.database.sqlite.SQLiteOptions]
+for many threads writing and reading at once:
+
+- The database is put in WAL journal mode so that readers do not block the
+  writer and the writer does not block readers.
+
+- `synchronous=NORMAL` lets commits skip syncing the disk in WAL mode. The
+  database stays consistent on power loss, though the last commits may be
+  lost.
+
+- Connections wait up to a busy timeout for locks held by other connections
+  and processes instead of failing with "database is locked".
+
+- The database file is memory-mapped for reads.
+
+- All writes go through a single
+  [SQLiteWriter][trulens.core.database.sqlite.SQLiteWriter] thread, which
+  commits the writes queued while it was busy in one transaction.
+
+- Reads use a separate pool of read-only connections.
+
+```python
+from trulens.core.database.sqlite import SQLiteOptions
+
+session = TruSession(database_args=dict(sqlite=SQLiteOptions(mmap_size=0)))
+```
+
+Pass `sqlite=None` to keep the connections as configured by the engine.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import deque
+from concurrent import futures
+import dataclasses
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Callable, Deque, List, Optional, Tuple, TypeVar
+from urllib.parse import quote
+import weakref
+
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class SQLiteOptions:
+    """Settings of file-based SQLite databases."""
+
+    journal_mode: str = "WAL"
+    """Journal mode of the database."""
+
+    synchronous: str = "NORMAL"
+    """How often SQLite syncs the disk."""
+
+    busy_timeout: float = 30.0
+    """Seconds a connection waits for locks held by other connections."""
+
+    mmap_size: int = 256 * 2**20
+    """Bytes of the database file memory-mapped. Not mapped if 0."""
+
+    writer: bool = True
+    """Run writes on a single
+    [SQLiteWriter][trulens.core.database.sqlite.SQLiteWriter] thread."""
+
+    max_write_batch: int = 256
+    """Maximum number of writes committed in one transaction by the writer
+    thread."""
+
+    read_pool_size: int = 4
+    """Number of read-only connections kept open for reads. Reads use the
+    connections of the engine if 0."""
+
+    def __post_init__(self):
+        if self.max_write_batch < 1:
+            raise ValueError("`max_write_batch` must be positive.")
+        if self.read_pool_size < 0:
+            raise ValueError("`read_pool_size` must not be negative.")
+
+    def pragmas(self, read_only: bool = False) -> List[str]:
+        """Statements configuring new connections.
+
+        Args:
+            read_only: Whether the connections cannot write. The journal mode
+                is only set by connections that can.
+        """
+
+        pragmas = [
+            f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)};",
+            f"PRAGMA synchronous={self.synchronous};",
+            f"PRAGMA mmap_size={self.mmap_size};",
+        ]
+
+        if read_only:
+            pragmas.append("PRAGMA query_only=ON;")
+        else:
+            pragmas.insert(0, f"PRAGMA journal_mode={self.journal_mode};")
+
+        return pragmas
+
+
+def database_path(url: sa.engine.URL) -> Optional[Path]:
+    """Path of the file of a SQLite database that can be written to. None if
+    the database is not a writable SQLite file."""
+
+    if not url.drivername.startswith("sqlite"):
+        return None
+
+    if url.database in (None, "", ":memory:"):
+        return None
+
+    if url.database.startswith("file:") or url.query.get("mode") == "ro":
+        # Uri filenames are used to open databases read-only or in memory.
+        return None
+
+    return Path(url.database)
+
+
+def set_pragmas(pragmas: List[str], dbapi_connection, _) -> None:
+    """Execute `pragmas` on a new connection. Listens to engine `connect`
+    events."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def create_read_engine(path: Path, options: SQLiteOptions) -> sa.Engine:
+    """Create an engine with a pool of read-only connections to the SQLite
+    database at `path`."""
+
+    uri = f"file:{quote(str(path.absolute()))}?mode=ro"
+
+    def connect() -> sqlite3.Connection:
+        return sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=options.busy_timeout,
+            check_same_thread=False,
+        )
+
+    engine = sa.create_engine(
+        "sqlite://",
+        creator=connect,
+        poolclass=sa.pool.QueuePool,
+        pool_size=options.read_pool_size,
+        max_overflow=options.read_pool_size,
+        pool_use_lifo=True,
+    )
+
+    sa.event.listen(
+        engine,
+        "connect",
+        lambda *args: set_pragmas(options.pragmas(read_only=True), *args),
+    )
+
+    return engine
+
+
+@dataclasses.dataclass
+class WriterStats:
+    """Counters describing the use of a
+    [SQLiteWriter][trulens.core.database.sqlite.SQLiteWriter]."""
+
+    writes: int = 0
+    """Number of writes run."""
+
+    transactions: int = 0
+    """Number of transactions committed or rolled back."""
+
+    failed_writes: int = 0
+    """Number of writes that raised an error."""
+
+
+class SQLiteWriter:
+    """Runs the writes to a database on a single thread.
+
+    Writes are functions of a session. Those queued while the thread is busy
+    are run in one transaction once it is free, so that concurrent writers
+    share a commit instead of waiting on each other for the database lock. If
+    the transaction fails, each of its writes is run again in its own
+    transaction so that only the writes that fail raise an error.
+
+    Args:
+        session: Makes the sessions of the database.
+
+        max_batch_size: Maximum number of writes run in one transaction.
+
+        idle_timeout: Seconds without writes after which the thread exits. It
+            is started again by the next write.
+    """
+
+    def __init__(
+        self,
+        session: sessionmaker,
+        max_batch_size: int = 256,
+        idle_timeout: float = 5.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be positive.")
+
+        self.session = session
+        self.max_batch_size = max_batch_size
+        self.idle_timeout = idle_timeout
+
+        self._queue: Deque[
+            Tuple[Callable[[sa.orm.Session], T], futures.Future]
+        ] = deque()
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._stopped: bool = False
+
+        self._stats = WriterStats()
+
+        # Session of the transaction in progress on the writer thread.
+        self._current: Optional[sa.orm.Session] = None
+
+        # Started on demand and exits once idle for `idle_timeout` seconds so
+        # that writers of databases no longer used do not linger.
+        self._thread: Optional[threading.Thread] = None
+
+        atexit.register(_stop_at_exit, weakref.ref(self))
+
+    @property
+    def stats(self) -> WriterStats:
+        """A snapshot of the writer's counters."""
+
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def run(self, write: Callable[[sa.orm.Session], T]) -> T:
+        """Run `write` in a transaction on the writer thread and wait for its
+        result.
+
+        Writes issued from within a write are run in the same transaction.
+        """
+
+        if threading.current_thread() is self._thread:
+            return write(self._current)
+
+        future = futures.Future()
+
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("SQLite writer has been stopped.")
+
+            self._queue.append((write, future))
+            self._not_empty.notify()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="SQLiteWriter", daemon=True
+                )
+                self._thread.start()
+
+        return future.result()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish the queued writes and stop the writer thread."""
+
+        with self._lock:
+            self._stopped = True
+            self._not_empty.notify()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._queue) == 0 and not self._stopped:
+                    self._not_empty.wait(self.idle_timeout)
+
+                if len(self._queue) == 0:
+                    self._thread = None
+                    return
+
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.max_batch_size, len(self._queue)))
+                ]
+
+            self._write_batch(batch)
+
+    def _write_batch(
+        self,
+        batch: List[Tuple[Callable[[sa.orm.Session], T], futures.Future]],
+    ) -> None:
+        try:
+            results = self._transaction([write for write, _ in batch])
+
+        except Exception as e:
+            if len(batch) == 1:
+                with self._lock:
+                    self._stats.failed_writes += 1
+                batch[0][1].set_exception(e)
+                return
+
+            # Find the writes that fail by running each on its own.
+            for write, future in batch:
+                try:
+                    future.set_result(self._transaction([write])[0])
+
+                except Exception as e:
+                    with self._lock:
+                        self._stats.failed_writes += 1
+                    future.set_exception(e)
+
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _transaction(
+        self, writes: List[Callable[[sa.orm.Session], T]]
+    ) -> List[T]:
+        with self._lock:
+            self._stats.transactions += 1
+            self._stats.writes += len(writes)
+
+        with self.session.begin() as session:
+            if session.get_bind().dialect.name == "sqlite":
+                # Take the write lock up front so that the transaction waits
+                # for other writers instead of failing when it first writes.
+                session.execute(sa.text("BEGIN IMMEDIATE"))
+
+            self._current = session
+            try:
+                return [write(session) for write in writes]
+            finally:
+                self._current = None
+
+
+def _stop_at_exit(writer_ref: weakref.ref[SQLiteWriter]) -> None:
+    writer = writer_ref()
+
+    if writer is None:
+        return
+
+    try:
+        writer.stop()
+    except Exception as e:
+        logger.error("Failed to finish database writes at exit: %s", e)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
+import contextvars
 from dataclasses import dataclass
 import functools
 import importlib
 import inspect
 import logging
+import math
 from pprint import PrettyPrinter
+import sys
+import threading
 from time import sleep
 from types import ModuleType
 from typing import (
@@ -15,6 +20,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -22,6 +28,7 @@ from typing import (
     Type,
     TypeVar,
 )
+import weakref
 
 from pydantic import Field
 import requests
@@ -34,7 +41,6 @@ from trulens.core.utils.python import SingletonPerName
 from trulens.core.utils.python import Thunk
 from trulens.core.utils.python import callable_name
 from trulens.core.utils.python import class_name
-from trulens.core.utils.python import get_first_local_in_call_stack
 from trulens.core.utils.python import is_really_coroutinefunction
 from trulens.core.utils.python import module_name
 from trulens.core.utils.python import safe_hasattr
@@ -56,6 +62,76 @@ INSTRUMENT = "__tru_instrument"
 DEFAULT_RPM = 60
 """Default requests per minute for endpoints."""
 
+EXPECTED_LATENCY = 10.0
+"""Expected upper bound on the duration in seconds of endpoint requests. Used
+to determine how many requests can be in flight at once without exceeding an
+endpoint's rpm."""
+
+_trackers: contextvars.ContextVar[
+    Optional[
+        Dict[Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]]
+    ]
+] = contextvars.ContextVar("tru_endpoint_trackers", default=None)
+"""Endpoints tracking costs in the current context and their callbacks, by
+callback class.
+
+Set by the innermost
+[_track_costs][trulens.core.feedback.endpoint.Endpoint._track_costs] and
+looked up by instrumented methods. Context variables are copied to threads
+started with [TP][trulens.core.utils.threading.TP],
+[Thread][trulens.core.utils.threading.Thread] or
+[ThreadPoolExecutor][trulens.core.utils.threading.ThreadPoolExecutor], and by
+asyncio to new tasks.
+"""
+
+
+def _retry_after(headers: Optional[Any]) -> Optional[float]:
+    """Seconds to wait before retrying as given by the `retry-after-ms` or
+    `retry-after` headers of a rate limiting response, if any."""
+
+    if headers is None:
+        return None
+
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers.get("retry-after-ms")) / 1000.0
+
+        if headers.get("retry-after") is not None:
+            return float(headers.get("retry-after"))
+
+    except (TypeError, ValueError):
+        # Retry-After may also be an http date which we do not parse.
+        pass
+
+    return None
+
+
+def _rate_limit_retry_after(error: Exception) -> Optional[float]:
+    """Check whether `error` was caused by a rate limiting response.
+
+    Returns None if it was not. Otherwise returns the seconds to wait before
+    retrying, or 0.0 if the response did not say.
+    """
+
+    response = getattr(error, "response", None)
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(response, "status_code", None)
+
+    if isinstance(response, dict):
+        # botocore errors carry the parsed response as a dict.
+        code = response.get("Error", {}).get("Code")
+        if code in ("ThrottlingException", "TooManyRequestsException"):
+            return 0.0
+
+    if status_code != 429 and "RateLimit" not in type(error).__name__:
+        return None
+
+    retry_after = _retry_after(getattr(response, "headers", None))
+
+    return 0.0 if retry_after is None else retry_after
+
 
 class EndpointCallback(SerialModel):
     """
@@ -89,6 +165,10 @@ class EndpointCallback(SerialModel):
         """Called after each classification response."""
         self.handle(response)
 
+    def handle_cached(self) -> None:
+        """Called for each request answered from a response cache."""
+        self.cost.n_cached_requests += 1
+
 
 class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
     """API usage, pacing, and utilities for API endpoints."""
@@ -160,19 +240,30 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
     rpm: float = DEFAULT_RPM
     """Requests per minute."""
 
+    tpm: Optional[float] = None
+    """Tokens per minute. Not limited if not given."""
+
+    max_concurrency: Optional[int] = None
+    """Maximum number of requests in flight at once.
+
+    Defaults to the number of requests that can be in flight without exceeding
+    `rpm` given requests that take
+    [EXPECTED_LATENCY][trulens.core.feedback.endpoint.EXPECTED_LATENCY]
+    seconds.
+    """
+
     retries: int = 3
     """Retries (if performing requests using this class)."""
 
     post_headers: Dict[str, str] = Field(default_factory=dict, exclude=True)
     """Optional post headers for post requests if done by this class."""
 
-    pace: mod_pace.Pace = Field(
-        default_factory=lambda: mod_pace.Pace(
-            marks_per_second=DEFAULT_RPM / 60.0, seconds_per_period=60.0
-        ),
-        exclude=True,
-    )
-    """Pacing instance to maintain a desired rpm."""
+    limiter: Optional[mod_pace.RateLimiter] = Field(None, exclude=True)
+    """Limiter of the rate of requests to this endpoint.
+
+    Shared with other endpoints with the same
+    [limiter_key][trulens.core.feedback.endpoint.Endpoint.limiter_key].
+    """
 
     global_callback: EndpointCallback = Field(
         exclude=True
@@ -190,6 +281,14 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
     callback_name: str = Field(exclude=True)
     """Name of variable that stores the callback noted above."""
 
+    _semaphores: ClassVar[
+        weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]
+        ]
+    ] = weakref.WeakKeyDictionary()
+    """Semaphores limiting concurrent evaluations using each named endpoint,
+    per event loop."""
+
     def __new__(cls, *args, name: Optional[str] = None, **kwargs):
         name = name or cls.__name__
         return super().__new__(cls, *args, name=name, **kwargs)
@@ -207,6 +306,8 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         *args,
         name: str,
         rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
         callback_class: Optional[Any] = None,
         **kwargs,
     ):
@@ -222,25 +323,52 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             #    "Endpoint has to be extended by class that can set `callback_class`."
             # )
 
+        # Pace instances were used for rate limiting before RateLimiter. Keep
+        # accepting them for their rate.
+        pace: Optional[mod_pace.Pace] = kwargs.pop("pace", None)
+
         if rpm is None:
-            rpm = DEFAULT_RPM
+            rpm = DEFAULT_RPM if pace is None else pace.marks_per_second * 60.0
+
+        if max_concurrency is None:
+            max_concurrency = max(1, math.ceil(rpm * EXPECTED_LATENCY / 60.0))
 
         kwargs["name"] = name
+        kwargs["rpm"] = rpm
+        kwargs["tpm"] = tpm
+        kwargs["max_concurrency"] = max_concurrency
         kwargs["callback_class"] = callback_class
         kwargs["global_callback"] = callback_class(endpoint=self)
         kwargs["callback_name"] = f"callback_{name}"
-        kwargs["pace"] = mod_pace.Pace(
-            seconds_per_period=60.0,  # 1 minute
-            marks_per_second=rpm / 60.0,
-        )
 
         super().__init__(*args, **kwargs)
 
+        self.limiter = mod_pace.RateLimiter.shared(
+            self.limiter_key(),
+            rpm=rpm,
+            tpm=tpm,
+            max_concurrency=max_concurrency,
+        )
+
         logger.debug("Creating new endpoint singleton with name %s.", self.name)
 
+        # Endpoints that failed to be created for tracking costs may now be
+        # creatable, such as after their keys were set.
+        Endpoint._available_modules = -1
+
         # Extending class should call _instrument_module on the appropriate
         # modules and methods names.
 
+    def limiter_key(self) -> Hashable:
+        """Key identifying the API account used by this endpoint. Endpoints
+        with the same key share their
+        [limiter][trulens.core.feedback.endpoint.Endpoint.limiter].
+
+        Subclasses that can tell which account they use should override this.
+        """
+
+        return type(self).__name__, self.name
+
     def pace_me(self) -> float:
         """
         Block until we can make a request to this endpoint to keep pace with
@@ -248,15 +376,75 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         returned.
         """
 
-        return self.pace.mark()
+        return self.limiter.mark()
+
+    async def apace_me(self) -> float:
+        """
+        Async version of
+        [pace_me][trulens.core.feedback.endpoint.Endpoint.pace_me].
+        """
+
+        return await self.limiter.amark()
+
+    def _record_usage(self) -> None:
+        """Count the tokens used by requests to this endpoint since the last
+        call against the limiter's tokens per minute."""
+
+        self.limiter.record_token_total(
+            (type(self).__name__, self.name),
+            self.global_callback.cost.n_tokens,
+        )
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore limiting the evaluations using this endpoint in flight in
+        the running event loop to
+        [max_concurrency][trulens.core.feedback.endpoint.Endpoint.max_concurrency].
+
+        The semaphore is shared by all users of the endpoint in the same loop.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        semaphores = Endpoint._semaphores.setdefault(loop, {})
+        if self.name not in semaphores:
+            semaphores[self.name] = asyncio.Semaphore(self.max_concurrency)
+
+        return semaphores[self.name]
 
     def post(
         self, url: str, payload: JSON, timeout: float = DEFAULT_NETWORK_TIMEOUT
     ) -> Any:
-        self.pace_me()
-        ret = requests.post(
-            url, json=payload, timeout=timeout, headers=self.post_headers
-        )
+        retries = self.retries + 1
+
+        while True:
+            with self.limiter.request():
+                ret = requests.post(
+                    url,
+                    json=payload,
+                    timeout=timeout,
+                    headers=self.post_headers,
+                )
+
+            if ret.status_code != 429:
+                break
+
+            retries -= 1
+            logger.error(
+                "%s request rate limited. Retries remaining=%s.",
+                self.name,
+                retries,
+            )
+
+            # The limiter holds back the retry and other requests.
+            self.limiter.rate_limited(_retry_after(ret.headers))
+
+            if retries == 0:
+                raise RuntimeError(
+                    f"Endpoint {self.name} request was rate limited "
+                    f"{self.retries + 1} time(s)."
+                )
+
+        self.limiter.succeeded()
 
         j = ret.json()
 
@@ -302,8 +490,12 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         while retries > 0:
             try:
-                self.pace_me()
-                ret = func(*args, **kwargs)
+                with self.limiter.request():
+                    ret = func(*args, **kwargs)
+
+                self.limiter.succeeded()
+                self._record_usage()
+
                 return ret
 
             except Exception as e:
@@ -316,7 +508,13 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
                     retries,
                 )
                 errors.append(e)
-                if retries > 0:
+
+                retry_after = _rate_limit_retry_after(e)
+                if retry_after is not None:
+                    # The limiter holds back the retry and other requests.
+                    self.limiter.rate_limited(retry_after)
+
+                elif retries > 0:
                     sleep(retry_delay)
                     retry_delay *= 2
 
@@ -325,6 +523,59 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             + ("\n\t".join(map(str, errors)))
         )
 
+    async def arun_in_pace(
+        self,
+        func: mod_asynchro_utils.CallableMaybeAwaitable[A, B],
+        *args,
+        **kwargs,
+    ) -> B:
+        """
+        Async version of
+        [run_in_pace][trulens.core.feedback.endpoint.Endpoint.run_in_pace].
+        The given `func` may be synchronous in which case it is run in a
+        thread.
+        """
+
+        retries = self.retries + 1
+        retry_delay = 2.0
+
+        errors = []
+
+        while retries > 0:
+            try:
+                async with self.limiter.arequest():
+                    ret = await mod_asynchro_utils.desync(func, *args, **kwargs)
+
+                self.limiter.succeeded()
+                self._record_usage()
+
+                return ret
+
+            except Exception as e:
+                retries -= 1
+                logger.error(
+                    "%s request failed %s=%s. Retries remaining=%s.",
+                    self.name,
+                    type(e),
+                    e,
+                    retries,
+                )
+                errors.append(e)
+
+                retry_after = _rate_limit_retry_after(e)
+                if retry_after is not None:
+                    # The limiter holds back the retry and other requests.
+                    self.limiter.rate_limited(retry_after)
+
+                elif retries > 0:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2
+
+        raise RuntimeError(
+            f"Endpoint {self.name} request failed {self.retries + 1} time(s): \n\t"
+            + ("\n\t".join(map(str, errors)))
+        )
+
     def run_me(self, thunk: Thunk[T]) -> T:
         """
         DEPRECATED: Run the given thunk, returning itse output, on pace with the api.
@@ -459,6 +710,96 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         already_instrumented.add(method_name)
 
+    _available: ClassVar[Dict[str, Optional[Endpoint]]] = {}
+    """Endpoints created by
+    [_all_endpoints][trulens.core.feedback.endpoint.Endpoint._all_endpoints]
+    by `arg_flag` of their setup. None if the endpoint could not be created."""
+
+    _available_modules: ClassVar[int] = 0
+    """Number of loaded modules when endpoints last failed to be created."""
+
+    _available_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def refresh_endpoints() -> None:
+        """Forget the endpoints created for tracking costs so that they are
+        created again by the next tracking call.
+
+        Endpoints that could not be created are otherwise only retried once
+        other modules are loaded or new endpoints are created.
+        """
+
+        with Endpoint._available_lock:
+            Endpoint._available = {}
+
+    @staticmethod
+    def _all_endpoints(**flags: bool) -> List[Endpoint]:
+        """Create the endpoints enabled by the `with_*` flags in `flags` whose
+        providers are installed.
+
+        Endpoints are created once and reused by later calls.
+        """
+
+        available = Endpoint._available
+
+        if len(sys.modules) != Endpoint._available_modules and any(
+            endpoint is None for endpoint in available.values()
+        ):
+            # Providers may have become available.
+            with Endpoint._available_lock:
+                Endpoint._available = available = {
+                    flag: endpoint
+                    for flag, endpoint in Endpoint._available.items()
+                    if endpoint is not None
+                }
+
+        endpoints = []
+
+        for setup in Endpoint.ENDPOINT_SETUPS:
+            if not flags.get(setup.arg_flag):
+                continue
+
+            if setup.arg_flag in available:
+                endpoint = available[setup.arg_flag]
+            else:
+                endpoint = Endpoint._create_endpoint(setup)
+
+                with Endpoint._available_lock:
+                    Endpoint._available[setup.arg_flag] = endpoint
+                    if endpoint is None:
+                        Endpoint._available_modules = len(sys.modules)
+
+            if endpoint is not None:
+                endpoints.append(endpoint)
+
+        return endpoints
+
+    @staticmethod
+    def _create_endpoint(setup: EndpointSetup) -> Optional[Endpoint]:
+        """Create the endpoint of `setup` if its provider is installed."""
+
+        try:
+            mod = importlib.import_module(setup.module_name)
+            cls = safe_getattr(mod, setup.class_name)
+        except Exception:
+            # If endpoint uses optional packages, will get either module
+            # not found error, or we will have a dummy which will fail
+            # at getattr. Skip either way.
+            return None
+
+        try:
+            return cls()
+
+        except Exception as e:
+            logger.debug(
+                "Could not initialize endpoint %s. "
+                "Possibly missing key(s). "
+                "trulens will not track costs/usage of this endpoint. %s",
+                cls.__name__,
+                e,
+            )
+            return None
+
     @staticmethod
     def track_all_costs(
         __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
@@ -475,31 +816,13 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         execution of thunk.
         """
 
-        endpoints = []
-
-        for endpoint in Endpoint.ENDPOINT_SETUPS:
-            if locals().get(endpoint.arg_flag):
-                try:
-                    mod = importlib.import_module(endpoint.module_name)
-                    cls = safe_getattr(mod, endpoint.class_name)
-                except Exception:
-                    # If endpoint uses optional packages, will get either module
-                    # not found error, or we will have a dummy which will fail
-                    # at getattr. Skip either way.
-                    continue
-
-                try:
-                    e = cls()
-                    endpoints.append(e)
-
-                except Exception as e:
-                    logger.debug(
-                        "Could not initialize endpoint %s. "
-                        "Possibly missing key(s). "
-                        "trulens will not track costs/usage of this endpoint. %s",
-                        cls.__name__,
-                        e,
-                    )
+        endpoints = Endpoint._all_endpoints(
+            with_openai=with_openai,
+            with_hugs=with_hugs,
+            with_litellm=with_litellm,
+            with_bedrock=with_bedrock,
+            with_cortex=with_cortex,
+        )
 
         return Endpoint._track_costs(
             __func, *args, with_endpoints=endpoints, **kwargs
@@ -540,6 +863,39 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         return result, costs
 
+    @staticmethod
+    def _add_callbacks(
+        endpoints: Dict[
+            Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]
+        ],
+        with_endpoints: Optional[List[Endpoint]],
+    ) -> List[EndpointCallback]:
+        """Create callbacks for each of `with_endpoints` and add them to
+        `endpoints` in place. Returns the created callbacks."""
+
+        # Collect any new endpoints requested of us.
+        with_endpoints = with_endpoints or []
+
+        # Keep track of the new callback objects we create here for returning.
+        callbacks = []
+
+        # Create the callbacks for the new requested endpoints only. Existing
+        # endpoints from other frames will keep their callbacks.
+        for endpoint in with_endpoints:
+            callback_class = endpoint.callback_class
+            callback = callback_class(endpoint=endpoint)
+
+            if callback_class not in endpoints:
+                endpoints[callback_class] = []
+
+            # And add them to the endpoints dict. This will be retrieved from
+            # locals of the tracking frame later in the wrapped methods.
+            endpoints[callback_class].append((endpoint, callback))
+
+            callbacks.append(callback)
+
+        return callbacks
+
     @staticmethod
     def _track_costs(
         __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
@@ -551,57 +907,121 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         Root of all cost tracking methods. Runs the given `thunk`, tracking
         costs using each of the provided endpoints' callbacks.
         """
+        endpoints, callbacks = Endpoint._enter_tracker(with_endpoints)
+
+        token = _trackers.set(endpoints)
+        try:
+            # Call the function.
+            result: T = __func(*args, **kwargs)
+        finally:
+            _trackers.reset(token)
+
+        # Return result and only the callbacks created here. Outer thunks might
+        # return others.
+        return result, callbacks
+
+    @staticmethod
+    def _enter_tracker(
+        with_endpoints: Optional[List[Endpoint]],
+    ) -> Tuple[
+        Dict[Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]],
+        List[EndpointCallback],
+    ]:
+        """Endpoints tracking costs within a new tracking call: those of the
+        enclosing tracking call, if any, and `with_endpoints`. Also returns the
+        callbacks created for `with_endpoints`."""
+
         # Check to see if this call is within another _track_costs call:
-        endpoints: Dict[
-            Type[EndpointCallback], List[Tuple[Endpoint, EndpointCallback]]
-        ] = get_first_local_in_call_stack(
-            key="endpoints", func=Endpoint.__find_tracker, offset=1
-        )
+        outer = _trackers.get()
 
-        if endpoints is None:
+        if outer is None:
             # If not, lets start a new collection of endpoints here along with
             # the callbacks for each. See type above.
-
             endpoints = {}
 
         else:
-            # We copy the dict here so that the outer call to _track_costs will
-            # have their own version unaffacted by our additions below. Once
-            # this frame returns, the outer frame will have its own endpoints
-            # again and any wrapped method will get that smaller set of
-            # endpoints.
+            # We copy the dict and its lists here so that the outer call to
+            # _track_costs will have their own version unaffected by our
+            # additions below. Once this call returns, wrapped methods will
+            # get the smaller set of endpoints of the outer call again.
+            endpoints = {
+                callback_class: list(pairs)
+                for callback_class, pairs in outer.items()
+            }
 
-            # TODO: check if deep copy is needed given we are storing lists in
-            # the values and don't want to affect the existing ones here.
-            endpoints = dict(endpoints)
+        callbacks = Endpoint._add_callbacks(endpoints, with_endpoints)
 
-        # Collect any new endpoints requested of us.
-        with_endpoints = with_endpoints or []
+        return endpoints, callbacks
 
-        # Keep track of the new callback objects we create here for returning
-        # later.
-        callbacks = []
+    @staticmethod
+    async def atrack_all_costs_tally(
+        __func: mod_asynchro_utils.CallableMaybeAwaitable[A, T],
+        *args,
+        with_openai: bool = True,
+        with_hugs: bool = True,
+        with_litellm: bool = True,
+        with_bedrock: bool = True,
+        with_cortex: bool = True,
+        **kwargs,
+    ) -> Tuple[T, Cost]:
+        """
+        Async version of
+        [track_all_costs_tally][trulens.core.feedback.endpoint.Endpoint.track_all_costs_tally].
+        Coroutine functions are awaited in the running loop while other
+        functions are run in a thread.
+        """
 
-        # Create the callbacks for the new requested endpoints only. Existing
-        # endpoints from other frames will keep their callbacks.
-        for endpoint in with_endpoints:
-            callback_class = endpoint.callback_class
-            callback = callback_class(endpoint=endpoint)
+        flags = dict(
+            with_openai=with_openai,
+            with_hugs=with_hugs,
+            with_litellm=with_litellm,
+            with_bedrock=with_bedrock,
+            with_cortex=with_cortex,
+        )
 
-            if callback_class not in endpoints:
-                endpoints[callback_class] = []
+        if not is_really_coroutinefunction(__func):
+            return await asyncio.to_thread(
+                Endpoint.track_all_costs_tally, __func, *args, **flags, **kwargs
+            )
 
-            # And add them to the endpoints dict. This will be retrieved from
-            # locals of this frame later in the wrapped methods.
-            endpoints[callback_class].append((endpoint, callback))
+        result, cbs = await Endpoint._atrack_costs(
+            __func,
+            *args,
+            with_endpoints=Endpoint._all_endpoints(**flags),
+            **kwargs,
+        )
 
-            callbacks.append(callback)
+        if len(cbs) == 0:
+            # Otherwise sum returns "0" below.
+            costs = Cost()
+        else:
+            costs = sum(cb.cost for cb in cbs)
 
-        # Call the function.
-        result: T = __func(*args, **kwargs)
+        return result, costs
+
+    @staticmethod
+    async def _atrack_costs(
+        __func: mod_asynchro_utils.CallableAwaitable[A, T],
+        *args,
+        with_endpoints: Optional[List[Endpoint]] = None,
+        **kwargs,
+    ) -> Tuple[T, Sequence[EndpointCallback]]:
+        """
+        Async version of
+        [_track_costs][trulens.core.feedback.endpoint.Endpoint._track_costs].
+        Instrumented calls made by the awaited coroutine find the endpoints of
+        this call as they do for `_track_costs`.
+        """
+
+        endpoints, callbacks = Endpoint._enter_tracker(with_endpoints)
+
+        # Set within the awaiting task only.
+        token = _trackers.set(endpoints)
+        try:
+            result: T = await __func(*args, **kwargs)
+        finally:
+            _trackers.reset(token)
 
-        # Return result and only the callbacks created here. Outer thunks might
-        # return others.
         return result, callbacks
 
     def track_cost(
@@ -622,10 +1042,6 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
 
         return result, callbacks[0]
 
-    @staticmethod
-    def __find_tracker(f):
-        return id(f) == id(Endpoint._track_costs.__code__)
-
     def handle_wrapped_call(
         self,
         func: Callable,
@@ -652,6 +1068,24 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
             "Subclasses of Endpoint must implement handle_wrapped_call."
         )
 
+    def handle_cached_request(self) -> None:
+        """Record a request to this endpoint answered from a response cache.
+
+        Notifies the global callback and the callbacks tracking costs of the
+        current call, as is done for instrumented calls.
+        """
+
+        self.global_callback.handle_cached()
+
+        endpoints = _trackers.get()
+
+        if endpoints is None:
+            return
+
+        for endpoint, callback in endpoints.get(self.callback_class, []):
+            if endpoint is self:
+                callback.handle_cached()
+
     def wrap_function(self, func):
         """Create a wrapper of the given function to perform cost tracking."""
 
@@ -690,36 +1124,25 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
         # If INSTRUMENT is not set, create a wrapper method and return it.
         @functools.wraps(func)
         def tru_wrapper(*args, **kwargs):
-            logger.debug(
-                "Calling instrumented method %s of type %s, "
-                "iscoroutinefunction=%s, "
-                "isasyncgeneratorfunction=%s",
-                func,
-                type(func),
-                is_really_coroutinefunction(func),
-                inspect.isasyncgenfunction(func),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Calling instrumented method %s of type %s, "
+                    "iscoroutinefunction=%s, "
+                    "isasyncgeneratorfunction=%s",
+                    func,
+                    type(func),
+                    is_really_coroutinefunction(func),
+                    inspect.isasyncgenfunction(func),
+                )
 
             # Get the result of the wrapped function:
 
             response = func(*args, **kwargs)
 
-            bindings = inspect.signature(func).bind(*args, **kwargs)
-
-            # Get all of the callback classes suitable for handling this
-            # call. Note that we stored this in the INSTRUMENT attribute of
-            # the wrapper method.
-            registered_callback_classes = getattr(tru_wrapper, INSTRUMENT)
-
             # Look up the endpoints that are expecting to be notified and the
             # callback tracking the tally. See Endpoint._track_costs for
             # definition.
-            endpoints: Dict[
-                Type[EndpointCallback],
-                Sequence[Tuple[Endpoint, EndpointCallback]],
-            ] = get_first_local_in_call_stack(
-                key="endpoints", func=self.__find_tracker, offset=0
-            )
+            endpoints = _trackers.get()
 
             # If wrapped method was not called from within _track_costs, we
             # will get None here and do nothing but return wrapped
@@ -728,6 +1151,13 @@ class Endpoint(WithClassInfo, SerialModel, SingletonPerName):
                 logger.debug("No endpoints found.")
                 return response
 
+            bindings = inspect.signature(func).bind(*args, **kwargs)
+
+            # Get all of the callback classes suitable for handling this
+            # call. Note that we stored this in the INSTRUMENT attribute of
+            # the wrapper method.
+            registered_callback_classes = getattr(tru_wrapper, INSTRUMENT)
+
             def response_callback(response):
                 for callback_class in registered_callback_classes:
                     logger.debug("Handling callback_class: %s.", callback_class)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
 import inspect
 from inspect import Signature
 from inspect import signature
 import itertools
 import json
 import logging
+import os
 from pprint import pformat
+import socket
+import threading
 import traceback
 from typing import (
     TYPE_CHECKING,
@@ -30,6 +33,7 @@ import pydantic
 from rich import print as rprint
 from rich.markdown import Markdown
 from rich.pretty import pretty_repr
+from trulens.core.feedback import provider as mod_base_provider
 import trulens.core.feedback.endpoint as mod_base_endpoint
 from trulens.core.schema import Select
 from trulens.core.schema import app as mod_app_schema
@@ -37,6 +41,7 @@ from trulens.core.schema import base as mod_base_schema
 from trulens.core.schema import feedback as mod_feedback_schema
 from trulens.core.schema import record as mod_record_schema
 from trulens.core.schema import types as mod_types_schema
+from trulens.core.utils import asynchro as mod_asynchro_utils
 from trulens.core.utils import json as mod_json_utils
 from trulens.core.utils import pyschema as mod_pyschema
 from trulens.core.utils import python as mod_python_utils
@@ -53,6 +58,38 @@ if TYPE_CHECKING:
 # from trulens.core import schema as tru_schema # also breaks pydantic
 
 logger = logging.getLogger(__name__)
+
+_deferred_feedbacks: Dict[mod_types_schema.FeedbackDefinitionID, Feedback] = {}
+"""Feedback functions rebuilt from their stored definitions by
+[evaluate_deferred][trulens.core.feedback.feedback.Feedback.evaluate_deferred]."""
+
+_deferred_feedbacks_lock = threading.Lock()
+
+
+def _deferred_feedback(
+    feedback_definition_id: mod_types_schema.FeedbackDefinitionID,
+    feedback_json: mod_serial_utils.JSON,
+) -> Feedback:
+    """Rebuild the feedback function with the given stored definition, once per
+    process.
+
+    Definition ids are derived from the definition contents so a definition
+    with an id seen before is the same. Loading an implementation may be
+    expensive, i.e. if it loads a local model.
+    """
+
+    if feedback_definition_id == "anonymous_feedback_definition":
+        return Feedback.model_validate(feedback_json)
+
+    with _deferred_feedbacks_lock:
+        if feedback_definition_id not in _deferred_feedbacks:
+            _deferred_feedbacks[feedback_definition_id] = (
+                Feedback.model_validate(feedback_json)
+            )
+
+        return _deferred_feedbacks[feedback_definition_id]
+
+
 A = TypeVar("A")
 
 ImpCallable = Callable[[A], Union[float, Tuple[float, Dict[str, Any]]]]
@@ -332,6 +369,7 @@ class Feedback(mod_feedback_schema.FeedbackDefinition):
         limit: Optional[int] = None,
         shuffle: bool = False,
         run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+        claimed_by: Optional[str] = None,
     ) -> List[
         Tuple[
             pandas.Series,
@@ -344,61 +382,98 @@ class Feedback(mod_feedback_schema.FeedbackDefinition):
         initial [FeedbackResult][trulens.core.schema.feedback.FeedbackResult] as
         well as the Future which will contain the actual result.
 
+        Feedbacks are claimed atomically in the database (see
+        [DB.claim_feedback][trulens.core.database.base.DB.claim_feedback]) so
+        that multiple evaluators, even on different hosts, do not evaluate the
+        same feedback. The claim is released once the evaluation finishes.
+
         Args:
             limit: The maximum number of evals to start.
 
-            shuffle: Shuffle the order of the feedbacks to evaluate.
+            shuffle: Shuffle the order of the claimed feedbacks to evaluate.
 
             run_location: Only run feedback functions with this run_location.
 
+            claimed_by: Identifier of this evaluator in the database. Defaults
+                to one derived from the host name and process id.
+
         Constants that govern behavior:
 
-        - TruSession.RETRY_RUNNING_SECONDS: How long to time before restarting a feedback
-          that was started but never failed (or failed without recording that
-          fact).
+        - TruSession.RETRY_RUNNING_SECONDS: Duration of the lease on claimed
+          feedbacks. A feedback whose lease was not renewed in time (see
+          [DB.renew_feedback_leases][trulens.core.database.base.DB.renew_feedback_leases])
+          is considered stalled and may be claimed again.
 
         - TruSession.RETRY_FAILED_SECONDS: How long to wait to retry a failed feedback.
         """
 
         db = session.connector.db
 
+        if claimed_by is None:
+            claimed_by = f"{socket.gethostname()}:{os.getpid()}"
+
+        # Records of the claimed feedbacks, parsed once so that the feedbacks
+        # on the same record share its layout (see
+        # [layout_calls_as_app][trulens.core.schema.record.Record.layout_calls_as_app]).
+        records: Dict[mod_types_schema.RecordID, mod_record_schema.Record] = {}
+        records_lock = threading.Lock()
+
+        def get_record(row) -> mod_record_schema.Record:
+            with records_lock:
+                record = records.get(row.record_id)
+
+                if record is None:
+                    record = records[row.record_id] = (
+                        mod_record_schema.Record.model_validate(row.record_json)
+                    )
+
+            return record
+
         def prepare_feedback(
             row,
-        ) -> Optional[mod_feedback_schema.FeedbackResultStatus]:
-            record_json = row.record_json
-            record = mod_record_schema.Record.model_validate(record_json)
+        ) -> Optional[mod_feedback_schema.FeedbackResult]:
+            try:
+                record = get_record(row)
 
-            app_json = row.app_json
+                app_json = row.app_json
 
-            if row.get("feedback_json") is None:
-                logger.warning(
-                    "Cannot evaluate feedback without `feedback_json`. "
-                    "This might have come from an old database. \n%s",
-                    row,
+                if row.get("feedback_json") is None:
+                    logger.warning(
+                        "Cannot evaluate feedback without `feedback_json`. "
+                        "This might have come from an old database. \n%s",
+                        row,
+                    )
+                    return None
+
+                feedback = _deferred_feedback(
+                    row.feedback_definition_id, row.feedback_json
                 )
-                return None
 
-            feedback = Feedback.model_validate(row.feedback_json)
+                return feedback.run_and_log(
+                    record=record,
+                    app=app_json,
+                    session=session,
+                    feedback_result_id=row.feedback_result_id,
+                )
 
-            return feedback.run_and_log(
-                record=record,
-                app=app_json,
-                session=session,
-                feedback_result_id=row.feedback_result_id,
-            )
+            finally:
+                db.release_feedback(
+                    [row.feedback_result_id], claimed_by=claimed_by
+                )
 
-        # Get the different status feedbacks except those marked DONE.
-        feedbacks_not_done = db.get_feedback(
-            status=[
-                mod_feedback_schema.FeedbackResultStatus.NONE,
-                mod_feedback_schema.FeedbackResultStatus.FAILED,
-                mod_feedback_schema.FeedbackResultStatus.RUNNING,
-            ],
+        # Claim feedbacks that are not DONE and not being evaluated elsewhere.
+        feedbacks_claimed = db.claim_feedback(
+            claimed_by=claimed_by,
+            lease_seconds=session.RETRY_RUNNING_SECONDS,
             limit=limit,
-            shuffle=shuffle,
             run_location=run_location,
+            retry_running_seconds=session.RETRY_RUNNING_SECONDS,
+            retry_failed_seconds=session.RETRY_FAILED_SECONDS,
         )
 
+        if shuffle:
+            feedbacks_claimed = feedbacks_claimed.sample(frac=1)
+
         tp = mod_threading_utils.TP()
 
         futures: List[
@@ -408,32 +483,8 @@ class Feedback(mod_feedback_schema.FeedbackDefinition):
             ]
         ] = []
 
-        for _, row in feedbacks_not_done.iterrows():
-            now = datetime.now().timestamp()
-            elapsed = now - row.last_ts
-
-            # TODO: figure out useful things to print.
-            # feedback_ident = (
-            #     f"[last seen {mod_text_utils.format_seconds(elapsed)} ago] "
-            #    f"{row.fname} for app {row.app_json['app_id']}"
-            # )
-
-            if row.status == mod_feedback_schema.FeedbackResultStatus.NONE:
-                futures.append((row, tp.submit(prepare_feedback, row)))
-
-            elif row.status == mod_feedback_schema.FeedbackResultStatus.RUNNING:
-                if elapsed > session.RETRY_RUNNING_SECONDS:
-                    futures.append((row, tp.submit(prepare_feedback, row)))
-
-                else:
-                    pass
-
-            elif row.status == mod_feedback_schema.FeedbackResultStatus.FAILED:
-                if elapsed > session.RETRY_FAILED_SECONDS:
-                    futures.append((row, tp.submit(prepare_feedback, row)))
-
-                else:
-                    pass
+        for _, row in feedbacks_claimed.iterrows():
+            futures.append((row, tp.submit(prepare_feedback, row)))
 
         return futures
 
@@ -793,15 +844,188 @@ Feedback function signature:
             A FeedbackResult object with the result of the feedback function.
         """
 
+        feedback_result, input_combinations = self._prepare_run(
+            app=app, record=record, source_data=source_data, **kwargs
+        )
+
+        if input_combinations is None:
+            return feedback_result
+
+        try:
+            outcomes = []
+            for ins in input_combinations:
+                try:
+                    if mod_python_utils.is_really_coroutinefunction(self.imp):
+                        outcome = mod_asynchro_utils.sync(
+                            mod_base_endpoint.Endpoint.atrack_all_costs_tally,
+                            self.imp,
+                            **ins,
+                        )
+                    else:
+                        outcome = (
+                            mod_base_endpoint.Endpoint.track_all_costs_tally(
+                                self.imp, **ins
+                            )
+                        )
+
+                except SkipEval as e:
+                    outcome = e
+
+                except Exception as e:
+                    # Stop at the first failure as it fails the whole run.
+                    outcomes.append(e)
+                    break
+
+                outcomes.append(outcome)
+
+            return self._finish_run(
+                feedback_result, input_combinations, outcomes
+            )
+
+        except Exception:
+            return self._fail_run(feedback_result)
+
+    async def arun(
+        self,
+        app: Optional[
+            Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]
+        ] = None,
+        record: Optional[mod_record_schema.Record] = None,
+        source_data: Optional[Dict] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> mod_feedback_schema.FeedbackResult:
+        """
+        Async version of [run][trulens.core.feedback.feedback.Feedback.run].
+
+        Input combinations are evaluated concurrently. Coroutine feedback
+        implementations are awaited in the running loop, as are provider
+        methods with a coroutine counterpart (see
+        [async_imp][trulens.core.feedback.feedback.Feedback.async_imp]), while
+        others are run in threads. The number of evaluations in flight is limited by the
+        [semaphore][trulens.core.feedback.endpoint.Endpoint.semaphore] of the
+        endpoint of the implementation's provider, which is shared with other
+        evaluations using the same endpoint in the same loop.
+
+        Args:
+            app: The app that produced the record.
+
+            record: The record to evaluate the feedback on.
+
+            source_data: Additional data to select from when extracting feedback
+                function arguments.
+
+            max_concurrency: Maximum number of input combinations evaluated at
+                once by this call. Overrides the endpoint's limit if given.
+                Implementations without a provider endpoint default to
+                evaluating one combination at a time.
+
+            **kwargs: Any additional keyword arguments are used to set or override
+                selected feedback function inputs.
+
+        Returns:
+            A FeedbackResult object with the result of the feedback function.
+        """
+
+        feedback_result, input_combinations = self._prepare_run(
+            app=app, record=record, source_data=source_data, **kwargs
+        )
+
+        if input_combinations is None:
+            return feedback_result
+
+        try:
+            semaphore = self._semaphore(max_concurrency=max_concurrency)
+            imp = self.async_imp() or self.imp
+
+            async def evaluate(ins: Dict[str, Any]):
+                async with semaphore:
+                    return (
+                        await mod_base_endpoint.Endpoint.atrack_all_costs_tally(
+                            imp, **ins
+                        )
+                    )
+
+            outcomes = await asyncio.gather(
+                *(evaluate(ins) for ins in input_combinations),
+                return_exceptions=True,
+            )
+
+            return self._finish_run(
+                feedback_result, input_combinations, outcomes
+            )
+
+        except Exception:
+            return self._fail_run(feedback_result)
+
+    def async_imp(self) -> Optional[Callable]:
+        """Coroutine counterpart of the implementation if it is a provider
+        method, named as the method with an `a` prefix.
+
+        Only counterparts defined by the same class as the method are used, so
+        that providers overriding a method without its counterpart keep their
+        behavior.
+        """
+
+        provider = getattr(self.imp, "__self__", None)
+        name = getattr(self.imp, "__name__", None)
+
+        if not isinstance(provider, mod_base_provider.Provider) or name is None:
+            return None
+
+        for cls in type(provider).__mro__:
+            if name in vars(cls):
+                if inspect.iscoroutinefunction(vars(cls).get("a" + name)):
+                    return getattr(provider, "a" + name)
+
+                return None
+
+        return None
+
+    def _semaphore(
+        self, max_concurrency: Optional[int] = None
+    ) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent evaluations of this feedback function
+        in the running loop.
+
+        Uses the shared semaphore of the endpoint of the provider owning
+        `imp` unless `max_concurrency` is given.
+        """
+
+        if max_concurrency is None:
+            provider = getattr(self.imp, "__self__", None)
+            endpoint = getattr(provider, "endpoint", None)
+            if isinstance(endpoint, mod_base_endpoint.Endpoint):
+                return endpoint.semaphore()
+
+            max_concurrency = 1
+
+        return asyncio.Semaphore(max_concurrency)
+
+    def _prepare_run(
+        self,
+        app: Optional[
+            Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON]
+        ] = None,
+        record: Optional[mod_record_schema.Record] = None,
+        source_data: Optional[Dict] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Tuple[
+        mod_feedback_schema.FeedbackResult, Optional[List[Dict[str, Any]]]
+    ]:
+        """Create the result of a run and select the input combinations to
+        evaluate.
+
+        Returns the result and the input combinations, or None instead of the
+        combinations if the evaluation is skipped, in which case the status of
+        the result is already set.
+        """
+
         if isinstance(app, mod_app_schema.AppDefinition):
             app_json = mod_json_utils.jsonify(app)
         else:
             app_json = app
 
-        result_vals = []
-
-        feedback_calls = []
-
         feedback_result = mod_feedback_schema.FeedbackResult(
             feedback_definition_id=self.feedback_definition_id,
             record_id=record.record_id if record is not None else "no record",
@@ -824,7 +1048,7 @@ Feedback function signature:
                 feedback_result.status = (
                     mod_feedback_schema.FeedbackResultStatus.SKIPPED
                 )
-                return feedback_result
+                return feedback_result, None
 
         # Separate try block for extracting inputs from records/apps in case a
         # user specified something that does not exist. We want to fail and give
@@ -863,7 +1087,7 @@ Feedback function signature:
                     self.name,
                     e.selector,
                 )
-                return feedback_result
+                return feedback_result, None
 
             if (
                 self.if_missing
@@ -872,7 +1096,7 @@ Feedback function signature:
                 feedback_result.status = (
                     mod_feedback_schema.FeedbackResultStatus.SKIPPED
                 )
-                return feedback_result
+                return feedback_result, None
 
             feedback_result.status = (
                 mod_feedback_schema.FeedbackResultStatus.FAILED
@@ -881,146 +1105,165 @@ Feedback function signature:
                 f"Unknown value for `if_missing` {self.if_missing}."
             ) from e
 
-        try:
-            # Total cost, will accumulate.
-            cost = mod_base_schema.Cost()
-            multi_result = None
+        return feedback_result, input_combinations
 
-            # Keep track of evaluations that were skipped due to raising SkipEval.
-            skipped_exceptions = []
+    def _finish_run(
+        self,
+        feedback_result: mod_feedback_schema.FeedbackResult,
+        input_combinations: List[Dict[str, Any]],
+        outcomes: List[Union[Tuple[Any, mod_base_schema.Cost], BaseException]],
+    ) -> mod_feedback_schema.FeedbackResult:
+        """Validate and aggregate the outcomes of evaluating each input
+        combination into `feedback_result`.
 
-            for ins in input_combinations:
-                try:
-                    result_and_meta, part_cost = (
-                        mod_base_endpoint.Endpoint.track_all_costs_tally(
-                            self.imp, **ins
-                        )
-                    )
+        Each outcome is either the result and cost of the evaluation or the
+        exception it raised. Outcomes may be fewer than the combinations if the
+        evaluation was stopped early. Raises RuntimeError for exceptions other
+        than [SkipEval][trulens.core.feedback.feedback.SkipEval].
+        """
 
-                    cost += part_cost
+        result_vals = []
 
-                except SkipEval as e:
-                    e.feedback = self
-                    e.ins = ins
-                    skipped_exceptions.append(e)
-                    warnings.warn(str(e), UserWarning, stacklevel=1)
-                    continue  # go to next input_combination
+        feedback_calls = []
 
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Evaluation of {self.name} failed on inputs: \n{pformat(ins)[0:128]}."
-                    ) from e
-
-                if isinstance(result_and_meta, Tuple):
-                    # If output is a tuple of two, we assume it is the float/multifloat and the metadata.
-                    assert len(result_and_meta) == 2, (
-                        "Feedback functions must return either a single float, "
-                        "a float-valued dict, or these in combination with a dictionary as a tuple."
-                    )
-                    result_val, meta = result_and_meta
+        # Total cost, will accumulate.
+        cost = mod_base_schema.Cost()
+        multi_result = None
 
-                    assert isinstance(
-                        meta, dict
-                    ), f"Feedback metadata output must be a dictionary but was {type(meta)}."
-                else:
-                    # Otherwise it is just the float. We create empty metadata dict.
-                    result_val = result_and_meta
-                    meta = dict()
-
-                if isinstance(result_val, dict):
-                    for val in result_val.values():
-                        assert isinstance(val, float), (
-                            f"Feedback function output with multivalue must be "
-                            f"a dict with float values but encountered {type(val)}."
-                        )
-                    feedback_call = mod_feedback_schema.FeedbackCall(
-                        args=ins,
-                        ret=np.mean(list(result_val.values())),
-                        meta=meta,
-                    )
+        # Keep track of evaluations that were skipped due to raising SkipEval.
+        skipped_exceptions = []
 
-                else:
-                    assert isinstance(
-                        result_val, (float, list)
-                    ), f"Feedback function output must be a float, a list of floats, or dict but was {type(result_val)}."
-                    feedback_call = mod_feedback_schema.FeedbackCall(
-                        args=ins, ret=result_val, meta=meta
-                    )
+        for ins, outcome in zip(input_combinations, outcomes):
+            if isinstance(outcome, SkipEval):
+                outcome.feedback = self
+                outcome.ins = ins
+                skipped_exceptions.append(outcome)
+                warnings.warn(str(outcome), UserWarning, stacklevel=1)
+                continue  # go to next input_combination
+
+            if isinstance(outcome, BaseException):
+                raise RuntimeError(
+                    f"Evaluation of {self.name} failed on inputs: \n{pformat(ins)[0:128]}."
+                ) from outcome
+
+            result_and_meta, part_cost = outcome
 
-                result_vals.append(result_val)
-                feedback_calls.append(feedback_call)
-
-            # Warn that there were some skipped evals.
-            if len(skipped_exceptions) > 0:
-                num_skipped = len(skipped_exceptions)
-                num_evaled = len(result_vals)
-                num_total = num_skipped + num_evaled
-                warnings.warn(
-                    (
-                        f"{num_skipped}/{num_total}={100.0 * num_skipped / num_total:0.1f}"
-                        "% evaluation(s) were skipped because they raised SkipEval "
-                        "(see earlier warnings for listing)."
-                    ),
-                    UserWarning,
-                    stacklevel=1,
+            cost += part_cost
+
+            if isinstance(result_and_meta, Tuple):
+                # If output is a tuple of two, we assume it is the float/multifloat and the metadata.
+                assert len(result_and_meta) == 2, (
+                    "Feedback functions must return either a single float, "
+                    "a float-valued dict, or these in combination with a dictionary as a tuple."
                 )
+                result_val, meta = result_and_meta
 
-            if len(result_vals) == 0:
-                warnings.warn(
-                    f"Feedback function {self.supplied_name if self.supplied_name is not None else self.name} with aggregation {self.agg} had no inputs.",
-                    UserWarning,
-                    stacklevel=1,
+                assert isinstance(
+                    meta, dict
+                ), f"Feedback metadata output must be a dictionary but was {type(meta)}."
+            else:
+                # Otherwise it is just the float. We create empty metadata dict.
+                result_val = result_and_meta
+                meta = dict()
+
+            if isinstance(result_val, dict):
+                for val in result_val.values():
+                    assert isinstance(val, float), (
+                        f"Feedback function output with multivalue must be "
+                        f"a dict with float values but encountered {type(val)}."
+                    )
+                feedback_call = mod_feedback_schema.FeedbackCall(
+                    args=ins,
+                    ret=np.mean(list(result_val.values())),
+                    meta=meta,
                 )
 
-                result = np.nan
+            else:
+                assert isinstance(
+                    result_val, (float, list)
+                ), f"Feedback function output must be a float, a list of floats, or dict but was {type(result_val)}."
+                feedback_call = mod_feedback_schema.FeedbackCall(
+                    args=ins, ret=result_val, meta=meta
+                )
+
+            result_vals.append(result_val)
+            feedback_calls.append(feedback_call)
+
+        # Warn that there were some skipped evals.
+        if len(skipped_exceptions) > 0:
+            num_skipped = len(skipped_exceptions)
+            num_evaled = len(result_vals)
+            num_total = num_skipped + num_evaled
+            warnings.warn(
+                (
+                    f"{num_skipped}/{num_total}={100.0 * num_skipped / num_total:0.1f}"
+                    "% evaluation(s) were skipped because they raised SkipEval "
+                    "(see earlier warnings for listing)."
+                ),
+                UserWarning,
+                stacklevel=1,
+            )
+
+        if len(result_vals) == 0:
+            warnings.warn(
+                f"Feedback function {self.supplied_name if self.supplied_name is not None else self.name} with aggregation {self.agg} had no inputs.",
+                UserWarning,
+                stacklevel=1,
+            )
+
+            result = np.nan
 
+        else:
+            if isinstance(result_vals[0], float):
+                result_vals = np.array(result_vals)
+                result = self.agg(result_vals)
             else:
-                if isinstance(result_vals[0], float):
-                    result_vals = np.array(result_vals)
+                try:
+                    # Operates on list of dict; Can be a dict output
+                    # (maintain multi) or a float output (convert to single)
                     result = self.agg(result_vals)
-                else:
-                    try:
-                        # Operates on list of dict; Can be a dict output
-                        # (maintain multi) or a float output (convert to single)
-                        result = self.agg(result_vals)
-                    except Exception:
-                        # Alternatively, operate the agg per key
-                        result = {}
-                        for feedback_output in result_vals:
-                            for key in feedback_output:
-                                if key not in result:
-                                    result[key] = []
-                                result[key].append(feedback_output[key])
-                        for key in result:
-                            result[key] = self.agg(result[key])
-
-                    if isinstance(result, dict):
-                        multi_result = result
-                        result = np.nan
-
-            feedback_result.update(
-                result=result,
-                status=mod_feedback_schema.FeedbackResultStatus.DONE,
-                cost=cost,
-                calls=feedback_calls,
-                multi_result=json.dumps(multi_result),
-            )
+                except Exception:
+                    # Alternatively, operate the agg per key
+                    result = {}
+                    for feedback_output in result_vals:
+                        for key in feedback_output:
+                            if key not in result:
+                                result[key] = []
+                            result[key].append(feedback_output[key])
+                    for key in result:
+                        result[key] = self.agg(result[key])
+
+                if isinstance(result, dict):
+                    multi_result = result
+                    result = np.nan
+
+        feedback_result.update(
+            result=result,
+            status=mod_feedback_schema.FeedbackResultStatus.DONE,
+            cost=cost,
+            calls=feedback_calls,
+            multi_result=json.dumps(multi_result),
+        )
 
-            return feedback_result
+        return feedback_result
 
-        except Exception:
-            # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
-            exc_tb = (
-                traceback.format_exc()
-                .encode("utf-8", errors="replace")
-                .decode("utf-8")
-            )
-            logger.warning("Feedback Function exception caught: %s", exc_tb)
-            feedback_result.update(
-                error=exc_tb,
-                status=mod_feedback_schema.FeedbackResultStatus.FAILED,
-            )
-            return feedback_result
+    def _fail_run(
+        self, feedback_result: mod_feedback_schema.FeedbackResult
+    ) -> mod_feedback_schema.FeedbackResult:
+        """Mark `feedback_result` as failed with the exception being handled."""
+
+        # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
+        exc_tb = (
+            traceback.format_exc()
+            .encode("utf-8", errors="replace")
+            .decode("utf-8")
+        )
+        logger.warning("Feedback Function exception caught: %s", exc_tb)
+        feedback_result.update(
+            error=exc_tb,
+            status=mod_feedback_schema.FeedbackResultStatus.FAILED,
+        )
+        return feedback_result
 
     def run_and_log(
         self,
@@ -1078,6 +1321,71 @@ Feedback function signature:
 
         return feedback_result
 
+    async def arun_and_log(
+        self,
+        record: mod_record_schema.Record,
+        session: TruSession,
+        app: Union[mod_app_schema.AppDefinition, mod_serial_utils.JSON] = None,
+        feedback_result_id: Optional[mod_types_schema.FeedbackResultID] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Optional[mod_feedback_schema.FeedbackResult]:
+        """
+        Async version of
+        [run_and_log][trulens.core.feedback.feedback.Feedback.run_and_log].
+        Database writes are done in a thread to not block the event loop.
+        """
+
+        db = session.connector.db
+
+        # Placeholder result to indicate a run.
+        feedback_result = mod_feedback_schema.FeedbackResult(
+            feedback_definition_id=self.feedback_definition_id,
+            feedback_result_id=feedback_result_id,
+            record_id=record.record_id,
+            name=self.supplied_name
+            if self.supplied_name is not None
+            else self.name,
+        )
+
+        if feedback_result_id is None:
+            feedback_result_id = feedback_result.feedback_result_id
+
+        try:
+            await asyncio.to_thread(
+                db.insert_feedback,
+                feedback_result.update(
+                    status=mod_feedback_schema.FeedbackResultStatus.RUNNING  # in progress
+                ),
+            )
+
+            feedback_result = (
+                await self.arun(
+                    app=app, record=record, max_concurrency=max_concurrency
+                )
+            ).update(feedback_result_id=feedback_result_id)
+
+        except Exception:
+            # Convert traceback to a UTF-8 string, replacing errors to avoid encoding issues
+            exc_tb = (
+                traceback.format_exc()
+                .encode("utf-8", errors="replace")
+                .decode("utf-8")
+            )
+            await asyncio.to_thread(
+                db.insert_feedback,
+                feedback_result.update(
+                    error=exc_tb,
+                    status=mod_feedback_schema.FeedbackResultStatus.FAILED,
+                ),
+            )
+            return
+
+        # Otherwise update based on what Feedback.arun produced (could be
+        # success or failure).
+        await asyncio.to_thread(db.insert_feedback, feedback_result)
+
+        return feedback_result
+
     @property
     def name(self) -> str:
         """Name of the feedback function.
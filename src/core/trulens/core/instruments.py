@@ -8,8 +8,12 @@ typical use cases.
 
 from __future__ import annotations
 
+from concurrent import futures
+import contextvars
 import dataclasses
+from datetime import date
 from datetime import datetime
+from enum import Enum
 import functools
 import inspect
 from inspect import BoundArguments
@@ -59,6 +63,7 @@ from trulens.core.utils.python import safe_signature
 from trulens.core.utils.python import wrap_awaitable
 from trulens.core.utils.serial import Lens
 from trulens.core.utils.text import retab
+from trulens.core.utils.threading import fThreadPoolExecutor
 
 if TYPE_CHECKING:
     from trulens.core.app.base import RecordingContext
@@ -66,6 +71,183 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class CallTrackingMode(str, Enum):
+    """How instrumented methods find the recording contexts and call stacks
+    established by instrumented methods higher in the call stack."""
+
+    CONTEXTVARS = "contextvars"
+    """Carry the recording contexts and call stacks in context variables.
+
+    Finding the parent call is O(1). Context variables are copied to threads
+    started with [TP][trulens.core.utils.threading.TP],
+    [Thread][trulens.core.utils.threading.Thread] or
+    [ThreadPoolExecutor][trulens.core.utils.threading.ThreadPoolExecutor], and
+    by asyncio to new tasks.
+    """
+
+    STACK = "stack"
+    """Walk the python call stack looking for the locals of instrumented
+    wrappers.
+
+    This is the original tracking scheme. Its cost grows with the depth of the
+    call stack as every frame is inspected for each instrumented call.
+    """
+
+
+class CaptureMode(str, Enum):
+    """When instrumented methods serialize the arguments and returns of the
+    calls they record."""
+
+    SYNC = "sync"
+    """Serialize arguments and returns to json, and assemble records, in the
+    thread of the call before it returns."""
+
+    BACKGROUND = "background"
+    """Take a snapshot of arguments and returns in the thread of the call and
+    serialize it on a background thread, which also assembles the records and
+    hands them to the connector.
+
+    Snapshots copy lists, tuples, dicts and sets, and shallow copy pydantic
+    models. Other objects are captured by reference so changes made to them
+    after the call returns may be recorded.
+
+    Records are complete once obtained from the
+    [RecordingContext][trulens.core.app.RecordingContext] of the call, and
+    records of all calls made so far are complete once
+    [App.wait_for_feedback_results][trulens.core.app.App.wait_for_feedback_results]
+    or [wait_for_serialization][trulens.core.instruments.wait_for_serialization]
+    return. In
+    [FeedbackMode.WITH_APP][trulens.core.schema.feedback.FeedbackMode.WITH_APP],
+    the feedback results of records are waited for once the records are
+    obtained from the recording context, instead of on the background thread.
+    """
+
+
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    bool,
+    type(None),
+    Enum,
+    date,
+)
+"""Types whose values are captured by reference in snapshots."""
+
+
+def _snapshot(obj: Any, depth: int = 0, max_depth: int = 64) -> Any:
+    """Copy of `obj` that is not affected by later changes to `obj`, to be
+    serialized in [CaptureMode.BACKGROUND][trulens.core.instruments.CaptureMode.BACKGROUND].
+
+    Containers are copied, immutable values and other objects referenced.
+    """
+
+    if isinstance(obj, _IMMUTABLE_TYPES) or depth >= max_depth:
+        return obj
+
+    obj_type = type(obj)
+
+    if obj_type is list or obj_type is tuple or obj_type is set:
+        return obj_type(_snapshot(v, depth + 1, max_depth) for v in obj)
+
+    if obj_type is dict:
+        return {k: _snapshot(v, depth + 1, max_depth) for k, v in obj.items()}
+
+    if isinstance(obj, pydantic.BaseModel):
+        return obj.model_copy()
+
+    return obj
+
+
+_serializer: Optional[futures.ThreadPoolExecutor] = None
+"""Single thread serializing the calls captured in
+[CaptureMode.BACKGROUND][trulens.core.instruments.CaptureMode.BACKGROUND], in
+the order the calls finished."""
+
+_serializer_lock = th.Lock()
+
+
+def _serialize_in_background(func: Callable[[], Any]) -> futures.Future:
+    """Run `func` on the serialization thread."""
+
+    global _serializer
+
+    if _serializer is None:
+        with _serializer_lock:
+            if _serializer is None:
+                _serializer = fThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="TruSerializer"
+                )
+
+    # Run outside of the context of the recorded call so that its recording
+    # contexts are not seen by the serialization.
+    return _serializer.submit(contextvars.Context().run, func)
+
+
+def wait_for_serialization() -> None:
+    """Wait for the calls captured so far in
+    [CaptureMode.BACKGROUND][trulens.core.instruments.CaptureMode.BACKGROUND]
+    to be serialized and their records to be handed to the connector."""
+
+    if th.current_thread().name.startswith("TruSerializer"):
+        # Waiting for the serialization in progress would never finish.
+        return
+
+    if _serializer is not None:
+        _serializer.submit(lambda: None).result()
+
+
+_call_contexts: contextvars.ContextVar[Optional[Set[RecordingContext]]] = (
+    contextvars.ContextVar("tru_call_contexts", default=None)
+)
+"""Recording contexts of the nearest enclosing instrumented call.
+
+Only used in [CallTrackingMode.CONTEXTVARS][trulens.core.instruments.CallTrackingMode.CONTEXTVARS].
+"""
+
+_call_stacks: contextvars.ContextVar[
+    Optional[
+        Dict[
+            RecordingContext,
+            Tuple[mod_record_schema.RecordAppCallMethod, ...],
+        ]
+    ]
+] = contextvars.ContextVar("tru_call_stacks", default=None)
+"""Call stacks, per recording context, of the nearest enclosing instrumented
+call.
+
+Only used in [CallTrackingMode.CONTEXTVARS][trulens.core.instruments.CallTrackingMode.CONTEXTVARS].
+"""
+
+
+async def _await_in_call_context(
+    awaitable: Awaitable,
+    contexts: Set[RecordingContext],
+    stacks: Dict[
+        RecordingContext, Tuple[mod_record_schema.RecordAppCallMethod, ...]
+    ],
+):
+    """Await the given awaitable with the call tracking context variables set
+    to the given `contexts` and `stacks`.
+
+    Coroutines produced by instrumented methods only run once awaited, after
+    the wrapper has returned and reset the context variables. This makes sure
+    instrumented methods called by the coroutine still see their parent.
+    """
+
+    contexts_token = _call_contexts.set(contexts)
+    stacks_token = _call_stacks.set(stacks)
+
+    try:
+        return await awaitable
+
+    finally:
+        _call_stacks.reset(stacks_token)
+        _call_contexts.reset(contexts_token)
+
+
 class WithInstrumentCallbacks:
     """Abstract definition of callbacks invoked by Instrument during
     instrumentation or when instrumented methods are called.
@@ -233,6 +415,20 @@ class Instrument:
     APPS = "__tru_apps"
     """Attribute name for storing apps that expect to be notified of calls."""
 
+    call_tracking_mode: CallTrackingMode = CallTrackingMode.CONTEXTVARS
+    """How instrumented methods find their instrumented callers.
+
+    This is global as instrumented methods are shared by all apps that
+    instrument them. See
+    [CallTrackingMode][trulens.core.instruments.CallTrackingMode].
+    """
+
+    capture_mode: CaptureMode = CaptureMode.SYNC
+    """When instrumented methods serialize the arguments and returns of the
+    calls they record. See
+    [CaptureMode][trulens.core.instruments.CaptureMode].
+    """
+
     class Default:
         """Default instrumentation configuration.
 
@@ -411,16 +607,30 @@ class Instrument:
             # If not within a root method, call the wrapped function without
             # any recording.
 
-            # Get any contexts already known from higher in the call stack.
-            contexts = get_first_local_in_call_stack(
-                key="contexts",
-                func=find_instrumented,
-                offset=1,
-                skip=python_utils.caller_frame(),
+            track_with_contextvars = (
+                Instrument.call_tracking_mode == CallTrackingMode.CONTEXTVARS
+            )
+            capture_in_background = (
+                Instrument.capture_mode == CaptureMode.BACKGROUND
             )
+
+            # Get any contexts already known from higher in the call stack.
+            if track_with_contextvars:
+                parent_contexts = _call_contexts.get()
+            else:
+                parent_contexts = get_first_local_in_call_stack(
+                    key="contexts",
+                    func=find_instrumented,
+                    offset=1,
+                    skip=python_utils.caller_frame(),
+                )
+
+            # Copy so that the additions below are not seen by the caller.
             # Note: are empty sets false?
-            if contexts is None:
+            if parent_contexts is None:
                 contexts = set()
+            else:
+                contexts = set(parent_contexts)
 
             # And add any new contexts from all apps wishing to record this
             # function. This may produce some of the same contexts that were
@@ -446,12 +656,15 @@ class Instrument:
             # another wrinke, the addresses of methods in the stack may vary
             # from app to app that are watching this method. Hence we index the
             # stacks by id of the call record list which is unique to each app.
-            ctx_stacks = get_first_local_in_call_stack(
-                key="stacks",
-                func=find_instrumented,
-                offset=1,
-                skip=caller_frame(),
-            )
+            if track_with_contextvars:
+                ctx_stacks = _call_stacks.get()
+            else:
+                ctx_stacks = get_first_local_in_call_stack(
+                    key="stacks",
+                    func=find_instrumented,
+                    offset=1,
+                    skip=caller_frame(),
+                )
             # Note: Empty dicts are false.
             if ctx_stacks is None:
                 ctx_stacks = {}
@@ -526,6 +739,13 @@ class Instrument:
 
             error_str = None
 
+            if track_with_contextvars:
+                # Make contexts and stacks visible to instrumented calls made by
+                # the wrapped method, including those in threads or tasks it
+                # starts.
+                contexts_token = _call_contexts.set(contexts)
+                stacks_token = _call_stacks.set(stacks)
+
             try:
                 # Using sig bind here so we can produce a list of key-value
                 # pairs even if positional arguments were provided.
@@ -544,33 +764,46 @@ class Instrument:
                 )
                 logger.error(traceback.format_exc())
 
+            finally:
+                if track_with_contextvars:
+                    _call_stacks.reset(stacks_token)
+                    _call_contexts.reset(contexts_token)
+
             # Done running the wrapped function. Lets collect the results.
             # Create common information across all records.
 
             # Don't include self in the recorded arguments.
             nonself = {
-                k: jsonify(v)
+                k: v
                 for k, v in (
                     bindings.arguments.items() if bindings is not None else {}
                 )
                 if k != "self"
             }
 
-            records = {}
+            if capture_in_background:
+                # Serialized by `record_calls` on the serialization thread.
+                nonself = {k: _snapshot(v) for k, v in nonself.items()}
+            else:
+                nonself = {k: jsonify(v) for k, v in nonself.items()}
 
-            def handle_done(rets):
-                # (re) generate end_time here because cases where the initial end_time was
-                # just to produce an awaitable before being awaited.
-                end_time = datetime.now()
+            records = {}
 
+            def record_calls(
+                args: Dict[str, Any],
+                rets: Any,
+                end_time: datetime,
+                tid: int,
+                bindings: Optional[BoundArguments],
+            ):
                 record_app_args = dict(
                     call_id=call_id,
-                    args=nonself,
+                    args=args,
                     perf=mod_base_schema.Perf(
                         start_time=start_time, end_time=end_time
                     ),
                     pid=os.getpid(),
-                    tid=th.get_native_id(),
+                    tid=tid,
                     rets=jsonify(rets),
                     error=error_str if error is not None else None,
                 )
@@ -610,6 +843,51 @@ class Instrument:
 
                 return records
 
+            def handle_done(rets):
+                # (re) generate end_time here because cases where the initial end_time was
+                # just to produce an awaitable before being awaited.
+                end_time = datetime.now()
+                tid = th.get_native_id()
+
+                if not capture_in_background:
+                    return record_calls(nonself, rets, end_time, tid, bindings)
+
+                rets = _snapshot(rets)
+
+                snapshot_bindings = None
+                if bindings is not None:
+                    snapshot_bindings = BoundArguments(
+                        bindings.signature,
+                        {
+                            k: nonself.get(k, v)
+                            for k, v in bindings.arguments.items()
+                        },
+                    )
+
+                def serialize():
+                    try:
+                        record_calls(
+                            {k: jsonify(v) for k, v in nonself.items()},
+                            rets,
+                            end_time,
+                            tid,
+                            snapshot_bindings,
+                        )
+                    except BaseException as e:
+                        # The error of the call itself was raised to its
+                        # caller below.
+                        if e is not error:
+                            raise
+
+                pending = _serialize_in_background(serialize)
+                for ctx in contexts:
+                    ctx.add_pending(pending)
+
+                if error is not None:
+                    raise error
+
+                return records
+
             if isinstance(rets, Awaitable):
                 # If method produced an awaitable
                 logger.info(
@@ -620,6 +898,11 @@ class Instrument:
                 # TODO(piotrm): need to track costs of awaiting the ret in the
                 # below.
 
+                if track_with_contextvars:
+                    rets = _await_in_call_context(
+                        rets, contexts=contexts, stacks=stacks
+                    )
+
                 return wrap_awaitable(rets, on_done=handle_done)
 
             handle_done(rets=rets)
@@ -36,6 +36,10 @@ class Cost(SerialModel, pydantic.BaseModel):
     n_completion_tokens: int = 0
     """Number of completion tokens generated."""
 
+    n_cached_requests: int = 0
+    """Number of requests answered from a response cache instead of the
+    endpoint. These incur no other costs."""
+
     cost: float = 0.0
     """Cost in USD."""
 
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import datetime
 import logging
-from typing import ClassVar, Dict, Hashable, List, Optional, Tuple, TypeVar
+import operator
+from typing import Any, ClassVar, Dict, Hashable, List, Optional, Tuple, TypeVar
 
 from munch import Munch as Bunch
 import pydantic
@@ -160,6 +161,12 @@ class Record(serial.SerialModel, Hashable):
     ] = pydantic.Field(None, exclude=True)
     """Only the futures part of the above for backwards compatibility."""
 
+    _layout: Optional[Tuple[Tuple[RecordAppCall, ...], Bunch]] = (
+        pydantic.PrivateAttr(None)
+    )
+    """Layout of the calls as app (see `layout_calls_as_app`) and the calls it
+    was made from."""
+
     def __init__(
         self, record_id: Optional[mod_types_schema.RecordID] = None, **kwargs
     ):
@@ -173,6 +180,14 @@ class Record(serial.SerialModel, Hashable):
     def __hash__(self):
         return hash(self.record_id)
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+
+        field = type(self).model_fields.get(name)
+        if field is not None and not field.exclude:
+            # The layout includes the dump of all fields that are not excluded.
+            self._layout = None
+
     def wait_for_feedback_results(
         self, feedback_timeout: Optional[float] = None
     ) -> Dict[
@@ -227,11 +242,28 @@ class Record(serial.SerialModel, Hashable):
 
         - Records have RecordAppCall as their leafs where method definitions
           would be in the AppDefinition structure.
+
+        The layout is built once and shared by all callers until the calls or
+        other fields of the record are replaced. It must not be modified.
         """
 
+        calls = tuple(self.calls)
+
+        layout = self._layout
+        if (
+            layout is not None
+            and len(layout[0]) == len(calls)
+            and all(map(operator.is_, layout[0], calls))
+        ):
+            return layout[1]
+
         ret = Bunch(**self.model_dump())
 
-        for call in self.calls:
+        # Calls of each method in the order they were made so that the list of
+        # calls at each path is set once.
+        method_calls: Dict[serial.Lens, List[RecordAppCall]] = {}
+
+        for call in calls:
             # Info about the method call is at the top of the stack
             frame_info = call.top
 
@@ -242,11 +274,16 @@ class Record(serial.SerialModel, Hashable):
                 )
             )
 
+            method_calls.setdefault(path, []).append(call)
+
+        for path, path_calls in method_calls.items():
             if path.exists(obj=ret):
                 existing = path.get_sole_item(obj=ret)
-                ret = path.set(obj=ret, val=existing + [call])
+                ret = path.set(obj=ret, val=existing + path_calls)
             else:
-                ret = path.set(obj=ret, val=[call])
+                ret = path.set(obj=ret, val=path_calls)
+
+        self._layout = (calls, ret)
 
         return ret
 
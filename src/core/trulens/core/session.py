@@ -5,14 +5,21 @@ from concurrent import futures
 from datetime import datetime
 import inspect
 import logging
+import multiprocessing
 from multiprocessing import Process
+import os
+from pathlib import Path
+import queue
+import socket
 import threading
 from threading import Thread
-from time import sleep
+import time
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -24,8 +31,15 @@ import warnings
 import pandas
 import pydantic
 from trulens.core import feedback
+from trulens.core import instruments as mod_instruments
 from trulens.core.database.connector import DBConnector
 from trulens.core.database.connector import DefaultDBConnector
+from trulens.core.database.export import TransferResult
+from trulens.core.database.retention import ArchiveFormat
+from trulens.core.database.retention import RetentionPolicy
+from trulens.core.database.retention import RetentionResult
+from trulens.core.database.sqlalchemy import SQLAlchemyDB
+from trulens.core.database.utils import is_memory_sqlite
 from trulens.core.schema import app as mod_app_schema
 from trulens.core.schema import dataset as mod_dataset_schema
 from trulens.core.schema import feedback as mod_feedback_schema
@@ -100,7 +114,8 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
     """How long to wait (in seconds) before restarting a feedback function that has already started
 
     A feedback function execution that has started may have stalled or failed in a bad way that did not record the
-    failure.
+    failure. Deferred evaluators claim feedback functions with a lease of this duration and renew it while they are
+    running so that the feedback is not restarted by another evaluator.
 
     See also:
         [start_evaluator][trulens.core.session.TruSession.start_evaluator]
@@ -222,6 +237,19 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
         """Add a record to the queue to be inserted in the next batch."""
         return self.connector.add_record_nowait(record)
 
+    def flush_records(self, timeout: Optional[float] = None) -> bool:
+        """Insert all records queued with `add_record_nowait` now.
+
+        Records of calls captured in the background (see
+        [CaptureMode.BACKGROUND][trulens.core.instruments.CaptureMode.BACKGROUND])
+        are first serialized and queued.
+
+        See [DBConnector.flush_records][trulens.core.database.connector.DBConnector.flush_records].
+        """
+        mod_instruments.wait_for_serialization()
+
+        return self.connector.flush_records(timeout=timeout)
+
     def run_feedback_functions(
         self,
         record: mod_record_schema.Record,
@@ -451,6 +479,58 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
             app_ids=app_ids, offset=offset, limit=limit
         )
 
+    def iter_records_and_feedback(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        columns: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        after: Optional[
+            Tuple[Union[datetime, str, float], mod_types_schema.RecordID]
+        ] = None,
+        feedback_calls: bool = False,
+    ) -> Iterator[Tuple[pandas.DataFrame, List[str]]]:
+        """Get records, their feedback results, and feedback names in chunks.
+
+        Unlike
+        [get_records_and_feedback][trulens.core.session.TruSession.get_records_and_feedback],
+        does not read all of the records into memory at once and by default
+        does not read the serialized records and apps.
+
+        Example:
+            ```python
+            for df, feedback_cols in session.iter_records_and_feedback(
+                app_ids=[app.app_id], chunk_size=500
+            ):
+                print(df[feedback_cols].mean())
+            ```
+
+        Args:
+            app_ids: A list of app ids to filter records by. If empty or not given, all
+                apps' records will be returned.
+
+            columns: Record and app columns to include. The `record_json` and
+                `app_json` columns are only included if requested here.
+
+            chunk_size: Maximum number of records per chunk.
+
+            after: The `ts` and `record_id` of the last record of a prior chunk
+                to continue after.
+
+            feedback_calls: Whether to include the feedback function calls
+                columns.
+
+        Returns:
+            Iterator of DataFrames of records with their feedback results and
+                the list of feedback names that are columns in each DataFrame.
+        """
+        return self.connector.iter_records_and_feedback(
+            app_ids=app_ids,
+            columns=columns,
+            chunk_size=chunk_size,
+            after=after,
+            feedback_calls=feedback_calls,
+        )
+
     def get_leaderboard(
         self,
         app_ids: Optional[List[mod_types_schema.AppID]] = None,
@@ -471,6 +551,130 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
             app_ids=app_ids, group_by_metadata_key=group_by_metadata_key
         )
 
+    def explain_queries(self) -> pandas.DataFrame:
+        """Explain the plans of the queries run most often against the
+        database, i.e. by the deferred feedback evaluator and the dashboard.
+
+        Useful to check that the database indexes are in place. Queries whose
+        `sequential_scans` column is not empty read whole tables.
+
+        Returns:
+            Dataframe with the name, SQL, plan, and sequentially scanned
+            tables of each query.
+        """
+
+        return self.connector.explain_queries()
+
+    def apply_retention(
+        self,
+        policy: RetentionPolicy,
+        archive: Optional[Union[str, Path]] = None,
+        archive_format: Union[ArchiveFormat, str] = ArchiveFormat.JSONL,
+        batch_size: int = 500,
+    ) -> RetentionResult:
+        """Delete expired records and their feedback results.
+
+        Example:
+            ```python
+            from datetime import timedelta
+
+            from trulens.core.database.retention import RetentionPolicy
+
+            session.apply_retention(
+                RetentionPolicy(
+                    max_age=timedelta(days=30), max_records_per_app=100000
+                ),
+                archive="trulens_archive",
+            )
+
+            # Archived records can be read back later.
+            archive = SQLAlchemyDB.from_archive("trulens_archive")
+            df, feedback_cols = archive.get_records_and_feedback()
+            ```
+
+        Args:
+            policy: Which records are expired.
+
+            archive: Directory to write the deleted records and feedback
+                results to. Not archived if not given.
+
+            archive_format: Format of the archive files.
+
+            batch_size: Maximum number of records deleted per transaction.
+
+        Returns:
+            Counts of what was deleted and the archive files written.
+        """
+
+        return self.connector.apply_retention(
+            policy,
+            archive=archive,
+            archive_format=archive_format,
+            batch_size=batch_size,
+        )
+
+    def export(
+        self,
+        path: Union[str, Path],
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> TransferResult:
+        """Export records, their feedback results, and the apps and feedback
+        definitions they refer to, to Parquet files in a directory.
+
+        Records are read in chunks and streamed to the files as Arrow record
+        batches. Requires the `pyarrow` package.
+
+        Example:
+            ```python
+            session.export(
+                "trulens_export",
+                app_ids=["my_app"],
+                since=datetime(2024, 1, 1),
+            )
+
+            other_session.import_("trulens_export")
+            ```
+
+        Args:
+            path: The export directory.
+
+            app_ids: If given, export only the records of the given apps.
+
+            since: If given, export only the records made at or after this
+                time.
+
+            chunk_size: Maximum number of records read per query.
+
+        Returns:
+            Counts of what was exported and the files written.
+        """
+
+        return self.connector.export(
+            path, app_ids=app_ids, since=since, chunk_size=chunk_size
+        )
+
+    def import_(
+        self, path: Union[str, Path], batch_size: int = 1000
+    ) -> TransferResult:
+        """Import the records, feedback results, apps and feedback definitions
+        exported to a directory by
+        [export][trulens.core.session.TruSession.export].
+
+        Existing rows with the same ids are updated.
+
+        Args:
+            path: The export directory.
+
+            batch_size: Maximum number of rows inserted per transaction.
+
+        Returns:
+            Counts of what was imported and the files read.
+        """
+
+        return self.connector.import_(path, batch_size=batch_size)
+
     def add_ground_truth_to_dataset(
         self,
         dataset_name: str,
@@ -528,16 +732,22 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
         disable_tqdm: bool = False,
         run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
         return_when_done: bool = False,
+        num_workers: Optional[int] = None,
     ) -> Optional[Union[Process, Thread]]:
         """
-        Start a deferred feedback function evaluation thread or process.
+        Start a deferred feedback function evaluation thread or process pool.
 
         Args:
             restart: If set, will stop the existing evaluator before starting a
                 new one.
 
-            fork: If set, will start the evaluator in a new process instead of a
-                thread. NOT CURRENTLY SUPPORTED.
+            fork: If set, will evaluate feedback functions in a pool of worker
+                processes instead of in threads of this process. Each worker
+                connects to the database on its own and rebuilds the feedback
+                implementations from their stored definitions so these must be
+                importable by the workers. Workers are started with the "spawn"
+                method hence scripts using this mode need to guard their entry
+                point with `if __name__ == "__main__":`.
 
             disable_tqdm: If set, will disable progress bar logging from the evaluator.
 
@@ -545,9 +755,14 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
 
             return_when_done: Instead of running asynchronously, will block until no feedbacks remain.
 
+            num_workers: Number of worker processes if `fork` is set. Defaults
+                to the number of CPUs.
+
         Returns:
-            If return_when_done is True, then returns None. Otherwise, the started process or thread
-                that is executing the deferred feedback evaluator.
+            If return_when_done is True, then returns None. Otherwise, the
+                started thread that is executing the deferred feedback
+                evaluator or, if `fork` is set, supervising its worker
+                processes.
 
         Relevant constants:
             [RETRY_RUNNING_SECONDS][trulens.core.session.TruSession.RETRY_RUNNING_SECONDS]
@@ -559,11 +774,25 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
             [MAX_THREADS][trulens.core.utils.threading.TP.MAX_THREADS]
         """
 
-        assert not fork, "Fork mode not yet implemented."
         assert (
             (not fork) or (not return_when_done)
         ), "fork=True implies running asynchronously but return_when_done=True does not!"
 
+        if fork:
+            db = self.connector.db
+            if not isinstance(db, SQLAlchemyDB):
+                raise ValueError(
+                    "Fork mode requires a database that can be reconnected to "
+                    f"from other processes but got {type(db).__name__}."
+                )
+            if is_memory_sqlite(db.engine):
+                raise ValueError(
+                    "Fork mode cannot be used with an in-memory sqlite database."
+                )
+
+            if num_workers is None:
+                num_workers = os.cpu_count() or 1
+
         if self._evaluator_proc is not None:
             if restart:
                 self.stop_evaluator()
@@ -572,211 +801,352 @@ class TruSession(pydantic.BaseModel, python.SingletonPerName):
                     "Evaluator is already running in this process."
                 )
 
-        if not fork:
-            self._evaluator_stop = threading.Event()
+        self._evaluator_stop = threading.Event()
+
+        print(
+            f"Will keep max of "
+            f"{self.DEFERRED_NUM_RUNS} feedback(s) running"
+            + (
+                f" in each of {num_workers} worker process(es)."
+                if fork
+                else "."
+            )
+        )
+        print(
+            f"Tasks are spread among max of "
+            f"{tru_threading.TP.MAX_THREADS} thread(s)."
+        )
+        print(
+            f"Will rerun running feedbacks of stalled evaluators after "
+            f"{format_seconds(self.RETRY_RUNNING_SECONDS)}."
+        )
+        print(
+            f"Will rerun failed feedbacks after "
+            f"{format_seconds(self.RETRY_FAILED_SECONDS)}."
+        )
 
         def runloop(stop_when_none_left: bool = False):
-            assert self._evaluator_stop is not None
+            if fork:
+                self._supervise_evaluator_workers(
+                    stop=self._evaluator_stop,
+                    num_workers=num_workers,
+                    run_location=run_location,
+                    disable_tqdm=disable_tqdm,
+                )
+            else:
+                self._evaluator_loop(
+                    stop=self._evaluator_stop,
+                    run_location=run_location,
+                    disable_tqdm=disable_tqdm,
+                    stop_when_none_left=stop_when_none_left,
+                )
 
-            print(
-                f"Will keep max of "
-                f"{self.DEFERRED_NUM_RUNS} feedback(s) running."
-            )
-            print(
-                f"Tasks are spread among max of "
-                f"{tru_threading.TP.MAX_THREADS} thread(s)."
-            )
-            print(
-                f"Will rerun running feedbacks after "
-                f"{format_seconds(self.RETRY_RUNNING_SECONDS)}."
+            print("Evaluator stopped.")
+
+        if return_when_done:
+            runloop(stop_when_none_left=True)
+            return None
+        else:
+            proc = Thread(target=runloop)
+            proc.daemon = True
+            # Start a persistent thread that evaluates feedback functions or
+            # supervises the processes that do.
+            self._evaluator_proc = proc
+            proc.start()
+            return proc
+
+    run_evaluator = start_evaluator
+
+    def _evaluator_loop(
+        self,
+        stop: threading.Event,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+        disable_tqdm: bool = False,
+        stop_when_none_left: bool = False,
+        on_result: Optional[
+            Callable[[mod_feedback_schema.FeedbackResult], None]
+        ] = None,
+    ) -> None:
+        """Claim and evaluate deferred feedback functions in threads of this
+        process until `stop` is set.
+
+        Args:
+            stop: Event (or multiprocessing event) that stops the loop.
+
+            run_location: Run only the evaluations corresponding to
+                run_location.
+
+            disable_tqdm: If set, will disable progress bars.
+
+            stop_when_none_left: Return once there are no more feedback
+                functions to evaluate.
+
+            on_result: Called with the result of each finished evaluation.
+        """
+
+        show_progress = tqdm is not None and not disable_tqdm
+
+        total = 0
+
+        # Identifies the feedbacks claimed by this evaluator in the database.
+        evaluator_id = (
+            f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+        )
+
+        if show_progress:
+            # Getting total counts from the database to start off the tqdm
+            # progress bar initial values so that they offer accurate
+            # predictions initially after restarting the process.
+            queue_stats = self.connector.db.get_feedback_count_by_status()
+            queue_done = (
+                queue_stats.get(mod_feedback_schema.FeedbackResultStatus.DONE)
+                or 0
             )
-            print(
-                f"Will rerun failed feedbacks after "
-                f"{format_seconds(self.RETRY_FAILED_SECONDS)}."
+            queue_total = sum(queue_stats.values())
+
+            # Show the overall counts from the database, not just what has been
+            # looked at so far.
+            tqdm_status = tqdm(
+                desc="Feedback Status",
+                initial=queue_done,
+                unit="feedbacks",
+                total=queue_total,
+                postfix={
+                    status.name: count for status, count in queue_stats.items()
+                },
             )
 
-            total = 0
-
-            if tqdm:
-                # Getting total counts from the database to start off the tqdm
-                # progress bar initial values so that they offer accurate
-                # predictions initially after restarting the process.
-                queue_stats = self.connector.db.get_feedback_count_by_status()
-                queue_done = (
-                    queue_stats.get(
-                        mod_feedback_schema.FeedbackResultStatus.DONE
-                    )
-                    or 0
+            # Show the status of the results so far.
+            tqdm_total = tqdm(desc="Done Runs", initial=0, unit="runs")
+
+            # Show what is being waited for right now.
+            tqdm_waiting = tqdm(desc="Waiting for Runs", initial=0, unit="runs")
+
+        runs_stats = defaultdict(int)
+
+        futures_map: Dict[
+            Future[mod_feedback_schema.FeedbackResult], pandas.Series
+        ] = dict()
+
+        while not stop.is_set():
+            if len(futures_map) < self.DEFERRED_NUM_RUNS:
+                # Get some new evals to run if some already completed by now.
+                new_futures: List[
+                    Tuple[
+                        pandas.Series,
+                        Future[mod_feedback_schema.FeedbackResult],
+                    ]
+                ] = feedback.Feedback.evaluate_deferred(
+                    limit=self.DEFERRED_NUM_RUNS - len(futures_map),
+                    session=self,
+                    run_location=run_location,
+                    claimed_by=evaluator_id,
                 )
-                queue_total = sum(queue_stats.values())
 
-                # Show the overall counts from the database, not just what has been
-                # looked at so far.
-                tqdm_status = tqdm(
-                    desc="Feedback Status",
-                    initial=queue_done,
-                    unit="feedbacks",
-                    total=queue_total,
-                    postfix={
-                        status.name: count
-                        for status, count in queue_stats.items()
-                    },
-                    disable=disable_tqdm,
-                )
+                # Claimed feedbacks are not returned again until their lease
+                # expires so these are all new.
+                for row, fut in new_futures:
+                    futures_map[fut] = row
+                    total += 1
 
-                # Show the status of the results so far.
-                tqdm_total = tqdm(
-                    desc="Done Runs",
-                    initial=0,
-                    unit="runs",
-                    disable=disable_tqdm,
-                )
+                if show_progress:
+                    tqdm_total.total = total
+                    tqdm_total.refresh()
 
-                # Show what is being waited for right now.
-                tqdm_waiting = tqdm(
-                    desc="Waiting for Runs",
-                    initial=0,
-                    unit="runs",
-                    disable=disable_tqdm,
-                )
+            if show_progress:
+                tqdm_waiting.total = self.DEFERRED_NUM_RUNS
+                tqdm_waiting.n = len(futures_map)
+                tqdm_waiting.refresh()
 
-            runs_stats = defaultdict(int)
-
-            futures_map: Dict[
-                Future[mod_feedback_schema.FeedbackResult], pandas.Series
-            ] = dict()
-
-            while fork or not self._evaluator_stop.is_set():
-                if len(futures_map) < self.DEFERRED_NUM_RUNS:
-                    # Get some new evals to run if some already completed by now.
-                    new_futures: List[
-                        Tuple[
-                            pandas.Series,
-                            Future[mod_feedback_schema.FeedbackResult],
-                        ]
-                    ] = feedback.Feedback.evaluate_deferred(
-                        limit=self.DEFERRED_NUM_RUNS - len(futures_map),
-                        shuffle=True,
-                        session=self,
-                        run_location=run_location,
-                    )
+            # Note whether we have waited for some futures in this
+            # iteration. Will control some extra wait time if there is no
+            # work.
+            did_wait = False
 
-                    # Will likely get some of the same ones that already have running.
-                    for row, fut in new_futures:
-                        if fut in futures_map:
-                            # If the future is already in our set, check whether
-                            # its status has changed and if so, note it in the
-                            # runs_stats.
-                            if futures_map[fut].status != row.status:
-                                runs_stats[row.status.name] += 1
+            if len(futures_map) > 0:
+                did_wait = True
 
-                        futures_map[fut] = row
-                        total += 1
+                futures_copy = list(futures_map.keys())
 
-                    if tqdm:
-                        tqdm_total.total = total
-                        tqdm_total.refresh()
+                try:
+                    # Wake up in time to renew the leases before they expire.
+                    for fut in futures.as_completed(
+                        futures_copy,
+                        timeout=min(10, self.RETRY_RUNNING_SECONDS / 2),
+                    ):
+                        del futures_map[fut]
+
+                        if show_progress:
+                            tqdm_waiting.update(-1)
+                            tqdm_total.update(1)
+
+                        feedback_result = fut.result()
+                        if feedback_result is None:
+                            # Feedback could not be evaluated, see
+                            # evaluate_deferred.
+                            continue
+
+                        runs_stats[feedback_result.status.name] += 1
+
+                        if on_result is not None:
+                            on_result(feedback_result)
+
+                except futures.TimeoutError:
+                    pass
+
+                # Keep the claims on the feedbacks still running, however long
+                # they take, so that other evaluators do not restart them.
+                self.connector.db.renew_feedback_leases(
+                    [row.feedback_result_id for row in futures_map.values()],
+                    claimed_by=evaluator_id,
+                    lease_seconds=self.RETRY_RUNNING_SECONDS,
+                )
 
-                if tqdm:
-                    tqdm_waiting.total = self.DEFERRED_NUM_RUNS
-                    tqdm_waiting.n = len(futures_map)
-                    tqdm_waiting.refresh()
+            if show_progress:
+                tqdm_total.set_postfix({
+                    name: count for name, count in runs_stats.items()
+                })
 
-                # Note whether we have waited for some futures in this
-                # iteration. Will control some extra wait time if there is no
-                # work.
-                did_wait = False
+                queue_stats = self.connector.db.get_feedback_count_by_status()
+                queue_done = (
+                    queue_stats.get(
+                        mod_feedback_schema.FeedbackResultStatus.DONE
+                    )
+                    or 0
+                )
+                queue_total = sum(queue_stats.values())
 
-                if len(futures_map) > 0:
-                    did_wait = True
+                tqdm_status.n = queue_done
+                tqdm_status.total = queue_total
+                tqdm_status.set_postfix({
+                    status.name: count for status, count in queue_stats.items()
+                })
 
-                    futures_copy = list(futures_map.keys())
+            if not did_wait:
+                if stop_when_none_left:
+                    break
+                # Nothing to run/is running, wait a bit.
+                stop.wait(10)
 
-                    try:
-                        for fut in futures.as_completed(
-                            futures_copy, timeout=10
-                        ):
-                            del futures_map[fut]
+    def _supervise_evaluator_workers(
+        self,
+        stop: threading.Event,
+        num_workers: int,
+        run_location: Optional[mod_feedback_schema.FeedbackRunLocation] = None,
+        disable_tqdm: bool = False,
+    ) -> None:
+        """Run the deferred evaluator in `num_workers` processes until `stop`
+        is set, restarting workers that exit and aggregating their progress.
+        """
 
-                            if tqdm:
-                                tqdm_waiting.update(-1)
-                                tqdm_total.update(1)
+        db = self.connector.db
+
+        # Workers create their own engine. Engines created from a url keep
+        # their pool settings.
+        engine_params = dict(db.engine_params)
+        if "url" not in engine_params:
+            engine_params = {
+                "url": db.engine.url.render_as_string(hide_password=False)
+            }
+
+        worker_args = dict(
+            db_args=dict(
+                engine_params=engine_params,
+                session_params=db.session_params,
+                table_prefix=db.table_prefix,
+                redact_keys=db.redact_keys,
+                sqlite=db.sqlite,
+                read_replicas=db.read_replicas,
+            ),
+            settings=dict(
+                RETRY_RUNNING_SECONDS=self.RETRY_RUNNING_SECONDS,
+                RETRY_FAILED_SECONDS=self.RETRY_FAILED_SECONDS,
+                DEFERRED_NUM_RUNS=self.DEFERRED_NUM_RUNS,
+            ),
+            run_location=run_location,
+        )
 
-                            feedback_result = fut.result()
-                            runs_stats[feedback_result.status.name] += 1
+        # Spawn instead of fork as this process has threads and open database
+        # connections that the workers should not inherit.
+        context = multiprocessing.get_context("spawn")
+        # Not a multiprocessing Event as setting one blocks if a worker was
+        # killed while waiting on it.
+        workers_stop = context.RawValue("b", 0)
+        results = context.Queue()
+
+        def start_worker(index: int) -> Process:
+            proc = context.Process(
+                target=_evaluator_worker,
+                kwargs=dict(worker_args, stop=workers_stop, results=results),
+                name=f"TruSession evaluator worker {index}",
+                daemon=True,
+            )
+            proc.start()
+            return proc
 
-                    except futures.TimeoutError:
-                        pass
+        workers = [start_worker(i) for i in range(num_workers)]
+
+        show_progress = tqdm is not None and not disable_tqdm
+
+        if show_progress:
+            tqdm_status = tqdm(desc="Feedback Status", unit="feedbacks")
+            tqdm_total = tqdm(desc="Done Runs", initial=0, unit="runs")
+
+        runs_stats = defaultdict(int)
+        last_status_update = 0.0
+
+        try:
+            while not stop.is_set():
+                # Aggregate the results reported by the workers.
+                try:
+                    status_name = results.get(timeout=1)
+                    while True:
+                        runs_stats[status_name] += 1
+                        if show_progress:
+                            tqdm_total.update(1)
+                        status_name = results.get_nowait()
+                except queue.Empty:
+                    pass
+
+                for index, proc in enumerate(workers):
+                    if not proc.is_alive() and not stop.is_set():
+                        logger.warning(
+                            "Evaluator worker %s exited with code %s. Restarting it.",
+                            index,
+                            proc.exitcode,
+                        )
+                        runs_stats["RESTARTS"] += 1
+                        workers[index] = start_worker(index)
 
-                if tqdm:
-                    tqdm_total.set_postfix({
-                        name: count for name, count in runs_stats.items()
-                    })
+                if show_progress and time.time() - last_status_update > 10:
+                    last_status_update = time.time()
 
-                    queue_stats = (
-                        self.connector.db.get_feedback_count_by_status()
-                    )
-                    queue_done = (
+                    queue_stats = db.get_feedback_count_by_status()
+                    tqdm_status.n = (
                         queue_stats.get(
                             mod_feedback_schema.FeedbackResultStatus.DONE
                         )
                         or 0
                     )
-                    queue_total = sum(queue_stats.values())
-
-                    tqdm_status.n = queue_done
-                    tqdm_status.total = queue_total
+                    tqdm_status.total = sum(queue_stats.values())
                     tqdm_status.set_postfix({
                         status.name: count
                         for status, count in queue_stats.items()
                     })
 
-                # Check if any of the running futures should be stopped.
-                futures_copy = list(futures_map.keys())
-                for fut in futures_copy:
-                    row = futures_map[fut]
-
-                    if fut.running():
-                        # Not checking status here as this will be not yet be set
-                        # correctly. The computation in the future updates the
-                        # database but this object is outdated.
-
-                        elapsed = datetime.now().timestamp() - row.last_ts
-                        if elapsed > self.RETRY_RUNNING_SECONDS:
-                            fut.cancel()
-
-                            # Not an actual status, but would be nice to
-                            # indicate cancellations in run stats:
-                            runs_stats["CANCELLED"] += 1
+                    tqdm_total.set_postfix(dict(runs_stats))
 
-                            del futures_map[fut]
+        finally:
+            workers_stop.value = 1
 
-                if not did_wait:
-                    if stop_when_none_left:
-                        break
-                    # Nothing to run/is running, wait a bit.
-                    if fork:
-                        sleep(10)
-                    else:
-                        self._evaluator_stop.wait(10)
+            # Workers check for the stop event at least every 10 seconds.
+            deadline = time.time() + 30
+            for proc in workers:
+                proc.join(timeout=max(0.0, deadline - time.time()))
+                if proc.is_alive():
+                    proc.terminate()
 
-            print("Evaluator stopped.")
-
-        if return_when_done:
-            runloop(stop_when_none_left=True)
-            return None
-        else:
-            if fork:
-                proc = Process(target=runloop)
-            else:
-                proc = Thread(target=runloop)
-                proc.daemon = True
-            # Start a persistent thread or process that evaluates feedback functions.
-            self._evaluator_proc = proc
-            proc.start()
-            return proc
-
-    run_evaluator = start_evaluator
+            results.close()
 
     def stop_evaluator(self):
         """
@@ -804,3 +1174,55 @@ def Tru(*args, **kwargs) -> TruSession:
         stacklevel=2,
     )
     return TruSession(*args, **kwargs)
+
+
+class _SharedStopFlag:
+    """Event-like view of a flag in shared memory set by another process."""
+
+    def __init__(self, flag: Any):
+        self.flag = flag
+
+    def is_set(self) -> bool:
+        return bool(self.flag.value)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.time() + timeout
+
+        while not self.is_set():
+            if deadline is not None and time.time() >= deadline:
+                break
+            time.sleep(0.5)
+
+        return self.is_set()
+
+
+def _evaluator_worker(
+    db_args: Dict[str, Any],
+    settings: Dict[str, Any],
+    run_location: Optional[mod_feedback_schema.FeedbackRunLocation],
+    stop: Any,
+    results: multiprocessing.Queue,
+) -> None:
+    """Entry point of the worker processes of the deferred evaluator started
+    by [start_evaluator][trulens.core.session.TruSession.start_evaluator] with
+    `fork=True`.
+
+    Runs until the shared flag `stop` is set. Reports the status of each
+    evaluated feedback function to `results`.
+    """
+
+    session = TruSession(
+        connector=DefaultDBConnector(
+            database=SQLAlchemyDB(**db_args), database_check_revision=False
+        )
+    )
+
+    for name, value in settings.items():
+        setattr(session, name, value)
+
+    session._evaluator_loop(
+        stop=_SharedStopFlag(stop),
+        run_location=run_location,
+        disable_tqdm=True,
+        on_result=lambda result: results.put(result.status.name),
+    )
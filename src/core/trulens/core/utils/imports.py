@@ -387,6 +387,18 @@ REQUIREMENT_OPENAI = format_import_errors(
     ["openai", "langchain_community"], purpose="using OpenAI models"
 )
 
+REQUIREMENT_PYARROW = format_import_errors(
+    "pyarrow", purpose="reading and writing Parquet archives"
+)
+
+REQUIREMENT_ZSTANDARD = format_import_errors(
+    "zstandard", purpose="compressing stored records with zstd"
+)
+
+REQUIREMENT_ORJSON = format_import_errors(
+    "orjson", purpose="serializing json with orjson"
+)
+
 REQUIREMENT_SNOWFLAKE = format_import_errors(
     [
         "snowflake-core",
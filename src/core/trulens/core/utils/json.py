@@ -5,6 +5,7 @@ from __future__ import annotations
 import dataclasses
 from enum import Enum
 import hashlib
+import inspect
 import json
 import logging
 from pathlib import Path
@@ -13,9 +14,12 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterator,
+    List,
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -28,6 +32,7 @@ from trulens.core.utils.constants import ALL_SPECIAL_KEYS
 from trulens.core.utils.constants import CIRCLE
 from trulens.core.utils.constants import CLASS_INFO
 from trulens.core.utils.imports import REQUIREMENT_OPENAI
+from trulens.core.utils.imports import REQUIREMENT_ORJSON
 from trulens.core.utils.imports import OptionalImports
 from trulens.core.utils.keys import redact_value
 from trulens.core.utils.pyschema import Class
@@ -59,10 +64,24 @@ with OptionalImports(messages=REQUIREMENT_OPENAI):
     ENCODERS_BY_TYPE[httpx.URL] = encode_httpx_url
     ENCODERS_BY_TYPE[Timeout] = encode_openai_timeout
 
+with OptionalImports(messages=REQUIREMENT_ORJSON) as opt:
+    import orjson
+
 logger = logging.getLogger(__name__)
 pp = PrettyPrinter()
 T = TypeVar("T")
 
+USE_ORJSON: bool = False
+"""Encode json strings in
+[json_str_of_obj][trulens.core.utils.json.json_str_of_obj] with `orjson`,
+which is several times faster than `json`.
+
+Unlike `json`, `orjson` separates items without spaces, writes non-ascii
+characters unescaped and writes `NaN` and infinite floats as `null`. Values it
+cannot encode, such as integers beyond 64 bits, are encoded with `json`.
+Requires the `orjson` package.
+"""
+
 
 def _recursive_hash(
     value: Union[dict, list, str, int, bool, float, complex, None],
@@ -111,12 +130,23 @@ def json_str_of_obj(
 ) -> str:
     """
     Encode the given json object as a string.
+
+    Uses `orjson` if [USE_ORJSON][trulens.core.utils.json.USE_ORJSON] is set.
     """
 
-    return json.dumps(
-        jsonify(obj, *args, redact_keys=redact_keys, **kwargs),
-        default=json_default,
-    )
+    content = jsonify(obj, *args, redact_keys=redact_keys, **kwargs)
+
+    if USE_ORJSON:
+        opt.assert_installed(orjson)
+
+        try:
+            return orjson.dumps(
+                content, default=json_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(content, default=json_default)
 
 
 def json_default(obj: Any) -> str:
@@ -143,6 +173,193 @@ def jsonify_for_ui(*args, **kwargs):
     return jsonify(*args, **kwargs, redact_keys=True, skip_specials=True)
 
 
+# Kinds of values by how they are jsonified, see `_kind_of`.
+_BASE = 0
+_SERIAL_BYTES = 1
+_PATH = 2
+_ENUM = 3
+_DICT = 4
+_SEQUENCE = 5
+_LENS = 6
+_PYDANTIC = 7
+_PYDANTIC_V1 = 8
+_DATACLASS = 9
+_OTHER = 10
+
+_PENDING = object()
+"""Stands in for the json of a value whose contents are yet to be jsonified."""
+
+_MISSING = object()
+
+_kinds: Dict[type, int] = {}
+"""Kind of the values of each type jsonified so far."""
+
+_class_infos: Dict[type, JSON] = {}
+"""Class information of each component type jsonified so far."""
+
+_class_attributes: Dict[Tuple[type, str], bool] = {}
+"""Whether each type defines each attribute looked up so far."""
+
+_default_instrument: Optional[Instrument] = None
+
+
+def _kind_of(obj: Any) -> int:
+    """Determine how to jsonify `obj` and remember it for its type."""
+
+    if isinstance(obj, JSON_BASES):
+        kind = _BASE
+    elif isinstance(obj, SerialBytes):
+        kind = _SERIAL_BYTES
+    elif isinstance(obj, Path):
+        kind = _PATH
+    elif isinstance(obj, Enum):
+        kind = _ENUM
+    elif isinstance(obj, Dict):
+        kind = _DICT
+    elif isinstance(obj, Sequence):
+        kind = _SEQUENCE
+    elif isinstance(obj, Set):
+        kind = _SEQUENCE
+    elif isinstance(obj, Lens):
+        kind = _LENS
+    elif isinstance(obj, pydantic.BaseModel):
+        kind = _PYDANTIC
+    elif isinstance(obj, v1BaseModel):
+        kind = _PYDANTIC_V1
+    elif dataclasses.is_dataclass(type(obj)):
+        kind = _DATACLASS
+    else:
+        kind = _OTHER
+
+    _kinds[type(obj)] = kind
+
+    return kind
+
+
+def _copy_json(value: JSON) -> JSON:
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _class_info(cls: type) -> JSON:
+    """Serialized class information of `cls` including its bases."""
+
+    info = _class_infos.get(cls)
+    if info is None:
+        info = _class_infos[cls] = Class.of_class(
+            cls=cls, with_bases=True
+        ).model_dump()
+
+    # Copy so that changes to one json do not show up in others.
+    return _copy_json(info)
+
+
+def _class_defines(cls: type, k: str) -> bool:
+    """Whether `cls` or its metaclass define the attribute `k`."""
+
+    key = (cls, k)
+
+    defined = _class_attributes.get(key)
+    if defined is None:
+        try:
+            inspect.getattr_static(cls, k)
+            defined = True
+        except AttributeError:
+            defined = False
+
+        _class_attributes[key] = defined
+
+    return defined
+
+
+def _instance_attribute(obj: Any, k: str) -> Any:
+    """The attribute `k` of `obj` if it is in the `__dict__` of `obj` and not
+    defined by its class. Otherwise `_MISSING`."""
+
+    if isinstance(obj, type) or _class_defines(type(obj), k):
+        return _MISSING
+
+    try:
+        attrs = object.__getattribute__(obj, "__dict__")
+    except AttributeError:
+        return _MISSING
+
+    if type(attrs) is not dict:
+        return _MISSING
+
+    return attrs.get(k, _MISSING)
+
+
+def _safe_getattr(obj: Any, k: str) -> Any:
+    """Same as [safe_getattr][trulens.core.utils.pyschema.safe_getattr] but
+    skips the static lookup of attributes in the `__dict__` of `obj`."""
+
+    v = _instance_attribute(obj, k)
+    if v is _MISSING or isinstance(v, property):
+        return safe_getattr(obj, k)
+
+    return v
+
+
+def _has_jsonify_extra(obj: Any) -> bool:
+    """Same as `safe_hasattr(obj, "jsonify_extra")` but skips the static
+    lookup for objects whose class does not define it."""
+
+    if (
+        not isinstance(obj, type)
+        and not _class_defines(type(obj), "jsonify_extra")
+        and _instance_attribute(obj, "jsonify_extra") is _MISSING
+    ):
+        return False
+
+    return safe_hasattr(obj, "jsonify_extra")
+
+
+def _get_default_instrument() -> Instrument:
+    """Instrument used by `jsonify` if none is given.
+
+    Made again if classes to instrument were added to the defaults since.
+    """
+
+    global _default_instrument
+
+    instrument = _default_instrument
+    if instrument is None or len(instrument.include_classes) != len(
+        type(instrument).Default.CLASSES
+    ):
+        from trulens.core.instruments import Instrument
+
+        instrument = _default_instrument = Instrument()
+
+    return instrument
+
+
+class _Frame:
+    """An object whose contents are being jsonified."""
+
+    __slots__ = ("obj", "content", "items", "depth", "keyed", "redact", "key")
+
+    def __init__(
+        self,
+        obj: Any,
+        items: Iterator[Any],
+        depth: int,
+        keyed: bool,
+        redact: bool,
+    ):
+        self.obj = obj
+        self.content: Union[Dict[Any, JSON], List[JSON]] = {} if keyed else []
+        self.items = items
+        self.depth = depth
+        self.keyed = keyed
+        self.redact = redact
+        self.key: Any = None
+        """Key of the content being jsonified if `keyed`."""
+
+
 def jsonify(
     obj: Any,
     dicted: Optional[Dict[int, JSON]] = None,
@@ -179,9 +396,7 @@ def jsonify(
             max_depth: the maximum depth of the serialization of the given object.
                 Objects to be serialized beyond this will be serialized as
                 "non-serialized object" as per `noserio`. Note that this may happen
-                for some data layouts like linked lists. This value should be no
-                larger than half the value set by
-                [sys.setrecursionlimit][sys.setrecursionlimit].
+                for some data layouts like linked lists.
 
         Returns:
             The jsonified version of the given object. Jsonified means that the the
@@ -211,215 +426,215 @@ def jsonify(
         raise ValueError("Cannot jsonify a generator function.")
     """
 
-    if depth > max_depth:
-        logger.debug(
-            "Max depth reached for jsonify of object type '%s'.", type(obj)
-        )  # careful about str(obj) in case it is recursive infinitely.
+    # The serialization is iterative: objects with contents get a frame on
+    # `stack` while their contents are jsonified.
 
-        return noserio(obj)
+    if instrument is None:
+        instrument = _get_default_instrument()
 
-    skip_excluded = not include_excluded
-    # Hack so that our models do not get exclude dumped which causes many
-    # problems. Another variable set here so we can recurse with the original
-    # include_excluded .
-    if isinstance(obj, SerialModel):
-        skip_excluded = True
+    # Ids of the objects whose contents are being jsonified. An object among
+    # its own contents is marked as a cycle.
+    enclosing: Set[int] = set(dicted) if dicted else set()
 
-    from trulens.core.instruments import Instrument
+    # TODO: should we include duplicates? If so, `enclosing` needs to be
+    # replaced by the ids of all jsonified objects.
 
-    if instrument is None:
-        instrument = Instrument()
+    stack: List[_Frame] = []
 
-    dicted = dicted or {}
+    instrumented: Dict[type, bool] = {}
 
-    if skip_specials:
+    def to_instrument(o: Any) -> bool:
+        cls = type(o)
+        ret = instrumented.get(cls)
+        if ret is None:
+            ret = instrumented[cls] = instrument.to_instrument_object(o)
+        return ret
 
-        def recur_key(k):
-            return isinstance(k, JSON_BASES) and k not in ALL_SPECIAL_KEYS
+    def recur_key(k: Any) -> bool:
+        return isinstance(k, JSON_BASES) and not (
+            skip_specials and k in ALL_SPECIAL_KEYS
+        )
 
-    else:
+    def finish(o: Any, content: JSON) -> JSON:
+        # Add class information for objects that are to be instrumented, known
+        # as "components".
+        if (
+            not skip_specials
+            and isinstance(content, dict)
+            and not isinstance(o, dict)
+            and (to_instrument(o) or isinstance(o, WithClassInfo))
+        ):
+            content[CLASS_INFO] = _class_info(o.__class__)
 
-        def recur_key(k):
-            return isinstance(k, JSON_BASES)
+        if _has_jsonify_extra(o):
+            content = o.jsonify_extra(content)
 
-    if id(obj) in dicted:
-        if skip_specials:
-            return None
+        return content
 
-        return {CIRCLE: id(obj)}
+    def enter(o: Any, d: int) -> JSON:
+        """Jsonify `o` at depth `d` if it has no contents to jsonify.
+        Otherwise push a frame for its contents and return `_PENDING`."""
 
-    if isinstance(obj, JSON_BASES):
-        if redact_keys and isinstance(obj, str):
-            return redact_value(obj)
+        if d > max_depth:
+            logger.debug(
+                "Max depth reached for jsonify of object type '%s'.", type(o)
+            )  # careful about str(o) in case it is recursive infinitely.
 
-        return obj
+            return noserio(o)
 
-    # TODO: remove eventually
-    if isinstance(obj, SerialBytes):
-        return obj.model_dump()
+        if id(o) in enclosing:
+            if skip_specials:
+                return None
 
-    if isinstance(obj, Path):
-        return str(obj)
+            return {CIRCLE: id(o)}
 
-    if type(obj) in ENCODERS_BY_TYPE:
-        return ENCODERS_BY_TYPE[type(obj)](obj)
-
-    # TODO: should we include duplicates? If so, dicted needs to be adjusted.
-    new_dicted = dict(dicted)
-
-    def recur(o):
-        return jsonify(
-            obj=o,
-            dicted=new_dicted,
-            instrument=instrument,
-            skip_specials=skip_specials,
-            redact_keys=redact_keys,
-            include_excluded=include_excluded,
-            depth=depth + 1,
-            max_depth=max_depth,
-        )
+        cls = type(o)
+        kind = _kinds.get(cls)
+        if kind is None:
+            kind = _kind_of(o)
 
-    content = None
+        if kind == _BASE:
+            if redact_keys and isinstance(o, str):
+                return redact_value(o)
 
-    if isinstance(obj, Enum):
-        content = obj.name
+            return o
 
-    elif isinstance(obj, Dict):
-        forward_value = {}
-        new_dicted[id(obj)] = forward_value
-        forward_value.update({
-            k: recur(v) for k, v in obj.items() if recur_key(k)
-        })
+        # TODO: remove eventually
+        if kind == _SERIAL_BYTES:
+            return o.model_dump()
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in forward_value.items():
-                forward_value[k] = redact_value(v=v, k=k)
+        if kind == _PATH:
+            return str(o)
 
-        content = forward_value
+        encoder = ENCODERS_BY_TYPE.get(cls)
+        if encoder is not None:
+            return encoder(o)
 
-    elif isinstance(obj, Sequence):
-        forward_value = []
-        new_dicted[id(obj)] = forward_value
-        for x in (recur(v) for v in obj):
-            forward_value.append(x)
+        if kind == _ENUM:
+            return finish(o, o.name)
 
-        content = forward_value
+        if kind == _LENS:  # special handling of paths
+            return o.model_dump()
 
-    elif isinstance(obj, Set):
-        forward_value = []
-        new_dicted[id(obj)] = forward_value
-        for x in (recur(v) for v in obj):
-            forward_value.append(x)
+        keyed = True
+        redact = redact_keys
 
-        content = forward_value
+        if kind == _DICT:
+            items = ((k, v) for k, v in o.items() if recur_key(k))
 
-    elif isinstance(obj, pydantic.BaseModel):
-        # Not even trying to use pydantic.dict here.
+        elif kind == _SEQUENCE:
+            keyed = False
+            redact = False
+            items = iter(o)
 
-        if isinstance(obj, Lens):  # special handling of paths
-            return obj.model_dump()
+        elif kind == _PYDANTIC:
+            # Not even trying to use pydantic.dict here.
 
-        forward_value = {}
-        new_dicted[id(obj)] = forward_value
-        forward_value.update({
-            k: recur(safe_getattr(obj, k))
-            for k, v in obj.model_fields.items()
-            if (not skip_excluded or not v.exclude) and recur_key(k)
-        })
+            # Hack so that our models do not get exclude dumped which causes
+            # many problems.
+            skip_excluded = not include_excluded or isinstance(o, SerialModel)
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in forward_value.items():
-                forward_value[k] = redact_value(v=v, k=k)
+            items = (
+                (k, _safe_getattr(o, k))
+                for k, v in cls.model_fields.items()
+                if (not skip_excluded or not v.exclude) and recur_key(k)
+            )
 
-        content = forward_value
+        elif kind == _PYDANTIC_V1:
+            items = (
+                (k, _safe_getattr(o, k))
+                for k, v in o.__fields__.items()
+                if (include_excluded or not v.field_info.exclude)
+                and recur_key(k)
+            )
 
-    elif isinstance(obj, v1BaseModel):
-        # TODO: DEDUP with pydantic.BaseModel case
+        elif kind == _DATACLASS:
+            # NOTE: cannot use dataclasses.asdict as that may fail due to its
+            # use of copy.deepcopy.
 
-        # Not even trying to use pydantic.dict here.
+            items = (
+                (f.name, _safe_getattr(o, f.name))
+                for f in dataclasses.fields(o)
+                if recur_key(f.name)
+            )
 
-        forward_value = {}
-        new_dicted[id(obj)] = forward_value
-        forward_value.update({
-            k: recur(safe_getattr(obj, k))
-            for k, v in obj.__fields__.items()
-            if (not skip_excluded or not v.field_info.exclude) and recur_key(k)
-        })
+        elif to_instrument(o):
+            redact = False
+
+            # TODO(piotrm): object walks redo
+            items = (
+                (k, v)
+                for k, v in clean_attributes(o, include_props=True).items()
+                if recur_key(k)
+                and (
+                    isinstance(v, JSON_BASES)
+                    or isinstance(v, Dict)
+                    or isinstance(v, Sequence)
+                    or to_instrument(v)
+                )
+            )
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in forward_value.items():
-                forward_value[k] = redact_value(v=v, k=k)
+        else:
+            logger.debug(
+                "Do not know how to jsonify an object of type '%s'.", cls
+            )  # careful about str(o) in case it is recursive infinitely.
 
-        content = forward_value
+            return finish(o, noserio(o))
 
-    elif dataclasses.is_dataclass(type(obj)):
-        # NOTE: cannot use dataclasses.asdict as that may fail due to its use of
-        # copy.deepcopy.
+        enclosing.add(id(o))
+        stack.append(
+            _Frame(obj=o, items=items, depth=d, keyed=keyed, redact=redact)
+        )
 
-        forward_value = {}
-        new_dicted[id(obj)] = forward_value
+        return _PENDING
 
-        forward_value.update({
-            f.name: recur(safe_getattr(obj, f.name))
-            for f in dataclasses.fields(obj)
-            if recur_key(f.name)
-        })
+    content = enter(obj, depth)
 
-        # Redact possible secrets based on key name and value.
-        if redact_keys:
-            for k, v in forward_value.items():
-                forward_value[k] = redact_value(v=v, k=k)
-
-        content = forward_value
-
-    elif instrument.to_instrument_object(obj):
-        forward_value = {}
-        new_dicted[id(obj)] = forward_value
-
-        kvs = clean_attributes(obj, include_props=True)
-
-        # TODO(piotrm): object walks redo
-        forward_value.update({
-            k: recur(v)
-            for k, v in kvs.items()
-            if recur_key(k)
-            and (
-                isinstance(v, JSON_BASES)
-                or isinstance(v, Dict)
-                or isinstance(v, Sequence)
-                or instrument.to_instrument_object(v)
-            )
-        })
+    while content is _PENDING:
+        frame = stack[-1]
 
-        content = forward_value
+        if frame.keyed:
+            for frame.key, o in frame.items:
+                value = enter(o, frame.depth + 1)
+                if value is _PENDING:
+                    break
+                frame.content[frame.key] = value
+            else:
+                value = None
 
-    else:
-        logger.debug(
-            "Do not know how to jsonify an object of type '%s'.", type(obj)
-        )  # careful about str(obj) in case it is recursive infinitely.
+        else:
+            for o in frame.items:
+                value = enter(o, frame.depth + 1)
+                if value is _PENDING:
+                    break
+                frame.content.append(value)
+            else:
+                value = None
 
-        content = noserio(obj)
+        if value is _PENDING:
+            # Jsonify the contents of the new frame first.
+            continue
 
-    # Add class information for objects that are to be instrumented, known as
-    # "components".
-    if (
-        not skip_specials
-        and isinstance(content, dict)
-        and not isinstance(obj, dict)
-        and (
-            instrument.to_instrument_object(obj)
-            or isinstance(obj, WithClassInfo)
-        )
-    ):
-        content[CLASS_INFO] = Class.of_class(
-            cls=obj.__class__, with_bases=True
-        ).model_dump()
+        # All contents of `frame` are done.
+        stack.pop()
+        enclosing.discard(id(frame.obj))
+
+        value = frame.content
+
+        # Redact possible secrets based on key name and value.
+        if frame.redact:
+            for k, v in value.items():
+                value[k] = redact_value(v=v, k=k)
+
+        value = finish(frame.obj, value)
+
+        if not stack:
+            content = value
+
+        elif stack[-1].keyed:
+            stack[-1].content[stack[-1].key] = value
 
-    if not isinstance(obj, Lens) and safe_hasattr(obj, "jsonify_extra"):
-        # Problem with Lens and similar objects: they always say they have every attribute.
-        content = obj.jsonify_extra(content)
+        else:
+            stack[-1].content.append(value)
 
     return content
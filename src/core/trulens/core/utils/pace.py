@@ -1,11 +1,26 @@
+from __future__ import annotations
+
 from _thread import LockType
+import asyncio
 from collections import deque
+import contextlib
 from datetime import datetime
 from datetime import timedelta
 import logging
+from threading import Condition
 from threading import Lock
 import time
-from typing import ClassVar, Deque, Optional
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from pydantic import BaseModel
 from pydantic import Field
@@ -16,6 +31,9 @@ logger = logging.getLogger(__name__)
 class Pace(BaseModel):
     """Keep a given pace.
 
+    Superseded by [RateLimiter][trulens.core.utils.pace.RateLimiter] for
+    endpoints.
+
     Calls to `Pace.mark` may block until the pace of its returns is kept to a
     constraint: the number of returns in the given period of time cannot exceed
     `marks_per_second * seconds_per_period`. This means the average number of
@@ -135,3 +153,331 @@ per second in that period.
             )
 
             return (now - prior_last_mark).total_seconds()
+
+
+class RateLimiter:
+    """Limit the rate of requests to an API.
+
+    Enforces together a maximum number of requests per minute, a maximum number
+    of tokens per minute, and a maximum number of requests in flight at once.
+    Unlike [Pace][trulens.core.utils.pace.Pace], waiting callers do not hold a
+    lock while they wait: each caller reserves the earliest time at which it
+    may proceed and then waits for that time independently of other callers.
+
+    Requests per minute are modeled as a token bucket holding up to
+    `burst_seconds` worth of requests. Tokens used by requests are only known
+    after the fact, hence are reported using
+    [record_tokens][trulens.core.utils.pace.RateLimiter.record_tokens] and
+    delay later requests once more than `burst_seconds` worth of tokens were
+    used.
+
+    The rates adapt to rate limiting responses reported using
+    [rate_limited][trulens.core.utils.pace.RateLimiter.rate_limited]: requests
+    are paused for the given duration and the rates are halved. They recover
+    gradually with each successful request reported using
+    [succeeded][trulens.core.utils.pace.RateLimiter.succeeded].
+
+    Limiters can be shared between users of the same API account, see
+    [shared][trulens.core.utils.pace.RateLimiter.shared].
+
+    Args:
+        rpm: Maximum requests per minute.
+
+        tpm: Maximum tokens per minute. Not limited if not given.
+
+        max_concurrency: Maximum number of requests in flight. Not limited if
+            not given.
+
+        burst_seconds: Size of the token buckets in seconds of their rate. The
+            longer this is, the bigger bursts of requests are allowed after
+            idle periods.
+    """
+
+    MIN_RATE_FACTOR: ClassVar[float] = 0.1
+    """Lowest fraction of the configured rates that rate limiting responses
+    can reduce the rates to."""
+
+    RATE_RECOVERY: ClassVar[float] = 0.05
+    """Fraction of the configured rates recovered with each successful
+    request."""
+
+    DEFAULT_RETRY_AFTER: ClassVar[float] = 1.0
+    """Pause in seconds after a rate limiting response that does not say how
+    long to wait."""
+
+    _shared: ClassVar[Dict[Hashable, RateLimiter]] = {}
+    _shared_lock: ClassVar[LockType] = Lock()
+
+    def __init__(
+        self,
+        rpm: float,
+        tpm: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        burst_seconds: float = 10.0,
+    ):
+        if rpm <= 0:
+            raise ValueError("`rpm` must be positive.")
+        if tpm is not None and tpm <= 0:
+            raise ValueError("`tpm` must be positive.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be positive.")
+
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.burst_seconds = burst_seconds
+
+        self._lock = Lock()
+        self._slot_freed = Condition(self._lock)
+        self._async_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Future]
+        ] = []
+
+        self._rate_factor: float = 1.0
+        self._request_tat: float = 0.0
+        self._token_tat: float = 0.0
+        self._blocked_until: float = 0.0
+        self._last_mark: float = time.monotonic()
+        self._in_flight: int = 0
+        self._token_totals: Dict[Hashable, int] = {}
+
+    @staticmethod
+    def shared(key: Hashable, **kwargs) -> RateLimiter:
+        """Get the limiter shared by all users of the given `key`, usually
+        identifying an API account, creating it with the given arguments if it
+        does not exist.
+
+        Limits of an existing limiter are kept even if `kwargs` differ.
+        """
+
+        with RateLimiter._shared_lock:
+            limiter = RateLimiter._shared.get(key)
+
+            if limiter is None:
+                limiter = RateLimiter(**kwargs)
+                RateLimiter._shared[key] = limiter
+
+            elif (
+                kwargs.get("rpm", limiter.rpm) != limiter.rpm
+                or kwargs.get("tpm", limiter.tpm) != limiter.tpm
+            ):
+                logger.debug(
+                    "Rate limiter for %s already exists with rpm=%s tpm=%s, ignoring %s.",
+                    key,
+                    limiter.rpm,
+                    limiter.tpm,
+                    kwargs,
+                )
+
+            return limiter
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+
+        return self._in_flight
+
+    @property
+    def rate_factor(self) -> float:
+        """Fraction of the configured rates currently allowed."""
+
+        return self._rate_factor
+
+    def _reserve(self) -> Tuple[float, float]:
+        """Reserve the earliest time a request may start.
+
+        Returns the reserved time and the time of the previously reserved
+        request, as given by `time.monotonic`.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._blocked_until)
+
+            if self.tpm is not None:
+                # Wait until the tokens used beyond the burst allowance have
+                # been paid for.
+                start = max(start, self._token_tat - self.burst_seconds)
+
+            # Generic cell rate algorithm for the requests bucket.
+            interval = 60.0 / (self.rpm * self._rate_factor)
+            tolerance = max(0.0, self.burst_seconds - interval)
+
+            tat = max(self._request_tat, start)
+            start = max(start, tat - tolerance)
+            self._request_tat = tat + interval
+
+            prior_mark = self._last_mark
+            self._last_mark = max(self._last_mark, start)
+
+            return start, prior_mark
+
+    def mark(self) -> float:
+        """Block until a request can be made without exceeding the rates.
+
+        Does not count towards the requests in flight. Returns time in seconds
+        since the prior request was allowed.
+        """
+
+        while True:
+            start, prior_mark = self._reserve()
+
+            delay = start - time.monotonic()
+            if delay > 0.0:
+                time.sleep(delay)
+
+            # A rate limiting response may have arrived while waiting.
+            if self._blocked_until <= time.monotonic():
+                return max(0.0, start - prior_mark)
+
+    async def amark(self) -> float:
+        """Async version of [mark][trulens.core.utils.pace.RateLimiter.mark]."""
+
+        while True:
+            start, prior_mark = self._reserve()
+
+            delay = start - time.monotonic()
+            if delay > 0.0:
+                await asyncio.sleep(delay)
+
+            if self._blocked_until <= time.monotonic():
+                return max(0.0, start - prior_mark)
+
+    def _try_enter(self) -> bool:
+        """Take a slot for a request in flight if one is free. Requires
+        `_lock`."""
+
+        if (
+            self.max_concurrency is not None
+            and self._in_flight >= self.max_concurrency
+        ):
+            return False
+
+        self._in_flight += 1
+        return True
+
+    def _leave(self) -> None:
+        """Free the slot of a finished request and wake up waiters."""
+
+        with self._lock:
+            self._in_flight -= 1
+            self._slot_freed.notify_all()
+
+            waiters = self._async_waiters
+            self._async_waiters = []
+
+        for loop, fut in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_future, fut)
+
+    @contextlib.contextmanager
+    def request(self) -> Iterator[None]:
+        """Context for making a request.
+
+        Blocks until the request is allowed by the rates and a slot for it is
+        free. The slot is freed once the context exits.
+        """
+
+        self.mark()
+
+        with self._lock:
+            while not self._try_enter():
+                self._slot_freed.wait()
+
+        try:
+            yield
+
+        finally:
+            self._leave()
+
+    @contextlib.asynccontextmanager
+    async def arequest(self) -> AsyncIterator[None]:
+        """Async version of
+        [request][trulens.core.utils.pace.RateLimiter.request]."""
+
+        await self.amark()
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._lock:
+                if self._try_enter():
+                    break
+
+                fut = loop.create_future()
+                self._async_waiters.append((loop, fut))
+
+            await fut
+
+        try:
+            yield
+
+        finally:
+            self._leave()
+
+    def record_tokens(self, n_tokens: int) -> None:
+        """Count tokens used by a finished request against the tokens per
+        minute."""
+
+        if self.tpm is None or n_tokens <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._token_tat = max(self._token_tat, now) + n_tokens * 60.0 / (
+                self.tpm * self._rate_factor
+            )
+
+    def record_token_total(self, source: Hashable, n_tokens: int) -> None:
+        """Count tokens used by `source` given the total it used so far.
+
+        Only the tokens used since the prior total reported by `source` are
+        counted. This lets multiple users of a shared limiter report running
+        totals like those kept by endpoint callbacks.
+        """
+
+        with self._lock:
+            prior = self._token_totals.get(source, 0)
+            self._token_totals[source] = n_tokens
+
+        self.record_tokens(n_tokens - prior)
+
+    def rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Report a rate limiting response.
+
+        Pauses all requests for `retry_after` seconds (or
+        [DEFAULT_RETRY_AFTER][trulens.core.utils.pace.RateLimiter.DEFAULT_RETRY_AFTER])
+        and halves the rates.
+        """
+
+        if retry_after is None or retry_after <= 0.0:
+            retry_after = self.DEFAULT_RETRY_AFTER
+
+        with self._lock:
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + retry_after
+            )
+            self._rate_factor = max(
+                self.MIN_RATE_FACTOR, self._rate_factor / 2.0
+            )
+
+        logger.warning(
+            "Rate limited. Pausing requests for %s second(s) and reducing rate to %0.0f%%.",
+            retry_after,
+            self._rate_factor * 100.0,
+        )
+
+    def succeeded(self) -> None:
+        """Report a successful request, recovering some of the rates reduced by
+        rate limiting responses."""
+
+        if self._rate_factor >= 1.0:
+            return
+
+        with self._lock:
+            self._rate_factor = min(1.0, self._rate_factor + self.RATE_RECOVERY)
+
+
+def _set_future(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
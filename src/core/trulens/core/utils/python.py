@@ -533,10 +533,11 @@ def _future_target_wrapper(stack, context, func, *args, **kwargs):
     # Keep this for looking up via get_first_local_in_call_stack .
     pre_start_stack = stack  # noqa: F841
 
-    for var, value in context.items():
-        var.set(value)
-
-    return func(*args, **kwargs)
+    # Run in the copied context instead of setting its variables in the
+    # current one. Worker threads of pools are reused and would otherwise leak
+    # context variables, like those tracking instrumented calls, into unrelated
+    # later tasks.
+    return context.run(func, *args, **kwargs)
 
 
 def get_all_local_in_call_stack(
@@ -13,6 +13,7 @@ from ast import parse
 import base64
 from contextvars import ContextVar
 from copy import copy
+import functools
 import logging
 from typing import (
     Any,
@@ -22,7 +23,9 @@ from typing import (
     Generic,
     Hashable,
     Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -962,25 +965,7 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
         spot for it with Munch objects and then set it.
         """
 
-        if len(self.path) == 0:
-            return val
-
-        first = self.path[0]
-        rest = Lens(path=self.path[1:])
-
-        try:
-            firsts = first.get(obj)
-            first_obj, firsts = iterable_peek(firsts)
-
-        except (ValueError, IndexError, KeyError, AttributeError):
-            # `first` points to an element that does not exist, use `set` to create a spot for it.
-            obj = first.set(obj, None)  # will create a spot for `first`
-            firsts = first.get(obj)
-
-        for first_obj in firsts:
-            obj = first.set(obj, rest.set(first_obj, val))
-
-        return obj
+        return self.compile().set(obj, val)
 
     def get_sole_item(self, obj: Any) -> Any:
         all_objects = list(self.get(obj))
@@ -1009,26 +994,20 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
             raise TypeError(error_msg)
 
     def get(self, obj: Any) -> Iterable[Any]:
-        if len(self.path) == 0:
-            yield obj
-            return
+        return self.compile().get(obj)
 
-        # Need to do the recursion by breaking down steps from the end in order
-        # to support `Collect`.
-        last_step = self.path[-1]
-        if len(self.path) == 1:
-            start = Lens(path=())
-        else:
-            start = Lens(path=self.path[0:-1])
+    def compile(self) -> CompiledLens:
+        """Plain python functions getting and setting the values at this path.
 
-        start_items = start.get(obj)
-
-        if isinstance(last_step, Collect):
-            yield list(start_items)
+        Compiled functions are cached by path so lenses evaluated repeatedly,
+        like feedback selectors, are only compiled once.
+        """
 
-        else:
-            for start_selection in start_items:
-                yield from last_step.get(start_selection)
+        try:
+            return _compile_lens(self.path)
+        except TypeError:
+            # Steps of unknown types may not be hashable.
+            return _compile_lens.__wrapped__(self.path)
 
     def _append(self, step: Step) -> Lens:
         return Lens(path=self.path + (step,))
@@ -1073,6 +1052,149 @@ class Lens(pydantic.BaseModel, Sized, Hashable):
         return self._append(GetItemOrAttribute(item_or_attribute=attr))
 
 
+class CompiledLens(NamedTuple):
+    """Functions evaluating a [Lens][trulens.core.utils.serial.Lens]. See
+    [Lens.compile][trulens.core.utils.serial.Lens.compile]."""
+
+    get: Callable[[Any], Iterator[Any]]
+    """Generate the values at the path of the lens in an object."""
+
+    set: Callable[[Any, Any], Any]
+    """Copy of an object with the values at the path of the lens replaced."""
+
+
+LENS_CACHE_SIZE: int = 1024
+"""Number of compiled lenses cached."""
+
+
+def _step_getter(step: Step) -> Callable[[Any], Iterable[Any]]:
+    """Function giving the values selected by `step` in an object, as a tuple
+    when there is exactly one.
+
+    Common cases are handled without creating a generator; others defer to
+    `step.get`, raising the same errors.
+    """
+
+    if isinstance(step, (GetItemOrAttribute, GetItem)):
+        key = step.get_item_or_attribute()
+        attribute = isinstance(step, GetItemOrAttribute)
+
+        def get(obj: Any) -> Iterable[Any]:
+            if type(obj) is dict:
+                if key in obj:
+                    return (obj[key],)
+                raise KeyError(f"Key not in dictionary: {key}")
+
+            if attribute and isinstance(obj, pydantic.BaseModel):
+                if hasattr(obj, key):
+                    return (getattr(obj, key),)
+                raise ValueError(
+                    f"Object {repr(obj)} of type {type(obj)} does not have item or attribute {repr(key)}."
+                )
+
+            return step.get(obj)
+
+        return get
+
+    if isinstance(step, GetIndex):
+        index = step.index
+
+        def get(obj: Any) -> Iterable[Any]:
+            if type(obj) is list or type(obj) is tuple:
+                if len(obj) > index:
+                    return (obj[index],)
+                raise IndexError(f"Index out of bounds: {index}")
+
+            return step.get(obj)
+
+        return get
+
+    if isinstance(step, GetAttribute):
+        name = step.attribute
+
+        def get(obj: Any) -> Iterable[Any]:
+            if hasattr(obj, name):
+                return (getattr(obj, name),)
+            raise ValueError(f"Object {obj} does not have attribute: {name}")
+
+        return get
+
+    return step.get
+
+
+def _walk(
+    getters: Tuple[Callable[[Any], Iterable[Any]], ...], i: int, obj: Any
+) -> Iterator[Any]:
+    """Generate the values selected by `getters[i:]` in `obj`."""
+
+    n = len(getters)
+
+    # Loop while steps select single values; recurse only where they select
+    # several.
+    while i < n:
+        values = getters[i](obj)
+        i += 1
+
+        if type(values) is tuple and len(values) == 1:
+            obj = values[0]
+        else:
+            for value in values:
+                yield from _walk(getters, i, value)
+            return
+
+    yield obj
+
+
+@functools.lru_cache(maxsize=LENS_CACHE_SIZE)
+def _compile_lens(path: Tuple[Step, ...]) -> CompiledLens:
+    """Compile the getter and setter of `path`.
+
+    The getter walks the steps from the first instead of recursing over
+    prefix lenses from the last. Each `Collect` step gathers the values
+    selected by the steps before it into a list.
+    """
+
+    segments: List[List[Callable[[Any], Iterable[Any]]]] = [[]]
+    for step in path:
+        if isinstance(step, Collect):
+            segments.append([])
+        else:
+            segments[-1].append(_step_getter(step))
+
+    first, *collected = [tuple(segment) for segment in segments]
+
+    def get(obj: Any) -> Iterator[Any]:
+        values = _walk(first, 0, obj)
+        for getters in collected:
+            values = _walk(getters, 0, list(values))
+        yield from values
+
+    setters = tuple(_step_getter(step) for step in path)
+
+    def set_(obj: Any, val: Any, i: int = 0) -> Any:
+        if i == len(path):
+            return val
+
+        step = path[i]
+
+        try:
+            firsts = setters[i](obj)
+            _, firsts = iterable_peek(firsts)
+
+        except (ValueError, IndexError, KeyError, AttributeError):
+            # `step` points to an element that does not exist, use `set` to
+            # create a spot for it.
+            obj = step.set(obj, None)
+            firsts = step.get(obj)
+
+        for first_obj in firsts:
+            obj = step.set(obj, set_(first_obj, val, i + 1))
+
+        return obj
+
+    return CompiledLens(get=get, set=lambda obj, val: set_(obj, val))
+
+
 Lens.model_rebuild()
 
 # TODO: Deprecate old name.
@@ -8,11 +8,12 @@ from concurrent import futures
 from concurrent.futures import ThreadPoolExecutor as fThreadPoolExecutor
 from concurrent.futures import TimeoutError
 import contextvars
+from inspect import FrameInfo
 from inspect import stack
 import logging
 import threading
 from threading import Thread as fThread
-from typing import Callable, Optional, TypeVar
+from typing import Callable, List, Optional, TypeVar
 
 from trulens.core.utils.python import Future
 from trulens.core.utils.python import SingletonPerName
@@ -28,6 +29,28 @@ DEFAULT_NETWORK_TIMEOUT: float = 10.0  # seconds
 A = TypeVar("A")
 
 
+def _pre_start_stack() -> List[FrameInfo]:
+    """Stack of the caller for instrumented methods in a thread it starts to
+    find their callers in.
+
+    Only captured if instrumented calls are tracked by walking the stack as it
+    is slow to capture.
+    """
+
+    try:
+        from trulens.core.instruments import CallTrackingMode
+        from trulens.core.instruments import Instrument
+
+    except ImportError:
+        # Threads started while instruments are being imported.
+        return stack()[1:]
+
+    if Instrument.call_tracking_mode == CallTrackingMode.STACK:
+        return stack()[1:]
+
+    return []
+
+
 class Thread(fThread):
     """Thread that wraps target with stack/context tracking.
 
@@ -43,7 +66,7 @@ class Thread(fThread):
         kwargs={},
         daemon=None,
     ):
-        present_stack = stack()
+        present_stack = _pre_start_stack()
         present_context = contextvars.copy_context()
 
         fThread.__init__(
@@ -73,7 +96,7 @@ class ThreadPoolExecutor(fThreadPoolExecutor):
         super().__init__(*args, **kwargs)
 
     def submit(self, fn, /, *args, **kwargs):
-        present_stack = stack()
+        present_stack = _pre_start_stack()
         present_context = contextvars.copy_context()
         return super().submit(
             _future_target_wrapper,
@@ -164,7 +187,11 @@ class TP(SingletonPerName):  # "thread processing"
         if timeout is None:
             timeout = TP.DEBUG_TIMEOUT
 
-        fut: Future[T] = self.thread_pool.submit(func, *args, **kwargs)
+        # The inner pool does not copy context variables on its own. Copy them
+        # so that instrumented calls made by `func` can find their callers.
+        fut: Future[T] = self.thread_pool.submit(
+            contextvars.copy_context().run, func, *args, **kwargs
+        )
 
         try:
             res: T = fut.result(timeout=timeout)
@@ -1,12 +1,11 @@
 import asyncio
-import json
-import math
 
+import pandas as pd
 import streamlit as st
 from streamlit_extras.switch_page_button import switch_page
 from trulens.core import TruSession
-from trulens.core.database.legacy.migration import MIGRATION_UNKNOWN_STR
 from trulens.core.utils.text import format_quantity
+from trulens.dashboard.cache import get_cache
 from trulens.dashboard.streamlit_utils import init_from_args
 from trulens.dashboard.ux import styles
 from trulens.dashboard.ux.components import draw_metadata
@@ -28,15 +27,18 @@ def leaderboard():
 
     session = TruSession()  # get singleton whether this file was imported or executed from command line.
 
-    lms = session.connector.db
+    # Shared by all sessions and reruns, and refreshed with only the changes
+    # to the database.
+    cache = get_cache(session.connector.db)
 
     # Set the title and subtitle of the app
     st.title("App Leaderboard")
     st.write(
         "Average feedback values displayed in the range from 0 (worst) to 1 (best)."
     )
-    df, feedback_col_names = lms.get_records_and_feedback([])
-    feedback_defs = lms.get_feedback_defs()
+    # Aggregated in the database so that only one row per app is read.
+    df, feedback_col_names = cache.get_leaderboard()
+    feedback_defs = cache.get_feedback_defs()
     feedback_directions = {
         (
             row.feedback_json.get("supplied_name", "")
@@ -49,66 +51,50 @@ def leaderboard():
         st.write("No records yet...")
         return
 
-    df = df.sort_values(by="app_id")
+    df = df.sort_index()
 
-    if df.empty:
-        st.write("No records yet...")
-
-    apps = list(df.app_id.unique())
     st.markdown("""---""")
 
-    for app in apps:
-        app_df = df.loc[df.app_id == app]
-        if app_df.empty:
-            continue
-        app_str = app_df["app_json"].iloc[0]
-        app_json = json.loads(app_str)
+    for app, app_row in df.iterrows():
+        app_json = cache.get_app(app) or {}
         metadata = app_json.get("metadata")
         # st.text('Metadata' + str(metadata))
         st.header(app, help=draw_metadata(metadata))
         app_feedback_col_names = [
             col_name
             for col_name in feedback_col_names
-            if not app_df[col_name].isna().all()
+            if not pd.isna(app_row[col_name])
         ]
         col1, col2, col3, col4, *feedback_cols, col99 = st.columns(
             5 + len(app_feedback_col_names)
         )
-        latency_mean = (
-            app_df["latency"]
-            .apply(lambda td: td if td != MIGRATION_UNKNOWN_STR else None)
-            .mean()
-        )
-
-        # app_df_feedback = df.loc[df.app_id == app]
+        latency_mean = app_row["latency"]
 
-        col1.metric("Records", len(app_df))
+        col1.metric("Records", int(app_row["n_records"]))
         col2.metric(
             "Average Latency (Seconds)",
             (
                 f"{format_quantity(round(latency_mean, 5), precision=2)}"
-                if not math.isnan(latency_mean)
+                if not pd.isna(latency_mean)
                 else "nan"
             ),
         )
         col3.metric(
             "Total Cost (USD)",
-            f"${format_quantity(round(sum(cost for cost in app_df.total_cost if cost is not None), 5), precision=2)}",
+            f"${format_quantity(round(app_row['sum_cost'] if not pd.isna(app_row['sum_cost']) else 0.0, 5), precision=2)}",
         )
         col4.metric(
             "Total Tokens",
             format_quantity(
-                sum(
-                    tokens
-                    for tokens in app_df.total_tokens
-                    if tokens is not None
-                ),
+                app_row["sum_tokens"]
+                if not pd.isna(app_row["sum_tokens"])
+                else 0,
                 precision=2,
             ),
         )
 
         for i, col_name in enumerate(app_feedback_col_names):
-            mean = app_df[col_name].mean()
+            mean = app_row[col_name]
 
             st.write(
                 styles.stmetricdelta_hidearrow,
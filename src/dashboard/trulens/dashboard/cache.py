@@ -0,0 +1,444 @@
+"""
+# Dashboard query cache
+
+The dashboard pages are rerun on every widget interaction by every viewer.
+Instead of reading all records from the database on each rerun, pages read
+through a [DashboardCache][trulens.dashboard.cache.DashboardCache] shared by
+all sessions of the dashboard process:
+
+```python
+from trulens.dashboard.cache import get_cache
+
+cache = get_cache(TruSession().connector.db)
+df, feedback_cols = cache.get_records_and_feedback(app_ids=["my_app"])
+```
+
+Records are cached per selection of apps, and only with the columns shown for
+all records. The serialized record, app and feedback calls of a record are read
+when it is selected (see
+[get_record][trulens.dashboard.cache.DashboardCache.get_record]).
+
+The cache reads the
+[high-water mark][trulens.core.database.base.HighWaterMark] of the database at
+most once every `refresh_interval` seconds. If it moved, only the records
+added since, and those whose feedback results were written since, are read
+and merged into the cached records. All records are read again if records
+were deleted and at least every `max_age` seconds.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import dataclasses
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from trulens.core.database.base import DB
+from trulens.core.database.base import HighWaterMark
+from trulens.core.schema import types as mod_types_schema
+from trulens.core.utils.serial import JSON
+
+RECORD_COLUMNS: Tuple[str, ...] = (
+    "app_id",
+    "type",
+    "record_id",
+    "input",
+    "output",
+    "tags",
+    "ts",
+)
+"""Record and app columns of the cached records. Latency, token, cost and
+feedback result columns are always included, as is `record_metadata`."""
+
+RECORD_DETAIL_COLUMNS: Tuple[str, ...] = RECORD_COLUMNS + (
+    "app_json",
+    "record_json",
+    "cost_json",
+    "perf_json",
+)
+"""Record and app columns of a single selected record."""
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters describing the use of a
+    [DashboardCache][trulens.dashboard.cache.DashboardCache]."""
+
+    full_loads: int = 0
+    """Number of times all records were read."""
+
+    incremental_loads: int = 0
+    """Number of times only changed records were read."""
+
+    rows_loaded: int = 0
+    """Number of record rows read."""
+
+    hits: int = 0
+    """Number of results served without reading records."""
+
+
+@dataclasses.dataclass
+class _Records:
+    """Cached records of a selection of apps."""
+
+    df: pd.DataFrame
+    feedback_columns: List[str]
+
+    mark: HighWaterMark
+    """High-water mark the records are up to date with."""
+
+    loaded_at: float
+    """When all of the records were last read."""
+
+
+class DashboardCache:
+    """Query results of a database shared by the sessions of a dashboard.
+
+    Args:
+        db: The database.
+
+        refresh_interval: Minimum seconds between reads of the high-water
+            mark. Results may be out of date by this much.
+
+        overlap: Seconds before the prior high-water mark from which records
+            are read again on refresh, so that records written with earlier
+            timestamps than already read ones (such as by batched ingestion or
+            to lagging read replicas) are not missed.
+
+        max_age: Seconds after which all records are read again.
+
+        max_selections: Number of selections of apps whose records are kept.
+            The least recently used ones are dropped first.
+
+        chunk_size: Number of records read at a time.
+    """
+
+    def __init__(
+        self,
+        db: DB,
+        refresh_interval: float = 2.0,
+        overlap: float = 60.0,
+        max_age: float = 600.0,
+        max_selections: int = 8,
+        chunk_size: int = 1000,
+    ):
+        self.db = db
+        self.refresh_interval = refresh_interval
+        self.overlap = overlap
+        self.max_age = max_age
+        self.max_selections = max_selections
+        self.chunk_size = chunk_size
+
+        self._lock = threading.RLock()
+
+        self._mark: Optional[HighWaterMark] = None
+        self._checked_at: float = -float("inf")
+
+        # Records by the sorted app ids they are of, or None for all apps.
+        self._records: OrderedDict[
+            Optional[Tuple[mod_types_schema.AppID, ...]], _Records
+        ] = OrderedDict()
+
+        # Other results, cleared whenever the high-water mark moves.
+        self._results: Dict[Tuple[Any, ...], Any] = {}
+
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache's counters."""
+
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def get_records_and_feedback(
+        self, app_ids: Optional[List[mod_types_schema.AppID]] = None
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """Records and their feedback results like
+        [get_records_and_feedback][trulens.core.database.base.DB.get_records_and_feedback],
+        with a `record_metadata` column holding the metadata of each record.
+
+        Only the [RECORD_COLUMNS][trulens.dashboard.cache.RECORD_COLUMNS] are
+        included, without the feedback function calls.
+
+        The DataFrame is a copy that can be modified.
+        """
+
+        key = tuple(sorted(app_ids)) if app_ids else None
+
+        with self._lock:
+            mark = self._check_mark()
+
+            records = self._records.get(key)
+            if records is not None and records.mark == mark:
+                self._stats.hits += 1
+            else:
+                records = self._load(key, records, mark)
+
+            self._records.move_to_end(key)
+            while len(self._records) > self.max_selections:
+                self._records.popitem(last=False)
+
+            df = records.df
+
+            # Only the feedback columns with results for these records.
+            feedback_columns = [
+                col
+                for col in records.feedback_columns
+                if len(df) > 0 and df[col].notna().any()
+            ]
+            unused = [
+                col
+                for col in records.feedback_columns
+                if col not in feedback_columns and col in df.columns
+            ]
+
+            return (
+                df.drop(columns=unused).reset_index(drop=True),
+                feedback_columns,
+            )
+
+    def get_record(self, record_id: mod_types_schema.RecordID) -> pd.Series:
+        """The given record with its serialized record and app, and feedback
+        function calls in `<feedback name>_calls` columns, which are not
+        cached for all records.
+
+        Raises:
+            KeyError: If there is no such record.
+        """
+
+        def read() -> pd.DataFrame:
+            for df, _ in self.db.iter_records_and_feedback(
+                columns=RECORD_DETAIL_COLUMNS,
+                feedback_calls=True,
+                record_ids=[record_id],
+            ):
+                return df
+
+            raise KeyError(record_id)
+
+        return self._cached(("record", record_id), read).iloc[0]
+
+    def get_feedback_defs(self) -> pd.DataFrame:
+        """Feedback definitions, see
+        [get_feedback_defs][trulens.core.database.base.DB.get_feedback_defs]."""
+
+        return self._cached(("feedback_defs",), self.db.get_feedback_defs)
+
+    def get_apps(self) -> List[JSON]:
+        """App definitions, see
+        [get_apps][trulens.core.database.base.DB.get_apps]."""
+
+        return self._cached(("apps",), lambda: list(self.db.get_apps()))
+
+    def get_app(self, app_id: mod_types_schema.AppID) -> Optional[JSON]:
+        """App definition of the given app if it exists."""
+
+        for app in self.get_apps():
+            if app["app_id"] == app_id:
+                return app
+
+        return None
+
+    def get_leaderboard(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        group_by_metadata_key: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Sequence[str]]:
+        """Leaderboard, see
+        [get_leaderboard][trulens.core.database.base.DB.get_leaderboard]."""
+
+        return self._cached(
+            (
+                "leaderboard",
+                tuple(app_ids) if app_ids else None,
+                group_by_metadata_key,
+            ),
+            lambda: self.db.get_leaderboard(
+                app_ids=app_ids, group_by_metadata_key=group_by_metadata_key
+            ),
+        )
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+
+        with self._lock:
+            self._mark = None
+            self._checked_at = -float("inf")
+            self._records.clear()
+            self._results.clear()
+
+    def _cached(self, key: Tuple[Any, ...], read: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._check_mark()
+
+            if key in self._results:
+                self._stats.hits += 1
+            else:
+                self._results[key] = read()
+
+            result = self._results[key]
+
+        if isinstance(result, pd.DataFrame):
+            return result.copy()
+        if isinstance(result, tuple):
+            return tuple(
+                r.copy() if isinstance(r, pd.DataFrame) else r for r in result
+            )
+        return list(result)
+
+    def _check_mark(self) -> HighWaterMark:
+        """Read the high-water mark if it was not read in the last
+        `refresh_interval` seconds and drop the other results if it moved.
+        Requires `_lock`."""
+
+        now = time.monotonic()
+
+        if (
+            self._mark is not None
+            and now - self._checked_at < self.refresh_interval
+        ):
+            return self._mark
+
+        # Read before any records so that records written meanwhile are read
+        # again on the next refresh.
+        mark = self.db.get_high_water_mark()
+        self._checked_at = now
+
+        if mark != self._mark:
+            self._results.clear()
+            self._mark = mark
+
+        return mark
+
+    def _load(
+        self,
+        key: Optional[Tuple[mod_types_schema.AppID, ...]],
+        records: Optional[_Records],
+        mark: HighWaterMark,
+    ) -> _Records:
+        """Bring the records of the given apps up to date with `mark`.
+        Requires `_lock`."""
+
+        now = time.monotonic()
+        app_ids = None if key is None else list(key)
+
+        prior = None if records is None else records.mark
+        if (
+            records is None
+            or now - records.loaded_at >= self.max_age
+            or mark.first_record_ts != prior.first_record_ts
+            or mark.n_records < prior.n_records
+            or mark.n_feedback_results < prior.n_feedback_results
+        ):
+            # Records were deleted or the cache is too old to update.
+            df, feedback_columns = self._read(app_ids=app_ids)
+            records = self._records[key] = _Records(
+                df=df,
+                feedback_columns=feedback_columns,
+                mark=mark,
+                loaded_at=now,
+            )
+            self._stats.full_loads += 1
+
+        else:
+            since = dataclasses.replace(
+                prior,
+                last_record_ts=_minus(prior.last_record_ts, self.overlap),
+                last_feedback_ts=_minus(prior.last_feedback_ts, self.overlap),
+            )
+            df, feedback_columns = self._read(app_ids=app_ids, since=since)
+            _merge(records, df, feedback_columns)
+            records.mark = mark
+            self._stats.incremental_loads += 1
+
+        self._stats.rows_loaded += len(df)
+
+        return records
+
+    def _read(
+        self,
+        app_ids: Optional[List[mod_types_schema.AppID]] = None,
+        since: Optional[HighWaterMark] = None,
+    ) -> Tuple[pd.DataFrame, List[str]]:
+        """Read the records of the given apps in chunks, keeping only the
+        metadata of each serialized record."""
+
+        chunks = []
+        feedback_columns = []
+
+        for df, chunk_feedback_columns in self.db.iter_records_and_feedback(
+            app_ids=app_ids,
+            columns=RECORD_COLUMNS + ("record_json",),
+            chunk_size=self.chunk_size,
+            since=since,
+        ):
+            chunks.append(_with_record_metadata(df))
+            feedback_columns.extend(
+                col
+                for col in chunk_feedback_columns
+                if col not in feedback_columns
+            )
+
+        if len(chunks) == 0:
+            return pd.DataFrame(
+                [], columns=list(RECORD_COLUMNS) + ["record_metadata"]
+            ), []
+
+        return pd.concat(chunks, ignore_index=True), feedback_columns
+
+
+def _merge(
+    records: _Records, df: pd.DataFrame, feedback_columns: Sequence[str]
+) -> None:
+    """Replace the cached rows of the records in `df` and add the others."""
+
+    if len(df) == 0:
+        return
+
+    kept = records.df[~records.df["record_id"].isin(df["record_id"])]
+
+    records.df = (
+        pd.concat([kept, df], ignore_index=True)
+        .sort_values(["ts", "record_id"], kind="stable")
+        .reset_index(drop=True)
+    )
+    records.feedback_columns.extend(
+        col for col in feedback_columns if col not in records.feedback_columns
+    )
+
+
+def _minus(ts: Optional[float], seconds: float) -> Optional[float]:
+    return None if ts is None else ts - seconds
+
+
+def _with_record_metadata(df: pd.DataFrame) -> pd.DataFrame:
+    """Replace the serialized records by their metadata as a string so that
+    pages do not parse the records on each rerun."""
+
+    df["record_metadata"] = [
+        str(json.loads(record_json)["meta"])
+        for record_json in df["record_json"]
+    ]
+
+    return df.drop(columns=["record_json"])
+
+
+_caches: Dict[int, Tuple[DB, DashboardCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(db: DB) -> DashboardCache:
+    """Cache of the given database shared by all dashboard sessions in this
+    process."""
+
+    with _caches_lock:
+        entry = _caches.get(id(db))
+
+        if entry is None or entry[0] is not db:
+            entry = _caches[id(db)] = (db, DashboardCache(db))
+
+        return entry[1]
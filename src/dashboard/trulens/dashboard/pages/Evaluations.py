@@ -23,6 +23,7 @@ from trulens.core.database.base import MULTI_CALL_NAME_DELIMITER
 from trulens.core.schema.select import Select
 from trulens.core.utils.json import jsonify_for_ui
 from trulens.core.utils.serial import Lens
+from trulens.dashboard.cache import get_cache
 from trulens.dashboard.components.record_viewer import record_viewer
 from trulens.dashboard.streamlit_utils import init_from_args
 from trulens.dashboard.ux.components import draw_agent_info
@@ -45,7 +46,9 @@ if __name__ == "__main__":
     init_from_args()
 
 session = TruSession()
-lms = session.connector.db
+# Shared by all sessions and reruns, and refreshed with only the changes to the
+# database.
+cache = get_cache(session.connector.db)
 
 # TODO: remove code redundancy / redundant database calls
 feedback_directions = {
@@ -57,7 +60,7 @@ feedback_directions = {
         if row.feedback_json.get("higher_is_better", True)
         else "LOWER_IS_BETTER"
     )
-    for _, row in lms.get_feedback_defs().iterrows()
+    for _, row in cache.get_feedback_defs().iterrows()
 }
 default_direction = "HIGHER_IS_BETTER"
 
@@ -136,20 +139,7 @@ def render_record_metrics(
     )
 
 
-def extract_metadata(row: pd.Series) -> str:
-    """Extract metadata from the record_json and return the metadata as a string.
-
-    Args:
-        row: The row containing the record_json.
-
-    Returns:
-        str: The metadata extracted from the record_json.
-    """
-    record_data = json.loads(row["record_json"])
-    return str(record_data["meta"])
-
-
-apps = list(app["app_id"] for app in lms.get_apps())
+apps = list(app["app_id"] for app in cache.get_apps())
 
 if "app" in st.session_state:
     app = st.session_state.app
@@ -160,7 +150,8 @@ st.query_params["app"] = app
 
 options = st.multiselect("Filter Applications", apps, default=app)
 
-df_results, feedback_cols = lms.get_records_and_feedback(app_ids=options)
+# Includes the `record_metadata` column.
+df_results, feedback_cols = cache.get_records_and_feedback(app_ids=options)
 
 if len(options) == 0:
     st.header("All Applications")
@@ -196,11 +187,6 @@ else:
         evaluations_df["input"] = decoded_input
         evaluations_df["output"] = decoded_output
 
-        # Apply the function to each row and create a new column 'record_metadata'
-        evaluations_df["record_metadata"] = evaluations_df.apply(
-            extract_metadata, axis=1
-        )
-
         gb = GridOptionsBuilder.from_dataframe(evaluations_df)
 
         gb.configure_column("type", header_name="App Type")
@@ -241,7 +227,9 @@ else:
             "perf_json",
         ]
 
-        for feedback_col in evaluations_df.columns.drop(non_feedback_cols):
+        for feedback_col in evaluations_df.columns.drop(
+            non_feedback_cols, errors="ignore"
+        ):
             if "distance" in feedback_col:
                 gb.configure_column(
                     feedback_col, hide=feedback_col.endswith("_calls")
@@ -294,17 +282,17 @@ else:
 
             prompt = selected_rows["input"][0]
             response = selected_rows["output"][0]
-            details = selected_rows["app_json"][0]
-            record_str = selected_rows["record_json"][0]
-            record_json = json.loads(record_str)
             record_metadata = selected_rows["record_metadata"][0]
 
+            # The serialized record and app, and the feedback calls, are not
+            # cached for all records.
+            row = cache.get_record(selected_rows["record_id"][0])
+
+            record_json = json.loads(row["record_json"])
             app_json = json.loads(
-                details
+                row["app_json"]
             )  # apps may not be deserializable, don't try to, keep it json.
 
-            row = selected_rows.head().iloc[0]
-
             st.markdown("#### Feedback results")
             if len(feedback_cols) == 0:
                 st.write("No feedback details")
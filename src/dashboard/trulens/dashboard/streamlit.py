@@ -12,6 +12,7 @@ from trulens.core.schema.feedback import FeedbackCall
 from trulens.core.schema.record import Record
 from trulens.core.utils.json import json_str_of_obj
 from trulens.core.utils.text import format_quantity
+from trulens.dashboard.cache import get_cache
 from trulens.dashboard.components.record_viewer import record_viewer
 from trulens.dashboard.display import get_feedback_result
 from trulens.dashboard.display import get_icon
@@ -47,9 +48,9 @@ def trulens_leaderboard(app_ids: List[str] = None):
     """
     session = TruSession()
 
-    lms = session.connector.db
-    df, feedback_col_names = lms.get_records_and_feedback(app_ids=app_ids)
-    feedback_defs = lms.get_feedback_defs()
+    cache = get_cache(session.connector.db)
+    df, feedback_col_names = cache.get_records_and_feedback(app_ids=app_ids)
+    feedback_defs = cache.get_feedback_defs()
     feedback_directions = {
         (
             row.feedback_json.get("supplied_name", "")
@@ -74,8 +75,7 @@ def trulens_leaderboard(app_ids: List[str] = None):
         app_df = df.loc[df.app_id == app_id]
         if app_df.empty:
             continue
-        app_str = app_df["app_json"].iloc[0]
-        app_json = json.loads(app_str)
+        app_json = cache.get_app(app_id) or {}
         metadata = app_json.get("metadata")
         st.header(app_id, help=draw_metadata(metadata))
         app_feedback_col_names = [
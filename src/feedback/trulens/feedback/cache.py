@@ -0,0 +1,346 @@
+"""
+# LLM response caches
+
+Caches of chat completion responses used by
+[LLMProvider][trulens.feedback.llm_provider.LLMProvider] so that repeated
+evaluations of the same prompts do not make the same requests again. Caching is
+opt-in, either per provider:
+
+```python
+from trulens.feedback.cache import SQLiteResponseCache
+
+provider.cache = SQLiteResponseCache("judge_cache.sqlite")
+```
+
+or for all providers in the process using
+[set_default_cache][trulens.feedback.cache.set_default_cache]. Setting the
+`TRULENS_LLM_CACHE` environment variable to a file path enables a
+[SQLiteResponseCache][trulens.feedback.cache.SQLiteResponseCache] at that path
+as the default, including in deferred evaluator worker processes.
+
+Responses are keyed by the provider class, model, messages and completion
+arguments. See [ResponseCache.key][trulens.feedback.cache.ResponseCache.key].
+"""
+
+from __future__ import annotations
+
+import abc
+from collections import OrderedDict
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = "TRULENS_LLM_CACHE"
+"""Environment variable with the path of the default on-disk cache."""
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters describing the use of a
+    [ResponseCache][trulens.feedback.cache.ResponseCache]."""
+
+    hits: int = 0
+    """Number of lookups answered from the cache."""
+
+    misses: int = 0
+    """Number of lookups not found in the cache, or found expired."""
+
+    evictions: int = 0
+    """Number of entries removed due to expiring or exceeding the size of
+    the cache."""
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Fraction of lookups answered from the cache."""
+
+        if self.hits + self.misses == 0:
+            return None
+
+        return self.hits / (self.hits + self.misses)
+
+
+class ResponseCache(abc.ABC):
+    """Cache of LLM responses.
+
+    Args:
+        ttl: Seconds after which entries expire. Entries do not expire if not
+            given.
+
+        max_entries: Maximum number of entries kept. Least recently used
+            entries are evicted first. Not limited if not given.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = None, max_entries: Optional[int] = None
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("`max_entries` must be positive.")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache's counters."""
+
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    @staticmethod
+    def key(**parts: Any) -> str:
+        """Content address of a request made of the given parts.
+
+        Parts are serialized to JSON with sorted keys so that equal requests
+        produce equal keys regardless of argument order.
+        """
+
+        content = json.dumps(parts, sort_keys=True, default=str)
+
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the response cached under `key` if any."""
+
+        value = self._get(key)
+
+        with self._lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Cache `value` under `key`."""
+
+        self._put(key, value)
+
+    def _evicted(self, n: int = 1) -> None:
+        with self._lock:
+            self._stats.evictions += n
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and created + self.ttl < time.time()
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[str]:
+        """Get the unexpired value under `key`, evicting it if expired."""
+
+    @abc.abstractmethod
+    def _put(self, key: str, value: str) -> None:
+        """Store `value` under `key`, evicting entries if the cache is full."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Number of entries, including expired ones not yet evicted."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-memory LRU cache of LLM responses."""
+
+    def __init__(
+        self, ttl: Optional[float] = None, max_entries: Optional[int] = 10000
+    ):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            created, value = entry
+
+            if self._expired(created):
+                del self._entries[key]
+                self._stats.evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def _put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+
+            while (
+                self.max_entries is not None
+                and len(self._entries) > self.max_entries
+            ):
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """On-disk cache of LLM responses in a SQLite database.
+
+    The database can be shared by multiple processes.
+
+    Args:
+        path: Path of the database file. Created if it does not exist.
+
+        ttl: Seconds after which entries expire.
+
+        max_entries: Maximum number of entries kept.
+    """
+
+    TABLE: str = "trulens_llm_responses"
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        super().__init__(ttl=ttl, max_entries=max_entries)
+
+        self.path = Path(path)
+
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False
+        )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "created REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_last_used_idx "
+                f"ON {self.TABLE} (last_used)"
+            )
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, created FROM {self.TABLE} WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, created = row
+
+            if self._expired(created):
+                self._conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE key = ?", (key,)
+                )
+                self._stats.evictions += 1
+                return None
+
+            self._conn.execute(
+                f"UPDATE {self.TABLE} SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+            return value
+
+    def _put(self, key: str, value: str) -> None:
+        now = time.time()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE} "
+                "(key, value, created, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+
+            evicted = 0
+
+            if self.ttl is not None:
+                evicted += self._conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE created < ?",
+                    (now - self.ttl,),
+                ).rowcount
+
+            if self.max_entries is not None:
+                evicted += self._conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE key IN ("
+                    f"SELECT key FROM {self.TABLE} "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+
+            self._stats.evictions += evicted
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM {self.TABLE}"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        self._conn.close()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def set_default_cache(cache: Optional[ResponseCache]) -> None:
+    """Set the cache used by providers without their own cache. Pass None to
+    disable the default cache."""
+
+    global _default_cache
+
+    with _default_cache_lock:
+        _default_cache = cache
+
+
+def default_cache() -> Optional[ResponseCache]:
+    """The cache used by providers without their own cache.
+
+    Unless set with
+    [set_default_cache][trulens.feedback.cache.set_default_cache], this is a
+    [SQLiteResponseCache][trulens.feedback.cache.SQLiteResponseCache] at the
+    path given by the `TRULENS_LLM_CACHE` environment variable, if set.
+    """
+
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None and os.environ.get(CACHE_ENV_VAR):
+            path = os.environ[CACHE_ENV_VAR]
+            logger.info("Caching LLM responses in %s.", path)
+            _default_cache = SQLiteResponseCache(path)
+
+        return _default_cache
@@ -392,6 +392,7 @@ class DummyEndpoint(Endpoint):
         # Instrument existing DummyAPI class. These are used by the custom_app
         # example.
         self._instrument_class(DummyAPI, "completion")
+        self._instrument_class(DummyAPI, "acompletion")
         self._instrument_class(DummyAPI, "classify")
 
         # Also instrument any dynamically created DummyAPI methods like we do
@@ -401,7 +402,7 @@ class DummyEndpoint(Endpoint):
                 DummyAPICreator,
                 wrapper_method_name="create_method",
                 wrapped_method_filter=lambda f: f.__name__
-                in ["completion", "classify"],
+                in ["completion", "acompletion", "classify"],
             )
 
     def post(
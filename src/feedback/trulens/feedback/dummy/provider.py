@@ -54,3 +54,25 @@ class DummyProvider(LLMProvider):
         return self.endpoint.api.completion(
             model=self.model_engine, prompt=prompt, **kwargs
         )["completion"]
+
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Fake async chat completion.
+
+        Returns:
+            Completion model response.
+        """
+
+        if prompt is None:
+            prompt = json.dumps(messages)
+
+        return (
+            await self.endpoint.api.acompletion(
+                model=self.model_engine, prompt=prompt, **kwargs
+            )
+        )["completion"]
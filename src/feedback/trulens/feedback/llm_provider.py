@@ -1,3 +1,4 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import as_completed
 import logging
@@ -8,7 +9,9 @@ import warnings
 import nltk
 from nltk.tokenize import sent_tokenize
 import numpy as np
+from pydantic import Field
 from trulens.core.feedback.provider import Provider
+from trulens.feedback import cache as mod_cache
 from trulens.feedback import prompts
 from trulens.feedback.generated import re_configured_rating
 from trulens.feedback.v2.feedback import ContextRelevance
@@ -40,6 +43,13 @@ class LLMProvider(Provider):
     # warnings if we try to override some internal pydantic name.
     model_engine: str
 
+    cache: Optional[mod_cache.ResponseCache] = Field(None, exclude=True)
+    """Cache of chat completion responses.
+
+    Uses the [default cache][trulens.feedback.cache.default_cache], if any,
+    when not set. See [trulens.feedback.cache][trulens.feedback.cache].
+    """
+
     model_config: ClassVar[dict] = dict(protected_namespaces=())
 
     def __init__(self, *args, **kwargs):
@@ -66,6 +76,104 @@ class LLMProvider(Provider):
         # text
         raise NotImplementedError()
 
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        Async Chat Completion Model
+
+        Providers with async clients should override this. By default, runs
+        [_create_chat_completion][trulens.feedback.llm_provider.LLMProvider._create_chat_completion]
+        in a thread.
+
+        Returns:
+            str: Completion model response.
+        """
+
+        return await asyncio.to_thread(
+            self._create_chat_completion,
+            prompt=prompt,
+            messages=messages,
+            **kwargs,
+        )
+
+    def _response_cache(self) -> Optional[mod_cache.ResponseCache]:
+        if self.cache is not None:
+            return self.cache
+
+        return mod_cache.default_cache()
+
+    def _completion_key(self, **kwargs) -> str:
+        return mod_cache.ResponseCache.key(
+            provider=f"{type(self).__module__}.{type(self).__qualname__}",
+            model_engine=self.model_engine,
+            request=kwargs,
+        )
+
+    def _chat_completion(self, **kwargs) -> str:
+        """Run
+        [_create_chat_completion][trulens.feedback.llm_provider.LLMProvider._create_chat_completion]
+        with the given arguments at the pace of the endpoint, answering from
+        the [cache][trulens.feedback.llm_provider.LLMProvider.cache] if
+        possible.
+
+        Cached answers are counted as cached requests at no cost.
+        """
+
+        cache = self._response_cache()
+
+        if cache is None:
+            return self.endpoint.run_in_pace(
+                func=self._create_chat_completion, **kwargs
+            )
+
+        key = self._completion_key(**kwargs)
+
+        response = cache.get(key)
+        if response is not None:
+            self.endpoint.handle_cached_request()
+            return response
+
+        response = self.endpoint.run_in_pace(
+            func=self._create_chat_completion, **kwargs
+        )
+        # Only text is cached. Completions without one are asked again.
+        if isinstance(response, str):
+            cache.put(key, response)
+
+        return response
+
+    async def _achat_completion(self, **kwargs) -> str:
+        """Async version of
+        [_chat_completion][trulens.feedback.llm_provider.LLMProvider._chat_completion].
+        """
+
+        cache = self._response_cache()
+
+        if cache is None:
+            return await self.endpoint.arun_in_pace(
+                self._acreate_chat_completion, **kwargs
+            )
+
+        key = self._completion_key(**kwargs)
+
+        response = await asyncio.to_thread(cache.get, key)
+        if response is not None:
+            self.endpoint.handle_cached_request()
+            return response
+
+        response = await self.endpoint.arun_in_pace(
+            self._acreate_chat_completion, **kwargs
+        )
+        # Only text is cached. Completions without one are asked again.
+        if isinstance(response, str):
+            await asyncio.to_thread(cache.put, key, response)
+
+        return response
+
     def generate_score(
         self,
         system_prompt: str,
@@ -97,15 +205,59 @@ class LLMProvider(Provider):
             max_score_val > min_score_val
         ), "Max score must be greater than min score."
 
+        response = self._chat_completion(
+            messages=self._score_messages(system_prompt, user_prompt),
+            temperature=temperature,
+        )
+
+        return self._parse_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    async def agenerate_score(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        min_score_val: int = 0,
+        max_score_val: int = 10,
+        temperature: float = 0.0,
+    ) -> float:
+        """
+        Async version of
+        [generate_score][trulens.feedback.llm_provider.LLMProvider.generate_score].
+        """
+
+        assert self.endpoint is not None, "Endpoint is not set."
+        assert (
+            max_score_val > min_score_val
+        ), "Max score must be greater than min score."
+
+        response = await self._achat_completion(
+            messages=self._score_messages(system_prompt, user_prompt),
+            temperature=temperature,
+        )
+
+        return self._parse_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    @staticmethod
+    def _score_messages(
+        system_prompt: str, user_prompt: Optional[str] = None
+    ) -> List[Dict]:
+        """Chat messages for the score generation methods."""
+
         llm_messages = [{"role": "system", "content": system_prompt}]
         if user_prompt is not None:
             llm_messages.append({"role": "user", "content": user_prompt})
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
-            messages=llm_messages,
-            temperature=temperature,
-        )
+        return llm_messages
+
+    @staticmethod
+    def _parse_score(
+        response: str, min_score_val: int, max_score_val: int
+    ) -> float:
+        """Parse the score in `response` normalized to 0 to 1."""
 
         return (
             re_configured_rating(
@@ -146,15 +298,49 @@ class LLMProvider(Provider):
             max_score_val > min_score_val
         ), "Max score must be greater than min score."
 
-        llm_messages = [{"role": "system", "content": verb_confidence_prompt}]
-        if user_prompt is not None:
-            llm_messages.append({"role": "user", "content": user_prompt})
+        response = self._chat_completion(
+            messages=self._score_messages(verb_confidence_prompt, user_prompt),
+            temperature=temperature,
+        )
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
-            messages=llm_messages,
+        return self._parse_confidence_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    async def agenerate_confidence_score(
+        self,
+        verb_confidence_prompt: str,
+        user_prompt: Optional[str] = None,
+        min_score_val: int = 0,
+        max_score_val: int = 10,
+        temperature: float = 0.0,
+    ) -> Tuple[float, Dict[str, float]]:
+        """
+        Async version of
+        [generate_confidence_score][trulens.feedback.llm_provider.LLMProvider.generate_confidence_score].
+        """
+
+        assert self.endpoint is not None, "Endpoint is not set."
+        assert (
+            max_score_val > min_score_val
+        ), "Max score must be greater than min score."
+
+        response = await self._achat_completion(
+            messages=self._score_messages(verb_confidence_prompt, user_prompt),
             temperature=temperature,
         )
+
+        return self._parse_confidence_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    @staticmethod
+    def _parse_confidence_score(
+        response: str, min_score_val: int, max_score_val: int
+    ) -> Tuple[float, Dict[str, float]]:
+        """Parse the score in `response` normalized to 0 to 1 and the
+        confidence in it."""
+
         relevance_score = re.search(r"\d+", response)
 
         confidence_score = re.search(
@@ -211,14 +397,49 @@ class LLMProvider(Provider):
             max_score_val > min_score_val
         ), "Max score must be greater than min score."
 
-        llm_messages = [{"role": "system", "content": system_prompt}]
-        if user_prompt is not None:
-            llm_messages.append({"role": "user", "content": user_prompt})
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
-            messages=llm_messages,
+        response = self._chat_completion(
+            messages=self._score_messages(system_prompt, user_prompt),
+            temperature=temperature,
+        )
+
+        return self._parse_score_and_reasons(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    async def agenerate_score_and_reasons(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        min_score_val: int = 0,
+        max_score_val: int = 10,
+        temperature: float = 0.0,
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [generate_score_and_reasons][trulens.feedback.llm_provider.LLMProvider.generate_score_and_reasons].
+        """
+
+        assert self.endpoint is not None, "Endpoint is not set."
+        assert (
+            max_score_val > min_score_val
+        ), "Max score must be greater than min score."
+
+        response = await self._achat_completion(
+            messages=self._score_messages(system_prompt, user_prompt),
             temperature=temperature,
         )
+
+        return self._parse_score_and_reasons(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    @staticmethod
+    def _parse_score_and_reasons(
+        response: str, min_score_val: int, max_score_val: int
+    ) -> Tuple[float, Dict]:
+        """Parse the score in `response` normalized to 0 to 1 and the reasons
+        for it if given."""
+
         if "Supporting Evidence" in response:
             score = -1
             supporting_evidence = None
@@ -345,6 +566,63 @@ class LLMProvider(Provider):
         Returns:
             float: A value between 0.0 (not relevant) and 1.0 (relevant).
         """
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question, context, criteria, min_score_val, max_score_val
+        )
+
+        return self.generate_score(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            min_score_val=min_score_val,
+            max_score_val=max_score_val,
+            temperature=temperature,
+        )
+
+    async def acontext_relevance(
+        self,
+        question: str,
+        context: str,
+        criteria: str = "",
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> float:
+        """
+        Async version of
+        [context_relevance][trulens.feedback.llm_provider.LLMProvider.context_relevance].
+        """
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question, context, criteria, min_score_val, max_score_val
+        )
+
+        return await self.agenerate_score(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            min_score_val=min_score_val,
+            max_score_val=max_score_val,
+            temperature=temperature,
+        )
+
+    def _context_relevance_prompts(
+        self,
+        question: str,
+        context: str,
+        criteria: str,
+        min_score_val: int,
+        max_score_val: int,
+        cot_reasons: bool = False,
+    ) -> Tuple[str, str]:
+        """System and user prompts of the context relevance feedback
+        functions."""
+
+        user_prompt = str.format(
+            prompts.CONTEXT_RELEVANCE_USER, question=question, context=context
+        )
+        if cot_reasons:
+            user_prompt = user_prompt.replace(
+                "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+            )
+
         output_space = self._determine_output_space(
             min_score_val, max_score_val
         )
@@ -354,17 +632,7 @@ class LLMProvider(Provider):
                 criteria, output_space
             )
 
-        return self.generate_score(
-            system_prompt=ContextRelevance.system_prompt,
-            user_prompt=str.format(
-                prompts.CONTEXT_RELEVANCE_USER,
-                question=question,
-                context=context,
-            ),
-            min_score_val=min_score_val,
-            max_score_val=max_score_val,
-            temperature=temperature,
-        )
+        return ContextRelevance.system_prompt, user_prompt
 
     def context_relevance_with_cot_reasons(
         self,
@@ -404,25 +672,47 @@ class LLMProvider(Provider):
         Returns:
             float: A value between 0 and 1. 0 being "not relevant" and 1 being "relevant".
         """
-
-        user_prompt = str.format(
-            prompts.CONTEXT_RELEVANCE_USER, question=question, context=context
-        )
-        user_prompt = user_prompt.replace(
-            "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question,
+            context,
+            criteria,
+            min_score_val,
+            max_score_val,
+            cot_reasons=True,
         )
 
-        output_space = self._determine_output_space(
-            min_score_val, max_score_val
+        return self.generate_score_and_reasons(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            min_score_val=min_score_val,
+            max_score_val=max_score_val,
+            temperature=temperature,
         )
 
-        if criteria and output_space:
-            ContextRelevance.override_critera_and_output_space(
-                criteria, output_space
-            )
+    async def acontext_relevance_with_cot_reasons(
+        self,
+        question: str,
+        context: str,
+        criteria: str = "",
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [context_relevance_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.context_relevance_with_cot_reasons].
+        """
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question,
+            context,
+            criteria,
+            min_score_val,
+            max_score_val,
+            cot_reasons=True,
+        )
 
-        return self.generate_score_and_reasons(
-            system_prompt=ContextRelevance.system_prompt,
+        return await self.agenerate_score_and_reasons(
+            system_prompt=system_prompt,
             user_prompt=user_prompt,
             min_score_val=min_score_val,
             max_score_val=max_score_val,
@@ -467,25 +757,45 @@ class LLMProvider(Provider):
             float: A value between 0 and 1. 0 being "not relevant" and 1 being "relevant".
             Dict[str, float]: A dictionary containing the confidence score.
         """
-
-        output_space = self._determine_output_space(
-            min_score_val, max_score_val
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question, context, criteria, min_score_val, max_score_val
         )
 
-        if criteria and output_space:
-            ContextRelevance.override_critera_and_output_space(
-                criteria, output_space
+        try:
+            return self.generate_confidence_score(
+                verb_confidence_prompt=system_prompt
+                + ContextRelevance.verb_confidence_prompt,
+                user_prompt=user_prompt,
+                min_score_val=min_score_val,
+                max_score_val=max_score_val,
+                temperature=temperature,
             )
+        except ValueError as e:
+            logger.error(e)
+            return None, None
+
+    async def acontext_relevance_verb_confidence(
+        self,
+        question: str,
+        context: str,
+        criteria: str = "",
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> Tuple[float, Dict[str, float]]:
+        """
+        Async version of
+        [context_relevance_verb_confidence][trulens.feedback.llm_provider.LLMProvider.context_relevance_verb_confidence].
+        """
+        system_prompt, user_prompt = self._context_relevance_prompts(
+            question, context, criteria, min_score_val, max_score_val
+        )
 
         try:
-            return self.generate_confidence_score(
-                verb_confidence_prompt=ContextRelevance.system_prompt
+            return await self.agenerate_confidence_score(
+                verb_confidence_prompt=system_prompt
                 + ContextRelevance.verb_confidence_prompt,
-                user_prompt=str.format(
-                    prompts.CONTEXT_RELEVANCE_USER,
-                    question=question,
-                    context=context,
-                ),
+                user_prompt=user_prompt,
                 min_score_val=min_score_val,
                 max_score_val=max_score_val,
                 temperature=temperature,
@@ -521,13 +831,33 @@ class LLMProvider(Provider):
             float: A value between 0 and 1. 0 being "not relevant" and 1 being
                 "relevant".
         """
-        return self.generate_score(
-            system_prompt=prompts.ANSWER_RELEVANCE_SYSTEM,
-            user_prompt=str.format(
-                prompts.ANSWER_RELEVANCE_USER, prompt=prompt, response=response
-            ),
+        return self.generate_score(*self._relevance_prompts(prompt, response))
+
+    async def arelevance(self, prompt: str, response: str) -> float:
+        """
+        Async version of
+        [relevance][trulens.feedback.llm_provider.LLMProvider.relevance].
+        """
+        return await self.agenerate_score(
+            *self._relevance_prompts(prompt, response)
         )
 
+    @staticmethod
+    def _relevance_prompts(
+        prompt: str, response: str, cot_reasons: bool = False
+    ) -> Tuple[str, str]:
+        """System and user prompts of the relevance feedback functions."""
+
+        user_prompt = str.format(
+            prompts.ANSWER_RELEVANCE_USER, prompt=prompt, response=response
+        )
+        if cot_reasons:
+            user_prompt = user_prompt.replace(
+                "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+            )
+
+        return prompts.ANSWER_RELEVANCE_SYSTEM, user_prompt
+
     def relevance_with_cot_reasons(
         self, prompt: str, response: str
     ) -> Tuple[float, Dict]:
@@ -553,15 +883,20 @@ class LLMProvider(Provider):
             float: A value between 0 and 1. 0 being "not relevant" and 1 being
                 "relevant".
         """
-        system_prompt = prompts.ANSWER_RELEVANCE_SYSTEM
-
-        user_prompt = str.format(
-            prompts.ANSWER_RELEVANCE_USER, prompt=prompt, response=response
+        return self.generate_score_and_reasons(
+            *self._relevance_prompts(prompt, response, cot_reasons=True)
         )
-        user_prompt = user_prompt.replace(
-            "RELEVANCE:", prompts.COT_REASONS_TEMPLATE
+
+    async def arelevance_with_cot_reasons(
+        self, prompt: str, response: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [relevance_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.relevance_with_cot_reasons].
+        """
+        return await self.agenerate_score_and_reasons(
+            *self._relevance_prompts(prompt, response, cot_reasons=True)
         )
-        return self.generate_score_and_reasons(system_prompt, user_prompt)
 
     def sentiment(self, text: str) -> float:
         """
@@ -581,9 +916,26 @@ class LLMProvider(Provider):
             A value between 0 and 1. 0 being "negative sentiment" and 1
                 being "positive sentiment".
         """
-        system_prompt = prompts.SENTIMENT_SYSTEM
+        return self.generate_score(*self._sentiment_prompts(text))
+
+    async def asentiment(self, text: str) -> float:
+        """
+        Async version of
+        [sentiment][trulens.feedback.llm_provider.LLMProvider.sentiment].
+        """
+        return await self.agenerate_score(*self._sentiment_prompts(text))
+
+    @staticmethod
+    def _sentiment_prompts(
+        text: str, cot_reasons: bool = False
+    ) -> Tuple[str, str]:
+        """System and user prompts of the sentiment feedback functions."""
+
         user_prompt = prompts.SENTIMENT_USER + text
-        return self.generate_score(system_prompt, user_prompt)
+        if cot_reasons:
+            user_prompt += prompts.COT_REASONS_TEMPLATE
+
+        return prompts.SENTIMENT_SYSTEM, user_prompt
 
     def sentiment_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
@@ -603,11 +955,20 @@ class LLMProvider(Provider):
         Returns:
             float: A value between 0.0 (negative sentiment) and 1.0 (positive sentiment).
         """
-        system_prompt = prompts.SENTIMENT_SYSTEM
-        user_prompt = (
-            prompts.SENTIMENT_USER + text + prompts.COT_REASONS_TEMPLATE
+        return self.generate_score_and_reasons(
+            *self._sentiment_prompts(text, cot_reasons=True)
+        )
+
+    async def asentiment_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [sentiment_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.sentiment_with_cot_reasons].
+        """
+        return await self.agenerate_score_and_reasons(
+            *self._sentiment_prompts(text, cot_reasons=True)
         )
-        return self.generate_score_and_reasons(system_prompt, user_prompt)
 
     def model_agreement(self, prompt: str, response: str) -> float:
         """
@@ -662,14 +1023,35 @@ class LLMProvider(Provider):
                 evaluation.
         """
 
+        return self.generate_score(*self._langchain_prompts(text, criteria))
+
+    async def _alangchain_evaluate(self, text: str, criteria: str) -> float:
+        """
+        Async version of
+        [_langchain_evaluate][trulens.feedback.llm_provider.LLMProvider._langchain_evaluate].
+        """
+        return await self.agenerate_score(
+            *self._langchain_prompts(text, criteria)
+        )
+
+    @staticmethod
+    def _langchain_prompts(
+        text: str, criteria: str, cot_reasons: bool = False
+    ) -> Tuple[str, str]:
+        """System and user prompts of the feedback functions evaluating text
+        by a criteria."""
+
         system_prompt = str.format(
-            prompts.LANGCHAIN_PROMPT_TEMPLATE_SYSTEM, criteria=criteria
+            prompts.LANGCHAIN_PROMPT_TEMPLATE_WITH_COT_REASONS_SYSTEM
+            if cot_reasons
+            else prompts.LANGCHAIN_PROMPT_TEMPLATE_SYSTEM,
+            criteria=criteria,
         )
         user_prompt = str.format(
             prompts.LANGCHAIN_PROMPT_TEMPLATE_USER, submission=text
         )
 
-        return self.generate_score(system_prompt, user_prompt)
+        return system_prompt, user_prompt
 
     def _langchain_evaluate_with_cot_reasons(
         self, text: str, criteria: str
@@ -686,14 +1068,20 @@ class LLMProvider(Provider):
             Tuple[float, str]: A tuple containing a value between 0.0 and 1.0, representing the specified evaluation, and a string containing the reasons for the evaluation.
         """
 
-        system_prompt = str.format(
-            prompts.LANGCHAIN_PROMPT_TEMPLATE_WITH_COT_REASONS_SYSTEM,
-            criteria=criteria,
+        return self.generate_score_and_reasons(
+            *self._langchain_prompts(text, criteria, cot_reasons=True)
         )
-        user_prompt = str.format(
-            prompts.LANGCHAIN_PROMPT_TEMPLATE_USER, submission=text
+
+    async def _alangchain_evaluate_with_cot_reasons(
+        self, text: str, criteria: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [_langchain_evaluate_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider._langchain_evaluate_with_cot_reasons].
+        """
+        return await self.agenerate_score_and_reasons(
+            *self._langchain_prompts(text, criteria, cot_reasons=True)
         )
-        return self.generate_score_and_reasons(system_prompt, user_prompt)
 
     def conciseness(self, text: str) -> float:
         """
@@ -717,6 +1105,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CONCISENESS_SYSTEM_PROMPT
         )
 
+    async def aconciseness(self, text: str) -> float:
+        """
+        Async version of
+        [conciseness][trulens.feedback.llm_provider.LLMProvider.conciseness].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_CONCISENESS_SYSTEM_PROMPT
+        )
+
     def conciseness_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -737,6 +1134,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CONCISENESS_SYSTEM_PROMPT
         )
 
+    async def aconciseness_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [conciseness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.conciseness_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_CONCISENESS_SYSTEM_PROMPT
+        )
+
     def correctness(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -758,6 +1166,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CORRECTNESS_SYSTEM_PROMPT
         )
 
+    async def acorrectness(self, text: str) -> float:
+        """
+        Async version of
+        [correctness][trulens.feedback.llm_provider.LLMProvider.correctness].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_CORRECTNESS_SYSTEM_PROMPT
+        )
+
     def correctness_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -780,6 +1197,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CORRECTNESS_SYSTEM_PROMPT
         )
 
+    async def acorrectness_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [correctness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.correctness_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_CORRECTNESS_SYSTEM_PROMPT
+        )
+
     def coherence(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a
@@ -801,6 +1229,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_COHERENCE_SYSTEM_PROMPT
         )
 
+    async def acoherence(self, text: str) -> float:
+        """
+        Async version of
+        [coherence][trulens.feedback.llm_provider.LLMProvider.coherence].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_COHERENCE_SYSTEM_PROMPT
+        )
+
     def coherence_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -823,6 +1260,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_COHERENCE_SYSTEM_PROMPT
         )
 
+    async def acoherence_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [coherence_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.coherence_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_COHERENCE_SYSTEM_PROMPT
+        )
+
     def harmfulness(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -844,6 +1292,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_HARMFULNESS_SYSTEM_PROMPT
         )
 
+    async def aharmfulness(self, text: str) -> float:
+        """
+        Async version of
+        [harmfulness][trulens.feedback.llm_provider.LLMProvider.harmfulness].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_HARMFULNESS_SYSTEM_PROMPT
+        )
+
     def harmfulness_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -867,6 +1324,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_HARMFULNESS_SYSTEM_PROMPT
         )
 
+    async def aharmfulness_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [harmfulness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.harmfulness_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_HARMFULNESS_SYSTEM_PROMPT
+        )
+
     def maliciousness(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -889,6 +1357,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_MALICIOUSNESS_SYSTEM_PROMPT
         )
 
+    async def amaliciousness(self, text: str) -> float:
+        """
+        Async version of
+        [maliciousness][trulens.feedback.llm_provider.LLMProvider.maliciousness].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_MALICIOUSNESS_SYSTEM_PROMPT
+        )
+
     def maliciousness_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat compoletion model. A function that completes a
@@ -911,6 +1388,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_MALICIOUSNESS_SYSTEM_PROMPT
         )
 
+    async def amaliciousness_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [maliciousness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.maliciousness_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_MALICIOUSNESS_SYSTEM_PROMPT
+        )
+
     def helpfulness(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -932,6 +1420,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_HELPFULNESS_SYSTEM_PROMPT
         )
 
+    async def ahelpfulness(self, text: str) -> float:
+        """
+        Async version of
+        [helpfulness][trulens.feedback.llm_provider.LLMProvider.helpfulness].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_HELPFULNESS_SYSTEM_PROMPT
+        )
+
     def helpfulness_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -954,6 +1451,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_HELPFULNESS_SYSTEM_PROMPT
         )
 
+    async def ahelpfulness_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [helpfulness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.helpfulness_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_HELPFULNESS_SYSTEM_PROMPT
+        )
+
     def controversiality(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -977,6 +1485,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CONTROVERSIALITY_SYSTEM_PROMPT
         )
 
+    async def acontroversiality(self, text: str) -> float:
+        """
+        Async version of
+        [controversiality][trulens.feedback.llm_provider.LLMProvider.controversiality].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_CONTROVERSIALITY_SYSTEM_PROMPT
+        )
+
     def controversiality_with_cot_reasons(
         self, text: str
     ) -> Tuple[float, Dict]:
@@ -1001,6 +1518,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CONTROVERSIALITY_SYSTEM_PROMPT
         )
 
+    async def acontroversiality_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [controversiality_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.controversiality_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_CONTROVERSIALITY_SYSTEM_PROMPT
+        )
+
     def misogyny(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -1022,6 +1550,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_MISOGYNY_SYSTEM_PROMPT
         )
 
+    async def amisogyny(self, text: str) -> float:
+        """
+        Async version of
+        [misogyny][trulens.feedback.llm_provider.LLMProvider.misogyny].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_MISOGYNY_SYSTEM_PROMPT
+        )
+
     def misogyny_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -1044,6 +1581,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_MISOGYNY_SYSTEM_PROMPT
         )
 
+    async def amisogyny_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [misogyny_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.misogyny_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_MISOGYNY_SYSTEM_PROMPT
+        )
+
     def criminality(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -1066,6 +1612,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CRIMINALITY_SYSTEM_PROMPT
         )
 
+    async def acriminality(self, text: str) -> float:
+        """
+        Async version of
+        [criminality][trulens.feedback.llm_provider.LLMProvider.criminality].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_CRIMINALITY_SYSTEM_PROMPT
+        )
+
     def criminality_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -1088,6 +1643,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_CRIMINALITY_SYSTEM_PROMPT
         )
 
+    async def acriminality_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [criminality_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.criminality_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_CRIMINALITY_SYSTEM_PROMPT
+        )
+
     def insensitivity(self, text: str) -> float:
         """
         Uses chat completion model. A function that completes a template to
@@ -1109,6 +1675,15 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_INSENSITIVITY_SYSTEM_PROMPT
         )
 
+    async def ainsensitivity(self, text: str) -> float:
+        """
+        Async version of
+        [insensitivity][trulens.feedback.llm_provider.LLMProvider.insensitivity].
+        """
+        return await self._alangchain_evaluate(
+            text=text, criteria=prompts.LANGCHAIN_INSENSITIVITY_SYSTEM_PROMPT
+        )
+
     def insensitivity_with_cot_reasons(self, text: str) -> Tuple[float, Dict]:
         """
         Uses chat completion model. A function that completes a template to
@@ -1131,6 +1706,17 @@ class LLMProvider(Provider):
             text=text, criteria=prompts.LANGCHAIN_INSENSITIVITY_SYSTEM_PROMPT
         )
 
+    async def ainsensitivity_with_cot_reasons(
+        self, text: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [insensitivity_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.insensitivity_with_cot_reasons].
+        """
+        return await self._alangchain_evaluate_with_cot_reasons(
+            text=text, criteria=prompts.LANGCHAIN_INSENSITIVITY_SYSTEM_PROMPT
+        )
+
     def _get_answer_agreement(
         self, prompt: str, response: str, check_response: str
     ) -> str:
@@ -1149,8 +1735,7 @@ class LLMProvider(Provider):
 
         assert self.endpoint is not None, "Endpoint is not set."
 
-        return self.endpoint.run_in_pace(
-            func=self._create_chat_completion,
+        return self._chat_completion(
             prompt=(prompts.AGREEMENT_SYSTEM % (prompt, check_response))
             + response,
         )
@@ -1172,6 +1757,17 @@ class LLMProvider(Provider):
             + str.format(prompts.GENERATE_KEY_POINTS_USER_PROMPT, source=source)
         )
 
+    async def _agenerate_key_points(self, source: str):
+        """
+        Async version of
+        [_generate_key_points][trulens.feedback.llm_provider.LLMProvider._generate_key_points].
+        """
+
+        return await self._acreate_chat_completion(
+            prompt=prompts.GENERATE_KEY_POINTS_SYSTEM_PROMPT
+            + str.format(prompts.GENERATE_KEY_POINTS_USER_PROMPT, source=source)
+        )
+
     def _assess_key_point_inclusion(
         self, key_points: str, summary: str
     ) -> List:
@@ -1185,22 +1781,44 @@ class LLMProvider(Provider):
         Returns:
             List[str]: A list of strings indicating whether each key point is included in the summary.
         """
-        key_points_list = key_points.split("\n")
+        return [
+            self._create_chat_completion(prompt=prompt)
+            for prompt in self._key_point_inclusion_prompts(key_points, summary)
+        ]
+
+    async def _aassess_key_point_inclusion(
+        self, key_points: str, summary: str
+    ) -> List:
+        """
+        Async version of
+        [_assess_key_point_inclusion][trulens.feedback.llm_provider.LLMProvider._assess_key_point_inclusion].
+        Key points are assessed concurrently.
+        """
+        return await asyncio.gather(
+            *(
+                self._acreate_chat_completion(prompt=prompt)
+                for prompt in self._key_point_inclusion_prompts(
+                    key_points, summary
+                )
+            )
+        )
+
+    @staticmethod
+    def _key_point_inclusion_prompts(
+        key_points: str, summary: str
+    ) -> List[str]:
+        """Prompts assessing whether each of the key points separated by
+        newlines is included in the summary."""
 
-        system_prompt = prompts.COMPREHENSIVENESS_SYSTEM_PROMPT
-        inclusion_assessments = []
-        for key_point in key_points_list:
-            user_prompt = str.format(
+        return [
+            prompts.COMPREHENSIVENESS_SYSTEM_PROMPT
+            + str.format(
                 prompts.COMPOREHENSIVENESS_USER_PROMPT,
                 key_point=key_point,
                 summary=summary,
             )
-            inclusion_assessment = self._create_chat_completion(
-                prompt=system_prompt + user_prompt
-            )
-            inclusion_assessments.append(inclusion_assessment)
-
-        return inclusion_assessments
+            for key_point in key_points.split("\n")
+        ]
 
     def comprehensiveness_with_cot_reasons(
         self, source: str, summary: str
@@ -1229,6 +1847,31 @@ class LLMProvider(Provider):
         key_point_inclusion_assessments = self._assess_key_point_inclusion(
             key_points, summary
         )
+
+        return self._comprehensiveness_score(key_point_inclusion_assessments)
+
+    async def acomprehensiveness_with_cot_reasons(
+        self, source: str, summary: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [comprehensiveness_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.comprehensiveness_with_cot_reasons].
+        """
+
+        key_points = await self._agenerate_key_points(source)
+        key_point_inclusion_assessments = (
+            await self._aassess_key_point_inclusion(key_points, summary)
+        )
+
+        return self._comprehensiveness_score(key_point_inclusion_assessments)
+
+    @staticmethod
+    def _comprehensiveness_score(
+        key_point_inclusion_assessments: List[str],
+    ) -> Tuple[float, Dict]:
+        """Score and reasons of the comprehensiveness feedback function given
+        the assessments of each key point."""
+
         scores = []
         reasons = ""
         for assessment in key_point_inclusion_assessments:
@@ -1276,11 +1919,32 @@ class LLMProvider(Provider):
         Returns:
             A value between 0.0 (no stereotypes assumed) and 1.0 (stereotypes assumed).
         """
+        return self.generate_score(*self._stereotypes_prompts(prompt, response))
+
+    async def astereotypes(self, prompt: str, response: str) -> float:
+        """
+        Async version of
+        [stereotypes][trulens.feedback.llm_provider.LLMProvider.stereotypes].
+        """
+        return await self.agenerate_score(
+            *self._stereotypes_prompts(prompt, response)
+        )
+
+    @staticmethod
+    def _stereotypes_prompts(
+        prompt: str, response: str, cot_reasons: bool = False
+    ) -> Tuple[str, str]:
+        """System and user prompts of the stereotypes feedback functions."""
+
         system_prompt = prompts.STEREOTYPES_SYSTEM_PROMPT
+        if cot_reasons:
+            system_prompt += prompts.COT_REASONS_TEMPLATE
+
         user_prompt = str.format(
             prompts.STEREOTYPES_USER_PROMPT, prompt=prompt, response=response
         )
-        return self.generate_score(system_prompt, user_prompt)
+
+        return system_prompt, user_prompt
 
     def stereotypes_with_cot_reasons(
         self, prompt: str, response: str
@@ -1304,14 +1968,20 @@ class LLMProvider(Provider):
         Returns:
             Tuple[float, str]: A tuple containing a value between 0.0 (no stereotypes assumed) and 1.0 (stereotypes assumed) and a string containing the reasons for the evaluation.
         """
-        system_prompt = (
-            prompts.STEREOTYPES_SYSTEM_PROMPT + prompts.COT_REASONS_TEMPLATE
-        )
-        user_prompt = str.format(
-            prompts.STEREOTYPES_USER_PROMPT, prompt=prompt, response=response
+        return self.generate_score_and_reasons(
+            *self._stereotypes_prompts(prompt, response, cot_reasons=True)
         )
 
-        return self.generate_score_and_reasons(system_prompt, user_prompt)
+    async def astereotypes_with_cot_reasons(
+        self, prompt: str, response: str
+    ) -> Tuple[float, Dict]:
+        """
+        Async version of
+        [stereotypes_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.stereotypes_with_cot_reasons].
+        """
+        return await self.agenerate_score_and_reasons(
+            *self._stereotypes_prompts(prompt, response, cot_reasons=True)
+        )
 
     def _remove_trivial_statements(self, statements: List[str]) -> List[str]:
         """
@@ -1333,9 +2003,25 @@ class LLMProvider(Provider):
         llm_messages = [{"role": "system", "content": system_prompt}]
         llm_messages.append({"role": "user", "content": user_prompt})
 
+        return eval(self._chat_completion(messages=llm_messages))
+
+    async def _aremove_trivial_statements(
+        self, statements: List[str]
+    ) -> List[str]:
+        """
+        Async version of
+        [_remove_trivial_statements][trulens.feedback.llm_provider.LLMProvider._remove_trivial_statements].
+        """
+
+        user_prompt = prompts.LLM_TRIVIAL_USER.format(
+            statements=str(statements)
+        )
+
         return eval(
-            self.endpoint.run_in_pace(
-                func=self._create_chat_completion, messages=llm_messages
+            await self._achat_completion(
+                messages=self._score_messages(
+                    prompts.LLM_TRIVIAL_SYSTEM, user_prompt
+                )
             )
         )
 
@@ -1398,8 +2084,6 @@ class LLMProvider(Provider):
             Tuple[float, dict]: A tuple containing a value between 0.0 (not grounded) and 1.0 (grounded) and a dictionary containing the reasons for the evaluation.
         """
         nltk.download("punkt", quiet=True)
-        groundedness_scores = {}
-        reasons_str = ""
 
         hypotheses = sent_tokenize(statement)
         hypotheses = self._remove_trivial_statements(hypotheses)
@@ -1426,23 +2110,40 @@ class LLMProvider(Provider):
             for future in as_completed(futures):
                 results.append(future.result())
 
-        results.sort(key=lambda x: x[0])  # Sort results by index
+        return self._groundedness_score(results)
 
-        for i, score, reason in results:
-            groundedness_scores[f"statement_{i}"] = score
-            reason_str = (
-                reason["reason"]
-                if "reason" in reason
-                else "reason not generated"
+    async def agroundedness_measure_with_cot_reasons(
+        self, source: str, statement: str
+    ) -> Tuple[float, dict]:
+        """
+        Async version of
+        [groundedness_measure_with_cot_reasons][trulens.feedback.llm_provider.LLMProvider.groundedness_measure_with_cot_reasons].
+        Statements are evaluated concurrently.
+        """
+        nltk.download("punkt", quiet=True)
+
+        hypotheses = sent_tokenize(statement)
+        hypotheses = await self._aremove_trivial_statements(hypotheses)
+
+        system_prompt = prompts.LLM_GROUNDEDNESS_SYSTEM
+
+        async def evaluate_hypothesis(index, hypothesis):
+            user_prompt = prompts.LLM_GROUNDEDNESS_USER.format(
+                premise=f"{source}", hypothesis=f"{hypothesis}"
             )
-            reasons_str += f"STATEMENT {i}:\n{reason_str}\n"
+            score, reason = await self.agenerate_score_and_reasons(
+                system_prompt, user_prompt
+            )
+            return index, score, reason
 
-        # Calculate the average groundedness score from the scores dictionary
-        average_groundedness_score = float(
-            np.mean(list(groundedness_scores.values()))
+        results = await asyncio.gather(
+            *(
+                evaluate_hypothesis(i, hypothesis)
+                for i, hypothesis in enumerate(hypotheses)
+            )
         )
 
-        return average_groundedness_score, {"reasons": reasons_str}
+        return self._groundedness_score(results)
 
     def groundedness_measure_with_cot_reasons_consider_answerability(
         self, source: str, statement: str, question: str
@@ -1485,8 +2186,6 @@ class LLMProvider(Provider):
             Tuple[float, dict]: A tuple containing a value between 0.0 (not grounded) and 1.0 (grounded) and a dictionary containing the reasons for the evaluation.
         """
         nltk.download("punkt", quiet=True)
-        groundedness_scores = {}
-        reasons_str = ""
 
         def evaluate_abstention(statement):
             user_prompt = prompts.LLM_ABSTENTION_USER.format(
@@ -1540,7 +2239,79 @@ class LLMProvider(Provider):
             for future in as_completed(futures):
                 results.append(future.result())
 
-        results.sort(key=lambda x: x[0])  # Sort results by index
+        return self._groundedness_score(results)
+
+    async def agroundedness_measure_with_cot_reasons_consider_answerability(
+        self, source: str, statement: str, question: str
+    ) -> Tuple[float, dict]:
+        """
+        Async version of
+        [groundedness_measure_with_cot_reasons_consider_answerability][trulens.feedback.llm_provider.LLMProvider.groundedness_measure_with_cot_reasons_consider_answerability].
+        Statements are evaluated concurrently.
+        """
+        nltk.download("punkt", quiet=True)
+
+        async def evaluate_abstention(statement):
+            user_prompt = prompts.LLM_ABSTENTION_USER.format(
+                statement=statement
+            )
+            return await self.agenerate_score(
+                prompts.LLM_ABSTENTION_SYSTEM, user_prompt
+            )
+
+        async def evaluate_answerability(question, source):
+            user_prompt = prompts.LLM_ANSWERABILITY_USER.format(
+                question=question, source=source
+            )
+            return await self.agenerate_score(
+                prompts.LLM_ANSWERABILITY_SYSTEM, user_prompt
+            )
+
+        hypotheses = sent_tokenize(statement)
+
+        hypotheses = await self._aremove_trivial_statements(hypotheses)
+
+        system_prompt = prompts.LLM_GROUNDEDNESS_SYSTEM
+
+        async def evaluate_hypothesis(index, hypothesis):
+            abstention_score = await evaluate_abstention(hypothesis)
+            if abstention_score > 0.5:
+                answerability_score = await evaluate_answerability(
+                    question, source
+                )
+                if answerability_score > 0.5:
+                    return index, 0.0, {"reason": "Answerable abstention"}
+                else:
+                    return index, 1.0, {"reason": "Unanswerable abstention"}
+            else:
+                user_prompt = prompts.LLM_GROUNDEDNESS_USER.format(
+                    premise=f"{source}", hypothesis=f"{hypothesis}"
+                )
+                score, reason = await self.agenerate_score_and_reasons(
+                    system_prompt, user_prompt
+                )
+                return index, score, reason
+
+        results = await asyncio.gather(
+            *(
+                evaluate_hypothesis(i, hypothesis)
+                for i, hypothesis in enumerate(hypotheses)
+            )
+        )
+
+        return self._groundedness_score(results)
+
+    @staticmethod
+    def _groundedness_score(
+        results: List[Tuple[int, float, Dict]],
+    ) -> Tuple[float, dict]:
+        """Average score and reasons of the groundedness measures given the
+        index, score and reasons of each statement."""
+
+        groundedness_scores = {}
+        reasons_str = ""
+
+        results = sorted(results, key=lambda x: x[0])  # Sort results by index
 
         for i, score, reason in results:
             groundedness_scores[f"statement_{i}"] = score
@@ -200,14 +200,44 @@ class Bedrock(LLMProvider):
                 "The `temperature` argument is ignored for Bedrock provider."
             )
 
-        llm_messages = [{"role": "system", "content": system_prompt}]
-        if user_prompt is not None:
-            llm_messages.append({"role": "user", "content": user_prompt})
+        response = self._chat_completion(
+            messages=self._score_messages(system_prompt, user_prompt)
+        )
+
+        return self._parse_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    async def agenerate_score(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> float:
+        """
+        Async version of
+        [generate_score][trulens.providers.bedrock.Bedrock.generate_score].
+        """
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion, messages=llm_messages
+        if temperature != 0.0:
+            logger.warning(
+                "The `temperature` argument is ignored for Bedrock provider."
+            )
+
+        response = await self._achat_completion(
+            messages=self._score_messages(system_prompt, user_prompt)
+        )
+
+        return self._parse_score(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
         )
 
+    @staticmethod
+    def _parse_score(
+        response: str, min_score_val: int, max_score_val: int
+    ) -> float:
         return (re_configured_rating(response) - min_score_val) / (
             max_score_val - min_score_val
         )
@@ -242,13 +272,44 @@ class Bedrock(LLMProvider):
                 "The `temperature` argument is ignored for Bedrock provider."
             )
 
-        llm_messages = [{"role": "system", "content": system_prompt}]
-        if user_prompt is not None:
-            llm_messages.append({"role": "user", "content": user_prompt})
+        response = self._chat_completion(
+            messages=self._score_messages(system_prompt, user_prompt)
+        )
 
-        response = self.endpoint.run_in_pace(
-            func=self._create_chat_completion, messages=llm_messages
+        return self._parse_score_and_reasons(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
         )
+
+    async def agenerate_score_and_reasons(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        min_score_val: int = 0,
+        max_score_val: int = 3,
+        temperature: float = 0.0,
+    ) -> Union[float, Tuple[float, Dict]]:
+        """
+        Async version of
+        [generate_score_and_reasons][trulens.providers.bedrock.Bedrock.generate_score_and_reasons].
+        """
+
+        if temperature != 0.0:
+            logger.warning(
+                "The `temperature` argument is ignored for Bedrock provider."
+            )
+
+        response = await self._achat_completion(
+            messages=self._score_messages(system_prompt, user_prompt)
+        )
+
+        return self._parse_score_and_reasons(
+            response, min_score_val=min_score_val, max_score_val=max_score_val
+        )
+
+    @staticmethod
+    def _parse_score_and_reasons(
+        response: str, min_score_val: int, max_score_val: int
+    ) -> Union[float, Tuple[float, Dict]]:
         if "Supporting Evidence" in response:
             score = 0.0
             supporting_evidence = None
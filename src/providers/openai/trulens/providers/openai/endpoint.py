@@ -20,10 +20,22 @@ the involved classes will need to be adapted here. The important classes are:
 
 """
 
+import asyncio
+import hashlib
 import inspect
 import logging
 import pprint
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Union,
+)
+import weakref
 
 from langchain.callbacks.openai_info import OpenAICallbackHandler
 from langchain.schema import Generation
@@ -45,6 +57,14 @@ logger = logging.getLogger(__name__)
 
 pp = pprint.PrettyPrinter()
 
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    weakref.WeakKeyDictionary[oai.OpenAI, oai.AsyncOpenAI],
+] = weakref.WeakKeyDictionary()
+"""Async clients created by
+[OpenAIClient.async_client][trulens.providers.openai.endpoint.OpenAIClient.async_client]
+per event loop and wrapped client."""
+
 
 class OpenAIClient(SerialModel):
     """
@@ -139,6 +159,37 @@ class OpenAIClient(SerialModel):
             client=client, client_cls=client_cls, client_kwargs=client_kwargs
         )
 
+    def async_client(self) -> Optional[oai.AsyncOpenAI]:
+        """An `openai.AsyncOpenAI` client configured like the wrapped client
+        for use in the running event loop.
+
+        Returns None if the wrapped client is not an `openai.OpenAI` client.
+        """
+
+        client = self.client
+
+        if type(client) is not oai.OpenAI:
+            return None
+
+        clients = _async_clients.setdefault(
+            asyncio.get_running_loop(), weakref.WeakKeyDictionary()
+        )
+
+        if client not in clients:
+            kwargs = dict(
+                api_key=client.api_key,
+                organization=client.organization,
+                base_url=client.base_url,
+                timeout=client.timeout,
+                max_retries=client.max_retries,
+            )
+            if safe_hasattr(client, "project"):
+                kwargs["project"] = client.project
+
+            clients[client] = oai.AsyncOpenAI(**kwargs)
+
+        return clients[client]
+
     def __getattr__(self, k):
         # Pass through attribute lookups to `self.client`, the openai.OpenAI
         # instance.
@@ -218,6 +269,8 @@ class OpenAIEndpoint(Endpoint):
         ] = None,
         rpm: Optional[int] = None,
         pace: Optional[Pace] = None,
+        tpm: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
         **kwargs: dict,
     ):
         if safe_hasattr(self, "name") and client is not None:
@@ -234,6 +287,8 @@ class OpenAIEndpoint(Endpoint):
             "name": name,  # for SingletonPerName
             "rpm": rpm,
             "pace": pace,
+            "tpm": tpm,
+            "max_concurrency": max_concurrency,
             **kwargs,
         }
 
@@ -277,6 +332,19 @@ class OpenAIEndpoint(Endpoint):
     def __new__(cls, *args, **kwargs):
         return super(Endpoint, cls).__new__(cls, name="openai")
 
+    def limiter_key(self) -> Hashable:
+        # Endpoints using the same API key at the same service share rate
+        # limits. Only a digest of the key is kept.
+        client = self.client.client
+
+        api_key = getattr(client, "api_key", None) or ""
+
+        return (
+            "openai",
+            str(getattr(client, "base_url", None)),
+            hashlib.sha256(api_key.encode()).hexdigest(),
+        )
+
     def handle_wrapped_call(
         self,
         func: Callable,
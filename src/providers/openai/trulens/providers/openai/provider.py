@@ -81,6 +81,44 @@ class OpenAI(LLMProvider):
         messages: Optional[Sequence[Dict]] = None,
         **kwargs,
     ) -> str:
+        completion = self.endpoint.client.chat.completions.create(
+            **self._chat_completion_kwargs(
+                prompt=prompt, messages=messages, **kwargs
+            )
+        )
+
+        return completion.choices[0].message.content
+
+    async def _acreate_chat_completion(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs,
+    ) -> str:
+        client = self.endpoint.client.async_client()
+
+        if client is None:
+            # No async counterpart of the wrapped client, run it in a thread.
+            return await super()._acreate_chat_completion(
+                prompt=prompt, messages=messages, **kwargs
+            )
+
+        completion = await client.chat.completions.create(
+            **self._chat_completion_kwargs(
+                prompt=prompt, messages=messages, **kwargs
+            )
+        )
+
+        return completion.choices[0].message.content
+
+    def _chat_completion_kwargs(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[Sequence[Dict]] = None,
+        **kwargs,
+    ) -> Dict:
+        """Arguments to the chat completions `create` method."""
+
         if "model" not in kwargs:
             kwargs["model"] = self.model_engine
 
@@ -91,19 +129,15 @@ class OpenAI(LLMProvider):
             kwargs["seed"] = 123
 
         if messages is not None:
-            completion = self.endpoint.client.chat.completions.create(
-                messages=messages, **kwargs
-            )
+            kwargs["messages"] = messages
 
         elif prompt is not None:
-            completion = self.endpoint.client.chat.completions.create(
-                messages=[{"role": "system", "content": prompt}], **kwargs
-            )
+            kwargs["messages"] = [{"role": "system", "content": prompt}]
 
         else:
             raise ValueError("`prompt` or `messages` must be specified.")
 
-        return completion.choices[0].message.content
+        return kwargs
 
     def _moderation(self, text: str):
         # See https://platform.openai.com/docs/guides/moderation/overview .
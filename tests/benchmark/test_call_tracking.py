@@ -0,0 +1,118 @@
+"""
+Microbenchmark of instrumented call tracking.
+
+Compares the overhead of instrumented method calls made at various python call
+stack depths under the two
+[CallTrackingMode][trulens.core.instruments.CallTrackingMode]s. Run with:
+
+```bash
+pytest -s tests/benchmark/test_call_tracking.py
+```
+"""
+
+import time
+from unittest import TestCase
+from unittest import main
+
+from trulens.core import TruSession
+from trulens.core.app.custom import TruCustomApp
+from trulens.core.app.custom import instrument
+from trulens.core.instruments import CallTrackingMode
+from trulens.core.instruments import Instrument
+
+DEPTHS = (10, 50, 200)
+"""Python call stack depths (in frames above the recording context) at which
+instrumented calls are made."""
+
+CALLS = 50
+"""Number of instrumented calls per measurement."""
+
+
+class DeepApp:
+    """App whose root method reaches the instrumented leaf method through a
+    configurable number of uninstrumented frames."""
+
+    @instrument
+    def root(self, depth: int, calls: int) -> int:
+        return self._descend(depth, calls)
+
+    def _descend(self, depth: int, calls: int) -> int:
+        if depth > 0:
+            return self._descend(depth - 1, calls)
+
+        return sum(self.leaf(i) for i in range(calls))
+
+    @instrument
+    def leaf(self, i: int) -> int:
+        return i
+
+
+def _descend_plain(depth: int, func, *args):
+    """Call `func` with `args` from `depth` frames deeper than the caller."""
+
+    if depth > 0:
+        return _descend_plain(depth - 1, func, *args)
+
+    return func(*args)
+
+
+class TestCallTrackingBenchmark(TestCase):
+    def setUp(self):
+        self.session = TruSession()
+        self.session.reset_database()
+
+        self.app = DeepApp()
+        self.recorder = TruCustomApp(
+            self.app, app_name="deep_app", app_version="benchmark"
+        )
+
+        self.original_mode = Instrument.call_tracking_mode
+
+    def tearDown(self):
+        Instrument.call_tracking_mode = self.original_mode
+
+    def _measure(self, mode: CallTrackingMode, depth: int) -> float:
+        """Average seconds per recorded instrumented call."""
+
+        Instrument.call_tracking_mode = mode
+
+        with self.recorder as recording:
+            start = time.perf_counter()
+            _descend_plain(depth, self.app.root, depth, CALLS)
+            elapsed = time.perf_counter() - start
+
+        record = recording.get()
+        # root plus every leaf, all nested under root:
+        self.assertEqual(len(record.calls), CALLS + 1)
+        for call in record.calls:
+            if call.method.name == "leaf":
+                self.assertEqual(len(call.stack), 2)
+
+        return elapsed / (CALLS + 1)
+
+    def test_call_tracking_overhead(self):
+        results = {}
+
+        print()
+        print(f"{'depth':>6} {'stack (ms)':>12} {'contextvars (ms)':>18}")
+
+        for depth in DEPTHS:
+            for mode in (CallTrackingMode.STACK, CallTrackingMode.CONTEXTVARS):
+                results[(mode, depth)] = self._measure(mode, depth)
+
+            print(
+                f"{depth:>6} "
+                f"{results[(CallTrackingMode.STACK, depth)] * 1000:>12.3f} "
+                f"{results[(CallTrackingMode.CONTEXTVARS, depth)] * 1000:>18.3f}"
+            )
+
+        # Stack walking cost grows with depth; contextvars lookup does not.
+        deepest = max(DEPTHS)
+        self.assertLess(
+            results[(CallTrackingMode.CONTEXTVARS, deepest)],
+            results[(CallTrackingMode.STACK, deepest)],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+"""
+Microbenchmark of jsonify.
+
+Compares the serialization of nested app components and of records with
+[jsonify][trulens.core.utils.json.jsonify] against the prior implementation,
+which recurred with a copy of the ids of visited objects at each level and
+serialized the class information of each component anew. Run with:
+
+```bash
+pytest -s tests/benchmark/test_jsonify.py
+```
+"""
+
+import dataclasses
+from enum import Enum
+from pathlib import Path
+import time
+from typing import Any, Dict, Optional, Sequence, Set
+from unittest import TestCase
+from unittest import main
+
+import pydantic
+from pydantic.v1 import BaseModel as v1BaseModel
+from pydantic.v1.json import ENCODERS_BY_TYPE
+from trulens.core.instruments import Instrument
+from trulens.core.schema.record import Record
+from trulens.core.schema.record import RecordAppCall
+from trulens.core.schema.record import RecordAppCallMethod
+from trulens.core.utils import pyschema
+from trulens.core.utils.constants import ALL_SPECIAL_KEYS
+from trulens.core.utils.constants import CIRCLE
+from trulens.core.utils.constants import CLASS_INFO
+from trulens.core.utils.json import jsonify
+from trulens.core.utils.keys import redact_value
+from trulens.core.utils.pyschema import Class
+from trulens.core.utils.pyschema import WithClassInfo
+from trulens.core.utils.pyschema import clean_attributes
+from trulens.core.utils.pyschema import noserio
+from trulens.core.utils.pyschema import safe_getattr
+from trulens.core.utils.python import safe_hasattr
+from trulens.core.utils.serial import JSON
+from trulens.core.utils.serial import JSON_BASES
+from trulens.core.utils.serial import Lens
+from trulens.core.utils.serial import SerialBytes
+from trulens.core.utils.serial import SerialModel
+
+DEPTHS = (10, 50, 200)
+"""Number of nested app components."""
+
+CALLS = (10, 100, 1000)
+"""Number of calls in records."""
+
+REPEATS = 5
+"""Number of serializations per measurement."""
+
+
+def _jsonify_recursive(
+    obj: Any,
+    dicted: Optional[Dict[int, JSON]] = None,
+    instrument: Optional[Instrument] = None,
+    skip_specials: bool = False,
+    redact_keys: bool = False,
+    include_excluded: bool = True,
+    depth: int = 0,
+    max_depth: int = 256,
+) -> JSON:
+    """Jsonify prior to the iterative serialization."""
+
+    if depth > max_depth:
+        return noserio(obj)
+
+    skip_excluded = not include_excluded
+    if isinstance(obj, SerialModel):
+        skip_excluded = True
+
+    if instrument is None:
+        instrument = Instrument()
+
+    dicted = dicted or {}
+
+    if skip_specials:
+
+        def recur_key(k):
+            return isinstance(k, JSON_BASES) and k not in ALL_SPECIAL_KEYS
+
+    else:
+
+        def recur_key(k):
+            return isinstance(k, JSON_BASES)
+
+    if id(obj) in dicted:
+        if skip_specials:
+            return None
+
+        return {CIRCLE: id(obj)}
+
+    if isinstance(obj, JSON_BASES):
+        if redact_keys and isinstance(obj, str):
+            return redact_value(obj)
+
+        return obj
+
+    if isinstance(obj, SerialBytes):
+        return obj.model_dump()
+
+    if isinstance(obj, Path):
+        return str(obj)
+
+    if type(obj) in ENCODERS_BY_TYPE:
+        return ENCODERS_BY_TYPE[type(obj)](obj)
+
+    new_dicted = dict(dicted)
+
+    def recur(o):
+        return _jsonify_recursive(
+            obj=o,
+            dicted=new_dicted,
+            instrument=instrument,
+            skip_specials=skip_specials,
+            redact_keys=redact_keys,
+            include_excluded=include_excluded,
+            depth=depth + 1,
+            max_depth=max_depth,
+        )
+
+    content = None
+
+    if isinstance(obj, Enum):
+        content = obj.name
+
+    elif isinstance(obj, Dict):
+        forward_value = {}
+        new_dicted[id(obj)] = forward_value
+        forward_value.update({
+            k: recur(v) for k, v in obj.items() if recur_key(k)
+        })
+
+        if redact_keys:
+            for k, v in forward_value.items():
+                forward_value[k] = redact_value(v=v, k=k)
+
+        content = forward_value
+
+    elif isinstance(obj, Sequence):
+        forward_value = []
+        new_dicted[id(obj)] = forward_value
+        for x in (recur(v) for v in obj):
+            forward_value.append(x)
+
+        content = forward_value
+
+    elif isinstance(obj, Set):
+        forward_value = []
+        new_dicted[id(obj)] = forward_value
+        for x in (recur(v) for v in obj):
+            forward_value.append(x)
+
+        content = forward_value
+
+    elif isinstance(obj, pydantic.BaseModel):
+        if isinstance(obj, Lens):
+            return obj.model_dump()
+
+        forward_value = {}
+        new_dicted[id(obj)] = forward_value
+        forward_value.update({
+            k: recur(safe_getattr(obj, k))
+            for k, v in obj.model_fields.items()
+            if (not skip_excluded or not v.exclude) and recur_key(k)
+        })
+
+        if redact_keys:
+            for k, v in forward_value.items():
+                forward_value[k] = redact_value(v=v, k=k)
+
+        content = forward_value
+
+    elif isinstance(obj, v1BaseModel):
+        forward_value = {}
+        new_dicted[id(obj)] = forward_value
+        forward_value.update({
+            k: recur(safe_getattr(obj, k))
+            for k, v in obj.__fields__.items()
+            if (not skip_excluded or not v.field_info.exclude) and recur_key(k)
+        })
+
+        if redact_keys:
+            for k, v in forward_value.items():
+                forward_value[k] = redact_value(v=v, k=k)
+
+        content = forward_value
+
+    elif dataclasses.is_dataclass(type(obj)):
+        forward_value = {}
+        new_dicted[id(obj)] = forward_value
+
+        forward_value.update({
+            f.name: recur(safe_getattr(obj, f.name))
+            for f in dataclasses.fields(obj)
+            if recur_key(f.name)
+        })
+
+        if redact_keys:
+            for k, v in forward_value.items():
+                forward_value[k] = redact_value(v=v, k=k)
+
+        content = forward_value
+
+    elif instrument.to_instrument_object(obj):
+        forward_value = {}
+        new_dicted[id(obj)] = forward_value
+
+        kvs = clean_attributes(obj, include_props=True)
+
+        forward_value.update({
+            k: recur(v)
+            for k, v in kvs.items()
+            if recur_key(k)
+            and (
+                isinstance(v, JSON_BASES)
+                or isinstance(v, Dict)
+                or isinstance(v, Sequence)
+                or instrument.to_instrument_object(v)
+            )
+        })
+
+        content = forward_value
+
+    else:
+        content = noserio(obj)
+
+    if (
+        not skip_specials
+        and isinstance(content, dict)
+        and not isinstance(obj, dict)
+        and (
+            instrument.to_instrument_object(obj)
+            or isinstance(obj, WithClassInfo)
+        )
+    ):
+        content[CLASS_INFO] = Class.of_class(
+            cls=obj.__class__, with_bases=True
+        ).model_dump()
+
+    if not isinstance(obj, Lens) and safe_hasattr(obj, "jsonify_extra"):
+        content = obj.jsonify_extra(content)
+
+    return content
+
+
+class Component:
+    """App component with configuration, a prompt and a subcomponent."""
+
+    def __init__(self, i: int, child: Optional["Component"]):
+        self.name = f"component{i}"
+        self.config = dict(temperature=0.1 * i, stop=["\n", "###"])
+        self.prompt = f"You are component {i}. " * 10
+        self.child = child
+
+    def call(self, query: str) -> str:
+        return query
+
+
+def _app(depth: int) -> Component:
+    app = None
+    for i in range(depth):
+        app = Component(i, app)
+
+    return app
+
+
+def _record(calls: int) -> Record:
+    component = Component(0, None)
+    path = Lens().app.component
+
+    return Record(
+        app_id="app",
+        main_input="query",
+        main_output="answer",
+        calls=[
+            RecordAppCall(
+                stack=[
+                    RecordAppCallMethod(
+                        path=path,
+                        method=pyschema.Method.of_method(component.call),
+                    )
+                ],
+                args=dict(query=f"query {i}", context=["context"] * 5),
+                rets=f"answer {i}",
+                pid=0,
+                tid=0,
+            )
+            for i in range(calls)
+        ],
+    )
+
+
+class TestJsonifyBenchmark(TestCase):
+    def _measure(self, func) -> float:
+        """Average seconds per call of `func`."""
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            func()
+
+        return (time.perf_counter() - start) / REPEATS
+
+    def _compare(self, name: str, size: int, obj: Any, **kwargs):
+        self.assertEqual(
+            jsonify(obj, **kwargs), _jsonify_recursive(obj, **kwargs)
+        )
+
+        recursive = self._measure(lambda: _jsonify_recursive(obj, **kwargs))
+        iterative = self._measure(lambda: jsonify(obj, **kwargs))
+
+        print(
+            f"{name:>10} {size:>6} "
+            f"{recursive * 1e3:>16.2f} {iterative * 1e3:>16.2f}"
+        )
+
+        self.assertLess(iterative, recursive)
+
+    def test_jsonify(self):
+        print()
+        print(
+            f"{'value':>10} {'size':>6} "
+            f"{'recursive (ms)':>16} {'iterative (ms)':>16}"
+        )
+
+        instrument = Instrument(include_classes=[Component])
+
+        for depth in DEPTHS:
+            self._compare("app", depth, _app(depth), instrument=instrument)
+
+        for calls in CALLS:
+            self._compare(
+                "record",
+                calls,
+                _record(calls),
+                redact_keys=True,
+                skip_specials=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
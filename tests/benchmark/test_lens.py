@@ -0,0 +1,155 @@
+"""
+Microbenchmark of lens evaluation.
+
+Compares getting and setting values at deep record selectors with compiled
+lenses against the prior evaluation, which recursed over prefix lenses. Run
+with:
+
+```bash
+pytest -s tests/benchmark/test_lens.py
+```
+"""
+
+import time
+from typing import Any, Iterable
+from unittest import TestCase
+from unittest import main
+
+from trulens.core.utils.containers import iterable_peek
+from trulens.core.utils.serial import Collect
+from trulens.core.utils.serial import Lens
+
+DEPTHS = (5, 20, 50)
+"""Number of nested app components above the selected calls."""
+
+REPEATS = 200
+"""Number of evaluations per measurement."""
+
+
+def _get_recursive(lens: Lens, obj: Any) -> Iterable[Any]:
+    """Lens evaluation prior to compilation."""
+
+    if len(lens.path) == 0:
+        yield obj
+        return
+
+    last_step = lens.path[-1]
+    start_items = _get_recursive(Lens(path=lens.path[0:-1]), obj)
+
+    if isinstance(last_step, Collect):
+        yield list(start_items)
+
+    else:
+        for start_selection in start_items:
+            yield from last_step.get(start_selection)
+
+
+def _set_recursive(lens: Lens, obj: Any, val: Any) -> Any:
+    """Lens update prior to compilation."""
+
+    if len(lens.path) == 0:
+        return val
+
+    first = lens.path[0]
+    rest = Lens(path=lens.path[1:])
+
+    try:
+        firsts = first.get(obj)
+        first_obj, firsts = iterable_peek(firsts)
+
+    except (ValueError, IndexError, KeyError, AttributeError):
+        obj = first.set(obj, None)
+        firsts = first.get(obj)
+
+    for first_obj in firsts:
+        obj = first.set(obj, _set_recursive(rest, first_obj, val))
+
+    return obj
+
+
+def _record(depth: int) -> dict:
+    """Record json whose calls are nested `depth` components deep in its
+    app."""
+
+    calls = [
+        dict(args=dict(query=f"q{i}"), rets=dict(output=f"r{i}"))
+        for i in range(3)
+    ]
+
+    app = dict(calls=calls)
+    for i in range(depth):
+        app = dict(component=app, name=f"c{i}")
+
+    return dict(__record__=dict(app=app, meta=None))
+
+
+def _selector(depth: int) -> Lens:
+    lens = Lens().__record__.app
+    for _ in range(depth):
+        lens = lens.component
+
+    return lens
+
+
+class TestLensBenchmark(TestCase):
+    def _measure(self, func) -> float:
+        """Average seconds per call of `func`."""
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            func()
+
+        return (time.perf_counter() - start) / REPEATS
+
+    def test_lens_evaluation(self):
+        print()
+        print(
+            f"{'depth':>6} {'selector':>10} "
+            f"{'recursive (us)':>16} {'compiled (us)':>15}"
+        )
+
+        for depth in DEPTHS:
+            obj = _record(depth)
+            calls = _selector(depth).calls
+
+            selectors = {
+                "get": calls[0].rets.output,
+                "get all": calls[:].args.query,
+                "collect": calls[:].rets.output.collect(),
+            }
+
+            for name, lens in selectors.items():
+                self.assertEqual(
+                    list(lens.get(obj)), list(_get_recursive(lens, obj))
+                )
+
+                recursive = self._measure(
+                    lambda: list(_get_recursive(lens, obj))  # noqa: B023
+                )
+                compiled = self._measure(
+                    lambda: list(lens.get(obj))  # noqa: B023
+                )
+
+                print(
+                    f"{depth:>6} {name:>10} "
+                    f"{recursive * 1e6:>16.1f} {compiled * 1e6:>15.1f}"
+                )
+
+                self.assertLess(compiled, recursive)
+
+            lens = calls[1].rets.score
+            self.assertEqual(lens.set(obj, 1.0), _set_recursive(lens, obj, 1.0))
+
+            recursive = self._measure(lambda: _set_recursive(lens, obj, 1.0))  # noqa: B023
+            compiled = self._measure(lambda: lens.set(obj, 1.0))  # noqa: B023
+
+            print(
+                f"{depth:>6} {'set':>10} "
+                f"{recursive * 1e6:>16.1f} {compiled * 1e6:>15.1f}"
+            )
+
+            self.assertLess(compiled, recursive)
+
+
+if __name__ == "__main__":
+    main()
@@ -490,6 +490,39 @@ class TestTru(TestCase):
             0.1,
         )
 
+    def test_start_evaluator_with_fork(self):
+        session = TruSession()
+        f = Feedback(custom_feedback_function).on_default()
+        tru_app = TruBasicApp(
+            text_to_text=lambda t: f"returning {t}",
+            feedbacks=[f],
+            feedback_mode=mod_feedback_schema.FeedbackMode.DEFERRED,
+            app_name=f"test_start_evaluator_with_fork_{str(uuid.uuid4())}",
+        )
+        app_id = tru_app.app_id
+        with tru_app:
+            tru_app.main_call("test_deferred_mode")
+
+        session.start_evaluator(fork=True, num_workers=2, disable_tqdm=True)
+        try:
+            # Workers need to start up before evaluating.
+            deadline = time.time() + 120
+            while time.time() < deadline:
+                records, feedback_names = session.get_records_and_feedback(
+                    app_ids=[app_id]
+                )
+                if "custom_feedback_function" in feedback_names:
+                    break
+                time.sleep(1)
+
+        finally:
+            session.stop_evaluator()
+
+        self.assertIsNone(session._evaluator_proc)
+        self.assertEqual(feedback_names, ["custom_feedback_function"])
+        self.assertEqual(records.shape[0], 1)
+        self.assertEqual(records["custom_feedback_function"].iloc[0], 0.1)
+
     def test_stop_evaluator(self):
         # TODO
         pass
@@ -22,30 +22,58 @@ running.
 """
 
 from contextlib import contextmanager
+from datetime import datetime
+from datetime import timedelta
+import json
 from pathlib import Path
 import shutil
+import sqlite3
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, Iterator, Literal, Union
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Literal, Union
 from unittest import TestCase
 from unittest import main
+from unittest import mock
+from unittest import skipIf
 
 import pandas as pd
+import sqlalchemy as sa
 from sqlalchemy import Engine
 from trulens.core import Feedback
 from trulens.core import TruBasicApp
 from trulens.core import TruSession
+from trulens.core.database import export as mod_export
 from trulens.core.database.base import DB
+from trulens.core.database.base import HighWaterMark
+from trulens.core.database.codec import Compression
+from trulens.core.database.codec import StorageCodec
 from trulens.core.database.exceptions import DatabaseVersionException
 from trulens.core.database.migrations import DbRevisions
 from trulens.core.database.migrations import downgrade_db
 from trulens.core.database.migrations import get_revision_history
 from trulens.core.database.migrations import upgrade_db
+from trulens.core.database.migrations.data import migrate_alembic_3_to_10
+from trulens.core.database.migrations.data import migrate_alembic_11_to_13
+from trulens.core.database.replica import ReplicaOptions
+from trulens.core.database.retention import RetentionPolicy
 from trulens.core.database.sqlalchemy import SQLAlchemyDB
 from trulens.core.database.utils import copy_database
 from trulens.core.database.utils import is_legacy_sqlite
 from trulens.core.feedback import Provider
+from trulens.core.feedback import feedback as mod_feedback
+from trulens.core.schema.app import AppDefinition
+from trulens.core.schema.base import Cost
+from trulens.core.schema.base import Perf
+from trulens.core.schema.feedback import FeedbackCall
+from trulens.core.schema.feedback import FeedbackDefinition
 from trulens.core.schema.feedback import FeedbackMode
+from trulens.core.schema.feedback import FeedbackResult
+from trulens.core.schema.feedback import FeedbackResultStatus
+from trulens.core.schema.record import Record
 from trulens.core.schema.select import Select
+from trulens.core.utils.imports import is_dummy
+from trulens.core.utils.pyschema import Class
 
 
 class TestDBSpecifications(TestCase):
@@ -274,6 +302,395 @@ class TestDbV2Migration(TestCase):
         self.assertGreater(len(feedbacks), 0)
 
 
+class TestDbUpsert(TestCase):
+    """Tests for single-statement upserts of the various tables."""
+
+    def test_upsert_sqlite_file(self) -> None:
+        """Test upserts on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_upsert(self, db)
+
+    def test_upsert_postgres(self) -> None:
+        """Test upserts on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_upsert(self, db)
+
+    def test_upsert_mysql(self) -> None:
+        """Test upserts on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_upsert(self, db)
+
+    def test_upsert_statements(self) -> None:
+        """Check the upsert statement produced for each dialect."""
+
+        from sqlalchemy.dialects import mysql
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.dialects import sqlite
+        from trulens.core.database.orm import make_orm_for_prefix
+        from trulens.core.database.sqlalchemy import _upsert_statement
+
+        table = make_orm_for_prefix(table_prefix="trulens_").Dataset.__table__
+        rows = [
+            {"dataset_id": "a", "dataset_json": "{}"},
+            {"dataset_id": "b", "dataset_json": "{}"},
+        ]
+
+        for dialect, expected in [
+            (sqlite.dialect(), "ON CONFLICT (dataset_id) DO UPDATE"),
+            (postgresql.dialect(), "ON CONFLICT (dataset_id) DO UPDATE"),
+            (mysql.dialect(), "ON DUPLICATE KEY UPDATE"),
+        ]:
+            with self.subTest(dialect=dialect.name):
+                stmt = _upsert_statement(
+                    dialect=dialect,
+                    table=table,
+                    rows=rows,
+                    primary_key=["dataset_id"],
+                    update_columns=["dataset_json"],
+                )
+                compiled = str(stmt.compile(dialect=dialect))
+                self.assertIn(expected, compiled)
+                # All rows in one statement:
+                self.assertEqual(compiled.count("INSERT"), 1)
+
+
+class TestDbIndexes(TestCase):
+    """Tests for the secondary indexes and query plan diagnostics."""
+
+    def test_explain_sqlite_file(self) -> None:
+        """Check that hot queries on sqlite use the indexes."""
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            plans = db.explain_queries()
+
+            self.assertGreater(len(plans), 0)
+            for _, row in plans.iterrows():
+                with self.subTest(query=row["query"]):
+                    self.assertIsNotNone(row["plan"])
+                    self.assertEqual(row["sequential_scans"], [])
+
+            # Without the status index, the evaluator poll reads the whole
+            # feedbacks table.
+            with db.engine.begin() as conn:
+                conn.exec_driver_sql(
+                    f"DROP INDEX {db.table_prefix}feedbacks_status_last_ts_idx"
+                )
+
+            plans = db.explain_queries().set_index("query")
+            self.assertIn(
+                db.orm.FeedbackResult.__tablename__,
+                plans.loc["evaluator poll", "sequential_scans"],
+            )
+
+    def test_index_migration(self) -> None:
+        """Check that the migrated schema has the indexes declared in the
+        ORM."""
+
+        with clean_db("sqlite_file") as db:
+            db.migrate_database()
+
+            inspector = sa.inspect(db.engine)
+
+            for orm_class in [db.orm.Record, db.orm.FeedbackResult]:
+                table = orm_class.__table__
+                with self.subTest(table=table.name):
+                    expected = {index.name for index in table.indexes}
+                    actual = {
+                        index["name"]
+                        for index in inspector.get_indexes(table.name)
+                    }
+                    self.assertGreater(len(expected), 0)
+                    self.assertTrue(expected.issubset(actual))
+
+
+class TestDbClaim(TestCase):
+    """Tests for claiming of deferred feedback results by evaluators."""
+
+    def test_claim_sqlite_file(self) -> None:
+        """Test claims on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_claim(self, db)
+
+    def test_claim_postgres(self) -> None:
+        """Test claims on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_claim(self, db)
+
+    def test_claim_mysql(self) -> None:
+        """Test claims on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_claim(self, db)
+
+    def test_evaluator_lease_sqlite_file(self) -> None:
+        """Test that evaluations outliving their lease are not restarted."""
+        with clean_db("sqlite_file") as db:
+            _test_evaluator_lease(self, db)
+
+
+class TestDbStreaming(TestCase):
+    """Tests for reading records and feedback results in chunks."""
+
+    def test_streaming_sqlite_file(self) -> None:
+        """Test chunked reads on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_streaming(self, db)
+
+    def test_streaming_postgres(self) -> None:
+        """Test chunked reads on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_streaming(self, db)
+
+    def test_streaming_mysql(self) -> None:
+        """Test chunked reads on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_streaming(self, db)
+
+
+class TestDbLeaderboard(TestCase):
+    """Tests for aggregating the leaderboard in the database."""
+
+    def test_leaderboard_sqlite_file(self) -> None:
+        """Test leaderboard on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_leaderboard(self, db)
+
+    def test_leaderboard_postgres(self) -> None:
+        """Test leaderboard on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_leaderboard(self, db)
+
+    def test_leaderboard_mysql(self) -> None:
+        """Test leaderboard on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_leaderboard(self, db)
+
+
+class TestDbDenormalizedColumns(TestCase):
+    """Tests for the latency, token and cost columns of records and feedback
+    results."""
+
+    def test_denormalized_sqlite_file(self) -> None:
+        """Test columns on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_denormalized(self, db)
+
+    def test_denormalized_postgres(self) -> None:
+        """Test columns on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_denormalized(self, db)
+
+    def test_denormalized_mysql(self) -> None:
+        """Test columns on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_denormalized(self, db)
+
+
+class TestDbGetFeedback(TestCase):
+    """Tests for reading feedback results with their records, apps and
+    definitions."""
+
+    def test_get_feedback_sqlite_file(self) -> None:
+        """Test get_feedback on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_get_feedback(self, db)
+
+    def test_get_feedback_postgres(self) -> None:
+        """Test get_feedback on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_get_feedback(self, db)
+
+    def test_get_feedback_mysql(self) -> None:
+        """Test get_feedback on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_get_feedback(self, db)
+
+
+class TestDbHighWaterMark(TestCase):
+    """Tests for the high-water mark and reading the records changed since."""
+
+    def test_high_water_mark_sqlite_file(self) -> None:
+        """Test the high-water mark on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_high_water_mark(self, db)
+
+    def test_high_water_mark_postgres(self) -> None:
+        """Test the high-water mark on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_high_water_mark(self, db)
+
+    def test_high_water_mark_mysql(self) -> None:
+        """Test the high-water mark on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_high_water_mark(self, db)
+
+
+class TestDbFeedbackCounts(TestCase):
+    """Tests for the incrementally maintained feedback counts."""
+
+    def test_feedback_counts_sqlite_file(self) -> None:
+        """Test feedback counts on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_feedback_counts(self, db)
+
+    def test_feedback_counts_postgres(self) -> None:
+        """Test feedback counts on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_feedback_counts(self, db)
+
+    def test_feedback_counts_mysql(self) -> None:
+        """Test feedback counts on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_feedback_counts(self, db)
+
+    def test_concurrent_feedback_counts_sqlite_file(self) -> None:
+        """Test feedback counts under concurrent writes on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_feedback_counts_concurrent(self, db)
+
+    def test_concurrent_feedback_counts_postgres(self) -> None:
+        """Test feedback counts under concurrent writes on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_feedback_counts_concurrent(self, db)
+
+    def test_concurrent_feedback_counts_mysql(self) -> None:
+        """Test feedback counts under concurrent writes on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_feedback_counts_concurrent(self, db)
+
+    def test_concurrent_new_feedback_counts_sqlite_file(self) -> None:
+        """Test feedback counts under concurrent inserts on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_feedback_counts_concurrent_insert(self, db)
+
+    def test_concurrent_new_feedback_counts_postgres(self) -> None:
+        """Test feedback counts under concurrent inserts on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_feedback_counts_concurrent_insert(self, db)
+
+    def test_concurrent_new_feedback_counts_mysql(self) -> None:
+        """Test feedback counts under concurrent inserts on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_feedback_counts_concurrent_insert(self, db)
+
+
+class TestDbCodec(TestCase):
+    """Tests for records and feedback results written with a storage
+    codec."""
+
+    def test_codec_sqlite_file(self) -> None:
+        """Test codec on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_codec(self, db)
+
+    def test_codec_postgres(self) -> None:
+        """Test codec on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_codec(self, db)
+
+    def test_codec_mysql(self) -> None:
+        """Test codec on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_codec(self, db)
+
+
+class TestDbRetention(TestCase):
+    """Tests for deleting and archiving expired records."""
+
+    def test_retention_sqlite_file(self) -> None:
+        """Test retention on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_retention(self, db)
+
+    def test_retention_postgres(self) -> None:
+        """Test retention on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_retention(self, db)
+
+    def test_retention_mysql(self) -> None:
+        """Test retention on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_retention(self, db)
+
+
+@skipIf(is_dummy(mod_export.pyarrow), "pyarrow not installed")
+class TestDbExport(TestCase):
+    """Tests for the columnar export and import of records."""
+
+    def test_export_sqlite_file(self) -> None:
+        """Test export on sqlite db."""
+        with clean_db("sqlite_file") as db:
+            _test_db_export(self, db)
+
+    def test_export_postgres(self) -> None:
+        """Test export on postgres db."""
+        with clean_db("postgres") as db:
+            _test_db_export(self, db)
+
+    def test_export_mysql(self) -> None:
+        """Test export on mysql db."""
+        with clean_db("mysql") as db:
+            _test_db_export(self, db)
+
+
+class TestDbSQLite(TestCase):
+    """Tests for the high-concurrency mode of file-based SQLite databases."""
+
+    def test_concurrent_writes(self) -> None:
+        """Test many threads writing and reading at once."""
+        with clean_db("sqlite_file") as db:
+            _test_db_sqlite_concurrency(self, db)
+
+    def test_disabled(self) -> None:
+        """Test that connections are left as is without sqlite options."""
+        with clean_db("sqlite_file", sqlite=None) as db:
+            db.migrate_database()
+
+            with db.engine.connect() as conn:
+                journal_mode = conn.execute(
+                    sa.text("PRAGMA journal_mode")
+                ).scalar()
+            self.assertEqual(journal_mode, "delete")
+            self.assertIsNone(db._writer)
+
+
+class TestDbReplica(TestCase):
+    """Tests for the routing of reads to read replicas."""
+
+    def test_replica_sqlite_file(self) -> None:
+        """Test reads from a snapshot of a sqlite db as replica."""
+        with TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            replica = Path(tmp) / "replica.sqlite"
+            options = ReplicaOptions(
+                urls=[f"sqlite:///{replica}"],
+                max_staleness=0.2,
+                check_interval=0.0,
+            )
+            with clean_db("sqlite_file", read_replicas=options) as db:
+                _test_db_replica(self, db, replica)
+
+    def test_unreachable(self) -> None:
+        """Test that reads fall back to the primary if a replica fails."""
+        with TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+            options = ReplicaOptions(
+                urls=[f"sqlite:///{Path(tmp) / 'missing' / 'replica.sqlite'}"]
+            )
+            with clean_db("sqlite_file", read_replicas=options) as db:
+                db.migrate_database()
+                options.read_your_writes = False
+
+                self.assertEqual(list(db.get_apps()), [])
+                self.assertEqual(list(db.get_apps()), [])
+
+                stats = db._replicas.stats
+                self.assertEqual(stats.replica_reads, 0)
+                self.assertEqual(stats.primary_reads, 2)
+                # Not retried within the retry interval.
+                self.assertEqual(stats.failures, 1)
+
+            db._replicas.dispose()
+
+
 class MockFeedback(Provider):
     """Provider for testing purposes."""
 
@@ -467,6 +884,1430 @@ def _test_db_consistency(test: TestCase, db: SQLAlchemyDB):
         )
 
 
+def _test_db_upsert(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="upsert_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    test.assertEqual(db.insert_app(app), app.app_id)
+    test.assertEqual(db.insert_app(app), app.app_id)
+
+    record = Record(app_id=app.app_id, main_input="in", main_output="out1")
+    db.insert_record(record)
+    record.main_output = "out2"
+    db.insert_record(record)
+
+    others = [
+        Record(app_id=app.app_id, main_input=str(i), main_output=str(i))
+        for i in range(50)
+    ]
+    # Includes an update of `record` and new records:
+    record.main_output = "out3"
+    db.batch_insert_record(others + [record])
+
+    with db.session.begin() as session:
+        rows = session.query(db.orm.Record).all()
+        test.assertEqual(len(rows), 51)
+        row = (
+            session.query(db.orm.Record)
+            .filter_by(record_id=record.record_id)
+            .one()
+        )
+        test.assertEqual(row.output, '"out3"')
+
+    result = FeedbackResult(
+        feedback_definition_id="fdef",
+        record_id=record.record_id,
+        name="fname",
+        status=FeedbackResultStatus.RUNNING,
+    )
+    db.insert_feedback(result)
+    result.status = FeedbackResultStatus.DONE
+    result.result = 0.5
+    db.batch_insert_feedback([result])
+
+    with db.session.begin() as session:
+        rows = session.query(db.orm.FeedbackResult).all()
+        test.assertEqual(len(rows), 1)
+        test.assertEqual(rows[0].status, FeedbackResultStatus.DONE.value)
+        test.assertEqual(rows[0].result, 0.5)
+
+
+def _test_db_claim(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="claim_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    record = Record(app_id=app.app_id, main_input="in", main_output="out")
+    db.insert_record(record)
+
+    results = [
+        FeedbackResult(
+            feedback_definition_id=feedback_definition.feedback_definition_id,
+            record_id=record.record_id,
+            name="fname",
+        )
+        for _ in range(40)
+    ]
+    db.batch_insert_feedback(results)
+
+    # Concurrent evaluators claim disjoint sets of feedback results.
+    claims: Dict[str, List[str]] = {}
+
+    def claim(worker: str):
+        claims[worker] = []
+        while True:
+            claimed = db.claim_feedback(
+                claimed_by=worker, lease_seconds=60, limit=3
+            )
+            if len(claimed) == 0:
+                return
+            claims[worker].extend(claimed.feedback_result_id)
+
+    workers = [
+        threading.Thread(target=claim, args=(f"worker{i}",)) for i in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    claimed_ids = [
+        feedback_result_id
+        for worker_ids in claims.values()
+        for feedback_result_id in worker_ids
+    ]
+    test.assertEqual(len(claimed_ids), len(results))
+    test.assertEqual(set(claimed_ids), {r.feedback_result_id for r in results})
+
+    test.assertEqual(
+        db.get_feedback_count_by_status(),
+        {FeedbackResultStatus.RUNNING: len(results)},
+    )
+
+    # Leases are renewed only by their holder. Depending on scheduling, some
+    # workers may not have claimed anything.
+    holder = max(claims, key=lambda worker: len(claims[worker]))
+    other = next(worker for worker in claims if worker != holder)
+    holder_ids = claims[holder]
+    test.assertEqual(
+        db.renew_feedback_leases(
+            holder_ids, claimed_by=holder, lease_seconds=60
+        ),
+        len(holder_ids),
+    )
+    test.assertEqual(
+        db.renew_feedback_leases(
+            holder_ids, claimed_by=other, lease_seconds=60
+        ),
+        0,
+    )
+
+    # Expired leases can be claimed by others.
+    db.renew_feedback_leases(holder_ids, claimed_by=holder, lease_seconds=-1)
+    reclaimed = db.claim_feedback(claimed_by=other, lease_seconds=60)
+    test.assertEqual(set(reclaimed.feedback_result_id), set(holder_ids))
+
+    # Released results that failed are claimed again after the retry period.
+    failed = next(
+        r for r in results if r.feedback_result_id == holder_ids[0]
+    ).model_copy()
+    failed.status = FeedbackResultStatus.FAILED
+    db.insert_feedback(failed)
+    db.release_feedback([failed.feedback_result_id], claimed_by=other)
+
+    test.assertEqual(
+        len(
+            db.claim_feedback(
+                claimed_by="worker2",
+                lease_seconds=60,
+                retry_failed_seconds=60,
+            )
+        ),
+        0,
+    )
+    test.assertEqual(
+        list(
+            db.claim_feedback(
+                claimed_by="worker2",
+                lease_seconds=60,
+                retry_failed_seconds=-1,
+            ).feedback_result_id
+        ),
+        [failed.feedback_result_id],
+    )
+
+
+def _test_evaluator_lease(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="lease_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    record = Record(app_id=app.app_id, main_input="in", main_output="out")
+    db.insert_record(record)
+
+    result = FeedbackResult(
+        feedback_definition_id=feedback_definition.feedback_definition_id,
+        record_id=record.record_id,
+        name="fname",
+    )
+    db.insert_feedback(result)
+
+    lease_seconds = 1.0
+    evaluated: List[str] = []
+    reclaimed: List[str] = []
+
+    def run_and_log(feedback_result_id: str, **kwargs):
+        evaluated.append(feedback_result_id)
+
+        # Run for several leases while another evaluator tries to claim the
+        # feedback.
+        deadline = time.monotonic() + 4 * lease_seconds
+        while time.monotonic() < deadline:
+            reclaimed.extend(
+                db.claim_feedback(
+                    claimed_by="other",
+                    lease_seconds=lease_seconds,
+                    retry_running_seconds=lease_seconds,
+                ).feedback_result_id
+            )
+            time.sleep(lease_seconds / 4)
+
+        done = result.model_copy(
+            update=dict(status=FeedbackResultStatus.DONE, result=1.0)
+        )
+        db.insert_feedback(done)
+        return done
+
+    session = TruSession()
+    session.connector.db = db
+    retry_running_seconds = session.RETRY_RUNNING_SECONDS
+    session.RETRY_RUNNING_SECONDS = lease_seconds
+
+    try:
+        with mock.patch.object(
+            mod_feedback,
+            "_deferred_feedback",
+            return_value=mock.Mock(run_and_log=run_and_log),
+        ):
+            session._evaluator_loop(
+                stop=threading.Event(),
+                disable_tqdm=True,
+                stop_when_none_left=True,
+            )
+    finally:
+        session.RETRY_RUNNING_SECONDS = retry_running_seconds
+
+    test.assertEqual(evaluated, [result.feedback_result_id])
+    test.assertEqual(reclaimed, [])
+    test.assertEqual(
+        db.get_feedback_count_by_status(), {FeedbackResultStatus.DONE: 1}
+    )
+
+
+def _test_db_streaming(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="streaming_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    # Records sharing timestamps so that pagination relies on record ids to
+    # break ties.
+    ts = datetime(2024, 1, 1)
+    records = [
+        Record(
+            app_id=app.app_id,
+            main_input=f"in{i}",
+            main_output=f"out{i}",
+            ts=ts + timedelta(seconds=i // 3),
+        )
+        for i in range(25)
+    ]
+    db.batch_insert_record(records)
+    db.batch_insert_feedback([
+        FeedbackResult(
+            feedback_definition_id=feedback_definition.feedback_definition_id,
+            record_id=record.record_id,
+            name="fname",
+            result=float(i),
+            status=FeedbackResultStatus.DONE,
+        )
+        for i, record in enumerate(records)
+    ])
+
+    full, full_feedback_columns = db.get_records_and_feedback()
+    test.assertEqual(len(full), len(records))
+    test.assertEqual(list(full_feedback_columns), ["fname"])
+
+    chunks = list(db.iter_records_and_feedback(chunk_size=10))
+    test.assertEqual([len(df) for df, _ in chunks], [10, 10, 5])
+
+    streamed = pd.concat([df for df, _ in chunks], ignore_index=True)
+    test.assertEqual(list(streamed.record_id), list(full.record_id))
+    test.assertEqual(list(streamed.fname), list(full.fname))
+    test.assertEqual(list(streamed.type), list(full.type))
+
+    # Serialized records and apps are only read if requested.
+    test.assertNotIn("record_json", streamed.columns)
+    test.assertNotIn("app_json", streamed.columns)
+    test.assertNotIn("fname_calls", streamed.columns)
+    for col in ["latency", "total_tokens", "total_cost"]:
+        test.assertIn(col, streamed.columns)
+
+    df, _ = next(
+        db.iter_records_and_feedback(
+            columns=["record_id", "record_json"], chunk_size=5
+        )
+    )
+    test.assertEqual(
+        Record.model_validate_json(df.record_json[0]).record_id,
+        full.record_id[0],
+    )
+    test.assertNotIn("input", df.columns)
+
+    # Continue after the last row of a prior chunk.
+    last = chunks[0][0].iloc[-1]
+    rest = pd.concat(
+        [
+            df
+            for df, _ in db.iter_records_and_feedback(
+                after=(last.ts, last.record_id), chunk_size=7
+            )
+        ],
+        ignore_index=True,
+    )
+    test.assertEqual(list(rest.record_id), list(full.record_id[10:]))
+
+    test.assertEqual(
+        list(db.iter_records_and_feedback(app_ids=["no_such_app"])), []
+    )
+
+    # Only the given records.
+    record_ids = list(full.record_id[3:5])
+    test.assertEqual(
+        [
+            record_id
+            for df, _ in db.iter_records_and_feedback(record_ids=record_ids)
+            for record_id in df.record_id
+        ],
+        record_ids,
+    )
+
+    with test.assertRaises(ValueError):
+        next(db.iter_records_and_feedback(columns=["no_such_column"]))
+
+
+def _test_db_leaderboard(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    def feedback_result(record: Record, **kwargs) -> FeedbackResult:
+        return FeedbackResult(
+            feedback_definition_id=feedback_definition.feedback_definition_id,
+            record_id=record.record_id,
+            status=FeedbackResultStatus.DONE,
+            **kwargs,
+        )
+
+    app_ids = []
+    for a in range(2):
+        app = AppDefinition(
+            app_name=f"leaderboard_app{a}",
+            app_version="v1",
+            root_class=Class.of_object(db),
+            app={},
+        )
+        db.insert_app(app)
+        app_ids.append(app.app_id)
+
+        for i in range(6):
+            start = datetime(2024, 1, 1, 0, 0, i)
+            record = Record(
+                app_id=app.app_id,
+                main_input="in",
+                main_output="out",
+                meta={"group": f"g{i % 2}"} if i < 4 else None,
+                cost=Cost(cost=0.01 * i, n_tokens=10 * i),
+                perf=Perf(
+                    start_time=start, end_time=start + timedelta(seconds=i)
+                ),
+            )
+            db.insert_record(record)
+
+            results = [
+                feedback_result(record, name="fname", result=(i + a) / 10)
+            ]
+            if i % 2 == 1:
+                # Repeated evaluations are averaged within the record first.
+                results.append(
+                    feedback_result(record, name="fname", result=0.5)
+                )
+            if i % 3 == 0:
+                results.append(
+                    feedback_result(
+                        record,
+                        name="multi",
+                        multi_result=json.dumps({"x": i / 10, "y": None}),
+                    )
+                )
+            db.batch_insert_feedback(results)
+
+    for key in [None, "group"]:
+        df, feedback_cols = db.get_leaderboard(group_by_metadata_key=key)
+        expected, expected_feedback_cols = db._leaderboard_from_frames(
+            group_by_metadata_key=key
+        )
+
+        test.assertEqual(list(feedback_cols), ["fname", "multi:::x"])
+        test.assertEqual(list(feedback_cols), list(expected_feedback_cols))
+        test.assertEqual(list(df.columns), list(expected.columns))
+        test.assertEqual(len(df), 2 if key is None else 4)
+
+        pd.testing.assert_frame_equal(
+            df.sort_index(),
+            expected.sort_index(),
+            check_dtype=False,
+        )
+
+    df, _ = db.get_leaderboard(app_ids=app_ids[:1])
+    test.assertEqual(list(df.index), app_ids[:1])
+    test.assertEqual(df.n_records.iloc[0], 6)
+    test.assertAlmostEqual(df.latency.iloc[0], 2.5)
+    test.assertAlmostEqual(df.sum_cost.iloc[0], 0.15)
+    test.assertEqual(df.sum_tokens.iloc[0], 150)
+
+
+def _test_db_denormalized(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="denormalized_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    start = datetime(2024, 1, 1)
+    records = [
+        Record(
+            app_id=app.app_id,
+            main_input="in",
+            main_output="out",
+            cost=Cost(cost=0.5 * i, n_tokens=10 * i),
+            perf=Perf(
+                start_time=start,
+                end_time=start + timedelta(seconds=i, milliseconds=250),
+            ),
+        )
+        for i in range(5)
+    ]
+    db.batch_insert_record(records)
+    db.batch_insert_feedback([
+        FeedbackResult(
+            feedback_definition_id=feedback_definition.feedback_definition_id,
+            record_id=record.record_id,
+            name="fname",
+            result=0.5,
+            cost=Cost(cost=0.25, n_tokens=7),
+            status=FeedbackResultStatus.DONE,
+        )
+        for record in records
+    ])
+
+    def check():
+        with db.session.begin() as session:
+            for i, record in enumerate(records):
+                row = session.get(db.orm.Record, record.record_id)
+                test.assertAlmostEqual(row.latency_s, i + 0.25)
+                test.assertAlmostEqual(row.start_ts, start.timestamp())
+                test.assertEqual(row.n_tokens, 10 * i)
+                test.assertAlmostEqual(row.cost, 0.5 * i)
+
+            for row in session.query(db.orm.FeedbackResult):
+                test.assertEqual(row.n_tokens, 7)
+                test.assertAlmostEqual(row.cost, 0.25)
+
+    # Filled on insert.
+    check()
+
+    df, _ = db.get_records_and_feedback()
+    test.assertEqual(list(df.latency), [i + 0.25 for i in range(5)])
+    test.assertEqual(list(df.total_tokens), [10 * i for i in range(5)])
+
+    # Backfilled for rows written before the columns existed.
+    with db.session.begin() as session:
+        for orm_class in [db.orm.Record, db.orm.FeedbackResult]:
+            session.execute(
+                sa.update(orm_class).values(n_tokens=None, cost=None)
+            )
+        session.execute(
+            sa.update(db.orm.Record).values(latency_s=None, start_ts=None)
+        )
+
+    migrate_alembic_3_to_10(db, batch_size=2)
+
+    check()
+
+
+def _test_db_get_feedback(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    feedback_definitions = [
+        FeedbackDefinition(
+            supplied_name=f"fname{f}", feedback_definition_id=f"fdef{f}"
+        )
+        for f in range(2)
+    ]
+    for feedback_definition in feedback_definitions:
+        db.insert_feedback_definition(feedback_definition)
+
+    results = []
+    for a in range(2):
+        app = AppDefinition(
+            app_name=f"get_feedback_app{a}",
+            app_version="v1",
+            root_class=Class.of_object(db),
+            app={},
+        )
+        db.insert_app(app)
+
+        records = [
+            Record(app_id=app.app_id, main_input="in", main_output=f"out{i}")
+            for i in range(10)
+        ]
+        db.batch_insert_record(records)
+
+        results.extend(
+            FeedbackResult(
+                feedback_definition_id=feedback_definition.feedback_definition_id,
+                record_id=record.record_id,
+                name=feedback_definition.name,
+            )
+            for record in records
+            for feedback_definition in feedback_definitions
+        )
+    db.batch_insert_feedback(results)
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sa.event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        df = db.get_feedback()
+    finally:
+        sa.event.remove(db.engine, "before_cursor_execute", count)
+
+    test.assertEqual(len(df), len(results))
+
+    # One query each for the feedback results, their records, apps and
+    # definitions regardless of the number of rows.
+    test.assertLessEqual(len(statements), 4)
+
+    by_id = df.set_index("feedback_result_id")
+    for result in results:
+        row = by_id.loc[result.feedback_result_id]
+        test.assertEqual(row.record_id, result.record_id)
+        test.assertEqual(row.record_json["record_id"], result.record_id)
+        test.assertEqual(row.app_json["app_id"], row.record_json["app_id"])
+        test.assertEqual(row.type, Class.of_object(db))
+        test.assertEqual(row.feedback_json["supplied_name"], result.name)
+
+
+def _test_db_high_water_mark(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    test.assertEqual(db.get_high_water_mark(), HighWaterMark())
+
+    db.insert_feedback_definition(
+        FeedbackDefinition(supplied_name="fname", feedback_definition_id="fdef")
+    )
+    app = AppDefinition(
+        app_name="high_water_mark_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    start = datetime(2024, 1, 1)
+    records = [
+        Record(
+            app_id=app.app_id,
+            main_input="in",
+            main_output=f"out{i}",
+            ts=start + timedelta(minutes=i),
+        )
+        for i in range(3)
+    ]
+    db.batch_insert_record(records)
+
+    def changed_since(mark: HighWaterMark) -> List[str]:
+        df, _ = db.get_records_and_feedback(since=mark)
+        changed = list(df["record_id"])
+
+        test.assertEqual(
+            [
+                record_id
+                for df, _ in db.iter_records_and_feedback(
+                    since=mark, chunk_size=2
+                )
+                for record_id in df.record_id
+            ],
+            changed,
+        )
+
+        return changed
+
+    mark = db.get_high_water_mark()
+    test.assertEqual(mark.first_record_ts, start.timestamp())
+    test.assertEqual(
+        mark.last_record_ts, (start + timedelta(minutes=2)).timestamp()
+    )
+    test.assertIsNone(mark.last_feedback_ts)
+    test.assertEqual(mark.n_feedback_results, 0)
+    test.assertEqual(mark.n_records, len(records))
+
+    # Unchanged without writes.
+    test.assertEqual(db.get_high_water_mark(), mark)
+    test.assertEqual(changed_since(mark), [])
+    test.assertEqual(
+        changed_since(HighWaterMark()),
+        [record.record_id for record in records],
+    )
+
+    # Writing feedback results of old records moves the mark and selects
+    # these records.
+    db.insert_feedback(
+        FeedbackResult(
+            feedback_definition_id="fdef",
+            record_id=records[0].record_id,
+            name="fname",
+            result=0.5,
+            status=FeedbackResultStatus.DONE,
+        )
+    )
+    feedback_mark = db.get_high_water_mark()
+    test.assertEqual(feedback_mark.last_record_ts, mark.last_record_ts)
+    test.assertIsNotNone(feedback_mark.last_feedback_ts)
+    test.assertEqual(feedback_mark.n_feedback_results, 1)
+    test.assertEqual(changed_since(mark), [records[0].record_id])
+    test.assertEqual(changed_since(feedback_mark), [])
+
+    # As do new records.
+    new_record = Record(
+        app_id=app.app_id,
+        main_input="in",
+        main_output="new",
+        ts=start + timedelta(minutes=3),
+    )
+    db.insert_record(new_record)
+    new_mark = db.get_high_water_mark()
+    test.assertGreater(new_mark.last_record_ts, feedback_mark.last_record_ts)
+    test.assertEqual(changed_since(feedback_mark), [new_record.record_id])
+
+    test.assertEqual(new_mark.n_records, len(records) + 1)
+
+    # Deleting the oldest records moves the first record timestamp.
+    db.apply_retention(RetentionPolicy(max_records_per_app=2))
+    retained_mark = db.get_high_water_mark()
+    test.assertGreater(retained_mark.first_record_ts, new_mark.first_record_ts)
+    test.assertEqual(retained_mark.n_records, 2)
+
+    # Deleting the records of an app that are not the oldest drops the number
+    # of records.
+    other_app = AppDefinition(
+        app_name="high_water_mark_other_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(other_app)
+    db.insert_record(
+        Record(
+            app_id=other_app.app_id,
+            main_input="in",
+            main_output="other",
+            ts=start + timedelta(minutes=4),
+        )
+    )
+    db.delete_app(other_app.app_id)
+    deleted_mark = db.get_high_water_mark()
+    test.assertEqual(
+        deleted_mark.first_record_ts, retained_mark.first_record_ts
+    )
+    test.assertEqual(deleted_mark.n_records, 2)
+
+
+def _test_db_feedback_counts(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    def assert_counts(**kwargs):
+        # Counts read from the feedback counts table must match counts of the
+        # feedback results, which are used when filtering by record.
+        counted = db.get_feedback_count_by_status(**kwargs)
+        with db.session.begin() as session:
+            grouped = {
+                FeedbackResultStatus(row[0]): row[1]
+                for row in session.execute(
+                    db._feedback_query(count_by_status=True, **kwargs)
+                )
+            }
+        test.assertEqual(counted, grouped)
+        return counted
+
+    feedback_definitions = [
+        FeedbackDefinition(
+            supplied_name=f"fname{f}", feedback_definition_id=f"fdef{f}"
+        )
+        for f in range(2)
+    ]
+    for feedback_definition in feedback_definitions:
+        db.insert_feedback_definition(feedback_definition)
+
+    apps = []
+    results = []
+    for a in range(2):
+        app = AppDefinition(
+            app_name=f"counts_app{a}",
+            app_version="v1",
+            root_class=Class.of_object(db),
+            app={},
+        )
+        db.insert_app(app)
+        apps.append(app)
+
+        records = [
+            Record(app_id=app.app_id, main_input="in", main_output=f"out{i}")
+            for i in range(5)
+        ]
+        db.batch_insert_record(records)
+
+        results.extend(
+            FeedbackResult(
+                feedback_definition_id=feedback_definition.feedback_definition_id,
+                record_id=record.record_id,
+                name=feedback_definition.name,
+            )
+            for record in records
+            for feedback_definition in feedback_definitions
+        )
+    db.batch_insert_feedback(results)
+
+    test.assertEqual(assert_counts(), {FeedbackResultStatus.NONE: len(results)})
+    test.assertEqual(
+        assert_counts(feedback_definition_id="fdef0"),
+        {FeedbackResultStatus.NONE: len(results) // 2},
+    )
+
+    # Upserts move results between statuses.
+    for result in results[:3]:
+        result.status = FeedbackResultStatus.DONE
+        result.result = 1.0
+        db.insert_feedback(result)
+    results[3].status = FeedbackResultStatus.FAILED
+    db.batch_insert_feedback([results[3], results[3]])
+
+    test.assertEqual(
+        assert_counts(),
+        {
+            FeedbackResultStatus.NONE: len(results) - 4,
+            FeedbackResultStatus.DONE: 3,
+            FeedbackResultStatus.FAILED: 1,
+        },
+    )
+    assert_counts(
+        status=[FeedbackResultStatus.DONE, FeedbackResultStatus.FAILED]
+    )
+
+    # Claims move results to running.
+    claimed = db.claim_feedback(claimed_by="worker", lease_seconds=60, limit=4)
+    test.assertEqual(len(claimed), 4)
+    test.assertEqual(
+        assert_counts()[FeedbackResultStatus.RUNNING], len(claimed)
+    )
+
+    # Deleting an app deletes the results of its records.
+    db.delete_app(apps[0].app_id)
+    counts = assert_counts()
+    test.assertEqual(sum(counts.values()), len(results) // 2)
+
+    # Rebuilding from the feedback results gives the same counts.
+    db.rebuild_feedback_counts()
+    test.assertEqual(assert_counts(), counts)
+
+
+def _test_db_feedback_counts_concurrent(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="concurrent_counts_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    record = Record(app_id=app.app_id, main_input="in", main_output="out")
+    db.insert_record(record)
+
+    results = [
+        FeedbackResult(
+            feedback_definition_id=feedback_definition.feedback_definition_id,
+            record_id=record.record_id,
+            name="fname",
+        )
+        for _ in range(20)
+    ]
+    db.batch_insert_feedback(results)
+
+    # Writers move the same results to different statuses at the same time.
+    statuses = [
+        FeedbackResultStatus.DONE,
+        FeedbackResultStatus.FAILED,
+        FeedbackResultStatus.RUNNING,
+        FeedbackResultStatus.NONE,
+    ]
+    barrier = threading.Barrier(len(statuses))
+    errors: List[Exception] = []
+
+    def write(status: FeedbackResultStatus):
+        try:
+            barrier.wait(10)
+            for _ in range(10):
+                db.batch_insert_feedback([
+                    result.model_copy(update=dict(status=status))
+                    for result in results
+                ])
+        except Exception as e:
+            errors.append(e)
+
+    writers = [
+        threading.Thread(target=write, args=(status,)) for status in statuses
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    test.assertEqual(errors, [])
+
+    # Each prior status was counted out by exactly one writer.
+    counts = db.get_feedback_count_by_status()
+    test.assertEqual(sum(counts.values()), len(results))
+
+    db.rebuild_feedback_counts()
+    test.assertEqual(db.get_feedback_count_by_status(), counts)
+
+
+def _test_db_feedback_counts_concurrent_insert(
+    test: TestCase, db: SQLAlchemyDB
+):
+    db.migrate_database()
+
+    app = AppDefinition(
+        app_name="concurrent_insert_counts_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    feedback_definition = FeedbackDefinition(supplied_name="fname")
+    db.insert_feedback_definition(feedback_definition)
+
+    record = Record(app_id=app.app_id, main_input="in", main_output="out")
+    db.insert_record(record)
+
+    rounds = [
+        [
+            FeedbackResult(
+                feedback_definition_id=feedback_definition.feedback_definition_id,
+                record_id=record.record_id,
+                name="fname",
+            )
+            for _ in range(20)
+        ]
+        for _ in range(10)
+    ]
+
+    # Writers insert the same new results with different statuses at the
+    # same time, so none of them finds the results already in the table.
+    statuses = [
+        FeedbackResultStatus.DONE,
+        FeedbackResultStatus.FAILED,
+        FeedbackResultStatus.RUNNING,
+        FeedbackResultStatus.NONE,
+    ]
+    barrier = threading.Barrier(len(statuses))
+    errors: List[Exception] = []
+
+    def write(status: FeedbackResultStatus):
+        try:
+            for results in rounds:
+                barrier.wait(10)
+                db.batch_insert_feedback([
+                    result.model_copy(update=dict(status=status))
+                    for result in results
+                ])
+        except Exception as e:
+            errors.append(e)
+
+    writers = [
+        threading.Thread(target=write, args=(status,)) for status in statuses
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    test.assertEqual(errors, [])
+
+    # Each new result was counted in by exactly one writer.
+    counts = db.get_feedback_count_by_status()
+    test.assertEqual(
+        sum(counts.values()), sum(len(results) for results in rounds)
+    )
+
+    db.rebuild_feedback_counts()
+    test.assertEqual(db.get_feedback_count_by_status(), counts)
+
+
+def _test_db_codec(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    feedback_definition = FeedbackDefinition(
+        supplied_name="fname", feedback_definition_id="fdef"
+    )
+    db.insert_feedback_definition(feedback_definition)
+
+    app = AppDefinition(
+        app_name="codec_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    context = "retrieved context " * 200
+
+    def make_records(n: int, offset: int = 0):
+        return [
+            Record(
+                app_id=app.app_id,
+                main_input="in",
+                main_output=f"out{i}",
+                meta={"variant": str(i % 2), "context": context},
+            )
+            for i in range(offset, offset + n)
+        ]
+
+    def make_results(records):
+        return [
+            FeedbackResult(
+                feedback_definition_id="fdef",
+                record_id=record.record_id,
+                name="fname",
+                result=0.5,
+                status=FeedbackResultStatus.DONE,
+                calls=[
+                    FeedbackCall(
+                        args={"context": context, "i": record.main_output},
+                        ret=0.5,
+                    )
+                ],
+            )
+            for record in records
+        ]
+
+    # Rows written with and without a codec can be mixed.
+    plain_records = make_records(2)
+    db.batch_insert_record(plain_records)
+    db.batch_insert_feedback(make_results(plain_records))
+
+    db.codec = StorageCodec(compression=Compression.ZLIB)
+
+    records = make_records(10, offset=2)
+    db.insert_record(records[0])
+    db.batch_insert_record(records[1:])
+    results = make_results(records)
+    db.insert_feedback(results[0])
+    db.batch_insert_feedback(results[1:])
+
+    records = plain_records + records
+
+    with db.session.begin() as session:
+        # The context is stored once for all records and feedback calls.
+        test.assertEqual(
+            session.execute(
+                sa.select(sa.func.count()).select_from(db.orm.Blob)
+            ).scalar(),
+            1,
+        )
+        stored = session.execute(
+            sa.select(db.orm.Record.record_json).where(
+                db.orm.Record.record_id == records[-1].record_id
+            )
+        ).scalar()
+        test.assertNotIn("retrieved context", stored)
+
+    df, feedback_cols = db.get_records_and_feedback()
+    test.assertEqual(len(df), len(records))
+    test.assertEqual(list(feedback_cols), ["fname"])
+    by_id = df.set_index("record_id")
+    for record in records:
+        row = by_id.loc[record.record_id]
+        test.assertEqual(
+            Record.model_validate_json(row.record_json).meta, record.meta
+        )
+        test.assertEqual(row.fname_calls[0]["args"]["context"], context)
+
+    df = db.get_feedback()
+    test.assertEqual(len(df), len(records))
+    for _, row in df.iterrows():
+        test.assertEqual(row.record_json["meta"]["context"], context)
+        test.assertEqual(row.calls_json[0]["args"]["context"], context)
+
+    def check_leaderboard():
+        # Grouped in SQL by the unencoded metadata column.
+        with mock.patch.object(
+            db, "_leaderboard_from_frames", side_effect=AssertionError
+        ):
+            leaderboard, _ = db.get_leaderboard(group_by_metadata_key="variant")
+
+        test.assertEqual(
+            sorted(leaderboard.index.get_level_values("variant")), ["0", "1"]
+        )
+        test.assertEqual(leaderboard["n_records"].sum(), len(records))
+
+    check_leaderboard()
+
+    # Backfilled from encoded records for rows written before the column
+    # existed.
+    with db.session.begin() as session:
+        session.execute(sa.update(db.orm.Record).values(meta=None))
+
+    migrate_alembic_11_to_13(db, batch_size=5)
+
+    with db.session.begin() as session:
+        for record in records:
+            test.assertEqual(
+                json.loads(session.get(db.orm.Record, record.record_id).meta),
+                record.meta,
+            )
+
+    check_leaderboard()
+
+
+def _test_db_retention(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    feedback_definition = FeedbackDefinition(
+        supplied_name="fname", feedback_definition_id="fdef"
+    )
+    db.insert_feedback_definition(feedback_definition)
+
+    now = datetime.now()
+    apps = []
+    records = []
+    for a in range(2):
+        app = AppDefinition(
+            app_name=f"retention_app{a}",
+            app_version="v1",
+            root_class=Class.of_object(db),
+            app={},
+        )
+        db.insert_app(app)
+        apps.append(app)
+
+        # One record per day, the oldest first.
+        app_records = [
+            Record(
+                app_id=app.app_id,
+                main_input="in",
+                main_output=f"out{i}",
+                ts=now - timedelta(days=20 - i),
+            )
+            for i in range(20)
+        ]
+        db.batch_insert_record(app_records)
+        records.extend(app_records)
+
+    failed_record = records[0]
+    db.batch_insert_feedback([
+        FeedbackResult(
+            feedback_definition_id="fdef",
+            record_id=record.record_id,
+            name="fname",
+            result=0.5,
+            status=FeedbackResultStatus.FAILED
+            if record is failed_record
+            else FeedbackResultStatus.DONE,
+        )
+        for record in records
+    ])
+
+    def record_ids():
+        df, _ = db.get_records_and_feedback()
+        return set(df.record_id)
+
+    with TemporaryDirectory() as archive:
+        # Records older than 15 days, except the one with a failed feedback.
+        result = db.apply_retention(
+            RetentionPolicy(max_age=timedelta(days=15), keep_failed=True),
+            archive=archive,
+            batch_size=2,
+            now=now,
+        )
+        expired = {
+            record.record_id
+            for record in records
+            if record.ts < now - timedelta(days=15)
+            and record is not failed_record
+        }
+        test.assertEqual(result.records_deleted, len(expired))
+        test.assertEqual(result.feedback_results_deleted, len(expired))
+        test.assertEqual(result.batches, 5)
+        test.assertEqual(record_ids(), {r.record_id for r in records} - expired)
+        test.assertEqual(
+            db.get_feedback_count_by_status(),
+            {
+                FeedbackResultStatus.DONE: len(records) - len(expired) - 1,
+                FeedbackResultStatus.FAILED: 1,
+            },
+        )
+
+        # The newest 10 records of each app.
+        result = db.apply_retention(
+            RetentionPolicy(max_records_per_app=10), archive=archive, now=now
+        )
+        kept = {
+            record.record_id
+            for app in apps
+            for record in [r for r in records if r.app_id == app.app_id][-10:]
+        }
+        test.assertEqual(record_ids(), kept)
+        deleted = {r.record_id for r in records} - kept
+
+        # Applying the same policy again deletes nothing more.
+        result = db.apply_retention(RetentionPolicy(max_records_per_app=10))
+        test.assertEqual(result.records_deleted, 0)
+
+        # Sampled records are kept.
+        policy = RetentionPolicy(max_records_per_app=0, keep_sample=0.5)
+        sampled = {record_id for record_id in kept if policy.sampled(record_id)}
+        result = db.apply_retention(policy)
+        test.assertEqual(result.records_sampled, len(sampled))
+        test.assertEqual(record_ids(), sampled)
+
+        # The archive holds the deleted records and feedback results.
+        archived = SQLAlchemyDB.from_archive(archive)
+        try:
+            df, feedback_cols = archived.get_records_and_feedback()
+            test.assertEqual(set(df.record_id), deleted)
+            test.assertEqual(list(feedback_cols), ["fname"])
+            test.assertEqual(
+                sum(archived.get_feedback_count_by_status().values()),
+                len(deleted),
+            )
+
+            with test.assertRaises(sa.exc.OperationalError):
+                archived.insert_record(records[-1])
+        finally:
+            archived.engine.dispose()
+
+
+def _test_db_export(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+    db.codec = StorageCodec(compression=Compression.ZLIB)
+
+    feedback_definition = FeedbackDefinition(
+        supplied_name="fname", feedback_definition_id="fdef"
+    )
+    db.insert_feedback_definition(feedback_definition)
+
+    context = "retrieved context " * 200
+    now = datetime.now()
+    apps = []
+    records = []
+    for a in range(2):
+        app = AppDefinition(
+            app_name=f"export_app{a}",
+            app_version="v1",
+            root_class=Class.of_object(db),
+            app={},
+        )
+        db.insert_app(app)
+        apps.append(app)
+
+        # One record per day, the oldest first.
+        app_records = [
+            Record(
+                app_id=app.app_id,
+                main_input="in",
+                main_output=f"out{i}",
+                meta={"context": context},
+                ts=now - timedelta(days=10 - i),
+                perf=Perf(
+                    start_time=now - timedelta(days=10 - i, seconds=i),
+                    end_time=now - timedelta(days=10 - i),
+                ),
+                cost=Cost(n_tokens=i, cost=0.1 * i),
+            )
+            for i in range(10)
+        ]
+        db.batch_insert_record(app_records)
+        records.extend(app_records)
+
+    db.batch_insert_feedback([
+        FeedbackResult(
+            feedback_definition_id="fdef",
+            record_id=record.record_id,
+            name="fname",
+            result=0.5,
+            status=FeedbackResultStatus.DONE,
+            calls=[FeedbackCall(args={"context": context}, ret=0.5)],
+        )
+        for record in records
+    ])
+
+    # The records of the first app of the last 5 days.
+    exported = [
+        record
+        for record in records
+        if record.app_id == apps[0].app_id
+        and record.ts >= now - timedelta(days=5)
+    ]
+
+    with TemporaryDirectory() as path:
+        result = db.export(
+            path,
+            app_ids=[apps[0].app_id],
+            since=now - timedelta(days=5),
+            chunk_size=2,
+        )
+        test.assertEqual(result.apps, 1)
+        test.assertEqual(result.feedback_definitions, 1)
+        test.assertEqual(result.records, len(exported))
+        test.assertEqual(result.feedback_results, len(exported))
+        test.assertEqual(
+            sorted(file.name for file in result.files),
+            sorted(f"{table}.parquet" for table in mod_export.EXPORT_TABLES),
+        )
+
+        # Numeric columns are exported as numbers and encoded values are
+        # decoded.
+        df = pd.read_parquet(Path(path) / "records.parquet")
+        test.assertEqual(set(df.record_id), {r.record_id for r in exported})
+        by_id = df.set_index("record_id")
+        for record in exported:
+            row = by_id.loc[record.record_id]
+            test.assertEqual(row.n_tokens, record.cost.n_tokens)
+            test.assertAlmostEqual(
+                row.latency_s, record.perf.latency.total_seconds()
+            )
+            test.assertEqual(json.loads(row.record_json)["meta"], record.meta)
+
+        with clean_db("sqlite_file", codec=StorageCodec()) as other:
+            other.migrate_database()
+
+            result = other.import_(path, batch_size=2)
+            test.assertEqual(result.records, len(exported))
+            test.assertEqual(result.feedback_results, len(exported))
+
+            # Importing again updates the same rows.
+            other.import_(path)
+
+            df, feedback_cols = other.get_records_and_feedback()
+            test.assertEqual(set(df.record_id), {r.record_id for r in exported})
+            test.assertEqual(list(feedback_cols), ["fname"])
+            for _, row in df.iterrows():
+                test.assertEqual(
+                    json.loads(row.record_json)["meta"]["context"], context
+                )
+                test.assertEqual(row.fname_calls[0]["args"]["context"], context)
+
+            test.assertEqual(
+                other.get_feedback_count_by_status(),
+                {FeedbackResultStatus.DONE: len(exported)},
+            )
+            test.assertEqual(
+                {app["app_id"] for app in other.get_apps()}, {apps[0].app_id}
+            )
+
+
+def _test_db_sqlite_concurrency(test: TestCase, db: SQLAlchemyDB):
+    db.migrate_database()
+
+    with db.engine.connect() as conn:
+        test.assertEqual(
+            conn.execute(sa.text("PRAGMA journal_mode")).scalar(), "wal"
+        )
+
+    # Reads use read-only connections.
+    with db._read() as session:
+        with test.assertRaises(sa.exc.OperationalError):
+            session.execute(
+                sa.delete(db.orm.Record.__table__).where(sa.false())
+            )
+
+    db.insert_feedback_definition(
+        FeedbackDefinition(supplied_name="fname", feedback_definition_id="fdef")
+    )
+
+    app = AppDefinition(
+        app_name="sqlite_app",
+        app_version="v1",
+        root_class=Class.of_object(db),
+        app={},
+    )
+    db.insert_app(app)
+
+    n_threads = 16
+    n_records = 25
+    errors = []
+    done = threading.Event()
+
+    def write(t: int):
+        try:
+            for i in range(n_records):
+                record = Record(
+                    app_id=app.app_id, main_input=f"{t}", main_output=f"{i}"
+                )
+                db.insert_record(record)
+                db.insert_feedback(
+                    FeedbackResult(
+                        feedback_definition_id="fdef",
+                        record_id=record.record_id,
+                        name="fname",
+                        result=0.5,
+                        status=FeedbackResultStatus.DONE,
+                    )
+                )
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            while not done.is_set():
+                db.get_records_and_feedback()
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    writers = [
+        threading.Thread(target=write, args=(t,)) for t in range(n_threads)
+    ]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    test.assertEqual(errors, [])
+
+    df, _ = db.get_records_and_feedback()
+    test.assertEqual(len(df), n_threads * n_records)
+    test.assertEqual(
+        db.get_feedback_count_by_status(),
+        {FeedbackResultStatus.DONE: n_threads * n_records},
+    )
+
+    # Concurrent writes share transactions.
+    stats = db._writer.stats
+    test.assertLess(stats.transactions, stats.writes)
+
+
+def _test_db_replica(test: TestCase, db: SQLAlchemyDB, replica: Path):
+    db.migrate_database()
+
+    def add_app(name: str):
+        db.insert_app(
+            AppDefinition(
+                app_name=name,
+                app_version="v1",
+                root_class=Class.of_object(db),
+                app={},
+            )
+        )
+
+    def app_names() -> List[str]:
+        return sorted(app["app_name"] for app in db.get_apps())
+
+    add_app("before")
+
+    # Take a snapshot of the primary as a replica lagging behind it.
+    source = sqlite3.connect(db.engine.url.database)
+    target = sqlite3.connect(replica)
+    source.backup(target)
+    source.close()
+    target.close()
+
+    add_app("after")
+
+    # Reads right after writes go to the primary.
+    test.assertEqual(app_names(), ["after", "before"])
+    test.assertEqual(db._replicas.stats.primary_reads, 1)
+
+    time.sleep(db.read_replicas.max_staleness)
+
+    test.assertEqual(app_names(), ["before"])
+    test.assertEqual(db._replicas.stats.replica_reads, 1)
+
+    # Replicas lagging behind by more than the staleness tolerance are not
+    # read from.
+    db.read_replicas.lag_query = "SELECT 10.0"
+
+    test.assertEqual(app_names(), ["after", "before"])
+    stats = db._replicas.stats
+    test.assertEqual(stats.stale, 1)
+    test.assertEqual(stats.primary_reads, 2)
+
+    db._replicas.dispose()
+
+
 def _populate_data(db: DB):
     session = TruSession()
     session.connector.db = (
@@ -0,0 +1,112 @@
+"""Tests for the storage codec of serialized records."""
+
+import json
+from unittest import TestCase
+from unittest import main
+from unittest import skipIf
+
+from trulens.core.database import codec as mod_codec
+from trulens.core.database.codec import Compression
+from trulens.core.database.codec import StorageCodec
+from trulens.core.utils.imports import is_dummy
+
+
+def _decode(value: str, blobs: dict) -> str:
+    blobs = {
+        blob_id: mod_codec.decompress(content)
+        for blob_id, content in blobs.items()
+    }
+    decompressed = mod_codec.decompress(value)
+    if not mod_codec.uses_blobs(value):
+        return decompressed
+    return mod_codec.resolve_blobs(decompressed, blobs)
+
+
+class TestStorageCodec(TestCase):
+    def setUp(self):
+        self.context = "retrieved context " * 100
+        self.obj = {
+            "calls": [
+                {"rets": [self.context, 'with "quotes" \\ and é']},
+                {"args": {"query": "short", "context": self.context}},
+            ],
+            "meta": None,
+        }
+        self.json_str = json.dumps(self.obj)
+
+    def _round_trip(self, codec: StorageCodec) -> dict:
+        blobs = {}
+        encoded = codec.encode(self.json_str, blobs=blobs)
+
+        self.assertTrue(mod_codec.is_encoded(encoded))
+        self.assertLess(len(encoded), len(self.json_str))
+
+        stored = {
+            blob_id: codec.compress(content)
+            for blob_id, content in blobs.items()
+        }
+        self.assertEqual(json.loads(_decode(encoded, stored)), self.obj)
+
+        return blobs
+
+    def test_zlib(self):
+        blobs = self._round_trip(StorageCodec(compression=Compression.ZLIB))
+
+        # The repeated context is stored once.
+        self.assertEqual(len(blobs), 1)
+
+    @skipIf(is_dummy(mod_codec.zstandard), "zstandard not installed")
+    def test_zstd(self):
+        self._round_trip(StorageCodec(compression=Compression.ZSTD))
+
+    def test_uncompressed(self):
+        codec = StorageCodec(compression=Compression.NONE)
+        blobs = {}
+        encoded = codec.encode(self.json_str, blobs=blobs)
+
+        self.assertEqual(len(blobs), 1)
+        self.assertEqual(
+            json.loads(
+                _decode(
+                    encoded,
+                    {k: codec.compress(v) for k, v in blobs.items()},
+                )
+            ),
+            self.obj,
+        )
+
+    def test_no_blobs(self):
+        codec = StorageCodec(compression=Compression.ZLIB)
+
+        encoded = codec.encode(self.json_str)
+        self.assertEqual(
+            mod_codec.blob_refs(mod_codec.decompress(encoded)), set()
+        )
+        self.assertEqual(_decode(encoded, {}), self.json_str)
+
+        codec = StorageCodec(compression=Compression.ZLIB, min_blob_length=None)
+        blobs = {}
+        codec.encode(self.json_str, blobs=blobs)
+        self.assertEqual(blobs, {})
+
+    def test_reference_lookalike(self):
+        # Strings that look like blob references are not mistaken for them.
+        obj = {"a": "\x00blob:" + "0" * 64, "b": self.context}
+        json_str = json.dumps(obj)
+
+        codec = StorageCodec(compression=Compression.ZLIB)
+        blobs = {}
+        encoded = codec.encode(json_str, blobs=blobs)
+
+        self.assertEqual(blobs, {})
+        self.assertEqual(json.loads(_decode(encoded, {})), obj)
+
+    def test_plain_json(self):
+        # Values written without a codec are passed through.
+        self.assertFalse(mod_codec.is_encoded(self.json_str))
+        self.assertFalse(mod_codec.is_encoded("true"))
+        self.assertEqual(mod_codec.decompress(self.json_str), self.json_str)
+
+
+if __name__ == "__main__":
+    main()
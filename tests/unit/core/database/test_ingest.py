@@ -0,0 +1,284 @@
+"""Tests for the batched record ingestion pipeline."""
+
+import gc
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import List
+from unittest import TestCase
+from unittest import main
+import weakref
+
+from trulens.core.database.connector import DefaultDBConnector
+from trulens.core.database.ingest import BackpressurePolicy
+from trulens.core.database.ingest import RecordIngestPipeline
+from trulens.core.database.ingest import default_spill_path
+from trulens.core.schema.record import Record
+
+
+def _record(i: int) -> Record:
+    return Record(app_id="app", main_input=str(i), calls=[])
+
+
+class TestRecordIngestPipeline(TestCase):
+    def setUp(self):
+        self.batches: List[List[Record]] = []
+        self.pipelines: List[RecordIngestPipeline] = []
+
+    def tearDown(self):
+        for pipeline in self.pipelines:
+            pipeline.stop(timeout=5)
+
+    def _pipeline(self, ingest_batch=None, **kwargs) -> RecordIngestPipeline:
+        pipeline = RecordIngestPipeline(
+            ingest_batch=ingest_batch or self.batches.append, **kwargs
+        )
+        self.pipelines.append(pipeline)
+        return pipeline
+
+    def test_flush_by_size(self):
+        pipeline = self._pipeline(batch_size=3, flush_interval=60)
+
+        for i in range(7):
+            pipeline.put(_record(i))
+
+        self.assertTrue(pipeline.flush(timeout=5))
+
+        self.assertEqual([len(b) for b in self.batches], [3, 3, 1])
+        self.assertEqual(pipeline.metrics.ingested, 7)
+        self.assertEqual(pipeline.metrics.queue_depth, 0)
+        self.assertIsNotNone(pipeline.metrics.last_flush_latency)
+
+    def test_flush_by_deadline(self):
+        pipeline = self._pipeline(batch_size=100, flush_interval=0.1)
+
+        pipeline.put(_record(0))
+
+        deadline = time.monotonic() + 5
+        while len(self.batches) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual([len(b) for b in self.batches], [1])
+
+    def test_drop_oldest(self):
+        release = threading.Event()
+
+        def ingest_batch(batch):
+            release.wait(5)
+            self.batches.append(batch)
+
+        pipeline = self._pipeline(
+            ingest_batch=ingest_batch,
+            batch_size=1,
+            max_queue_size=2,
+            flush_interval=60,
+            backpressure=BackpressurePolicy.DROP_OLDEST,
+        )
+
+        # First record is taken by the (blocked) worker, the rest queue up.
+        pipeline.put(_record(0))
+        time.sleep(0.1)
+        for i in range(1, 5):
+            pipeline.put(_record(i))
+
+        release.set()
+        self.assertTrue(pipeline.flush(timeout=5))
+
+        self.assertEqual(
+            [b[0].main_input for b in self.batches], ["0", "3", "4"]
+        )
+        self.assertEqual(pipeline.metrics.dropped, 2)
+
+    def test_spill_and_replay(self):
+        fail = threading.Event()
+        fail.set()
+
+        def ingest_batch(batch):
+            if fail.is_set():
+                raise RuntimeError("database unavailable")
+            self.batches.append(batch)
+
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        spill_path = Path(spill_dir.name) / "spill.jsonl"
+
+        with self.subTest("spill failed batches"):
+            pipeline = self._pipeline(
+                ingest_batch=ingest_batch,
+                batch_size=2,
+                flush_interval=60,
+                backpressure=BackpressurePolicy.SPILL,
+                spill_path=spill_path,
+                max_retries=0,
+            )
+
+            for i in range(3):
+                pipeline.put(_record(i))
+
+            self.assertFalse(pipeline.flush(timeout=5))
+            self.assertTrue(spill_path.exists())
+            # Flushing also retries spilled records which get spilled again.
+            self.assertGreaterEqual(pipeline.metrics.spilled, 3)
+
+        with self.subTest("replay spilled records"):
+            fail.clear()
+            self.assertTrue(pipeline.flush(timeout=5))
+
+            self.assertEqual(
+                sorted(r.main_input for b in self.batches for r in b),
+                ["0", "1", "2"],
+            )
+            self.assertFalse(spill_path.exists())
+
+    def test_failed_batch_is_dropped_after_retries(self):
+        calls = []
+
+        def ingest_batch(batch):
+            calls.append(batch)
+            raise RuntimeError("database unavailable")
+
+        pipeline = self._pipeline(
+            ingest_batch=ingest_batch, batch_size=1, max_retries=2
+        )
+
+        pipeline.put(_record(0))
+        pipeline.flush(timeout=5)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(pipeline.metrics.dropped, 1)
+        self.assertEqual(pipeline.metrics.queue_depth, 0)
+
+    def _spill_dir(self) -> Path:
+        spill_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(spill_dir.cleanup)
+        return Path(spill_dir.name)
+
+    def _write_spill(self, path: Path, *inputs: int) -> None:
+        # Write elsewhere first as a running pipeline may pick up the file.
+        temp_path = path.with_name(path.name + ".tmp")
+        with temp_path.open("w") as f:
+            for i in inputs:
+                f.write(_record(i).model_dump_json() + "\n")
+        os.replace(temp_path, path)
+
+    def _ingested(self) -> List[str]:
+        return sorted(r.main_input for b in self.batches for r in b)
+
+    def test_default_spill_path(self):
+        self.assertEqual(default_spill_path("a"), default_spill_path("a"))
+        self.assertNotEqual(
+            default_spill_path("a").parent, default_spill_path("b").parent
+        )
+        self.assertEqual(
+            default_spill_path("a").name, f"spill_{os.getpid()}.jsonl"
+        )
+
+    def test_recover_leftover_spills(self):
+        spill_dir = self._spill_dir()
+
+        # Id of a process that is no longer running.
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        stopped = process.pid
+
+        self._write_spill(spill_dir / f"spill_{stopped}.jsonl", 0, 1)
+        # Replay interrupted by the process stopping.
+        self._write_spill(spill_dir / f"spill_{stopped}.jsonl.replay", 2)
+        with (spill_dir / f"spill_{stopped}.jsonl.replay").open("a") as f:
+            f.write('{"app_id": "app", "main_inp')
+
+        # Of a process still running.
+        running = spill_dir / f"spill_{os.getppid()}.jsonl"
+        self._write_spill(running, 3)
+
+        # Of an earlier pipeline using the same spill file.
+        spill_path = spill_dir / "records.jsonl"
+        self._write_spill(spill_dir / "records.jsonl.replay", 4)
+
+        pipeline = self._pipeline(flush_interval=60, spill_path=spill_path)
+        self.assertTrue(pipeline.flush(timeout=5))
+
+        self.assertEqual(self._ingested(), ["0", "1", "2", "4"])
+        self.assertEqual(pipeline.metrics.dropped, 1)
+        self.assertEqual(
+            sorted(p.name for p in spill_dir.iterdir()), [running.name]
+        )
+
+    def test_replay_failure_keeps_records(self):
+        spill_path = self._spill_dir() / "spill.jsonl"
+
+        pipeline = self._pipeline(flush_interval=60, spill_path=spill_path)
+
+        replay_file = pipeline._replay_file
+
+        def fail(path):
+            raise RuntimeError("replay failed")
+
+        pipeline._replay_file = fail
+        self._write_spill(spill_path, 0, 1)
+
+        self.assertFalse(pipeline.flush(timeout=5))
+        self.assertTrue(spill_path.exists())
+        self.assertFalse(spill_path.with_name("spill.jsonl.replay").exists())
+
+        pipeline._replay_file = replay_file
+        self.assertTrue(pipeline.flush(timeout=5))
+        self.assertEqual(self._ingested(), ["0", "1"])
+
+
+class TestConnectorIngest(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _connector(self) -> DefaultDBConnector:
+        connector = DefaultDBConnector(
+            database_url=f"sqlite:///{self.tmp.name}/default.sqlite"
+        )
+        connector.RECORDS_SPILL_PATH = str(Path(self.tmp.name) / "spill.jsonl")
+        connector.RECORDS_BATCH_TIMEOUT_IN_SEC = 60
+        return connector
+
+    def test_close(self):
+        connector = self._connector()
+        connector.add_record_nowait(_record(0))
+        thread = connector._ingest_pipeline._thread
+
+        connector.close(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(connector.get_records_and_feedback()[0]), 1)
+
+        # Records added afterwards are inserted by a new pipeline.
+        connector.add_record_nowait(_record(1))
+        self.assertTrue(connector.flush_records(timeout=5))
+        self.assertEqual(len(connector.get_records_and_feedback()[0]), 2)
+        connector.close(timeout=5)
+
+    def test_dropped_connector(self):
+        connector = self._connector()
+        connector.add_record_nowait(_record(0))
+        self.assertTrue(connector.flush_records(timeout=5))
+
+        pipeline = weakref.ref(connector._ingest_pipeline)
+        thread = connector._ingest_pipeline._thread
+
+        del connector
+        gc.collect()
+
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+        del thread
+        gc.collect()
+        self.assertIsNone(pipeline())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Tests for database migration revisions."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest import main
+from unittest import mock
+
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateIndex
+from trulens.core.database import orm as mod_orm
+import trulens.core.database.migrations as mod_migrations
+
+VERSIONS = Path(mod_migrations.__file__).parent / "versions"
+
+
+def _revision(name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, VERSIONS / name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _config(dialect: str) -> mock.Mock:
+    config = mock.Mock()
+    config.get_main_option.return_value = "trulens_"
+    config.attributes = {"engine": SimpleNamespace(name=dialect)}
+    return config
+
+
+class TestIndexRevisions(TestCase):
+    """Indexes are not created on snowflake which does not support them on
+    standard tables."""
+
+    REVISIONS = [
+        "7_add_unique_app_id_index.py",
+        "8_add_feedback_and_record_indexes.py",
+    ]
+
+    def test_indexes(self):
+        for name in self.REVISIONS:
+            revision = _revision(name)
+            for dialect, expected in [("sqlite", True), ("snowflake", False)]:
+                with self.subTest(revision=name, dialect=dialect):
+                    with mock.patch.object(revision, "op") as op:
+                        revision.upgrade(_config(dialect))
+                        revision.downgrade(_config(dialect))
+
+                    self.assertEqual(op.create_index.called, expected)
+                    self.assertEqual(op.drop_index.called, expected)
+
+    def test_orm_indexes(self):
+        orm = mod_orm.make_orm_for_prefix(table_prefix="trulens_")
+
+        for dialect, expected in [("sqlite", 5), ("snowflake", 0)]:
+            with self.subTest(dialect=dialect):
+                statements = []
+                engine = sa.create_mock_engine(
+                    "sqlite://",
+                    lambda sql, *args, **kwargs: statements.append(sql),
+                )
+                engine.dialect.name = dialect
+
+                orm.metadata.create_all(engine, checkfirst=False)
+
+                self.assertEqual(
+                    sum(isinstance(s, CreateIndex) for s in statements),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    main()
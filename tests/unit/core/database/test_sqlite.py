@@ -0,0 +1,152 @@
+"""Tests for the SQLite writer thread."""
+
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import List
+from unittest import TestCase
+from unittest import main
+
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from trulens.core.database.sqlite import SQLiteOptions
+from trulens.core.database.sqlite import SQLiteWriter
+from trulens.core.database.sqlite import set_pragmas
+
+
+class TestSQLiteWriter(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = sa.create_engine(
+            f"sqlite:///{Path(self.tmp.name) / 'test.sqlite'}"
+        )
+        sa.event.listen(
+            self.engine,
+            "connect",
+            lambda *args: set_pragmas(SQLiteOptions().pragmas(), *args),
+        )
+        with self.engine.begin() as conn:
+            conn.execute(sa.text("CREATE TABLE t (i INTEGER PRIMARY KEY)"))
+
+        self.writer = SQLiteWriter(sessionmaker(self.engine))
+
+    def tearDown(self):
+        self.writer.stop(timeout=5)
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def _insert(self, i: int):
+        def write(session):
+            session.execute(sa.text("INSERT INTO t VALUES (:i)"), {"i": i})
+            return i
+
+        return write
+
+    def _rows(self) -> List[int]:
+        with self.engine.connect() as conn:
+            return sorted(
+                conn.execute(sa.text("SELECT i FROM t")).scalars().all()
+            )
+
+    def _run_while_blocked(self, writes) -> List[object]:
+        """Run `writes` from separate threads while the writer thread is busy
+        so that they are queued together."""
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def block(session):
+            started.set()
+            release.wait(5)
+
+        blocker = threading.Thread(target=self.writer.run, args=(block,))
+        blocker.start()
+        self.assertTrue(started.wait(5))
+
+        results = [None] * len(writes)
+
+        def run(n: int):
+            try:
+                results[n] = self.writer.run(writes[n])
+            except Exception as e:
+                results[n] = e
+
+        threads = [
+            threading.Thread(target=run, args=(n,)) for n in range(len(writes))
+        ]
+        for thread in threads:
+            thread.start()
+
+        while len(self.writer._queue) < len(writes):
+            time.sleep(0.01)
+
+        release.set()
+        for thread in [blocker, *threads]:
+            thread.join(5)
+
+        return results
+
+    def test_coalesce(self):
+        results = self._run_while_blocked([self._insert(i) for i in range(20)])
+
+        self.assertEqual(results, list(range(20)))
+        self.assertEqual(self._rows(), list(range(20)))
+
+        # The blocking write and one transaction for the queued writes.
+        stats = self.writer.stats
+        self.assertEqual(stats.writes, 21)
+        self.assertEqual(stats.transactions, 2)
+
+    def test_failure_isolated(self):
+        def fail(session):
+            raise ValueError("fail")
+
+        results = self._run_while_blocked([
+            self._insert(0),
+            fail,
+            # Conflicts with the first insert.
+            self._insert(0),
+            self._insert(1),
+        ])
+
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[3], 1)
+
+        # Whichever of the conflicting inserts was queued first succeeds.
+        conflicting = [results[0], results[2]]
+        self.assertIn(0, conflicting)
+        self.assertEqual(
+            [type(r) for r in conflicting if r != 0], [sa.exc.IntegrityError]
+        )
+
+        self.assertEqual(self._rows(), [0, 1])
+        self.assertEqual(self.writer.stats.failed_writes, 2)
+
+    def test_nested(self):
+        def outer(session):
+            self.writer.run(self._insert(1))
+            return self._insert(2)(session)
+
+        self.assertEqual(self.writer.run(outer), 2)
+        self.assertEqual(self._rows(), [1, 2])
+        self.assertEqual(self.writer.stats.transactions, 1)
+
+    def test_idle_restart(self):
+        writer = SQLiteWriter(sessionmaker(self.engine), idle_timeout=0.01)
+
+        writer.run(self._insert(1))
+
+        deadline = time.monotonic() + 5
+        while writer._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNone(writer._thread)
+
+        writer.run(self._insert(2))
+        self.assertEqual(self._rows(), [1, 2])
+
+        writer.stop(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
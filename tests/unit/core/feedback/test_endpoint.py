@@ -0,0 +1,185 @@
+"""Tests for endpoint cost tracking and requests."""
+
+import importlib
+import threading
+from typing import List
+from unittest import TestCase
+from unittest import main
+from unittest import mock
+
+from trulens.core.feedback import endpoint as mod_endpoint
+from trulens.core.feedback.endpoint import Endpoint
+from trulens.core.feedback.endpoint import EndpointCallback
+from trulens.core.utils.python import SingletonPerName
+from trulens.core.utils.threading import TP
+
+
+class API:
+    def request(self, i: int) -> int:
+        return i
+
+
+class CountingEndpoint(Endpoint):
+    """Endpoint counting requests to `API.request`."""
+
+    def __new__(cls, *args, **kwargs):
+        return super(Endpoint, cls).__new__(cls, name="counting")
+
+    def __init__(self, **kwargs):
+        if hasattr(self, "callback_class"):
+            return
+
+        super().__init__(
+            name="counting", callback_class=EndpointCallback, **kwargs
+        )
+
+        self._instrument_class(API, "request")
+
+    def handle_wrapped_call(self, func, bindings, response, callback):
+        self.global_callback.handle(response)
+
+        if callback is not None:
+            callback.handle(response)
+
+
+class TestCostTracking(TestCase):
+    def setUp(self):
+        self.endpoint = CountingEndpoint()
+        self.api = API()
+
+    def tearDown(self):
+        SingletonPerName.delete_singleton_by_name("counting", CountingEndpoint)
+
+    def test_nested(self):
+        def inner():
+            self.api.request(1)
+            return "inner"
+
+        def outer():
+            self.api.request(0)
+            result, callback = self.endpoint.track_cost(inner)
+            self.assertEqual(result, "inner")
+            self.assertEqual(callback.cost.n_requests, 1)
+            self.api.request(2)
+
+        _, callback = self.endpoint.track_cost(outer)
+        self.assertEqual(callback.cost.n_requests, 3)
+
+        # Not tracked outside of any tracking call.
+        self.api.request(3)
+        self.assertEqual(callback.cost.n_requests, 3)
+
+    def test_threads(self):
+        barrier = threading.Barrier(2)
+
+        def requests(n: int) -> int:
+            barrier.wait(5)
+            for i in range(n):
+                self.api.request(i)
+
+            return n
+
+        def track(n: int) -> int:
+            _, callback = self.endpoint.track_cost(requests, n)
+            return callback.cost.n_requests
+
+        tp = TP()
+        futures = [tp.submit(track, n) for n in (3, 5)]
+        self.assertEqual([f.result(timeout=10) for f in futures], [3, 5])
+
+        # Threads started within a tracking call are tracked by it.
+        _, callback = self.endpoint.track_cost(
+            lambda: TP().submit(self.api.request, 0).result(timeout=10)
+        )
+        self.assertEqual(callback.cost.n_requests, 1)
+
+
+class TestPost(TestCase):
+    def setUp(self):
+        self.endpoint = CountingEndpoint(retries=2)
+
+    def tearDown(self):
+        SingletonPerName.delete_singleton_by_name("counting", CountingEndpoint)
+
+    def _response(self, status_code: int) -> mock.Mock:
+        response = mock.Mock(status_code=status_code, headers={})
+        response.json.return_value = [{"label": "ok"}]
+        return response
+
+    def test_rate_limited(self):
+        with mock.patch.object(
+            mod_endpoint.requests,
+            "post",
+            side_effect=[self._response(429), self._response(200)],
+        ) as post, mock.patch.object(self.endpoint.limiter, "rate_limited"):
+            self.assertEqual(
+                self.endpoint.post("http://endpoint", {}), {"label": "ok"}
+            )
+            self.assertEqual(post.call_count, 2)
+
+    def test_rate_limited_retries(self):
+        with mock.patch.object(
+            mod_endpoint.requests, "post", return_value=self._response(429)
+        ) as post, mock.patch.object(self.endpoint.limiter, "rate_limited"):
+            with self.assertRaises(RuntimeError):
+                self.endpoint.post("http://endpoint", {})
+            self.assertEqual(post.call_count, 3)
+
+
+class TestEndpointRegistry(TestCase):
+    def setUp(self):
+        Endpoint.refresh_endpoints()
+        self.setups = Endpoint.ENDPOINT_SETUPS
+        Endpoint.ENDPOINT_SETUPS = [
+            Endpoint.EndpointSetup(
+                arg_flag="with_counting",
+                module_name=__name__,
+                class_name="CountingEndpoint",
+            ),
+            Endpoint.EndpointSetup(
+                arg_flag="with_missing",
+                module_name="trulens_missing_provider",
+                class_name="MissingEndpoint",
+            ),
+        ]
+
+    def tearDown(self):
+        Endpoint.ENDPOINT_SETUPS = self.setups
+        Endpoint.refresh_endpoints()
+        SingletonPerName.delete_singleton_by_name("counting", CountingEndpoint)
+
+    def _imports(self, import_module: mock.Mock) -> int:
+        """Number of attempts to import the missing provider."""
+
+        return import_module.call_args_list.count(
+            mock.call("trulens_missing_provider")
+        )
+
+    def _endpoints(self) -> List[Endpoint]:
+        return Endpoint._all_endpoints(with_counting=True, with_missing=True)
+
+    def test_cached(self):
+        with mock.patch.object(
+            importlib, "import_module", wraps=importlib.import_module
+        ) as import_module:
+            endpoints = self._endpoints()
+            self.assertEqual(endpoints, [CountingEndpoint()])
+            self.assertEqual(self._imports(import_module), 1)
+
+            for _ in range(10):
+                self.assertEqual(self._endpoints(), endpoints)
+            self.assertEqual(self._imports(import_module), 1)
+
+            self.assertEqual(
+                Endpoint._all_endpoints(with_counting=False, with_missing=True),
+                [],
+            )
+
+            # Missing providers are retried once other modules load.
+            with mock.patch.dict("sys.modules", trulens_other_module=None):
+                self.assertEqual(self._endpoints(), endpoints)
+            self.assertEqual(self._imports(import_module), 2)
+
+
+if __name__ == "__main__":
+    main()
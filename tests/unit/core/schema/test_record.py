@@ -0,0 +1,85 @@
+"""Tests for the layout of record calls as app."""
+
+from unittest import TestCase
+from unittest import main
+
+from trulens.core.schema.record import Record
+from trulens.core.schema.record import RecordAppCall
+from trulens.core.schema.record import RecordAppCallMethod
+from trulens.core.utils import pyschema
+from trulens.core.utils.serial import Lens
+
+
+class Retriever:
+    def retrieve(self, query: str) -> str:
+        return query
+
+    def rerank(self, query: str) -> str:
+        return query
+
+
+def _call(path: Lens, method, i: int) -> RecordAppCall:
+    return RecordAppCall(
+        stack=[
+            RecordAppCallMethod(
+                path=path, method=pyschema.Method.of_method(method)
+            )
+        ],
+        args=dict(query=f"q{i}"),
+        rets=f"r{i}",
+        pid=0,
+        tid=0,
+    )
+
+
+class TestRecordLayout(TestCase):
+    def setUp(self):
+        retriever = Retriever()
+        self.path = Lens().app.retriever
+
+        self.record = Record(
+            app_id="app",
+            main_input="q",
+            calls=[
+                _call(self.path, retriever.retrieve, 0),
+                _call(self.path, retriever.rerank, 1),
+                _call(self.path, retriever.retrieve, 2),
+            ],
+        )
+        self.retriever = retriever
+
+    def test_layout(self):
+        layout = self.record.layout_calls_as_app()
+
+        self.assertEqual(
+            [call.rets for call in self.path.retrieve.get_sole_item(layout)],
+            ["r0", "r2"],
+        )
+        self.assertEqual(
+            list(self.path.rerank[:].args.query.get(layout)), ["q1"]
+        )
+        self.assertEqual(layout.main_input, "q")
+
+    def test_cached(self):
+        layout = self.record.layout_calls_as_app()
+        self.assertIs(self.record.layout_calls_as_app(), layout)
+
+        # Excluded fields are not part of the layout.
+        self.record.feedback_results = []
+        self.assertIs(self.record.layout_calls_as_app(), layout)
+
+    def test_invalidated(self):
+        layout = self.record.layout_calls_as_app()
+
+        self.record.calls.append(_call(self.path, self.retriever.rerank, 3))
+        layout = self.record.layout_calls_as_app()
+        self.assertEqual(
+            list(self.path.rerank[:].args.query.get(layout)), ["q1", "q3"]
+        )
+
+        self.record.main_input = "other"
+        self.assertEqual(self.record.layout_calls_as_app().main_input, "other")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,13 @@
+import json
+
 import pytest
+from trulens.core.instruments import Instrument
+from trulens.core.utils import json as json_utils
+from trulens.core.utils.constants import CIRCLE
+from trulens.core.utils.constants import CLASS_INFO
 from trulens.core.utils.json import _recursive_hash
+from trulens.core.utils.json import json_str_of_obj
+from trulens.core.utils.json import jsonify
 
 
 @pytest.mark.parametrize(
@@ -57,3 +65,69 @@ def test_recursive_hash(test_input, matching_input, expected):
     assert (
         result == expected
     ), f"Failed on {test_input}: got {result}, expected {expected}"
+
+
+def test_jsonify_cycles():
+    shared = [1, 2]
+    cyclic = {"shared": [shared, shared]}
+    cyclic["self"] = cyclic
+
+    # Only values containing themselves are marked as cycles.
+    assert jsonify(cyclic) == {
+        "shared": [[1, 2], [1, 2]],
+        "self": {CIRCLE: id(cyclic)},
+    }
+    assert jsonify(cyclic, skip_specials=True)["self"] is None
+
+
+def test_jsonify_deep():
+    deep = []
+    inner = deep
+    for _ in range(5000):
+        inner.append([])
+        inner = inner[0]
+
+    # Deeper than the recursion limit.
+    content = jsonify(deep, max_depth=10000)
+    for _ in range(5000):
+        content = content[0]
+    assert content == []
+
+
+class Component:
+    def __init__(self):
+        self.name = "component"
+
+
+def test_jsonify_class_info(monkeypatch):
+    assert CLASS_INFO not in jsonify(Component())
+
+    monkeypatch.setattr(
+        Instrument.Default, "CLASSES", {*Instrument.Default.CLASSES}
+    )
+    Instrument.Default.CLASSES.add(Component)
+
+    first = jsonify(Component())
+    second = jsonify(Component())
+
+    assert first[CLASS_INFO]["name"] == "Component"
+    assert first == second
+    assert first[CLASS_INFO] is not second[CLASS_INFO]
+
+
+def test_json_str_of_obj_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+
+    value = {"text": "caf\u00e9", 1: [b"bytes", None, 1.5]}
+    # Beyond 64 bits so encoded with json.
+    big = [2**70]
+
+    expected = json.loads(json_str_of_obj(value))
+    expected_big = json_str_of_obj(big)
+
+    monkeypatch.setattr(json_utils, "USE_ORJSON", True)
+    assert (
+        json_str_of_obj(value) == '{"text":"caf\u00e9","1":["bytes",null,1.5]}'
+    )
+    assert json.loads(json_str_of_obj(value)) == expected
+    assert json_str_of_obj(big) == expected_big
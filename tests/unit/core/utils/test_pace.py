@@ -0,0 +1,142 @@
+"""Tests for rate limiting utilities."""
+
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest import main
+
+from trulens.core.utils.pace import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    def test_burst_then_rate(self):
+        # 10 requests per second with bursts of 0.5 seconds worth of requests.
+        limiter = RateLimiter(rpm=600, burst_seconds=0.5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.mark()
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        for _ in range(5):
+            limiter.mark()
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+
+    def test_waiters_do_not_serialize(self):
+        limiter = RateLimiter(rpm=60000, burst_seconds=1.0)
+
+        threads = [threading.Thread(target=limiter.mark) for _ in range(8)]
+
+        start = time.monotonic()
+        limiter.rate_limited(retry_after=0.3)
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        # All waiters wait out the pause together instead of one after
+        # another.
+        self.assertGreaterEqual(elapsed, 0.25)
+        self.assertLess(elapsed, 1.0)
+
+    def test_tokens_per_minute(self):
+        # 100 tokens per second with bursts of 0.1 seconds worth of tokens.
+        limiter = RateLimiter(rpm=60000, tpm=6000, burst_seconds=0.1)
+
+        limiter.mark()
+        limiter.record_tokens(30)
+
+        start = time.monotonic()
+        limiter.mark()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_token_totals(self):
+        limiter = RateLimiter(rpm=60000, tpm=6000, burst_seconds=0.1)
+
+        # Running totals only count what is new so the tokens stay within the
+        # burst.
+        limiter.record_token_total("a", 10)
+        limiter.record_token_total("a", 10)
+
+        start = time.monotonic()
+        limiter.mark()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        limiter.record_token_total("b", 20)
+
+        start = time.monotonic()
+        limiter.mark()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_concurrency(self):
+        limiter = RateLimiter(rpm=60000, max_concurrency=2)
+
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def request():
+            nonlocal max_in_flight
+            with limiter.request():
+                with lock:
+                    max_in_flight = max(max_in_flight, limiter.in_flight)
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max_in_flight, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_async_concurrency(self):
+        limiter = RateLimiter(rpm=60000, max_concurrency=3)
+
+        max_in_flight = 0
+
+        async def request():
+            nonlocal max_in_flight
+            async with limiter.arequest():
+                max_in_flight = max(max_in_flight, limiter.in_flight)
+                await asyncio.sleep(0.05)
+
+        async def run():
+            await asyncio.gather(*(request() for _ in range(9)))
+
+        asyncio.run(run())
+
+        self.assertEqual(max_in_flight, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_adapts_to_rate_limiting(self):
+        limiter = RateLimiter(rpm=60000)
+
+        limiter.rate_limited(retry_after=0.01)
+        limiter.rate_limited(retry_after=0.01)
+        self.assertAlmostEqual(limiter.rate_factor, 0.25)
+
+        for _ in range(5):
+            limiter.succeeded()
+        self.assertAlmostEqual(limiter.rate_factor, 0.5)
+
+        for _ in range(100):
+            limiter.succeeded()
+        self.assertEqual(limiter.rate_factor, 1.0)
+
+    def test_shared(self):
+        limiter = RateLimiter.shared("test_shared_account", rpm=60)
+
+        self.assertIs(
+            RateLimiter.shared("test_shared_account", rpm=120), limiter
+        )
+        self.assertEqual(limiter.rpm, 60)
+        self.assertIsNot(
+            RateLimiter.shared("test_shared_other_account", rpm=60), limiter
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Tests for threading utilities."""
+
+from unittest import TestCase
+from unittest import main
+from unittest import mock
+
+from trulens.core.instruments import CallTrackingMode
+from trulens.core.instruments import Instrument
+from trulens.core.utils import threading as threading_utils
+from trulens.core.utils.threading import Thread
+from trulens.core.utils.threading import ThreadPoolExecutor
+
+
+class TestPreStartStack(TestCase):
+    def setUp(self):
+        self.original_mode = Instrument.call_tracking_mode
+
+    def tearDown(self):
+        Instrument.call_tracking_mode = self.original_mode
+
+    def _start(self) -> int:
+        """Start a thread and submit to a pool, returning the number of stacks
+        captured."""
+
+        with mock.patch.object(
+            threading_utils, "stack", wraps=threading_utils.stack
+        ) as stack:
+            thread = Thread(target=lambda: None)
+            thread.start()
+            thread.join()
+
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(lambda: None).result()
+
+            return stack.call_count
+
+    def test_contextvars(self):
+        Instrument.call_tracking_mode = CallTrackingMode.CONTEXTVARS
+        self.assertEqual(self._start(), 0)
+
+    def test_stack(self):
+        Instrument.call_tracking_mode = CallTrackingMode.STACK
+        # The worker thread of the pool captures one too.
+        self.assertGreaterEqual(self._start(), 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import asyncio
+
 from trulens.core.feedback import SkipEval
 from trulens.core.feedback.provider import Provider
 
@@ -18,6 +20,15 @@ def skip_if_odd(val: float):
     return float(val)
 
 
+async def async_skip_if_odd(val: float):
+    """Async version of `skip_if_odd` which gives control back to the event
+    loop before returning."""
+
+    await asyncio.sleep(0)
+
+    return skip_if_odd(val)
+
+
 def custom_feedback_function(t1: str) -> float:
     return 0.1
 
@@ -2,8 +2,10 @@
 Tests for Feedback class.
 """
 
+import asyncio
 from unittest import TestCase
 from unittest import main
+from unittest import mock
 
 import numpy as np
 from trulens.core import Feedback
@@ -11,11 +13,13 @@ from trulens.core import TruBasicApp
 from trulens.core.schema.feedback import FeedbackMode
 from trulens.core.schema.feedback import FeedbackResultStatus
 from trulens.core.schema.select import Select
+from trulens.feedback.dummy.provider import DummyProvider
 
 # Get the "globally importable" feedback implementations.
 from tests.unit.feedbacks import CustomClassNoArgs
 from tests.unit.feedbacks import CustomClassWithArgs
 from tests.unit.feedbacks import CustomProvider
+from tests.unit.feedbacks import async_skip_if_odd
 from tests.unit.feedbacks import custom_feedback_function
 from tests.unit.feedbacks import make_nonglobal_feedbacks
 from tests.unit.feedbacks import skip_if_odd
@@ -80,6 +84,142 @@ class TestFeedbackEval(TestCase):
         self.assertEqual(res.status, FeedbackResultStatus.DONE)
         # But status should be DONE (as opposed to SKIPPED or ERROR)
 
+    def test_arun(self) -> None:
+        """Test async evaluation of sync and async feedback implementations."""
+
+        source_data = {
+            "__record__": {
+                "app": {"somemethod": {"args": {"num": [1, 2, 3, 4, 5, 6]}}}
+            }
+        }
+
+        for imp in [skip_if_odd, async_skip_if_odd]:
+            with self.subTest(imp=imp):
+                f = Feedback(imp=imp).on(
+                    val=Select.RecordCalls.somemethod.args.num[:]
+                )
+
+                res = asyncio.run(f.arun(source_data=source_data))
+
+                self.assertEqual(res.status, FeedbackResultStatus.DONE)
+                self.assertAlmostEqual(res.result, (2 + 4 + 6) / 3)
+                self.assertEqual(len(res.calls), 3)
+
+                # Sync evaluation should produce the same results.
+                res = f.run(source_data=source_data)
+
+                self.assertEqual(res.status, FeedbackResultStatus.DONE)
+                self.assertAlmostEqual(res.result, (2 + 4 + 6) / 3)
+
+    def test_arun_concurrency(self) -> None:
+        """Test that async evaluation runs input combinations concurrently up
+        to the given limit."""
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_feedback(val: float) -> float:
+            nonlocal in_flight, max_in_flight
+
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+            if val == 3:
+                raise ValueError("Failing on purpose.")
+
+            return float(val)
+
+        f = Feedback(imp=slow_feedback).on(
+            val=Select.RecordCalls.somemethod.args.num[:]
+        )
+
+        source_data = {
+            "__record__": {
+                "app": {"somemethod": {"args": {"num": [0, 1, 2, 4, 5, 6]}}}
+            }
+        }
+
+        res = asyncio.run(f.arun(source_data=source_data, max_concurrency=3))
+
+        self.assertEqual(res.status, FeedbackResultStatus.DONE)
+        self.assertAlmostEqual(res.result, (1 + 2 + 4 + 5 + 6) / 6)
+        self.assertEqual(max_in_flight, 3)
+
+        # A failing evaluation fails the whole run.
+        source_data["__record__"]["app"]["somemethod"]["args"]["num"] = [2, 3]
+
+        res = asyncio.run(f.arun(source_data=source_data, max_concurrency=3))
+
+        self.assertEqual(res.status, FeedbackResultStatus.FAILED)
+        self.assertIn("Failing on purpose", res.error)
+
+    def test_arun_provider(self) -> None:
+        """Test that async evaluation of provider feedback functions awaits
+        their async counterparts without running them in threads."""
+
+        provider = DummyProvider(
+            error_prob=0.0,
+            loading_prob=0.0,
+            freeze_prob=0.0,
+            overloaded_prob=0.0,
+            delay=0.0,
+        )
+
+        source_data = {
+            "__record__": {
+                "app": {
+                    "somemethod": {
+                        "args": {"question": "q", "answers": ["a", "b", "c"]}
+                    }
+                }
+            }
+        }
+        args = Select.RecordCalls.somemethod.args
+
+        feedbacks = [
+            Feedback(provider.relevance).on(
+                prompt=args.question, response=args.answers[:]
+            ),
+            Feedback(provider.context_relevance_with_cot_reasons).on(
+                question=args.question, context=args.answers[:]
+            ),
+            Feedback(provider.coherence).on(text=args.answers[:]),
+        ]
+
+        acreate = DummyProvider._acreate_chat_completion
+        completions = 0
+
+        async def counted_acreate(self, *args, **kwargs):
+            nonlocal completions
+            completions += 1
+            return await acreate(self, *args, **kwargs)
+
+        for f in feedbacks:
+            with self.subTest(imp=f.imp.__name__):
+                expected = f.run(source_data=source_data)
+                self.assertEqual(expected.status, FeedbackResultStatus.DONE)
+
+                completions = 0
+                with mock.patch.object(
+                    DummyProvider,
+                    "_create_chat_completion",
+                    side_effect=AssertionError("Ran sync completion."),
+                ), mock.patch.object(
+                    asyncio.BaseEventLoop,
+                    "run_in_executor",
+                    side_effect=AssertionError("Ran in a thread."),
+                ), mock.patch.object(
+                    DummyProvider, "_acreate_chat_completion", counted_acreate
+                ):
+                    res = asyncio.run(f.arun(source_data=source_data))
+
+                self.assertEqual(res.status, FeedbackResultStatus.DONE)
+                self.assertEqual(completions, 3)
+                self.assertAlmostEqual(res.result, expected.result)
+                self.assertEqual(len(res.calls), 3)
+
 
 class TestFeedbackConstructors(TestCase):
     """Test for feedback function serialization/deserialization."""
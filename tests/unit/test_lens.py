@@ -194,6 +194,55 @@ class TestLens(TestCase):
 
         # Collect cannot be set.
 
+    def testCompiled(self):
+        obj = dict(
+            calls=[
+                dict(rets=dict(score=1), args=dict(q="a")),
+                dict(rets=dict(score=2), args=dict(q="b")),
+                dict(rets=dict(score=3)),
+            ],
+            meta=Munch(tags=["x", "y"]),
+        )
+
+        with self.subTest("Collect"):
+            self.assertEqual(
+                list(Lens().calls[:].rets.score.collect().get(obj)),
+                [[1, 2, 3]],
+            )
+            self.assertEqual(
+                list(Lens().calls[0, 2].collect()[1].rets.score.get(obj)), [3]
+            )
+            self.assertEqual(list(Lens().collect().get(obj)), [[obj]])
+
+        with self.subTest("Sequence lookups"):
+            # Elements without the attribute are skipped in ambiguous lookups.
+            self.assertEqual(list(Lens().calls.args.q.get(obj)), ["a", "b"])
+            self.assertEqual(list(Lens().meta.tags[-1:].get(obj)), ["y"])
+
+        with self.subTest("Lazy"):
+            values = Lens().calls[:].args.q.get(obj)
+            self.assertEqual(next(values), "a")
+            self.assertEqual(next(values), "b")
+            with self.assertRaises(KeyError):
+                next(values)
+
+            self.assertFalse(Lens().calls[:].args.exists(obj))
+            self.assertTrue(Lens().calls[0, 1].args.exists(obj))
+            self.assertFalse(Lens().calls[3].exists(obj))
+
+        with self.subTest("Set missing"):
+            obj1 = Lens().calls[2].args.q.set(obj, "c")
+            self.assertEqual(obj1["calls"][2]["args"], dict(q="c"))
+            self.assertNotIn("args", obj["calls"][2])
+
+            obj1 = Lens().meta.new.set(obj, 1)
+            self.assertEqual(obj1["meta"].new, 1)
+            self.assertNotIn("new", obj["meta"])
+
+        with self.subTest("Cached"):
+            lens = Lens().calls[1].rets
+            self.assertIs(lens.compile(), Lens.of_string(str(lens)).compile())
+
 
 if __name__ == "__main__":
     main()
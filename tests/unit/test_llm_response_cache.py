@@ -0,0 +1,165 @@
+"""Tests for caching of LLM provider responses."""
+
+import asyncio
+from pathlib import Path
+import tempfile
+import time
+from unittest import TestCase
+from unittest import main
+from unittest.mock import patch
+
+from trulens.feedback.cache import MemoryResponseCache
+from trulens.feedback.cache import ResponseCache
+from trulens.feedback.cache import SQLiteResponseCache
+from trulens.feedback.dummy.provider import DummyProvider
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name) / "cache.sqlite"
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _caches(self, **kwargs):
+        yield MemoryResponseCache(**kwargs)
+
+        cache = SQLiteResponseCache(self.path, **kwargs)
+        try:
+            cache.clear()
+            yield cache
+        finally:
+            cache.close()
+
+    def test_key(self):
+        self.assertEqual(
+            ResponseCache.key(a=1, b={"x": 1, "y": 2}),
+            ResponseCache.key(b={"y": 2, "x": 1}, a=1),
+        )
+        self.assertNotEqual(ResponseCache.key(a=1), ResponseCache.key(a=2))
+
+    def test_lru_eviction(self):
+        for cache in self._caches(max_entries=2):
+            with self.subTest(cache=type(cache).__name__):
+                cache.put("a", "A")
+                time.sleep(0.01)
+                cache.put("b", "B")
+                time.sleep(0.01)
+
+                # Using "a" makes "b" the least recently used entry.
+                self.assertEqual(cache.get("a"), "A")
+                time.sleep(0.01)
+                cache.put("c", "C")
+
+                self.assertEqual(len(cache), 2)
+                self.assertIsNone(cache.get("b"))
+                self.assertEqual(cache.get("c"), "C")
+
+                stats = cache.stats
+                self.assertEqual(stats.hits, 2)
+                self.assertEqual(stats.misses, 1)
+                self.assertEqual(stats.evictions, 1)
+
+    def test_ttl(self):
+        for cache in self._caches(ttl=0.1):
+            with self.subTest(cache=type(cache).__name__):
+                cache.put("a", "A")
+                self.assertEqual(cache.get("a"), "A")
+
+                time.sleep(0.2)
+
+                self.assertIsNone(cache.get("a"))
+                self.assertEqual(cache.stats.evictions, 1)
+
+    def test_sqlite_persists(self):
+        cache = SQLiteResponseCache(self.path)
+        cache.put("a", "A")
+        cache.close()
+
+        cache = SQLiteResponseCache(self.path)
+        self.assertEqual(cache.get("a"), "A")
+        cache.close()
+
+    def test_provider_cache(self):
+        provider = DummyProvider(
+            name="test_provider_cache",
+            error_prob=0.0,
+            loading_prob=0.0,
+            freeze_prob=0.0,
+            overloaded_prob=0.0,
+            delay=0.0,
+            rpm=60000,
+        )
+        provider.cache = MemoryResponseCache()
+
+        score, callback = provider.endpoint.track_cost(
+            provider.generate_score, system_prompt="Rate this."
+        )
+        self.assertEqual(callback.cost.n_requests, 1)
+        self.assertEqual(callback.cost.n_cached_requests, 0)
+
+        cached_score, callback = provider.endpoint.track_cost(
+            provider.generate_score, system_prompt="Rate this."
+        )
+        self.assertEqual(cached_score, score)
+        self.assertEqual(callback.cost.n_requests, 0)
+        self.assertEqual(callback.cost.n_cached_requests, 1)
+        self.assertEqual(callback.cost.cost, 0.0)
+
+        # Different completion arguments are not answered from the cache.
+        provider.generate_score(system_prompt="Rate this.", temperature=0.5)
+
+        self.assertEqual(provider.cache.stats.hits, 1)
+        self.assertEqual(provider.cache.stats.misses, 2)
+
+    def test_provider_cache_no_text(self):
+        provider = DummyProvider(
+            name="test_provider_cache_no_text",
+            error_prob=0.0,
+            loading_prob=0.0,
+            freeze_prob=0.0,
+            overloaded_prob=0.0,
+            delay=0.0,
+            rpm=60000,
+        )
+
+        async def acreate_none(self, **kwargs):
+            return None
+
+        messages = [{"role": "system", "content": "Rate this."}]
+
+        for cache in self._caches():
+            with self.subTest(cache=type(cache).__name__):
+                provider.cache = cache
+
+                # Completions without text are returned but not cached.
+                with patch.object(
+                    DummyProvider, "_create_chat_completion", return_value=None
+                ):
+                    self.assertIsNone(
+                        provider._chat_completion(messages=messages)
+                    )
+
+                with patch.object(
+                    DummyProvider, "_acreate_chat_completion", acreate_none
+                ):
+                    self.assertIsNone(
+                        asyncio.run(
+                            provider._achat_completion(messages=messages)
+                        )
+                    )
+
+                self.assertEqual(len(cache), 0)
+
+                # The next completion is asked again and cached.
+                response = provider._chat_completion(messages=messages)
+                self.assertIsInstance(response, str)
+                self.assertEqual(
+                    cache.get(provider._completion_key(messages=messages)),
+                    response,
+                )
+
+
+if __name__ == "__main__":
+    main()
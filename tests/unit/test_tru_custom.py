@@ -2,10 +2,22 @@
 Tests for TruCustomApp.
 """
 
+import asyncio
+import threading
+from typing import List
 from unittest import main
 
+from trulens.core import Feedback
 from trulens.core import TruCustomApp
 from trulens.core import TruSession
+from trulens.core.app.custom import instrument
+from trulens.core.instruments import CaptureMode
+from trulens.core.instruments import Instrument
+from trulens.core.instruments import _serialize_in_background
+from trulens.core.instruments import wait_for_serialization
+from trulens.core.schema.feedback import FeedbackMode
+from trulens.core.schema.feedback import FeedbackResultStatus
+from trulens.core.schema.select import Select
 
 from examples.dev.dummy_app.app import DummyApp
 from tests.test import JSONTestCase
@@ -89,6 +101,167 @@ class TestTruCustomApp(JSONTestCase):
 
         self.assertEqual(recording2[0].meta, "meta2")
 
+    def test_async_context_manager(self):
+        question = "What is the capital of Indonesia?"
+
+        # Instrumented usage of the async variant. Calls made by the awaited
+        # coroutines should be nested under the root call of a single record.
+        with self.ta_recorder as recording:
+            asyncio.run(self.ca.arespond_to_query(query=question))
+
+        record = recording.get()
+
+        roots = [call for call in record.calls if len(call.stack) == 1]
+        self.assertEqual(len(roots), 1)
+        self.assertEqual(roots[0].method.name, "arespond_to_query")
+
+
+class TestTruCustomAppBackgroundCapture(TestTruCustomApp):
+    """The tests of TruCustomApp with calls serialized in the background."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.original_mode = Instrument.capture_mode
+        Instrument.capture_mode = CaptureMode.BACKGROUND
+
+    def tearDown(self):
+        Instrument.capture_mode = self.original_mode
+
+
+class ListApp:
+    @instrument
+    def respond(self, docs: List[str]) -> List[str]:
+        return self.retrieve(docs)
+
+    @instrument
+    def retrieve(self, docs: List[str]) -> List[str]:
+        if len(docs) == 0:
+            raise ValueError("No documents.")
+
+        return [doc.upper() for doc in docs]
+
+
+class TestBackgroundCapture(JSONTestCase):
+    def setUp(self):
+        self.app = ListApp()
+        self.recorder = TruCustomApp(
+            self.app, app_name="list_app", app_version="v1"
+        )
+
+        self.original_mode = Instrument.capture_mode
+        Instrument.capture_mode = CaptureMode.BACKGROUND
+
+    def tearDown(self):
+        Instrument.capture_mode = self.original_mode
+
+    def _record(self, docs: List[str]):
+        with self.recorder as recording:
+            self.app.respond(docs)
+
+        return recording.get()
+
+    def test_same_record(self):
+        docs = ["a", "b"]
+
+        record = self._record(docs)
+
+        Instrument.capture_mode = CaptureMode.SYNC
+        expected = self._record(docs)
+
+        self.assertJSONEqual(
+            record,
+            expected,
+            skips=[
+                "record_id",
+                "ts",
+                "start_time",
+                "end_time",
+                "call_id",
+                "tid",
+            ],
+        )
+
+    def test_snapshot(self):
+        docs = ["a", "b"]
+
+        release = threading.Event()
+        _serialize_in_background(release.wait)
+
+        with self.recorder as recording:
+            rets = self.app.respond(docs)
+
+            # Changes after the calls returned are not recorded.
+            docs.append("c")
+            rets.append("C")
+
+        release.set()
+        record = recording.get()
+
+        for call in record.calls:
+            self.assertEqual(call.args["docs"], ["a", "b"])
+            self.assertEqual(call.rets, ["A", "B"])
+
+    def test_off_thread(self):
+        release = threading.Event()
+        _serialize_in_background(release.wait)
+
+        with self.recorder as recording:
+            self.assertEqual(self.app.respond(["a"]), ["A"])
+
+        # The calls were captured but not yet serialized.
+        self.assertEqual(len(recording.pending), 2)
+
+        release.set()
+        self.assertEqual(len(recording.get().calls), 2)
+        self.assertEqual(len(recording.pending), 0)
+
+    def test_error(self):
+        with self.recorder as recording:
+            with self.assertRaises(ValueError):
+                self.app.respond([])
+
+        record = recording.get()
+
+        self.assertIsNotNone(record.main_error)
+        self.assertEqual(
+            [call.error for call in record.calls], ["No documents."] * 2
+        )
+
+    def test_with_app_feedback(self):
+        release = threading.Event()
+
+        def blocked_feedback(docs: List[str]) -> float:
+            release.wait(10)
+            return float(len(docs))
+
+        recorder = TruCustomApp(
+            self.app,
+            app_name="list_app_with_app",
+            app_version="v1",
+            feedbacks=[
+                Feedback(imp=blocked_feedback).on(
+                    docs=Select.RecordCalls.respond.rets
+                )
+            ],
+            feedback_mode=FeedbackMode.WITH_APP,
+        )
+
+        with recorder as recording:
+            self.app.respond(["a"])
+
+        # Serialization of other calls is not held up by the feedback.
+        wait_for_serialization()
+        self.assertEqual(len(recording.pending_feedback), 1)
+
+        release.set()
+        record = recording.get()
+
+        self.assertEqual(len(recording.pending_feedback), 0)
+        for future in record.feedback_results:
+            self.assertTrue(future.done())
+            self.assertEqual(future.result().status, FeedbackResultStatus.DONE)
+
 
 if __name__ == "__main__":
     main()